@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Scale benchmark for SRAVerify.run_checks against a fake AWS backend.
+
+Runs a full scan of the management account of synthetic organizations for
+every combination of organization size and region count, each in a fresh
+process so peak RSS is per scenario, and reports wall time, API calls, peak
+RSS and findings per second. With --scan-accounts, each scenario instead
+scans that many accounts of the organization with SRAVerify.scan_accounts,
+assuming a role in each.
+
+Examples:
+    python benchmarks/bench_scan.py
+    python benchmarks/bench_scan.py --accounts 10,100,1000 --regions 1,5,25 --latency-ms 20
+    python benchmarks/bench_scan.py --service GuardDuty --json results.json
+    python benchmarks/bench_scan.py --accounts 100 --regions 5 --scan-accounts 50 --parallel-accounts 10
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+# Run against the working tree without installing the package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_ACCOUNTS = '10,100,1000'
+DEFAULT_REGIONS = '1,5,25'
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(',') if v.strip()]
+
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_scenario(accounts: int, regions: int, latency_ms: float, jitter_ms: float,
+                 max_workers: int, service: str = None, scan_accounts: int = 0,
+                 parallel_accounts: int = 5) -> Dict[str, Any]:
+    """
+    Run one scan against a fake organization in this process.
+
+    Args:
+        accounts: Number of accounts in the organization
+        regions: Number of regions to scan
+        latency_ms: Latency added to every API call
+        jitter_ms: Maximum random latency added to every API call
+        max_workers: Checks run concurrently
+        service: Only run checks for this service
+        scan_accounts: Number of accounts to scan with scan_accounts (0 scans the management account only)
+        parallel_accounts: Accounts scanned concurrently by scan_accounts
+
+    Returns:
+        Dictionary of results
+    """
+    import boto3
+    from fake_aws import FakeAWS, FakeOrganization
+    from sraverify.main import SRAVerify
+    from sraverify.core.metrics import metrics
+
+    region_names = boto3.Session().get_available_regions('ec2')[:regions]
+    organization = FakeOrganization(accounts, region_names)
+    fake = FakeAWS(organization, latency=latency_ms / 1000, jitter=jitter_ms / 1000)
+    sra = SRAVerify(session=fake.session(), regions=region_names)
+
+    started = time.perf_counter()
+    if scan_accounts:
+        # Every assumed role gets a fake session in its own account
+        with patch('sraverify.core.session.assume_role', fake.assume_role):
+            findings = sra.scan_accounts(
+                organization.account_ids[:scan_accounts],
+                role='SRAMemberRole',
+                account_type='all',
+                service=service,
+                audit_accounts=[organization.audit_account_id],
+                log_archive_accounts=[organization.log_archive_account_id],
+                max_workers=max_workers,
+                parallel_accounts=parallel_accounts
+            )
+    else:
+        findings = sra.run_checks(
+            account_type='all',
+            service=service,
+            audit_accounts=[organization.audit_account_id],
+            log_archive_accounts=[organization.log_archive_account_id],
+            max_workers=max_workers
+        )
+    wall = time.perf_counter() - started
+
+    api_calls = sum(row['calls'] for row in metrics.summary('service'))
+    return {
+        'accounts': accounts,
+        'scanned_accounts': len(organization.account_ids[:scan_accounts]) if scan_accounts else 1,
+        'regions': len(region_names),
+        'latency_ms': latency_ms,
+        'max_workers': max_workers,
+        'wall_s': round(wall, 3),
+        'api_calls': api_calls,
+        'findings': len(findings),
+        'findings_per_s': round(len(findings) / wall, 1) if wall else 0.0,
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+    }
+
+
+def main():
+    """Run every scenario in a subprocess and print a results table."""
+    parser = argparse.ArgumentParser(description='SRA Verify scale benchmark')
+    parser.add_argument('--accounts', type=str, default=DEFAULT_ACCOUNTS,
+                        help=f'Comma-separated organization sizes (default: {DEFAULT_ACCOUNTS})')
+    parser.add_argument('--regions', type=str, default=DEFAULT_REGIONS,
+                        help=f'Comma-separated region counts (default: {DEFAULT_REGIONS})')
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Latency added to every API call')
+    parser.add_argument('--jitter-ms', type=float, default=0.0,
+                        help='Maximum random latency added to every API call')
+    parser.add_argument('--max-workers', type=int, default=10, help='Checks run concurrently')
+    parser.add_argument('--service', type=str, help='Only run checks for this service')
+    parser.add_argument('--scan-accounts', type=int, default=0,
+                        help='Scan this many accounts of each organization with scan_accounts '
+                             '(default: 0, the management account only)')
+    parser.add_argument('--parallel-accounts', type=int, default=5,
+                        help='Accounts scanned concurrently with --scan-accounts')
+    parser.add_argument('--json', type=str, metavar='FILE', help='Also write results to a JSON file')
+    parser.add_argument('--run', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        # Child process: exactly one organization size and region count
+        result = run_scenario(_int_list(args.accounts)[0], _int_list(args.regions)[0], args.latency_ms,
+                              args.jitter_ms, args.max_workers, args.service, args.scan_accounts,
+                              args.parallel_accounts)
+        print(json.dumps(result))
+        return
+
+    results = []
+    print(f"{'Accounts':>9}{'Scanned':>9}{'Regions':>9}{'Wall s':>9}{'API calls':>11}{'Findings':>10}"
+          f"{'Findings/s':>12}{'Peak RSS MB':>13}")
+    for accounts in _int_list(args.accounts):
+        for regions in _int_list(args.regions):
+            command = [sys.executable, os.path.abspath(__file__), '--run',
+                       '--accounts', str(accounts), '--regions', str(regions),
+                       '--latency-ms', str(args.latency_ms), '--jitter-ms', str(args.jitter_ms),
+                       '--max-workers', str(args.max_workers),
+                       '--scan-accounts', str(args.scan_accounts),
+                       '--parallel-accounts', str(args.parallel_accounts)]
+            if args.service:
+                command += ['--service', args.service]
+            completed = subprocess.run(command, capture_output=True, text=True)
+            if completed.returncode != 0:
+                print(f"{accounts:>9}{regions:>9}  failed:\n{completed.stderr}", file=sys.stderr)
+                continue
+            result = json.loads(completed.stdout.strip().splitlines()[-1])
+            results.append(result)
+            print(f"{result['accounts']:>9}{result['scanned_accounts']:>9}{result['regions']:>9}{result['wall_s']:>9.2f}"
+                  f"{result['api_calls']:>11}{result['findings']:>10}{result['findings_per_s']:>12.1f}"
+                  f"{result['peak_rss_mb']:>13.1f}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,294 @@
+"""
+In-process fake AWS backend for benchmarks.
+
+FakeAWS answers every API call made through a boto3 session it creates, without
+any network access. Calls are short-circuited on botocore's before-call event,
+so client creation, parameter validation, the scan cache, paginators and API
+metrics all run as in a real scan; the rate limiter and retries do not, since
+no request is ever sent.
+
+Organization-wide APIs (accounts, delegated administrators, member lists) are
+answered from a FakeOrganization and paginated, so response sizes scale with
+the organization. Every session belongs to one account of the organization,
+and identity APIs (GetCallerIdentity, GetAccountInformation) answer with that
+account; FakeAWS.assume_role stands in for sraverify's assume_role so
+multi-account scans get a session per account. Every other operation gets a
+response generated from the operation's output shape.
+"""
+import copy
+import datetime
+import functools
+import re
+import time
+import random
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import boto3
+from botocore.awsrequest import AWSResponse
+
+# Members that would make paginators request another page
+_PAGINATION_TOKEN = re.compile(r'(?i)^(next.*token|.*marker|paginationtoken|position)$')
+
+# Nesting depth beyond which generated lists are empty and structures bare
+_MAX_DEPTH = 6
+
+# Page size for organization-wide list operations without MaxResults
+DEFAULT_PAGE_SIZE = 20
+
+
+class FakeOrganization:
+    """A synthetic AWS Organization with a management, audit and log archive account."""
+
+    def __init__(self, account_count: int, regions: List[str]):
+        """
+        Initialize the organization.
+
+        Args:
+            account_count: Total number of accounts, including management, audit and log archive
+            regions: Regions the scan covers
+        """
+        if account_count < 3:
+            raise ValueError("An organization needs at least 3 accounts")
+        self.account_ids = [f"{100000000000 + i:012d}" for i in range(account_count)]
+        self.management_account_id, self.audit_account_id, self.log_archive_account_id = self.account_ids[:3]
+        self.regions = regions
+        self.organization_id = "o-fake000000"
+        self.root_id = "r-fake"
+
+    def account(self, account_id: str) -> Dict[str, Any]:
+        """Build an Organizations Account for an account ID."""
+        return {
+            'Id': account_id,
+            'Arn': f"arn:aws:organizations::{self.management_account_id}:account/"
+                   f"{self.organization_id}/{account_id}",
+            'Email': f"{account_id}@example.com",
+            'Name': f"account-{account_id}",
+            'Status': 'ACTIVE',
+            'State': 'ACTIVE',
+            'JoinedMethod': 'CREATED',
+            'JoinedTimestamp': datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+        }
+
+
+def _page(items: List[Any], params: Dict[str, Any], items_key: str, token_key: str = 'NextToken',
+          max_results_key: str = 'MaxResults') -> Dict[str, Any]:
+    """
+    Return one page of items, with a token for the next page if there is one.
+
+    Args:
+        items: All items
+        params: API call parameters
+        items_key: Response key holding the items
+        token_key: Request and response key holding the page token
+        max_results_key: Request key holding the page size
+
+    Returns:
+        Response dictionary
+    """
+    start = int(params.get(token_key) or 0)
+    size = int(params.get(max_results_key) or DEFAULT_PAGE_SIZE)
+    response = {items_key: items[start:start + size]}
+    if start + size < len(items):
+        response[token_key] = str(start + size)
+    return response
+
+
+class FakeAWS:
+    """Fake AWS backend answering calls made through its sessions."""
+
+    def __init__(self, organization: FakeOrganization, latency: float = 0.0, jitter: float = 0.0,
+                 seed: int = 0):
+        """
+        Initialize the backend.
+
+        Args:
+            organization: Organization to answer organization-wide APIs from
+            latency: Seconds added to every call, to simulate network round trips
+            jitter: Maximum extra seconds added at random to every call
+            seed: Seed for the latency jitter
+        """
+        self.organization = organization
+        self.latency = latency
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._generated: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        org = organization
+        # Responders take the API parameters and the account ID of the calling session
+        self._responders: Dict[Tuple[str, str], Callable[[Dict[str, Any], str], Dict[str, Any]]] = {
+            ('sts', 'GetCallerIdentity'): lambda params, account_id: {
+                'Account': account_id,
+                'Arn': f"arn:aws:iam::{account_id}:role/benchmark",
+                'UserId': 'AROAFAKE:benchmark',
+            },
+            ('sts', 'AssumeRole'): lambda params, account_id: {
+                'Credentials': {
+                    'AccessKeyId': f"ASIAFAKE{params['RoleArn'].split(':')[4]}",
+                    'SecretAccessKey': 'fake',
+                    'SessionToken': 'fake',
+                    'Expiration': datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(hours=1),
+                },
+                'AssumedRoleUser': {
+                    'AssumedRoleId': f"AROAFAKE:{params['RoleSessionName']}",
+                    'Arn': f"arn:aws:sts::{params['RoleArn'].split(':')[4]}:assumed-role/"
+                           f"{params['RoleArn'].split('/')[-1]}/{params['RoleSessionName']}",
+                },
+            },
+            ('account', 'GetAccountInformation'): lambda params, account_id: {
+                'AccountId': account_id,
+                'AccountName': 'management' if account_id == org.management_account_id else f"account-{account_id}",
+            },
+            ('organizations', 'DescribeOrganization'): lambda params, account_id: {
+                'Organization': {
+                    'Id': org.organization_id,
+                    'Arn': f"arn:aws:organizations::{org.management_account_id}:organization/{org.organization_id}",
+                    'FeatureSet': 'ALL',
+                    'MasterAccountId': org.management_account_id,
+                    'MasterAccountArn': f"arn:aws:organizations::{org.management_account_id}:account/"
+                                        f"{org.organization_id}/{org.management_account_id}",
+                    'MasterAccountEmail': 'management@example.com',
+                }
+            },
+            ('organizations', 'ListRoots'): lambda params, account_id: {
+                'Roots': [{'Id': org.root_id, 'Name': 'Root',
+                           'Arn': f"arn:aws:organizations::{org.management_account_id}:root/"
+                                  f"{org.organization_id}/{org.root_id}"}]
+            },
+            ('organizations', 'ListAccounts'): lambda params, account_id: _page(
+                [org.account(a) for a in org.account_ids], params, 'Accounts'),
+            ('organizations', 'ListAccountsForParent'): lambda params, account_id: _page(
+                [org.account(a) for a in org.account_ids], params, 'Accounts'),
+            ('organizations', 'ListDelegatedAdministrators'): lambda params, account_id: {
+                'DelegatedAdministrators': [dict(org.account(org.audit_account_id),
+                                                 DelegationEnabledDate=datetime.datetime(
+                                                     2024, 1, 1, tzinfo=datetime.timezone.utc))]
+            },
+            ('securityhub', 'ListMembers'): lambda params, account_id: _page(
+                [{'AccountId': a, 'AdministratorId': org.audit_account_id, 'MemberStatus': 'Enabled'}
+                 for a in org.account_ids if a != org.audit_account_id], params, 'Members'),
+            ('macie2', 'ListMembers'): lambda params, account_id: _page(
+                [{'accountId': a, 'administratorAccountId': org.audit_account_id,
+                  'relationshipStatus': 'Enabled'}
+                 for a in org.account_ids if a != org.audit_account_id],
+                params, 'members', token_key='nextToken', max_results_key='maxResults'),
+            ('inspector2', 'BatchGetAccountStatus'): lambda params, account_id: {
+                'accounts': [
+                    {'accountId': a, 'state': {'status': 'ENABLED'},
+                     'resourceState': {r: {'status': 'ENABLED'} for r in ('ec2', 'ecr', 'lambda', 'lambdaCode')}}
+                    for a in params.get('accountIds') or [org.management_account_id]
+                ],
+                'failedAccounts': [],
+            },
+        }
+
+    def session(self, region_name: str = 'us-east-1', account_id: Optional[str] = None) -> boto3.Session:
+        """
+        Create a session whose clients are answered by this backend.
+
+        Args:
+            region_name: Default region of the session
+            account_id: Account the session's calls are made in (defaults to the management account)
+
+        Returns:
+            boto3 session with fake credentials
+        """
+        account_id = account_id or self.organization.management_account_id
+        session = boto3.Session(aws_access_key_id=f"AKIAFAKE{account_id}", aws_secret_access_key='fake',
+                                region_name=region_name)
+        session.events.register('before-parameter-build', self._capture_params)
+        # Registered last so API metrics handlers still see the call before it is answered
+        session.events.register_last('before-call', functools.partial(self._handle, account_id))
+        return session
+
+    def assume_role(self, session: boto3.Session, role_arn: str,
+                    region: Optional[str] = None) -> boto3.Session:
+        """
+        Stand-in for sraverify.core.session.assume_role.
+
+        Calls STS AssumeRole through the given session, as a real scan does, and
+        returns a session of this backend in the role's account.
+
+        Args:
+            session: Session of this backend used to call STS
+            role_arn: ARN of the role to assume
+            region: Default region of the new session
+
+        Returns:
+            boto3 session whose calls are made in the role's account
+        """
+        from sraverify.core.clients import get_client
+        get_client(session, 'sts').assume_role(RoleArn=role_arn, RoleSessionName='sraverify-session')
+        return self.session(region or session.region_name, account_id=role_arn.split(':')[4])
+
+    @staticmethod
+    def _capture_params(params: Dict[str, Any], context: Dict[str, Any], **kwargs):
+        # before-call only sees the serialized request, so keep the API parameters
+        context['fake_aws_params'] = dict(params)
+
+    def _handle(self, account_id: str, model: Any, context: Dict[str, Any],
+                **kwargs) -> Tuple[AWSResponse, Dict[str, Any]]:
+        delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        service_name = model.service_model.service_name
+        params = context.get('fake_aws_params', {})
+        responder = self._responders.get((service_name, model.name))
+        if responder is not None:
+            parsed = responder(params, account_id)
+        else:
+            parsed = self._generate(service_name, model)
+        parsed.setdefault('ResponseMetadata', {'HTTPStatusCode': 200, 'RetryAttempts': 0})
+        return AWSResponse(f"https://{service_name}.fake", 200, {}, None), parsed
+
+    def _generate(self, service_name: str, model: Any) -> Dict[str, Any]:
+        """Build (once) and copy a response from an operation's output shape."""
+        key = (service_name, model.name)
+        if key not in self._generated:
+            shape = model.output_shape
+            self._generated[key] = _fill(shape, model.name, 0, service_name) if shape is not None else {}
+        return copy.deepcopy(self._generated[key])
+
+
+def _fill(shape: Any, name: str, depth: int, service_name: str) -> Any:
+    """
+    Generate a plausible value for a botocore shape.
+
+    Structures get all members except pagination tokens, lists get one item,
+    enums take their first value, and ARN and account ID members get values
+    in the right format.
+    """
+    type_name = shape.type_name
+    if type_name == 'structure':
+        if depth > _MAX_DEPTH:
+            return {}
+        return {
+            member_name: _fill(member, member_name, depth + 1, service_name)
+            for member_name, member in shape.members.items()
+            if not _PAGINATION_TOKEN.match(member_name)
+            and not getattr(member, 'serialization', {}).get('eventstream')
+        }
+    if type_name == 'list':
+        return [] if depth > _MAX_DEPTH else [_fill(shape.member, name, depth + 1, service_name)]
+    if type_name == 'map':
+        return {}
+    if type_name == 'string':
+        if shape.enum:
+            return shape.enum[0]
+        lowered = name.lower()
+        if lowered.endswith('arn'):
+            return f"arn:aws:{service_name}:us-east-1:100000000000:fake/{name}"
+        if 'accountid' in lowered:
+            return '100000000000'
+        if lowered in ('region', 'regionname', 'homeregion'):
+            return 'us-east-1'
+        return f"fake-{name}"
+    if type_name in ('integer', 'long'):
+        return 1
+    if type_name in ('float', 'double'):
+        return 1.0
+    if type_name == 'boolean':
+        return name != 'IsTruncated'
+    if type_name == 'timestamp':
+        return datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    if type_name == 'blob':
+        return b''
+    return None
@@ -0,0 +1,383 @@
+"""
+Scan-scoped cache for AWS API responses, with an optional persistent store.
+"""
+import base64
+import datetime
+import fnmatch
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+from sraverify.core.logging import logger
+
+# Default lifetime of persisted responses, in seconds
+DEFAULT_CACHE_TTL = 3600
+
+
+def encode_value(value: Any) -> Any:
+    """
+    Convert a cached value into JSON-serializable form.
+
+    Datetimes, tuples and bytes, which appear in boto3 responses and cache keys, are
+    tagged so they round-trip through decode_value unchanged.
+
+    Raises:
+        TypeError: If the value contains a type that cannot be persisted
+    """
+    if isinstance(value, dict):
+        if all(isinstance(k, str) for k in value):
+            return {k: encode_value(v) for k, v in value.items()}
+        # JSON objects only allow string keys
+        return {'__dict__': [[encode_value(k), encode_value(v)] for k, v in value.items()]}
+    if isinstance(value, list):
+        return [encode_value(v) for v in value]
+    if isinstance(value, tuple):
+        return {'__tuple__': [encode_value(v) for v in value]}
+    if isinstance(value, datetime.datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, bytes):
+        return {'__bytes__': base64.b64encode(value).decode('ascii')}
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    raise TypeError(f"Cannot persist value of type {type(value).__name__}")
+
+
+def decode_value(value: Any) -> Any:
+    """Reverse encode_value."""
+    if isinstance(value, list):
+        return [decode_value(v) for v in value]
+    if isinstance(value, dict):
+        if '__datetime__' in value and len(value) == 1:
+            return datetime.datetime.fromisoformat(value['__datetime__'])
+        if '__bytes__' in value and len(value) == 1:
+            return base64.b64decode(value['__bytes__'])
+        if '__tuple__' in value and len(value) == 1:
+            return tuple(decode_value(v) for v in value['__tuple__'])
+        if '__dict__' in value and len(value) == 1:
+            return {decode_value(k): decode_value(v) for k, v in value['__dict__']}
+        return {k: decode_value(v) for k, v in value.items()}
+    return value
+
+
+class DiskCache:
+    """
+    Persistent store for cached API responses, shared between scans.
+
+    Each entry is a JSON file under <directory>/<account ID>/<namespace>/, so
+    responses are kept per account, operation and region. Entries older than
+    their namespace's TTL are ignored and overwritten by the next scan.
+    """
+
+    def __init__(self, directory: str, ttl: int = DEFAULT_CACHE_TTL,
+                 ttl_overrides: Optional[Dict[str, int]] = None):
+        """
+        Initialize disk cache.
+
+        Args:
+            directory: Directory to store responses in (created if missing)
+            ttl: Default lifetime of entries in seconds; 0 disables persistence
+            ttl_overrides: Mapping of namespace or namespace pattern
+                (e.g. 'organizations.*') to lifetime in seconds
+        """
+        self.directory = os.path.expanduser(directory)
+        self.ttl = ttl
+        self.ttl_overrides = ttl_overrides or {}
+
+    def ttl_for(self, namespace: str) -> int:
+        """
+        Get the lifetime of entries in a namespace.
+
+        An exact namespace override wins over a pattern; among patterns the
+        longest match wins.
+
+        Args:
+            namespace: Cache namespace
+
+        Returns:
+            Lifetime in seconds
+        """
+        if namespace in self.ttl_overrides:
+            return self.ttl_overrides[namespace]
+        matches = [p for p in self.ttl_overrides if fnmatch.fnmatchcase(namespace, p)]
+        if matches:
+            return self.ttl_overrides[max(matches, key=len)]
+        return self.ttl
+
+    def _path(self, namespace: str, account_id: Optional[str], key: Hashable) -> str:
+        digest = hashlib.sha256(repr(key).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, account_id or 'unknown', namespace, f"{digest}.json")
+
+    def load(self, namespace: str, account_id: Optional[str], key: Hashable) -> Tuple[bool, Any]:
+        """
+        Read an entry if it exists and has not expired.
+
+        Args:
+            namespace: Cache namespace
+            account_id: AWS account ID
+            key: Entry key within the namespace
+
+        Returns:
+            Tuple of (found, value)
+        """
+        ttl = self.ttl_for(namespace)
+        if ttl <= 0:
+            return False, None
+        path = self._path(namespace, account_id, key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return False, None
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return False, None
+        if entry.get('key') != repr(key) or time.time() - entry.get('stored_at', 0) > ttl:
+            return False, None
+        return True, decode_value(entry['value'])
+
+    def store(self, namespace: str, account_id: Optional[str], key: Hashable, value: Any):
+        """
+        Write an entry, unless its namespace is not persisted.
+
+        Error responses, None and values that cannot be serialized are
+        skipped. Accessors return None when a call fails (e.g. a GuardDuty
+        detector ID that could not be listed), so persisting it would keep
+        a transient failure for the rest of the TTL.
+
+        Args:
+            namespace: Cache namespace
+            account_id: AWS account ID
+            key: Entry key within the namespace
+            value: Value to persist
+        """
+        if self.ttl_for(namespace) <= 0:
+            return
+        if value is None or (isinstance(value, dict) and 'Error' in value):
+            return
+        try:
+            entry = {'key': repr(key), 'stored_at': time.time(), 'value': encode_value(value)}
+        except TypeError as e:
+            logger.debug(f"Not persisting {namespace} entry: {e}")
+            return
+        path = self._path(namespace, account_id, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write to a temporary file first so concurrent readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not write cache entry {path}: {e}")
+
+
+class CacheManager:
+    """
+    Thread-safe cache of API responses shared by all checks in a scan.
+
+    Entries are keyed by (namespace, account ID, key), where the key is usually
+    the region, so checks running concurrently against several accounts never
+    see each other's data. In-memory entries live as long as the scan that
+    created them; a DiskCache store, if given, keeps them between scans.
+    """
+
+    def __init__(self, store: Optional[DiskCache] = None, refresh: bool = False):
+        """
+        Initialize an empty cache.
+
+        Args:
+            store: Persistent store to read misses from and write entries to
+            refresh: Ignore persisted entries, but still write fresh ones
+        """
+        self.store = store
+        self.refresh = refresh
+        self._entries: Dict[Tuple[str, Optional[str], Hashable], Any] = {}
+        self._hits: Counter = Counter()
+        self._disk_hits: Counter = Counter()
+        self._misses: Counter = Counter()
+        self._lock = threading.RLock()
+
+    def view(self, namespace: str, account_id: Optional[str]) -> "CacheView":
+        """
+        Get a dictionary-like view of one namespace for one account.
+
+        Args:
+            namespace: Cache namespace (e.g. 'guardduty.detector_ids')
+            account_id: AWS account ID the cached responses belong to
+
+        Returns:
+            CacheView bound to the namespace and account
+        """
+        return CacheView(self, namespace, account_id)
+
+    def lookup(self, namespace: str, account_id: Optional[str], key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up an entry and record a hit or miss.
+
+        Args:
+            namespace: Cache namespace
+            account_id: AWS account ID
+            key: Entry key within the namespace, usually the region
+
+        Returns:
+            Tuple of (found, value)
+        """
+        entry_key = (namespace, account_id, key)
+        with self._lock:
+            if entry_key in self._entries:
+                self._hits[namespace] += 1
+                return True, self._entries[entry_key]
+        if self.store and not self.refresh:
+            found, value = self.store.load(namespace, account_id, key)
+            if found:
+                with self._lock:
+                    self._entries.setdefault(entry_key, value)
+                    self._hits[namespace] += 1
+                    self._disk_hits[namespace] += 1
+                    return True, self._entries[entry_key]
+        with self._lock:
+            self._misses[namespace] += 1
+        return False, None
+
+    def peek(self, namespace: str, account_id: Optional[str], key: Hashable) -> Any:
+        """
+        Read an entry without recording a hit or miss.
+
+        Args:
+            namespace: Cache namespace
+            account_id: AWS account ID
+            key: Entry key within the namespace
+
+        Returns:
+            Cached value
+
+        Raises:
+            KeyError: If the entry is not cached
+        """
+        with self._lock:
+            return self._entries[(namespace, account_id, key)]
+
+    def set(self, namespace: str, account_id: Optional[str], key: Hashable, value: Any):
+        """
+        Store an entry.
+
+        Args:
+            namespace: Cache namespace
+            account_id: AWS account ID
+            key: Entry key within the namespace, usually the region
+            value: Value to cache
+        """
+        with self._lock:
+            self._entries[(namespace, account_id, key)] = value
+        if self.store:
+            self.store.store(namespace, account_id, key, value)
+
+    def delete(self, namespace: str, account_id: Optional[str], key: Hashable):
+        """Remove an entry if present."""
+        with self._lock:
+            self._entries.pop((namespace, account_id, key), None)
+
+    def keys(self, namespace: str, account_id: Optional[str]) -> List[Hashable]:
+        """
+        List the keys cached for a namespace and account.
+
+        Returns:
+            List of entry keys
+        """
+        with self._lock:
+            return [
+                key for entry_namespace, entry_account, key in self._entries
+                if entry_namespace == namespace and entry_account == account_id
+            ]
+
+    def clear(self, account_id: Optional[str] = None):
+        """
+        Drop in-memory entries and statistics. Persisted entries are kept.
+
+        Args:
+            account_id: Only drop entries for this account (statistics are kept)
+        """
+        with self._lock:
+            if account_id is None:
+                self._entries.clear()
+                self._hits.clear()
+                self._disk_hits.clear()
+                self._misses.clear()
+                return
+            for entry_key in [k for k in self._entries if k[1] == account_id]:
+                del self._entries[entry_key]
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get hit and miss counts per namespace.
+
+        Returns:
+            Dictionary mapping namespace to {'hits': int, 'disk_hits': int, 'misses': int},
+            where disk_hits counts the hits served from the persistent store
+        """
+        with self._lock:
+            namespaces = sorted(set(self._hits) | set(self._misses))
+            return {
+                namespace: {
+                    'hits': self._hits[namespace],
+                    'disk_hits': self._disk_hits[namespace],
+                    'misses': self._misses[namespace]
+                }
+                for namespace in namespaces
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class CacheView:
+    """Dictionary-like view of one cache namespace for one account."""
+
+    def __init__(self, manager: CacheManager, namespace: str, account_id: Optional[str]):
+        """
+        Initialize cache view.
+
+        Args:
+            manager: Cache the view reads from and writes to
+            namespace: Cache namespace
+            account_id: AWS account ID
+        """
+        self._manager = manager
+        self.namespace = namespace
+        self.account_id = account_id
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self._manager.lookup(self.namespace, self.account_id, key)[0]
+
+    def __getitem__(self, key: Hashable) -> Any:
+        return self._manager.peek(self.namespace, self.account_id, key)
+
+    def __setitem__(self, key: Hashable, value: Any):
+        self._manager.set(self.namespace, self.account_id, key, value)
+
+    def __delitem__(self, key: Hashable):
+        self._manager.delete(self.namespace, self.account_id, key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        return len(self.keys())
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or default if it is not cached."""
+        found, value = self._manager.lookup(self.namespace, self.account_id, key)
+        return value if found else default
+
+    def keys(self) -> List[Hashable]:
+        """List the keys cached in this view."""
+        return self._manager.keys(self.namespace, self.account_id)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """List the (key, value) pairs cached in this view."""
+        return [(key, self[key]) for key in self.keys()]
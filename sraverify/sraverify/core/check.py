@@ -1,87 +1,242 @@
 """
 Base class for security checks.
 """
-from typing import List, Optional, Dict, Any
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Dict, Any, Callable, Hashable, Set, Tuple, Union
 import boto3
+from sraverify.core.cache import CacheView
+from sraverify.core.context import ScanContext
+from sraverify.core.finding import Finding, FindingMetadata
 from sraverify.core.logging import logger
+from sraverify.core.orgdirectory import OrgDirectory
+from sraverify.core.planner import ACCOUNT, DataRequirement, requirement_key, requirements_of
+
+# Maximum number of regions queried concurrently by a single region fan-out
+MAX_REGION_WORKERS = 8
+
+# Maximum number of per-resource calls made concurrently by a single resource fan-out
+MAX_RESOURCE_WORKERS = 8
+
+
+def _map_concurrently(func: Callable[[Any], Any], items: List[Any], max_workers: int,
+                      thread_name_prefix: str) -> List[Any]:
+    """Call func for each item on a thread pool and return the results in item order."""
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    workers = min(max_workers, len(items))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix) as executor:
+        # Run each call in a copy of the caller's context so API metrics stay attributed to the check
+        futures = [executor.submit(contextvars.copy_context().run, func, item) for item in items]
+        return [future.result() for future in futures]
 
 
 class SecurityCheck:
-    """Base class for all security checks."""
-    
-    # Class-level cache for account information shared across all instances
-    _account_info_cache = {}
+    """
+    Base class for all security checks.
+
+    Check metadata is declared as class attributes, by service base classes
+    (service, account_type, resource_type) and by each check (check_id,
+    check_name, description, severity, ...), so it can be read from the
+    class without instantiating the check.
+    """
+
+    check_id: Optional[str] = None
+    check_name: Optional[str] = None
+    description: Optional[str] = None
+    rationale: Optional[str] = None
+    remediation: Optional[str] = None
+    severity: str = "Unknown"
+    check_logic: Optional[str] = None
+    account_type: str = "application"
+    service: Optional[str] = None
+    resource_type: Optional[str] = None
+
+    # Data execute reads: accessor method names called once per region, or
+    # DataRequirement entries with another scope (see sraverify.core.planner)
+    data_requirements: Tuple[Union[str, DataRequirement], ...] = ()
     
-    def __init__(self, account_type="application", service=None, resource_type=None):
+    def __init__(self, account_type: Optional[str] = None, service: Optional[str] = None,
+                 resource_type: Optional[str] = None):
         """
         Initialize security check.
         
         Args:
-            account_type: Type of account (application, audit, log-archive, management)
-            service: AWS service name
-            resource_type: AWS resource type for findings
-        """
-        self.account_type = account_type
-        self.service = service
-        self.resource_type = resource_type
-        self.check_id = None
-        self.check_name = None
-        self.description = None
-        self.rationale = None
-        self.remediation = None
-        self.severity = "Unknown"
-        self.check_logic = None
+            account_type: Override the class's account type (application, audit, log-archive, management)
+            service: Override the class's AWS service name
+            resource_type: Override the class's AWS resource type for findings
+        """
+        if account_type is not None:
+            self.account_type = account_type
+        if service is not None:
+            self.service = service
+        if resource_type is not None:
+            self.resource_type = resource_type
         self.findings = []
         self.regions = []
         self.session = None
+        self.context = None
         self._clients = {}
         self.account_info = None  # Will hold {'account_id': str, 'account_name': str}
+        self._finding_metadata = None  # Shared by findings, built on first create_finding
         
-    def initialize(self, session: boto3.Session, regions: Optional[List[str]] = None):
+    def initialize(self, session: boto3.Session, regions: Optional[List[str]] = None,
+                   context: Optional[ScanContext] = None):
         """
         Initialize check with AWS session and optional regions.
         
         Args:
             session: AWS session to use for the check
             regions: List of AWS regions to check. If not provided, enabled regions will be detected.
+            context: Scan-wide context shared by all checks (created for this check if not provided)
         """
         logger.debug(f"Initializing {self.__class__.__name__} check")
         self.session = session
+        self.context = context if context else ScanContext(session, regions)
         # All account types need regions, so we'll get them regardless of account type
-        self.regions = regions if regions else self._get_enabled_regions()
+        self.regions = regions if regions else self.context.regions
         logger.debug(f"Check will run in regions: {', '.join(self.regions)}")
         
-        # Get account info once during initialization
-        self.account_info = self._get_account_info()
+        # Account info is resolved once per scan by the shared context
+        self.account_info = self.context.account_info
+        self._finding_metadata = None
         logger.debug(f"Check initialized for account: {self.account_info['account_name']} ({self.account_info['account_id']})")
         
         self._setup_clients()
 
-    def _get_enabled_regions(self) -> List[str]:
+    def _setup_clients(self):
         """
-        Get all enabled regions in the AWS account.
+        Set up clients for each region. Must be implemented by subclasses.
+        """
+        raise NotImplementedError("Subclasses must implement _setup_clients method")
+    
+    def map_regions(self, func: Callable[[str], Any],
+                    regions: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Call a per-region function for several regions concurrently.
         
+        Args:
+            func: Callable taking a region name
+            regions: Regions to call func for (defaults to the check's regions)
+            
         Returns:
-            List of enabled region names
+            Dictionary mapping each region to its result, in region order
         """
-        try:
-            logger.debug("Getting enabled AWS regions")
-            session = boto3.Session()
-            ec2_client = session.client('ec2', region_name='us-east-1')
-            response = ec2_client.describe_regions(AllRegions=False)
-            regions = [region['RegionName'] for region in response['Regions']]
-            logger.debug(f"Found {len(regions)} enabled regions")
-            return regions
-        except Exception as e:
-            logger.error(f"Failed to get enabled regions: {str(e)}")
-            raise Exception(f"Failed to get enabled regions: {str(e)}")
+        regions = list(self.regions if regions is None else regions)
+        return dict(zip(regions, _map_concurrently(func, regions, MAX_REGION_WORKERS, "sraverify-region")))
     
-    def _setup_clients(self):
+    def map_resources(self, func: Callable[[Any], Any], items: List[Any]) -> List[Any]:
         """
-        Set up clients for each region. Must be implemented by subclasses.
+        Call a per-resource function (e.g. a describe call) for several resources concurrently.
+        
+        Calls are still subject to the client pool's rate limiter.
+        
+        Args:
+            func: Callable taking one item
+            items: Items to call func for (e.g. resource IDs)
+            
+        Returns:
+            List of results, in item order
         """
-        raise NotImplementedError("Subclasses must implement _setup_clients method")
+        return _map_concurrently(func, list(items), MAX_RESOURCE_WORKERS, "sraverify-resource")
+    
+    def prefetch_data(self):
+        """
+        Fetch the data declared in data_requirements before execute.
+        
+        Region-scoped accessors are fanned out across all regions concurrently.
+        Data already fetched for the account by the prefetch planner is skipped.
+        Failures are only logged; execute will retry the call and report the
+        error through its normal path.
+        """
+        requirements = requirements_of(type(self))
+        if not requirements:
+            return
+        prefetched = self.context.prefetched
+        for requirement in requirements:
+            accessor = getattr(self, requirement.accessor)
+            key = requirement_key(type(self), requirement)
+            try:
+                if requirement.scope == ACCOUNT:
+                    if (key, None) not in prefetched:
+                        accessor()
+                    continue
+                regions = [region for region in self.regions if (key, region) not in prefetched]
+                if regions:
+                    logger.debug(f"Prefetching {requirement.accessor} for {len(regions)} regions")
+                    self.map_regions(accessor, regions)
+            except Exception as e:
+                logger.debug(f"Prefetch of {requirement.accessor} failed: {e}")
+    
+    def cache(self, namespace: str) -> CacheView:
+        """
+        Get the scan cache for a namespace, scoped to the current account.
+        
+        Args:
+            namespace: Cache namespace (e.g. 'guardduty.detector_ids')
+            
+        Returns:
+            Dictionary-like view of cached API responses for this account
+        """
+        return self.context.cache.view(namespace, self.account_id)
+    
+    def cached(self, namespace: str, key: Hashable, fetch: Callable[[], Any],
+               cache_errors: bool = False) -> Any:
+        """
+        Get a value from the scan cache, fetching it if missing.
+        
+        Concurrent checks asking for the same missing value wait for the
+        first one to fetch it, so it is fetched only once per account.
+        Error responses ({'Error': ...}) are returned without being cached,
+        so a transient failure is retried by the next caller instead of
+        failing every check for the rest of the account's scan.
+        
+        Args:
+            namespace: Cache namespace (e.g. 'waf.load_balancers')
+            key: Cache key within the namespace (e.g. a region)
+            fetch: Callable returning the value
+            cache_errors: Cache error responses for the rest of the scan too, for data
+                          whose callers have a fallback and should not retry it
+            
+        Returns:
+            Cached or fetched value
+        """
+        cache = self.cache(namespace)
+        with self.context.lock((namespace, key)):
+            if key in cache:
+                return cache[key]
+            value = fetch()
+            if cache_errors or not (isinstance(value, dict) and 'Error' in value):
+                cache[key] = value
+            return value
     
+    @property
+    def org_directory(self) -> OrgDirectory:
+        """
+        Get the account directory of the organization, shared by all checks in the scan.
+
+        Raises:
+            Exception: If the organization accounts cannot be listed
+        """
+        return self.context.org_directory
+
+    def get_active_account_ids(self) -> Set[str]:
+        """
+        Get the IDs of the organization's ACTIVE accounts from the shared organization directory.
+
+        The directory indexes accounts by status once per scan, so checks
+        comparing member lists against the organization need no list scans.
+
+        Returns:
+            New set of account IDs, which the caller may change; empty if the
+            organization accounts cannot be listed
+        """
+        try:
+            return set(self.org_directory.with_status('ACTIVE'))
+        except Exception as e:
+            logger.debug(f"Error listing organization accounts: {e}")
+            return set()
+
     def get_client(self, region: str) -> Optional[Any]:
         """
         Get client for a specific region.
@@ -96,10 +251,14 @@ class SecurityCheck:
     
     def create_finding(self, status: str, region: str, resource_id: str, 
                       actual_value: str, remediation: str, 
-                      checked_value: Optional[str] = None) -> Dict[str, Any]:
+                      checked_value: Optional[str] = None) -> Finding:
         """
         Create a standardized finding.
         
+        Check-level fields are shared by all findings of this check through a
+        single FindingMetadata; the finding itself only holds the per-resource
+        fields and can be read like a dictionary.
+        
         Args:
             status: Check status (PASS/FAIL/ERROR)
             region: AWS region
@@ -109,31 +268,33 @@ class SecurityCheck:
             checked_value: Value that was checked (defaults to service name + " Configuration")
             
         Returns:
-            Finding dictionary
+            Finding
             
         Note: account_id and account_name are automatically populated from initialization.
         """
         if checked_value is None:
             checked_value = f"{self.service} Configuration"
             
-        return {
-            "CheckId": self.check_id,
-            "Status": status,
-            "Region": region,
-            "Severity": self.severity,
-            "Title": f"{self.check_id} {self.check_name}",
-            "Description": self.description,
-            "ResourceId": resource_id,
-            "ResourceType": self.resource_type,
-            "AccountId": self.account_id,
-            "AccountName": self.account_name,
-            "CheckedValue": checked_value,
-            "ActualValue": actual_value,
-            "Remediation": remediation,
-            "Service": self.service,
-            "CheckLogic": self.check_logic,
-            "AccountType": self.account_type
-        }
+        return Finding(self.finding_metadata, status, region, resource_id,
+                       checked_value, actual_value, remediation)
+    
+    @property
+    def finding_metadata(self) -> FindingMetadata:
+        """Get the metadata shared by this check's findings, creating it on first use."""
+        if self._finding_metadata is None:
+            self._finding_metadata = FindingMetadata(
+                check_id=self.check_id,
+                title=f"{self.check_id} {self.check_name}",
+                severity=self.severity,
+                description=self.description,
+                resource_type=self.resource_type,
+                account_id=self.account_id,
+                account_name=self.account_name,
+                service=self.service,
+                check_logic=self.check_logic,
+                account_type=self.account_type
+            )
+        return self._finding_metadata
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -149,51 +310,9 @@ class SecurityCheck:
         Get findings from the check.
         
         Returns:
-            List of findings
+            List of findings as plain dictionaries
         """
-        return self.findings
-
-    def _get_account_info(self) -> Dict[str, str]:
-        """
-        Get account ID and name from AWS Account API with caching.
-        
-        Returns:
-            Dictionary with 'account_id' and 'account_name' keys
-        """
-        # Get account ID from STS first (reliable, high rate limits)
-        try:
-            sts_client = self.session.client("sts")
-            response = sts_client.get_caller_identity()
-            account_id = response["Account"]
-        except Exception as e:
-            logger.error(f"Failed to get account ID from STS: {str(e)}")
-            raise Exception(f"Failed to get account ID: {str(e)}")
-        
-        # Check class-level cache
-        if account_id in SecurityCheck._account_info_cache:
-            logger.debug(f"Using cached account information for {account_id}")
-            return SecurityCheck._account_info_cache[account_id]
-        
-        # Try to get account name from Account API (low rate limits)
-        try:
-            logger.debug("Getting AWS account name from Account API")
-            account_client = self.session.client("account")
-            response = account_client.get_account_information()
-            account_name = response['AccountName']
-            logger.debug(f"Retrieved account name: {account_name}")
-        except Exception as e:
-            logger.warning(f"Failed to get account name from Account API: {str(e)}")
-            account_name = ""  # Blank account name when Account API fails
-        
-        # Create and cache account info
-        account_info = {
-            'account_id': account_id,
-            'account_name': account_name
-        }
-        SecurityCheck._account_info_cache[account_id] = account_info
-        logger.debug(f"Cached account information for {account_id}")
-        
-        return account_info
+        return [finding.to_dict() if isinstance(finding, Finding) else finding for finding in self.findings]
 
     @property
     def account_id(self) -> str:
@@ -215,13 +334,6 @@ class SecurityCheck:
         Returns:
             AWS management account ID
         """
-        try:
-            logger.debug("Getting AWS management account ID")
-            org_client = session.client("organizations")
-            response = org_client.describe_organization()
-            management_account_id = response["Organization"]["MasterAccountId"]
-            logger.debug(f"Management account ID: {management_account_id}")
-            return management_account_id
-        except Exception as e:
-            logger.error(f"Failed to get AWS management account ID: {str(e)}")
-            raise Exception(f"Failed to get AWS management account ID: {str(e)}")
+        if self.context is None or session is not self.context.session:
+            return ScanContext(session).management_account_id
+        return self.context.management_account_id
@@ -0,0 +1,200 @@
+"""
+Shared boto3 client pool.
+
+Creating a botocore client loads the service model and opens a new HTTP
+connection pool, so every service client wrapper draws its boto3 clients
+from one process-wide pool instead of calling session.client() directly.
+"""
+import threading
+from typing import Any, Dict, Hashable, Optional, Tuple
+import boto3
+from botocore.config import Config
+from sraverify.core.logging import logger
+from sraverify.core.metrics import MetricsCollector, metrics as default_metrics
+from sraverify.core.ratelimit import RateLimiter, rate_limiter as default_rate_limiter
+
+# HTTP connections kept per endpoint, sized for concurrent checks and region fan-out
+MAX_POOL_CONNECTIONS = 50
+
+# Attempts per call, including the first; throttled calls are retried with
+# exponential backoff and jitter by botocore's standard retry mode
+MAX_ATTEMPTS = 8
+
+
+class ClientPool:
+    """Process-wide registry of boto3 clients keyed by (credentials, service, region)."""
+
+    def __init__(self, max_pool_connections: int = MAX_POOL_CONNECTIONS,
+                 rate_limiter: Optional[RateLimiter] = default_rate_limiter,
+                 max_attempts: int = MAX_ATTEMPTS,
+                 metrics: Optional[MetricsCollector] = default_metrics):
+        """
+        Initialize the client pool.
+
+        Args:
+            max_pool_connections: Maximum number of HTTP connections kept per client endpoint
+            rate_limiter: Rate limiter attached to every client (None disables rate limiting)
+            max_attempts: Maximum attempts per call, including retries
+            metrics: Metrics collector attached to every client (None disables metrics)
+        """
+        self._clients: Dict[Tuple[Hashable, ...], Any] = {}
+        # boto3 sessions are not thread-safe, so client creation is serialized
+        self._lock = threading.RLock()
+        self._rate_limiter = rate_limiter
+        self._metrics = metrics
+        # Snapshot recording or replaying the responses of every client (see use_snapshot)
+        self.snapshot = None
+        self._config = Config(
+            max_pool_connections=max_pool_connections,
+            retries={'mode': 'standard', 'max_attempts': max_attempts}
+        )
+
+    def get_client(self, session: boto3.Session, service_name: str,
+                   region_name: Optional[str] = None) -> Any:
+        """
+        Get a boto3 client, creating it on first use.
+
+        Args:
+            session: AWS session whose credentials the client should use
+            service_name: AWS service name (e.g. 'guardduty')
+            region_name: AWS region name (defaults to the session region)
+
+        Returns:
+            boto3 client shared by every caller with the same credentials, service and region
+        """
+        region_name = region_name or session.region_name
+        with self._lock:
+            credentials_key = self._credentials_key(session)
+            key = (credentials_key, service_name, region_name)
+            if self.snapshot is not None:
+                # Sessions recorded under different accounts never share a client
+                key += (self.snapshot.account_of(session),)
+            client = self._clients.get(key)
+            if client is None:
+                logger.debug(f"Creating {service_name} client for {region_name}")
+                client = session.client(service_name, region_name=region_name, config=self._config)
+                if self._rate_limiter is not None:
+                    self._rate_limiter.attach(client, credentials_key, service_name, region_name)
+                if self._metrics is not None:
+                    self._metrics.attach(client, service_name, region_name)
+                if self.snapshot is not None:
+                    self.snapshot.attach(client, session, service_name, region_name)
+                self._clients[key] = client
+            return client
+
+    def use_snapshot(self, snapshot):
+        """
+        Record or replay the calls of every client created from now on.
+
+        Pooled clients are dropped, so no client bypasses the snapshot.
+
+        Args:
+            snapshot: sraverify.core.snapshot.Snapshot, or None to stop recording or replaying
+        """
+        with self._lock:
+            self.snapshot = snapshot
+            self._clients.clear()
+
+    def release(self, session: boto3.Session):
+        """
+        Drop the clients created with a session's credentials, and their rate limiter buckets.
+
+        Called when the scan of an account finishes, so the pool does not grow
+        with the number of accounts scanned.
+
+        Args:
+            session: AWS session whose clients are no longer needed
+        """
+        with self._lock:
+            credentials_key = self._credentials_key(session)
+            for key in [key for key in self._clients if key[0] == credentials_key]:
+                del self._clients[key]
+        if self._rate_limiter is not None:
+            self._rate_limiter.release(credentials_key)
+
+    def clear(self):
+        """Drop all pooled clients."""
+        with self._lock:
+            self._clients.clear()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @staticmethod
+    def _credentials_key(session: boto3.Session) -> Hashable:
+        """
+        Build the credentials part of a pool key.
+
+        Args:
+            session: AWS session
+
+        Returns:
+            Hashable identifying the credentials the session signs requests with
+        """
+        credentials = session.get_credentials()
+        if credentials is None:
+            return (session.profile_name, None)
+        # Keyed on the credentials object, not its access key: refreshable
+        # (assumed-role) credentials change keys when they refresh, and their
+        # clients must still be found and released. The key keeps the object
+        # alive, so its identity is not reused while clients are pooled.
+        return (session.profile_name, credentials)
+
+
+# Process-wide pool used by all service clients
+client_pool = ClientPool()
+
+
+def get_client(session: boto3.Session, service_name: str, region_name: Optional[str] = None) -> Any:
+    """
+    Get a pooled boto3 client.
+
+    Args:
+        session: AWS session whose credentials the client should use
+        service_name: AWS service name (e.g. 'guardduty')
+        region_name: AWS region name (defaults to the session region)
+
+    Returns:
+        Shared boto3 client
+    """
+    return client_pool.get_client(session, service_name, region_name)
+
+
+class lazy_client:
+    """
+    Descriptor that builds a pooled boto3 client on first attribute access.
+
+    Service client wrappers declare their boto3 clients as class attributes so
+    that only the clients a check actually calls get created:
+
+        class WAFClient:
+            cloudfront_client = lazy_client('cloudfront', region_name='us-east-1')
+            elbv2_client = lazy_client('elbv2')
+
+    The owning instance must have ``session`` and ``region`` attributes. The
+    client is stored on the instance after first access, so later lookups are
+    plain attribute reads and the attribute can still be replaced (e.g. in tests).
+    """
+
+    def __init__(self, service_name: str, region_name: Optional[str] = None):
+        """
+        Initialize the descriptor.
+
+        Args:
+            service_name: AWS service name (e.g. 'cloudfront')
+            region_name: Fixed region for the client (defaults to the instance region)
+        """
+        self.service_name = service_name
+        self.region_name = region_name
+        self.attr_name: Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str):
+        self.attr_name = name
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        client = get_client(instance.session, self.service_name,
+                            self.region_name or instance.region)
+        instance.__dict__[self.attr_name] = client
+        return client
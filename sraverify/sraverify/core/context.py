@@ -0,0 +1,202 @@
+"""
+Scan-wide context shared by all checks.
+"""
+import threading
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple
+import boto3
+from sraverify.core.cache import CacheManager
+from sraverify.core.clients import get_client
+from sraverify.core.logging import logger
+from sraverify.core.orgdirectory import DIRECTORY_NAMESPACE, OrgDirectory, list_organization_accounts
+
+
+class ScanContext:
+    """
+    Account facts resolved once per scan and shared by every check.
+
+    Each value is looked up on first use and then reused, so a scan makes one
+    STS, Account, EC2 and Organizations call in total instead of one per check.
+    Failed lookups raise the same errors checks used to raise. Only a failed
+    organization account listing is remembered, until reset.
+    """
+
+    def __init__(self, session: boto3.Session, regions: Optional[List[str]] = None,
+                 cache: Optional[CacheManager] = None):
+        """
+        Initialize scan context.
+
+        Args:
+            session: AWS session used for the scan
+            regions: List of AWS regions to check. If not provided, enabled regions will be detected.
+            cache: API response cache shared by the scan (a new one is created if not provided)
+        """
+        self.session = session
+        self.cache = cache if cache is not None else CacheManager()
+        self._regions = list(regions) if regions else None
+        self._account_info: Optional[Dict[str, str]] = None
+        self._management_account_id: Optional[str] = None
+        # (requirement key, region or None) pairs already fetched by the prefetch planner
+        self.prefetched: Set[Tuple[Any, Optional[str]]] = set()
+        self._org_directory: Optional[OrgDirectory] = None
+        # Error raised by the first failed account listing, re-raised instead of listing again
+        self._org_directory_error: Optional[Exception] = None
+        # Checks initialize concurrently; resolve each value only once
+        self._lock = threading.Lock()
+        # Listing accounts can take many pages; held separately so other lookups are not blocked
+        self._directory_lock = threading.Lock()
+        self._locks: Dict[Hashable, threading.Lock] = {}
+
+    def lock(self, key: Hashable) -> threading.Lock:
+        """
+        Get a lock shared by all checks, e.g. to build data several checks read only once.
+
+        Args:
+            key: Lock name (e.g. a cache namespace and region)
+
+        Returns:
+            The same lock for every call with the same key
+        """
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def reset(self):
+        """Forget the data an earlier run fetched: prefetched requirements and a failed account listing."""
+        self.prefetched.clear()
+        with self._directory_lock:
+            self._org_directory_error = None
+
+    @property
+    def regions(self) -> List[str]:
+        """Get the regions to check, detecting enabled regions if none were given."""
+        with self._lock:
+            if self._regions is None:
+                self._regions = self._get_enabled_regions()
+            return list(self._regions)
+
+    @property
+    def account_info(self) -> Dict[str, str]:
+        """Get account information as {'account_id': str, 'account_name': str}."""
+        with self._lock:
+            if self._account_info is None:
+                self._account_info = self._get_account_info()
+            return self._account_info
+
+    @property
+    def account_id(self) -> str:
+        """Get current account ID."""
+        return self.account_info['account_id']
+
+    @property
+    def account_name(self) -> str:
+        """Get current account name."""
+        return self.account_info['account_name']
+
+    @property
+    def management_account_id(self) -> str:
+        """Get AWS management account ID of the organization."""
+        with self._lock:
+            if self._management_account_id is None:
+                self._management_account_id = self._get_management_account_id()
+            return self._management_account_id
+
+    @property
+    def org_directory(self) -> OrgDirectory:
+        """
+        Get the account directory of the organization.
+
+        Accounts are listed once per scan and kept in the scan cache, so the
+        directory is shared by every check and reused between scans when a
+        persistent cache is configured. A failed listing is remembered too, so
+        every later caller gets the same error without another listing.
+
+        Raises:
+            Exception: If the organization accounts cannot be listed
+        """
+        with self._directory_lock:
+            if self._org_directory_error is not None:
+                raise self._org_directory_error
+            cache = self.cache.view(DIRECTORY_NAMESPACE, self.account_id)
+            if 'global' in cache:
+                accounts = cache['global']
+            else:
+                logger.debug("Listing organization accounts")
+                try:
+                    accounts = list_organization_accounts(get_client(self.session, 'organizations'))
+                except Exception as e:
+                    self._org_directory_error = e
+                    raise
+                cache['global'] = accounts
+            # Rebuild the index only when the cached accounts changed (e.g. the cache was cleared)
+            if self._org_directory is None or self._org_directory.accounts is not accounts:
+                self._org_directory = OrgDirectory(accounts)
+            return self._org_directory
+
+    def _get_enabled_regions(self) -> List[str]:
+        """
+        Get all enabled regions in the AWS account.
+
+        Returns:
+            List of enabled region names
+        """
+        try:
+            logger.debug("Getting enabled AWS regions")
+            # Default credentials: the member role does not grant ec2:DescribeRegions
+            session = boto3.Session()
+            ec2_client = get_client(session, 'ec2', 'us-east-1')
+            response = ec2_client.describe_regions(AllRegions=False)
+            regions = [region['RegionName'] for region in response['Regions']]
+            logger.debug(f"Found {len(regions)} enabled regions")
+            return regions
+        except Exception as e:
+            logger.error(f"Failed to get enabled regions: {str(e)}")
+            raise Exception(f"Failed to get enabled regions: {str(e)}")
+
+    def _get_account_info(self) -> Dict[str, str]:
+        """
+        Get account ID from STS and account name from the Account API.
+
+        Returns:
+            Dictionary with 'account_id' and 'account_name' keys
+        """
+        # Get account ID from STS first (reliable, high rate limits)
+        try:
+            sts_client = get_client(self.session, 'sts')
+            response = sts_client.get_caller_identity()
+            account_id = response["Account"]
+        except Exception as e:
+            logger.error(f"Failed to get account ID from STS: {str(e)}")
+            raise Exception(f"Failed to get account ID: {str(e)}")
+
+        # Try to get account name from Account API (low rate limits)
+        try:
+            logger.debug("Getting AWS account name from Account API")
+            account_client = get_client(self.session, 'account')
+            response = account_client.get_account_information()
+            account_name = response['AccountName']
+            logger.debug(f"Retrieved account name: {account_name}")
+        except Exception as e:
+            logger.warning(f"Failed to get account name from Account API: {str(e)}")
+            account_name = ""  # Blank account name when Account API fails
+
+        return {
+            'account_id': account_id,
+            'account_name': account_name
+        }
+
+    def _get_management_account_id(self) -> str:
+        """
+        Get AWS management account ID from Organizations.
+
+        Returns:
+            AWS management account ID
+        """
+        try:
+            logger.debug("Getting AWS management account ID")
+            org_client = get_client(self.session, 'organizations')
+            response = org_client.describe_organization()
+            management_account_id = response["Organization"]["MasterAccountId"]
+            logger.debug(f"Management account ID: {management_account_id}")
+            return management_account_id
+        except Exception as e:
+            logger.error(f"Failed to get AWS management account ID: {str(e)}")
+            raise Exception(f"Failed to get AWS management account ID: {str(e)}")
@@ -0,0 +1,160 @@
+"""
+Compact record type for security check findings.
+"""
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional
+
+
+class FindingMetadata:
+    """
+    Fields shared by every finding a check produces for one account.
+
+    A check creates one instance and all of its findings reference it, so
+    long strings such as the description and check logic are stored once.
+    """
+
+    __slots__ = (
+        'check_id', 'title', 'severity', 'description', 'resource_type',
+        'account_id', 'account_name', 'service', 'check_logic', 'account_type'
+    )
+
+    def __init__(self, check_id: str, title: str, severity: str, description: str,
+                 resource_type: str, account_id: Optional[str], account_name: Optional[str],
+                 service: str, check_logic: str, account_type: str):
+        """Initialize finding metadata."""
+        self.check_id = check_id
+        self.title = title
+        self.severity = severity
+        self.description = description
+        self.resource_type = resource_type
+        self.account_id = account_id
+        self.account_name = account_name
+        self.service = service
+        self.check_logic = check_logic
+        self.account_type = account_type
+
+
+# Finding keys in output order, mapped to (holder, attribute); holder is
+# None for per-finding slots and 'metadata' for shared check metadata
+_FIELDS = {
+    "CheckId": ('metadata', 'check_id'),
+    "Status": (None, 'status'),
+    "Region": (None, 'region'),
+    "Severity": ('metadata', 'severity'),
+    "Title": ('metadata', 'title'),
+    "Description": ('metadata', 'description'),
+    "ResourceId": (None, 'resource_id'),
+    "ResourceType": ('metadata', 'resource_type'),
+    "AccountId": ('metadata', 'account_id'),
+    "AccountName": ('metadata', 'account_name'),
+    "CheckedValue": (None, 'checked_value'),
+    "ActualValue": (None, 'actual_value'),
+    "Remediation": (None, 'remediation'),
+    "Service": ('metadata', 'service'),
+    "CheckLogic": ('metadata', 'check_logic'),
+    "AccountType": ('metadata', 'account_type'),
+}
+
+# Marks a standard field that was deleted from a finding
+_DELETED = object()
+
+
+class Finding(MutableMapping):
+    """
+    A single check result.
+
+    Only the per-resource fields are stored on the finding; check-level fields
+    come from the shared FindingMetadata. Findings behave like the dictionaries
+    SecurityCheck.create_finding used to return (finding['Status'],
+    finding.get('Region'), iteration, ==), and writes are kept on the finding
+    itself, so changing one finding never affects another.
+    """
+
+    __slots__ = ('metadata', 'status', 'region', 'resource_id', 'checked_value',
+                 'actual_value', 'remediation', '_overrides')
+
+    def __init__(self, metadata: FindingMetadata, status: str, region: str, resource_id: str,
+                 checked_value: str, actual_value: str, remediation: str):
+        """
+        Initialize finding.
+
+        Args:
+            metadata: Metadata shared with the check's other findings
+            status: Check status (PASS/FAIL/ERROR)
+            region: AWS region
+            resource_id: Resource identifier
+            checked_value: Value that was checked
+            actual_value: Actual value found
+            remediation: Remediation steps
+        """
+        self.metadata = metadata
+        self.status = status
+        self.region = region
+        self.resource_id = resource_id
+        self.checked_value = checked_value
+        self.actual_value = actual_value
+        self.remediation = remediation
+        # Created on first write to a metadata field or an extra key
+        self._overrides: Optional[Dict[str, Any]] = None
+
+    def __getitem__(self, key: str) -> Any:
+        if self._overrides is not None and key in self._overrides:
+            value = self._overrides[key]
+            if value is _DELETED:
+                raise KeyError(key)
+            return value
+        field = _FIELDS.get(key)
+        if field is None:
+            raise KeyError(key)
+        holder, attribute = field
+        return getattr(self.metadata if holder else self, attribute)
+
+    def __setitem__(self, key: str, value: Any):
+        field = _FIELDS.get(key)
+        if field is not None and field[0] is None:
+            setattr(self, field[1], value)
+            if self._overrides is not None:
+                self._overrides.pop(key, None)
+            return
+        if self._overrides is None:
+            self._overrides = {}
+        self._overrides[key] = value
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        if key in _FIELDS:
+            if self._overrides is None:
+                self._overrides = {}
+            self._overrides[key] = _DELETED
+        else:
+            del self._overrides[key]
+
+    def __contains__(self, key: object) -> bool:
+        if self._overrides is not None and key in self._overrides:
+            return self._overrides[key] is not _DELETED
+        return key in _FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        overrides = self._overrides or {}
+        for key in _FIELDS:
+            if overrides.get(key) is not _DELETED:
+                yield key
+        for key in overrides:
+            if key not in _FIELDS:
+                yield key
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"Finding({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the finding to a plain dictionary.
+
+        Returns:
+            Dictionary with the same keys and values as the finding
+        """
+        return {key: self[key] for key in self}
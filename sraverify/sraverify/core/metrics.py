@@ -0,0 +1,240 @@
+"""
+Per-call metrics for AWS API requests.
+
+Every pooled boto3 client is attached to a MetricsCollector, which listens on
+botocore's events and records call counts, latency, response bytes, retries
+and throttles per (check, service, operation, region, account). The check a
+call belongs to is taken from check_scope(), which SRAVerify sets around each
+check it runs.
+"""
+import contextlib
+import contextvars
+import json
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from sraverify.core.ratelimit import THROTTLE_ERROR_CODES
+
+# (check ID, account ID) of the check making calls on the current thread
+_current_check: contextvars.ContextVar = contextvars.ContextVar('sraverify_current_check', default=(None, None))
+
+# Latency percentiles reported per metrics row
+PERCENTILES = (50, 90, 99)
+
+
+@contextlib.contextmanager
+def check_scope(check_id: Optional[str], account_id: Optional[str]) -> Iterator[None]:
+    """
+    Attribute API calls made inside the block to a check.
+
+    Args:
+        check_id: ID of the running check
+        account_id: AWS account the check runs against
+    """
+    token = _current_check.set((check_id, account_id))
+    try:
+        yield
+    finally:
+        _current_check.reset(token)
+
+
+def _percentile(sorted_values: List[float], percentile: int) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(percentile / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class CallStats:
+    """Aggregated statistics for one metrics key."""
+
+    __slots__ = ('calls', 'errors', 'retries', 'throttles', 'bytes', 'latencies')
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.calls = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttles = 0
+        self.bytes = 0
+        self.latencies: List[float] = []
+
+    def merge(self, other: "CallStats"):
+        """Add another CallStats into this one."""
+        self.calls += other.calls
+        self.errors += other.errors
+        self.retries += other.retries
+        self.throttles += other.throttles
+        self.bytes += other.bytes
+        self.latencies.extend(other.latencies)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summarize the statistics.
+
+        Returns:
+            Dictionary with counts, total time and latency percentiles in milliseconds
+        """
+        latencies = sorted(self.latencies)
+        summary = {
+            'calls': self.calls,
+            'errors': self.errors,
+            'retries': self.retries,
+            'throttles': self.throttles,
+            'bytes': self.bytes,
+            'total_ms': round(sum(latencies) * 1000, 1),
+        }
+        for percentile in PERCENTILES:
+            summary[f'p{percentile}_ms'] = round(_percentile(latencies, percentile) * 1000, 1)
+        return summary
+
+
+# Metrics row keys, in the order used for tuples and JSON output
+KEY_FIELDS = ('check_id', 'service', 'operation', 'region', 'account_id')
+
+
+class MetricsCollector:
+    """Thread-safe collector of per-call API metrics."""
+
+    def __init__(self):
+        """Initialize an empty collector."""
+        self._stats: Dict[Tuple[Optional[str], ...], CallStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, check: Tuple[Optional[str], Optional[str]], service_name: str,
+               operation_name: str, region_name: Optional[str], latency: Optional[float] = None,
+               error: bool = False, retries: int = 0, throttles: int = 0, size: int = 0):
+        """
+        Add one observation.
+
+        Args:
+            check: (check ID, account ID) the call is attributed to
+            service_name: AWS service name
+            operation_name: API operation name
+            region_name: AWS region
+            latency: Call duration in seconds, including retries (None for attempt-level events)
+            error: Whether the call failed
+            retries: Number of retries the call needed
+            throttles: Number of throttled attempts
+            size: Response size in bytes
+        """
+        check_id, account_id = check
+        key = (check_id, service_name, operation_name, region_name, account_id)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = CallStats()
+            if latency is not None:
+                stats.calls += 1
+                stats.latencies.append(latency)
+            stats.errors += int(error)
+            stats.retries += retries
+            stats.throttles += throttles
+            stats.bytes += size
+
+    def attach(self, client: Any, service_name: str, region_name: Optional[str]):
+        """
+        Record metrics for every call made through a boto3 client.
+
+        Args:
+            client: boto3 client
+            service_name: AWS service name the client was created for
+            region_name: AWS region of the client
+        """
+        service_id = client.meta.service_model.service_id.hyphenize()
+
+        def before_call(context: Dict[str, Any], **kwargs):
+            # Stamp the call so after-call can attribute it even if it finishes on another thread
+            context['sraverify_started'] = time.perf_counter()
+            context['sraverify_check'] = _current_check.get()
+
+        def needs_retry(event_name: str, response=None, **kwargs):
+            if response is not None and response[1].get('Error', {}).get('Code') in THROTTLE_ERROR_CODES:
+                self.record(_current_check.get(), service_name, event_name.rsplit('.', 1)[-1],
+                            region_name, throttles=1)
+            return None
+
+        def after_call(event_name: str, context: Dict[str, Any], http_response=None,
+                       parsed=None, **kwargs):
+            started = context.get('sraverify_started')
+            if started is None:
+                return
+            retries = (parsed or {}).get('ResponseMetadata', {}).get('RetryAttempts', 0)
+            error = http_response is not None and http_response.status_code >= 300
+            # Content-Length avoids reading streamed bodies
+            size = int(http_response.headers.get('content-length') or 0) if http_response is not None else 0
+            self.record(context.get('sraverify_check', (None, None)), service_name,
+                        event_name.rsplit('.', 1)[-1], region_name,
+                        latency=time.perf_counter() - started, error=error, retries=retries, size=size)
+
+        def after_call_error(event_name: str, context: Dict[str, Any], **kwargs):
+            started = context.get('sraverify_started')
+            if started is None:
+                return
+            self.record(context.get('sraverify_check', (None, None)), service_name,
+                        event_name.rsplit('.', 1)[-1], region_name,
+                        latency=time.perf_counter() - started, error=True)
+
+        client.meta.events.register(f'before-call.{service_id}', before_call)
+        client.meta.events.register(f'needs-retry.{service_id}', needs_retry)
+        client.meta.events.register(f'after-call.{service_id}', after_call)
+        client.meta.events.register(f'after-call-error.{service_id}', after_call_error)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """
+        Get the metrics per (check, service, operation, region, account).
+
+        Returns:
+            List of dictionaries with the key fields and the CallStats summary, sorted by key
+        """
+        with self._lock:
+            items = sorted(self._stats.items(), key=lambda item: tuple(v or '' for v in item[0]))
+            return [dict(zip(KEY_FIELDS, key), **stats.to_dict()) for key, stats in items]
+
+    def summary(self, *fields: str) -> List[Dict[str, Any]]:
+        """
+        Aggregate the metrics over a subset of the key fields.
+
+        Args:
+            fields: Key fields to group by (e.g. 'service', or 'check_id')
+
+        Returns:
+            List of dictionaries with the group fields and CallStats summary,
+            sorted by total time, slowest first
+        """
+        indexes = [KEY_FIELDS.index(field) for field in fields]
+        groups: Dict[Tuple[Optional[str], ...], CallStats] = {}
+        with self._lock:
+            for key, stats in self._stats.items():
+                group = tuple(key[i] for i in indexes)
+                groups.setdefault(group, CallStats()).merge(stats)
+        rows = [dict(zip(fields, group), **stats.to_dict()) for group, stats in groups.items()]
+        return sorted(rows, key=lambda row: row['total_ms'], reverse=True)
+
+    def write_json(self, path: str):
+        """
+        Write all metrics rows, plus per-service and per-check summaries, to a JSON file.
+
+        Args:
+            path: Output file path
+        """
+        document = {
+            'calls': self.rows(),
+            'by_service': self.summary('service'),
+            'by_check': self.summary('check_id'),
+        }
+        with open(path, 'w') as f:
+            json.dump(document, f, indent=2)
+
+    def clear(self):
+        """Drop all recorded metrics."""
+        with self._lock:
+            self._stats.clear()
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+
+# Process-wide collector attached to every pooled client
+metrics = MetricsCollector()
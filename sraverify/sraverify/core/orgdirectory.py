@@ -0,0 +1,97 @@
+"""
+Organization account directory shared by all checks.
+
+Several services compare their member lists against the accounts of the
+organization. Instead of each service listing the accounts itself, the scan
+context pages Organizations ListAccounts once and every check queries the
+same indexed OrgDirectory.
+"""
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional
+
+from sraverify.core.logging import logger
+
+# Cache namespace holding the raw ListAccounts result
+DIRECTORY_NAMESPACE = 'organizations.directory'
+
+
+def list_organization_accounts(org_client: Any) -> List[Dict[str, Any]]:
+    """
+    List every account in the organization.
+
+    Args:
+        org_client: boto3 Organizations client
+
+    Returns:
+        List of Organizations Account dictionaries
+
+    Raises:
+        botocore.exceptions.ClientError: If the accounts cannot be listed
+    """
+    accounts = []
+    paginator = org_client.get_paginator('list_accounts')
+    for page in paginator.paginate():
+        accounts.extend(page.get('Accounts', []))
+    logger.debug(f"Found {len(accounts)} organization accounts")
+    return accounts
+
+
+class OrgDirectory:
+    """
+    Indexed view of the accounts of an organization.
+
+    Lookups by account ID and status are dictionary lookups, so checks
+    comparing member lists against the organization need no list scans.
+    """
+
+    def __init__(self, accounts: List[Dict[str, Any]]):
+        """
+        Initialize the directory.
+
+        Args:
+            accounts: Organizations Account dictionaries, as returned by ListAccounts
+        """
+        self.accounts = accounts
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        by_status: Dict[str, set] = {}
+        for account in accounts:
+            self._by_id[account['Id']] = account
+            by_status.setdefault(account.get('Status'), set()).add(account['Id'])
+        self._by_status: Dict[str, FrozenSet[str]] = {status: frozenset(ids) for status, ids in by_status.items()}
+
+    def __contains__(self, account_id: str) -> bool:
+        return account_id in self._by_id
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.accounts)
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    def get(self, account_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get an account by ID.
+
+        Args:
+            account_id: AWS account ID
+
+        Returns:
+            Organizations Account dictionary, or None if the account is not in the organization
+        """
+        return self._by_id.get(account_id)
+
+    def with_status(self, status: str) -> FrozenSet[str]:
+        """
+        Get the IDs of the accounts with a status.
+
+        Args:
+            status: Account status (e.g. 'ACTIVE', 'SUSPENDED')
+
+        Returns:
+            Set of account IDs
+        """
+        return self._by_status.get(status, frozenset())
+
+    def active_accounts(self) -> List[Dict[str, Any]]:
+        """List the ACTIVE accounts, in ListAccounts order."""
+        active = self.with_status('ACTIVE')
+        return [account for account in self.accounts if account['Id'] in active]
@@ -0,0 +1,210 @@
+"""
+Declarative data requirements and the prefetch planner.
+
+Checks declare the data they read in ``data_requirements``: the names of
+accessor methods to call once per region, or DataRequirement entries for
+accessors with another scope. Before checks run against an account,
+plan_prefetch reduces the requirements of all selected checks to the unique
+accessor calls (checks of one service share their base class accessors, so
+twenty checks reading the same configuration make one call per region) and
+execute_plan runs those calls concurrently.
+
+Accessors store their responses in the account-scoped scan cache, so after
+the plan has run, checks read a populated snapshot instead of discovering
+data one blocking call at a time.
+"""
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sraverify.core.logging import logger
+from sraverify.core.metrics import check_scope
+
+# Requirement scopes: call the accessor once per region, or once per account without arguments
+REGION = 'region'
+ACCOUNT = 'account'
+
+# Check ID API calls made by the planner are attributed to in metrics
+PREFETCH_CHECK_ID = 'prefetch'
+
+
+class DataRequirement(NamedTuple):
+    """Data a check reads: an accessor method and the scope it is called for."""
+
+    accessor: str
+    scope: str = REGION
+
+
+def requirements_of(check_class: type) -> List[DataRequirement]:
+    """
+    Get the data requirements a check class declares.
+
+    Args:
+        check_class: SecurityCheck subclass
+
+    Returns:
+        List of DataRequirement, in declaration order
+    """
+    requirements = []
+    for requirement in getattr(check_class, 'data_requirements', ()):
+        if isinstance(requirement, str):
+            requirement = DataRequirement(requirement)
+        if requirement.scope not in (REGION, ACCOUNT):
+            raise ValueError(f"{check_class.__name__} declares {requirement.accessor} "
+                             f"with unknown scope {requirement.scope}")
+        requirements.append(requirement)
+    return requirements
+
+
+def requirement_key(check_class: type, requirement: DataRequirement) -> Any:
+    """
+    Identify the data a requirement fetches, so requirements can be deduplicated.
+
+    Checks inheriting the same accessor fetch the same data, so the key is
+    the accessor function itself rather than the check declaring it.
+
+    Args:
+        check_class: Check class declaring the requirement
+        requirement: The requirement
+
+    Returns:
+        Hashable key
+    """
+    return getattr(check_class, requirement.accessor), requirement.scope
+
+
+class PlannedCall(NamedTuple):
+    """One unique accessor call in a prefetch plan."""
+
+    owner: type
+    requirement: DataRequirement
+    key: Any
+
+
+class PrefetchPlan:
+    """Unique accessor calls needed by a set of checks, grouped by service."""
+
+    def __init__(self):
+        """Initialize an empty plan."""
+        self.groups: Dict[str, List[PlannedCall]] = {}
+        self._keys = set()
+
+    def add(self, service: str, check_class: type, requirement: DataRequirement) -> bool:
+        """
+        Add a requirement unless an equivalent call is already planned.
+
+        Args:
+            service: Service the check belongs to
+            check_class: Check class declaring the requirement
+            requirement: The requirement
+
+        Returns:
+            True if the call was added
+        """
+        key = requirement_key(check_class, requirement)
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        calls = self.groups.setdefault(service, [])
+        # Make the call through a check already planned for the service when it shares the accessor
+        owner = next((call.owner for call in calls
+                      if getattr(call.owner, requirement.accessor, None) is key[0]), check_class)
+        calls.append(PlannedCall(owner, requirement, key))
+        return True
+
+    def owners(self) -> List[type]:
+        """List the check classes whose instances make the planned calls."""
+        owners = []
+        for calls in self.groups.values():
+            for call in calls:
+                if call.owner not in owners:
+                    owners.append(call.owner)
+        return owners
+
+    def call_count(self, region_count: int) -> int:
+        """
+        Count the API-level accessor calls the plan makes.
+
+        Args:
+            region_count: Number of regions scanned
+
+        Returns:
+            Number of accessor calls
+        """
+        return sum(region_count if call.requirement.scope == REGION else 1
+                   for calls in self.groups.values() for call in calls)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def plan_prefetch(checks: Iterable[Tuple[str, type]]) -> PrefetchPlan:
+    """
+    Reduce the data requirements of a set of checks to the unique calls.
+
+    Args:
+        checks: (service name, check class) pairs, in execution order
+
+    Returns:
+        PrefetchPlan
+    """
+    plan = PrefetchPlan()
+    declared = 0
+    for service_name, check_class in checks:
+        for requirement in requirements_of(check_class):
+            declared += 1
+            plan.add(service_name, check_class, requirement)
+    logger.debug(f"Prefetch plan: {len(plan)} unique accessors for {declared} declared requirements")
+    return plan
+
+
+def execute_plan(plan: PrefetchPlan, checks: Dict[type, Any], regions: List[str], context: Any,
+                 max_workers: int):
+    """
+    Run a prefetch plan concurrently and record what it fetched in the scan context.
+
+    Each service's region-scoped calls run in declaration order in one task
+    per region, so accessors that build on each other (a detector ID, then
+    the detector's details) never fetch the same data twice. Account-scoped
+    calls run in one task per service. Failures are only logged; the check
+    will retry the call and report the error through its normal path.
+
+    Args:
+        plan: The plan to run
+        checks: Initialized check instance for every class in plan.owners()
+        regions: Regions to call region-scoped accessors for
+        context: Scan context of the account, whose prefetched set is updated
+        max_workers: Maximum number of concurrent tasks
+    """
+    tasks: List[Tuple[List[PlannedCall], Optional[str]]] = []
+    for calls in plan.groups.values():
+        region_calls = [call for call in calls if call.requirement.scope == REGION]
+        account_calls = [call for call in calls if call.requirement.scope == ACCOUNT]
+        tasks.extend((region_calls, region) for region in regions if region_calls)
+        if account_calls:
+            tasks.append((account_calls, None))
+    if not tasks:
+        return
+
+    def run(calls: List[PlannedCall], region: Optional[str]):
+        for call in calls:
+            accessor = getattr(checks[call.owner], call.requirement.accessor)
+            try:
+                if region is None:
+                    accessor()
+                else:
+                    accessor(region)
+            except Exception as e:
+                logger.debug(f"Prefetch of {call.requirement.accessor} failed in {region or 'account'}: {e}")
+                continue
+            context.prefetched.add((call.key, region))
+
+    account_id = context.account_id
+    workers = max(1, min(max_workers, len(tasks)))
+    logger.debug(f"Prefetching {plan.call_count(len(regions))} accessor calls with {workers} workers")
+    with check_scope(PREFETCH_CHECK_ID, account_id):
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sraverify-prefetch") as executor:
+            futures = [executor.submit(contextvars.copy_context().run, run, calls, region)
+                       for calls, region in tasks]
+            for future in futures:
+                future.result()
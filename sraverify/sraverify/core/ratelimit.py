@@ -0,0 +1,208 @@
+"""
+Client-side rate limiting for AWS API calls.
+
+Every pooled boto3 client is attached to a RateLimiter. Before each request
+attempt the limiter takes a token from the bucket for the call's credentials,
+region, service and operation, so concurrent checks and accounts share the
+same budget instead of racing into ThrottlingException. Budgets adapt: a
+throttled response halves the bucket's rate, and successful calls restore it
+gradually. Throttled calls themselves are retried by botocore's standard
+retry mode, which backs off exponentially with jitter.
+"""
+import threading
+import time
+from typing import Any, Dict, Hashable, Optional, Tuple
+from sraverify.core.logging import logger
+
+# Budgets as (requests per second, burst), looked up by (service, operation)
+# first and then (service, None); services without an entry use DEFAULT_BUDGET
+DEFAULT_BUDGET = (20.0, 20)
+BUDGETS: Dict[Tuple[str, Optional[str]], Tuple[float, int]] = {
+    ('account', None): (5.0, 5),
+    ('organizations', None): (10.0, 10),
+    ('securityhub', None): (10.0, 30),
+    ('securityhub', 'GetFindings'): (3.0, 6),
+    ('securityhub', 'BatchEnableStandards'): (1.0, 1),
+    ('securityhub', 'UpdateStandardsControl'): (1.0, 1),
+}
+
+# Error codes AWS services return when a request is throttled
+THROTTLE_ERROR_CODES = frozenset({
+    'Throttling',
+    'ThrottlingException',
+    'ThrottledException',
+    'RequestThrottledException',
+    'TooManyRequestsException',
+    'ProvisionedThroughputExceededException',
+    'RequestLimitExceeded',
+    'RequestThrottled',
+    'SlowDown',
+    'EC2ThrottledException',
+})
+
+# Adaptive rate tuning: multiply the rate by BACKOFF_FACTOR on a throttle,
+# add RECOVERY_STEP of the configured rate per success, never go below MIN_RATE
+BACKOFF_FACTOR = 0.5
+RECOVERY_STEP = 0.05
+MIN_RATE = 0.5
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate adapts to throttling."""
+
+    def __init__(self, rate: float, burst: int):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second, and the ceiling for adaptive recovery
+            burst: Maximum number of tokens held
+        """
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """
+        Take a token, waiting until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def throttled(self):
+        """Lower the rate after a throttled response and drain the burst."""
+        with self._lock:
+            self._refill()
+            self.rate = max(MIN_RATE, self.rate * BACKOFF_FACTOR)
+            self._tokens = min(self._tokens, 0.0)
+
+    def succeeded(self):
+        """Raise the rate back towards its configured value after a successful call."""
+        with self._lock:
+            if self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + self.max_rate * RECOVERY_STEP)
+
+
+class RateLimiter:
+    """Registry of token buckets keyed by (credentials, region, service, operation)."""
+
+    def __init__(self, budgets: Optional[Dict[Tuple[str, Optional[str]], Tuple[float, int]]] = None,
+                 default_budget: Tuple[float, int] = DEFAULT_BUDGET):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            budgets: Mapping of (service, operation or None) to (requests per second, burst)
+            default_budget: Budget for services without an entry in budgets
+        """
+        self.budgets = BUDGETS if budgets is None else budgets
+        self.default_budget = default_budget
+        self._buckets: Dict[Tuple[Hashable, Optional[str], str, Optional[str]], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, credentials_key: Hashable, region_name: Optional[str],
+               service_name: str, operation_name: str) -> TokenBucket:
+        """
+        Get the bucket a call draws from, creating it on first use.
+
+        Operations with their own budget get their own bucket; all other
+        operations of a service share the service bucket.
+
+        Args:
+            credentials_key: Identifies the credentials (and so the account) making the call
+            region_name: AWS region of the client
+            service_name: AWS service name (e.g. 'securityhub')
+            operation_name: API operation name (e.g. 'GetFindings')
+
+        Returns:
+            TokenBucket for the call
+        """
+        if (service_name, operation_name) in self.budgets:
+            budget_key = (service_name, operation_name)
+        else:
+            budget_key = (service_name, None)
+        key = (credentials_key, region_name) + budget_key
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                rate, burst = self.budgets.get(budget_key, self.default_budget)
+                bucket = TokenBucket(rate, burst)
+                self._buckets[key] = bucket
+            return bucket
+
+    def attach(self, client: Any, credentials_key: Hashable, service_name: str,
+               region_name: Optional[str]):
+        """
+        Rate limit every call made through a boto3 client.
+
+        Args:
+            client: boto3 client
+            credentials_key: Identifies the credentials the client signs requests with
+            service_name: AWS service name the client was created for
+            region_name: AWS region of the client
+        """
+        service_id = client.meta.service_model.service_id.hyphenize()
+
+        def before_send(event_name: str, **kwargs):
+            # Emitted once per attempt, including retries
+            operation_name = event_name.rsplit('.', 1)[-1]
+            waited = self.bucket(credentials_key, region_name, service_name, operation_name).acquire()
+            if waited:
+                logger.debug(f"Rate limited {service_name}.{operation_name} in {region_name} for {waited:.2f}s")
+
+        def needs_retry(event_name: str, response=None, **kwargs):
+            # Observe the outcome of each attempt; botocore's retry handler decides on retries
+            if response is None:
+                return None
+            operation_name = event_name.rsplit('.', 1)[-1]
+            bucket = self.bucket(credentials_key, region_name, service_name, operation_name)
+            error_code = response[1].get('Error', {}).get('Code')
+            if error_code in THROTTLE_ERROR_CODES:
+                bucket.throttled()
+                logger.debug(f"Throttled on {service_name}.{operation_name} in {region_name}, "
+                             f"lowering rate to {bucket.rate:.2f}/s")
+            elif response[0].status_code < 300:
+                bucket.succeeded()
+            return None
+
+        client.meta.events.register(f'before-send.{service_id}', before_send)
+        client.meta.events.register(f'needs-retry.{service_id}', needs_retry)
+
+    def release(self, credentials_key: Hashable):
+        """
+        Drop the buckets of one set of credentials.
+
+        Args:
+            credentials_key: Identifies the credentials whose buckets are no longer needed
+        """
+        with self._lock:
+            for key in [key for key in self._buckets if key[0] == credentials_key]:
+                del self._buckets[key]
+
+    def clear(self):
+        """Drop all buckets."""
+        with self._lock:
+            self._buckets.clear()
+
+
+# Process-wide limiter attached to every pooled client
+rate_limiter = RateLimiter()
@@ -0,0 +1,367 @@
+"""
+Lazy registry of security checks.
+
+The check manifest (sraverify/services/manifest.py) records each check's ID,
+module, class and metadata, so checks can be listed, filtered and selected
+without importing their modules. A check module is only imported the first
+time its class is requested.
+
+Regenerate the manifest after adding a check or changing its metadata:
+
+    python -m sraverify.core.registry
+"""
+import argparse
+import importlib
+import json
+import os
+import pkgutil
+import sys
+import threading
+from collections.abc import MutableMapping
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from sraverify.services.manifest import CHECK_MANIFEST
+
+# Severity levels from lowest to highest, for severity floors
+SEVERITY_LEVELS = ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
+
+# Service packages in execution order; packages not listed run last, alphabetically
+SERVICE_ORDER = (
+    'guardduty', 'cloudtrail', 'accessanalyzer', 'config', 'securityhub', 's3',
+    'inspector', 'ec2', 'macie', 'shield', 'waf', 'account', 'auditmanager',
+    'firewallmanager', 'securitylake', 'securityincidentresponse', 'organizations',
+)
+
+
+class CheckSpec(NamedTuple):
+    """Manifest entry describing one check."""
+
+    check_id: str
+    module: str
+    class_name: str
+    service: str
+    account_type: str
+    name: str
+    description: str
+    severity: str
+
+
+def spec_for_class(check_id: str, check_class: type) -> CheckSpec:
+    """
+    Build a manifest entry from a check class's class-level metadata.
+
+    Classes that set their metadata in __init__ instead are instantiated once.
+
+    Args:
+        check_id: Check ID to register the class under
+        check_class: SecurityCheck subclass
+
+    Returns:
+        CheckSpec for the class
+    """
+    metadata = check_class
+    if check_class.check_id is None or check_class.service is None:
+        # Checks that still set their metadata in __init__
+        metadata = check_class()
+    return CheckSpec(
+        check_id=check_id,
+        module=check_class.__module__,
+        class_name=check_class.__name__,
+        service=metadata.service,
+        account_type=metadata.account_type,
+        name=metadata.check_name,
+        description=metadata.description,
+        severity=metadata.severity,
+    )
+
+
+class CheckRegistry(MutableMapping):
+    """
+    Mapping of check ID to check class that imports check modules on demand.
+
+    Iteration follows manifest order, which is the order checks run in.
+    Metadata queries (spec, specs, select, services) never import check
+    modules; select filters through indexes built once per registry.
+    """
+
+    def __init__(self, manifest: Dict[str, Dict[str, str]]):
+        """
+        Initialize the registry.
+
+        Args:
+            manifest: Mapping of check ID to CheckSpec fields (without check_id)
+        """
+        self._specs: Dict[str, CheckSpec] = {
+            check_id: CheckSpec(check_id=check_id, **entry) for check_id, entry in manifest.items()
+        }
+        self._classes: Dict[str, type] = {}
+        self._lock = threading.Lock()
+        self._index()
+
+    def _index(self):
+        """Rebuild the check ID indexes by service, account type and severity."""
+        by_service: Dict[str, List[str]] = {}
+        by_account_type: Dict[str, List[str]] = {}
+        by_severity: Dict[str, List[str]] = {}
+        for spec in self._specs.values():
+            by_service.setdefault(spec.service.lower(), []).append(spec.check_id)
+            by_account_type.setdefault(spec.account_type, []).append(spec.check_id)
+            by_severity.setdefault(spec.severity.upper(), []).append(spec.check_id)
+        self._by_service = by_service
+        self._by_account_type = by_account_type
+        self._by_severity = by_severity
+
+    def __getitem__(self, check_id: str) -> type:
+        check_class = self._classes.get(check_id)
+        if check_class is not None:
+            return check_class
+        spec = self._specs[check_id]
+        module = importlib.import_module(spec.module)
+        check_class = getattr(module, spec.class_name)
+        with self._lock:
+            self._classes[check_id] = check_class
+        return check_class
+
+    def __setitem__(self, check_id: str, check_class: type):
+        spec = spec_for_class(check_id, check_class)
+        with self._lock:
+            self._specs[check_id] = spec
+            self._classes[check_id] = check_class
+            self._index()
+
+    def __delitem__(self, check_id: str):
+        with self._lock:
+            del self._specs[check_id]
+            self._classes.pop(check_id, None)
+            self._index()
+
+    def __contains__(self, check_id: object) -> bool:
+        return check_id in self._specs
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._specs))
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def spec(self, check_id: str) -> CheckSpec:
+        """
+        Get a check's manifest entry.
+
+        Args:
+            check_id: Check ID
+
+        Returns:
+            CheckSpec for the check
+
+        Raises:
+            KeyError: If the check is not registered
+        """
+        return self._specs[check_id]
+
+    def specs(self, account_type: str = 'all', service: Optional[str] = None) -> List[CheckSpec]:
+        """
+        List manifest entries in execution order, optionally filtered.
+
+        Args:
+            account_type: Only include checks for this account type ('all' for every type)
+            service: Only include checks for this service (case-insensitive)
+
+        Returns:
+            List of CheckSpec
+        """
+        return self.select(account_type, services=[service] if service else None)
+
+    def select(self, account_type: str = 'all', services: Optional[Iterable[str]] = None,
+               min_severity: Optional[str] = None, exclude: Optional[Iterable[str]] = None,
+               check_ids: Optional[Iterable[str]] = None) -> List[CheckSpec]:
+        """
+        Select manifest entries in execution order using the indexes.
+
+        Args:
+            account_type: Only include checks for this account type ('all' for every type)
+            services: Only include checks for these services (case-insensitive)
+            min_severity: Only include checks at or above this severity (see SEVERITY_LEVELS)
+            exclude: Check IDs or service names (case-insensitive) to leave out
+            check_ids: Only include these check IDs
+
+        Returns:
+            List of CheckSpec
+
+        Raises:
+            ValueError: If min_severity is not a known severity level
+        """
+        selected: Optional[set] = None
+
+        def narrow(check_ids: Iterable[str]):
+            nonlocal selected
+            selected = set(check_ids) if selected is None else selected.intersection(check_ids)
+
+        if account_type != 'all':
+            narrow(self._by_account_type.get(account_type, ()))
+        if services is not None:
+            narrow(check_id for service in services for check_id in self._by_service.get(service.lower(), ()))
+        if min_severity:
+            level = min_severity.upper()
+            if level not in SEVERITY_LEVELS:
+                raise ValueError(f"Unknown severity {min_severity}, expected one of {', '.join(SEVERITY_LEVELS)}")
+            floor = SEVERITY_LEVELS.index(level)
+            narrow(check_id for severity in SEVERITY_LEVELS[floor:]
+                   for check_id in self._by_severity.get(severity, ()))
+        if check_ids is not None:
+            narrow(check_id for check_id in check_ids if check_id in self._specs)
+        if exclude:
+            excluded = set()
+            for item in exclude:
+                excluded.update(self._by_service.get(item.lower(), ()))
+                excluded.add(item)
+            narrow(check_id for check_id in self._specs if check_id not in excluded)
+
+        return [spec for check_id, spec in list(self._specs.items()) if selected is None or check_id in selected]
+
+    def services(self) -> List[str]:
+        """
+        List the services that have checks.
+
+        Returns:
+            Sorted list of service names
+        """
+        return sorted({spec.service for spec in list(self._specs.values())})
+
+    def service_checks(self, package: str) -> Dict[str, type]:
+        """
+        Get the check classes defined in a service package, importing them.
+
+        Args:
+            package: Service package name (e.g. 'sraverify.services.guardduty')
+
+        Returns:
+            Dictionary mapping check IDs to check classes
+        """
+        prefix = f"{package}."
+        return {
+            spec.check_id: self[spec.check_id]
+            for spec in list(self._specs.values()) if spec.module.startswith(prefix)
+        }
+
+
+# Registry of every check shipped with sraverify
+registry = CheckRegistry(CHECK_MANIFEST)
+
+
+def service_module_getattr(package: str) -> Callable[[str], object]:
+    """
+    Build a module __getattr__ that exposes a service package's checks lazily.
+
+    Service packages assign the result to ``__getattr__`` so that
+    ``from sraverify.services.guardduty import CHECKS`` and imports of
+    individual check classes keep working without importing every check
+    module when the package is imported.
+
+    Args:
+        package: Service package name (the package's __name__)
+
+    Returns:
+        Module-level __getattr__ function
+    """
+    prefix = f"{package}."
+
+    def __getattr__(name: str) -> object:
+        if name == 'CHECKS':
+            return registry.service_checks(package)
+        for spec in registry.specs():
+            if spec.class_name == name and spec.module.startswith(prefix):
+                return registry[spec.check_id]
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
+
+
+def discover_checks() -> List[CheckSpec]:
+    """
+    Import every check module and build manifest entries from the check classes.
+
+    Check modules are the sra_* modules in each service's checks package.
+
+    Returns:
+        List of CheckSpec in execution order
+    """
+    import sraverify.services as services
+    from sraverify.core.check import SecurityCheck
+
+    packages = [name for _, name, is_package in pkgutil.iter_modules(services.__path__) if is_package]
+    packages.sort(key=lambda p: (SERVICE_ORDER.index(p) if p in SERVICE_ORDER else len(SERVICE_ORDER), p))
+
+    specs = []
+    for package in packages:
+        checks_package = f"sraverify.services.{package}.checks"
+        try:
+            checks_module = importlib.import_module(checks_package)
+        except ModuleNotFoundError:
+            continue
+        module_names = sorted(name for _, name, _ in pkgutil.iter_modules(checks_module.__path__)
+                              if name.startswith('sra_'))
+        for module_name in module_names:
+            module = importlib.import_module(f"{checks_package}.{module_name}")
+            for obj in vars(module).values():
+                if (isinstance(obj, type) and issubclass(obj, SecurityCheck)
+                        and obj.__module__ == module.__name__):
+                    specs.append(spec_for_class(obj.check_id, obj))
+    return specs
+
+
+def render_manifest(specs: List[CheckSpec]) -> str:
+    """
+    Render manifest entries as the source of sraverify/services/manifest.py.
+
+    Args:
+        specs: Manifest entries in execution order
+
+    Returns:
+        Python module source
+    """
+    lines = [
+        '"""',
+        'Check manifest used by sraverify.core.registry.',
+        '',
+        'Generated by `python -m sraverify.core.registry`; do not edit by hand.',
+        '"""',
+        '',
+        'CHECK_MANIFEST = {',
+    ]
+    for spec in specs:
+        lines.append(f'    {json.dumps(spec.check_id)}: {{')
+        for field in CheckSpec._fields[1:]:
+            lines.append(f'        {json.dumps(field)}: {json.dumps(getattr(spec, field))},')
+        lines.append('    },')
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def main():
+    """Regenerate the check manifest, or verify it is up to date with --check."""
+    parser = argparse.ArgumentParser(description='Regenerate the SRA Verify check manifest')
+    parser.add_argument('--check', action='store_true',
+                        help='Exit with an error if the manifest is out of date instead of writing it')
+    args = parser.parse_args()
+
+    import sraverify.services.manifest as manifest_module
+    path = manifest_module.__file__
+    source = render_manifest(discover_checks())
+    with open(path, 'r', encoding='utf-8') as f:
+        current = f.read()
+
+    if args.check:
+        if current != source:
+            print(f"{path} is out of date; run python -m sraverify.core.registry", file=sys.stderr)
+            sys.exit(1)
+        return
+    if current != source:
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+    check_count = source.count('"module":')
+    print(f"Wrote {check_count} checks to {os.path.relpath(path)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,13 @@
 """
 AWS session management.
 """
-from typing import Optional
+import threading
+from typing import Dict, Optional
 import boto3
+import botocore.session
+from botocore.credentials import RefreshableCredentials
+from sraverify.core.clients import get_client
+from sraverify.core.logging import logger
 
 
 def get_session(region: Optional[str] = None, profile: Optional[str] = None, 
@@ -27,21 +32,135 @@ def get_session(region: Optional[str] = None, profile: Optional[str] = None,
         
         # If a role ARN is provided, assume that role
         if role_arn:
-            sts_client = session.client('sts')
-            response = sts_client.assume_role(
-                RoleArn=role_arn,
-                RoleSessionName='sraverify-session'
-            )
-            
-            # Create a new session with the assumed role credentials
-            credentials = response['Credentials']
-            return boto3.Session(
-                aws_access_key_id=credentials['AccessKeyId'],
-                aws_secret_access_key=credentials['SecretAccessKey'],
-                aws_session_token=credentials['SessionToken'],
-                region_name=region
-            )
+            return assume_role(session, role_arn, region=region)
         
         return session
     except Exception as e:
-        raise Exception(f"Failed to create AWS session: {str(e)}")
\ No newline at end of file
+        raise Exception(f"Failed to create AWS session: {str(e)}")
+
+
+def assume_role(session: boto3.Session, role_arn: str,
+                region: Optional[str] = None) -> boto3.Session:
+    """
+    Assume an IAM role.
+    
+    The session's credentials refresh themselves: botocore assumes the role
+    again shortly before they expire, so scans of large organizations can
+    outlive the role's maximum session duration.
+    
+    Args:
+        session: AWS session used to call STS
+        role_arn: ARN of IAM role to assume
+        region: AWS region name for the new session
+        
+    Returns:
+        AWS session using the role's credentials
+    """
+    sts_client = get_client(session, 'sts')
+    
+    def refresh() -> Dict[str, str]:
+        response = sts_client.assume_role(
+            RoleArn=role_arn,
+            RoleSessionName='sraverify-session'
+        )
+        credentials = response['Credentials']
+        expiration = credentials['Expiration']
+        return {
+            'access_key': credentials['AccessKeyId'],
+            'secret_key': credentials['SecretAccessKey'],
+            'token': credentials['SessionToken'],
+            'expiry_time': expiration.isoformat() if hasattr(expiration, 'isoformat') else str(expiration),
+        }
+    
+    # Create a new session with credentials that assume the role again when they are about to expire
+    botocore_session = botocore.session.Session()
+    botocore_session._credentials = RefreshableCredentials.create_from_metadata(
+        metadata=refresh(),
+        refresh_using=refresh,
+        method='sts-assume-role'
+    )
+    return boto3.Session(botocore_session=botocore_session, region_name=region)
+
+
+def role_arn_for_account(role: str, account_id: str, partition: str = 'aws') -> str:
+    """
+    Build the ARN of a role in another account.
+    
+    Args:
+        role: Role name (e.g. 'SRAMemberRole') or a role ARN whose account ID is replaced
+        account_id: AWS account ID the role lives in
+        partition: AWS partition used when role is a role name
+        
+    Returns:
+        Role ARN in the given account
+    """
+    if role.startswith('arn:'):
+        parts = role.split(':')
+        parts[4] = account_id
+        return ':'.join(parts)
+    return f"arn:{partition}:iam::{account_id}:role/{role}"
+
+
+class SessionPool:
+    """
+    Cache of assumed-role sessions shared by a multi-account scan.
+    
+    Each role is assumed once and its session is kept until it is released,
+    which the scan does when the role's account has been scanned. Sessions
+    refresh their credentials before they expire (see assume_role).
+    """
+    
+    def __init__(self, base_session: boto3.Session, region: Optional[str] = None):
+        """
+        Initialize session pool.
+        
+        Args:
+            base_session: AWS session used to assume roles
+            region: AWS region name for assumed-role sessions (defaults to the base session region)
+        """
+        self.base_session = base_session
+        self.region = region or base_session.region_name
+        self._sessions: Dict[str, boto3.Session] = {}
+        self._lock = threading.Lock()
+        # One lock per role, so assuming a role does not hold up the other accounts
+        self._role_locks: Dict[str, threading.Lock] = {}
+    
+    def get_session(self, role_arn: str) -> boto3.Session:
+        """
+        Get a session for a role, assuming it only if no session is cached.
+        
+        Args:
+            role_arn: ARN of IAM role to assume
+            
+        Returns:
+            AWS session using the role's credentials
+            
+        Raises:
+            Exception: If the role cannot be assumed
+        """
+        with self._lock:
+            role_lock = self._role_locks.setdefault(role_arn, threading.Lock())
+        with role_lock:
+            session = self._sessions.get(role_arn)
+            if session is not None:
+                return session
+            
+            logger.debug(f"Assuming role {role_arn}")
+            try:
+                session = assume_role(self.base_session, role_arn, region=self.region)
+            except Exception as e:
+                raise Exception(f"Failed to assume role {role_arn}: {str(e)}")
+            with self._lock:
+                self._sessions[role_arn] = session
+            return session
+    
+    def release(self, role_arn: str):
+        """
+        Drop the cached session of a role once its account has been scanned.
+        
+        Args:
+            role_arn: ARN of IAM role whose session is no longer needed
+        """
+        with self._lock:
+            self._sessions.pop(role_arn, None)
+            self._role_locks.pop(role_arn, None)
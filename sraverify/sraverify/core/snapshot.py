@@ -0,0 +1,197 @@
+"""
+Record and replay AWS API responses.
+
+A Snapshot in record mode stores the response of every call made through a
+pooled client in a SQLite file, keyed by account, region, service, operation
+and parameters. In replay mode it answers the same calls from the file
+before they are signed or sent, so checks can be evaluated again offline
+without credentials or network access.
+"""
+import json
+import os
+import sqlite3
+import threading
+import weakref
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.awsrequest import AWSResponse
+
+from sraverify.core.cache import decode_value, encode_value
+from sraverify.core.logging import logger
+
+# Snapshot modes
+RECORD = 'record'
+REPLAY = 'replay'
+
+# Error code returned for calls that are not in the snapshot during replay
+MISSING_RESPONSE_CODE = 'SnapshotResponseNotFound'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    account_id TEXT NOT NULL,
+    region TEXT NOT NULL,
+    service TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    response TEXT NOT NULL,
+    PRIMARY KEY (account_id, region, service, operation, params)
+)
+"""
+
+
+def _canonical(value: Any) -> Any:
+    """
+    Put the lists of scalars in encoded API parameters in sorted order.
+
+    Checks often build list parameters (e.g. account IDs) from sets, whose
+    order changes with the hash seed of the process, so the same call is
+    keyed the same way whatever order its list parameters were built in.
+    """
+    if isinstance(value, dict):
+        return {k: _canonical(v) for k, v in value.items()}
+    if isinstance(value, list):
+        items = [_canonical(v) for v in value]
+        if all(isinstance(v, (str, int, float, bool)) for v in items):
+            return sorted(items, key=lambda v: (type(v).__name__, v))
+        return items
+    return value
+
+
+class Snapshot:
+    """
+    SQLite store of API responses, attached to every pooled boto3 client.
+
+    Calls are keyed by the account of the session that made them. Sessions
+    are unlabelled (account '') unless label() assigns an account, which
+    SRAVerify does for the assumed-role session of every account in a
+    multi-account scan.
+    """
+
+    def __init__(self, path: str, mode: str):
+        """
+        Open a snapshot file.
+
+        Args:
+            path: SQLite file to record to (created if missing) or replay from
+            mode: RECORD or REPLAY
+
+        Raises:
+            ValueError: If mode is unknown
+            FileNotFoundError: If the file to replay does not exist
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Unknown snapshot mode {mode}")
+        self.path = path
+        self.mode = mode
+        # A mistyped replay path fails instead of creating an empty snapshot
+        if mode == REPLAY and not os.path.exists(path):
+            raise FileNotFoundError(f"Snapshot {path} does not exist")
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(_SCHEMA)
+        self._labels: "weakref.WeakKeyDictionary[boto3.Session, str]" = weakref.WeakKeyDictionary()
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+        self._lock = threading.Lock()
+
+    def label(self, session: boto3.Session, account_id: str):
+        """
+        Record calls made with a session under an account.
+
+        Args:
+            session: AWS session, before any client is created from it
+            account_id: AWS account ID the session belongs to
+        """
+        self._labels[session] = account_id
+
+    def account_of(self, session: boto3.Session) -> str:
+        """Get the account calls made with a session are keyed by ('' if unlabelled)."""
+        return self._labels.get(session, '')
+
+    @staticmethod
+    def _params_key(params: Dict[str, Any]) -> str:
+        return json.dumps(_canonical(encode_value(params)), sort_keys=True, separators=(',', ':'))
+
+    def attach(self, client: Any, session: boto3.Session, service_name: str, region_name: Optional[str]):
+        """
+        Record or replay every call made through a boto3 client.
+
+        Args:
+            client: boto3 client
+            session: AWS session the client was created from
+            service_name: AWS service name the client was created for
+            region_name: AWS region of the client
+        """
+        service_id = client.meta.service_model.service_id.hyphenize()
+        account_id = self.account_of(session)
+        region = region_name or ''
+
+        def capture_params(params: Dict[str, Any], context: Dict[str, Any], **kwargs):
+            # before-call and after-call only see the serialized request, so keep the API parameters
+            context['sraverify_snapshot_params'] = self._params_key(params)
+
+        def after_call(model: Any, context: Dict[str, Any], http_response=None, parsed=None, **kwargs):
+            params = context.get('sraverify_snapshot_params')
+            if params is None or http_response is None:
+                return
+            try:
+                response = json.dumps(encode_value(parsed))
+            except TypeError as e:
+                logger.debug(f"Not recording {service_name}.{model.name} response: {e}")
+                return
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (account_id, region, service_name, model.name, params, http_response.status_code, response)
+                )
+                self.recorded += 1
+
+        def before_call(model: Any, context: Dict[str, Any], **kwargs) -> Tuple[AWSResponse, Dict[str, Any]]:
+            params = context.get('sraverify_snapshot_params', self._params_key({}))
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT status, response FROM responses "
+                    "WHERE account_id = ? AND region = ? AND service = ? AND operation = ? AND params = ?",
+                    (account_id, region, service_name, model.name, params)
+                ).fetchone()
+                if row is None:
+                    self.missing += 1
+                else:
+                    self.replayed += 1
+            if row is None:
+                logger.debug(f"No snapshot response for {service_name}.{model.name} in {region or 'global'} "
+                             f"for account {account_id or 'default'}")
+                status = 400
+                parsed = {
+                    'Error': {'Code': MISSING_RESPONSE_CODE,
+                              'Message': f"{service_name}.{model.name} is not in snapshot {self.path}"},
+                    'ResponseMetadata': {'HTTPStatusCode': status, 'RetryAttempts': 0}
+                }
+            else:
+                status, parsed = row[0], decode_value(json.loads(row[1]))
+            return AWSResponse(f"https://{service_name}.snapshot", status, {}, None), parsed
+
+        client.meta.events.register(f'before-parameter-build.{service_id}', capture_params)
+        if self.mode == RECORD:
+            client.meta.events.register(f'after-call.{service_id}', after_call)
+        else:
+            # Registered last so API metrics handlers still see the call before it is answered
+            client.meta.events.register_last(f'before-call.{service_id}', before_call)
+
+    def close(self):
+        """Write recorded responses and close the file."""
+        with self._lock:
+            if self.mode == RECORD:
+                self._db.commit()
+                logger.info(f"Recorded {self.recorded} API responses to {self.path}")
+            elif self.missing:
+                logger.warning(f"{self.missing} API calls were not found in snapshot {self.path}")
+            self._db.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,267 @@
+"""
+Web ACL association index shared by WAF and Shield checks.
+
+Instead of calling GetWebACLForResource once per protected resource, the
+regional web ACLs are listed once per region and ListResourcesForWebACL is
+called once per web ACL and resource type. The resulting resource ARN to
+web ACL index is cached per account, so every check looking up an
+association in the region reuses it and the number of calls scales with
+the number of web ACLs instead of the number of resources. CloudFront
+distributions are indexed by ID from one paginated ListDistributions
+instead of a GetDistributionConfig call per distribution.
+
+An index that cannot be built (e.g. without wafv2:ListResourcesForWebACL
+permission) is recorded as failed for the rest of the account's scan, so
+every later lookup in the region goes straight to the per-resource call
+instead of trying to build the index again.
+"""
+from typing import Any, Callable, Dict, List, Optional
+
+from botocore.exceptions import ClientError
+
+from sraverify.core.clients import get_client
+from sraverify.core.logging import logger
+
+# Cache namespaces of the web ACLs and of the association indexes
+WEB_ACLS_NAMESPACE = 'wafv2.web_acls'
+ASSOCIATIONS_NAMESPACE = 'wafv2.web_acl_associations'
+DISTRIBUTIONS_NAMESPACE = 'cloudfront.distributions'
+DISTRIBUTION_WEB_ACLS_NAMESPACE = 'cloudfront.distribution_web_acls'
+# Error responses of indexes that could not be built, by region
+INDEX_ERRORS_NAMESPACE = 'wafv2.web_acl_index_errors'
+
+# CloudFront is global; its API is called in us-east-1
+CLOUDFRONT_REGION = 'us-east-1'
+# Key of the CloudFront distribution index in INDEX_ERRORS_NAMESPACE, apart from us-east-1's regional index
+CLOUDFRONT_REGION_KEY = 'cloudfront'
+
+# WAFv2 resource types of regional resources, by the service in their ARN
+RESOURCE_TYPES = {
+    'elasticloadbalancing': 'APPLICATION_LOAD_BALANCER',
+    'apigateway': 'API_GATEWAY',
+    'appsync': 'APPSYNC',
+    'cognito-idp': 'COGNITO_USER_POOL',
+    'apprunner': 'APP_RUNNER_SERVICE',
+    'ec2': 'VERIFIED_ACCESS_INSTANCE',
+    'amplify': 'AMPLIFY',
+}
+
+
+def resource_type_of(resource_arn: str) -> Optional[str]:
+    """
+    Get the WAFv2 resource type of a regional resource.
+
+    Args:
+        resource_arn: ARN of the resource
+
+    Returns:
+        WAFv2 resource type (e.g. 'APPLICATION_LOAD_BALANCER'), or None if
+        the resource cannot be associated with a regional web ACL
+    """
+    parts = resource_arn.split(':')
+    return RESOURCE_TYPES.get(parts[2]) if len(parts) > 2 else None
+
+
+def list_web_acls(wafv2_client: Any, scope: str = 'REGIONAL') -> List[Dict[str, Any]]:
+    """
+    List every web ACL of a scope, following NextMarker.
+
+    Args:
+        wafv2_client: boto3 WAFv2 client
+        scope: 'REGIONAL' or 'CLOUDFRONT'
+
+    Returns:
+        List of WebACLSummary dictionaries
+
+    Raises:
+        botocore.exceptions.ClientError: If the web ACLs cannot be listed
+    """
+    web_acls = []
+    params = {'Scope': scope}
+    while True:
+        response = wafv2_client.list_web_acls(**params)
+        web_acls.extend(response.get('WebACLs', []))
+        if not response.get('NextMarker') or not response.get('WebACLs'):
+            return web_acls
+        params['NextMarker'] = response['NextMarker']
+
+
+def list_distributions(cloudfront_client: Any) -> List[Dict[str, Any]]:
+    """
+    List every CloudFront distribution.
+
+    Args:
+        cloudfront_client: boto3 CloudFront client
+
+    Returns:
+        List of DistributionSummary dictionaries
+
+    Raises:
+        botocore.exceptions.ClientError: If the distributions cannot be listed
+    """
+    distributions = []
+    for page in cloudfront_client.get_paginator('list_distributions').paginate():
+        distributions.extend(page.get('DistributionList', {}).get('Items', []))
+    return distributions
+
+
+def get_distributions(check: Any) -> Dict[str, Any]:
+    """
+    Get all CloudFront distributions, listed once per account and shared by all checks.
+
+    Args:
+        check: Security check whose session and cache are used
+
+    Returns:
+        Dictionary shaped like a single ListDistributions response, with all
+        distributions in DistributionList.Items, or error information
+    """
+    def fetch() -> Dict[str, Any]:
+        try:
+            distributions = list_distributions(get_client(check.session, 'cloudfront', CLOUDFRONT_REGION))
+        except ClientError as e:
+            logger.error(f"Error listing CloudFront distributions: {e}")
+            return {'Error': {'Code': e.response.get('Error', {}).get('Code', ''), 'Message': str(e)}}
+        return {'DistributionList': {'Items': distributions, 'Quantity': len(distributions)}}
+
+    return check.cached(DISTRIBUTIONS_NAMESPACE, CLOUDFRONT_REGION, fetch)
+
+
+def get_distribution_web_acls(check: Any) -> Dict[str, Any]:
+    """
+    Get the web ACL ID of every CloudFront distribution.
+
+    Args:
+        check: Security check whose session and cache are used
+
+    Returns:
+        Dictionary with 'WebACLIds' mapping distribution IDs to web ACL IDs
+        ('' if none is associated), or error information
+    """
+    def build() -> Dict[str, Any]:
+        errors = check.cache(INDEX_ERRORS_NAMESPACE)
+        if CLOUDFRONT_REGION_KEY in errors:
+            return errors[CLOUDFRONT_REGION_KEY]
+        distributions = get_distributions(check)
+        if 'Error' in distributions:
+            errors[CLOUDFRONT_REGION_KEY] = distributions
+            return distributions
+        items = distributions['DistributionList']['Items']
+        return {'WebACLIds': {distribution['Id']: distribution.get('WebACLId', '') for distribution in items}}
+
+    return check.cached(DISTRIBUTION_WEB_ACLS_NAMESPACE, CLOUDFRONT_REGION, build)
+
+
+def _distribution_web_acl(check: Any, resource_arn: str) -> Dict[str, Any]:
+    """Look up the web ACL of a CloudFront distribution (arn:aws:cloudfront::account:distribution/ID)."""
+    web_acl_ids = get_distribution_web_acls(check)
+    if 'Error' in web_acl_ids:
+        return web_acl_ids
+    distribution_id = resource_arn.split('/')[-1]
+    if distribution_id not in web_acl_ids['WebACLIds']:
+        return {'Error': {'Code': 'NoSuchDistribution', 'Message': f"Distribution {distribution_id} not found"}}
+    web_acl_id = web_acl_ids['WebACLIds'][distribution_id]
+    return {'WebACL': {'Id': web_acl_id, 'Name': f"WebACL-{web_acl_id}"} if web_acl_id else None}
+
+
+def get_web_acls(check: Any, region: str, scope: str = 'REGIONAL') -> Dict[str, Any]:
+    """
+    Get all web ACLs of a scope, listed once per account and shared by all checks.
+
+    Args:
+        check: Security check whose session and cache are used
+        region: AWS region name ('us-east-1' for the CLOUDFRONT scope)
+        scope: 'REGIONAL' or 'CLOUDFRONT'
+
+    Returns:
+        Dictionary with 'WebACLs', a list of WebACLSummary dictionaries, or error information
+    """
+    def fetch() -> Dict[str, Any]:
+        try:
+            return {'WebACLs': list_web_acls(get_client(check.session, 'wafv2', region), scope)}
+        except ClientError as e:
+            logger.error(f"Error listing Web ACLs in {region}: {e}")
+            return {'Error': {'Code': e.response.get('Error', {}).get('Code', ''), 'Message': str(e)}}
+
+    return check.cached(WEB_ACLS_NAMESPACE, (region, scope), fetch)
+
+
+def get_associations(check: Any, region: str, resource_type: str) -> Dict[str, Any]:
+    """
+    Get the web ACL associated with each resource of a type in a region.
+
+    The index is built once, on first use, and cached for the check's
+    account, so it is shared by all WAF and Shield checks.
+
+    Args:
+        check: Security check whose session and cache are used
+        region: AWS region name
+        resource_type: WAFv2 resource type (e.g. 'APPLICATION_LOAD_BALANCER')
+
+    Returns:
+        Dictionary with 'Associations' mapping resource ARNs to WebACLSummary
+        dictionaries, or error information
+    """
+    def build() -> Dict[str, Any]:
+        # Indexes of a region are built one at a time, so a failure is only met once per region
+        with check.context.lock((INDEX_ERRORS_NAMESPACE, region)):
+            return _build_associations(check, region, resource_type)
+
+    return check.cached(ASSOCIATIONS_NAMESPACE, (region, resource_type), build)
+
+
+def _build_associations(check: Any, region: str, resource_type: str) -> Dict[str, Any]:
+    """List the resources of a type associated with each regional web ACL."""
+    errors = check.cache(INDEX_ERRORS_NAMESPACE)
+    if region in errors:
+        return errors[region]
+    web_acls = get_web_acls(check, region)
+    if 'Error' in web_acls:
+        errors[region] = web_acls
+        return web_acls
+    wafv2_client = get_client(check.session, 'wafv2', region)
+    associations = {}
+    try:
+        for web_acl in web_acls['WebACLs']:
+            response = wafv2_client.list_resources_for_web_acl(WebACLArn=web_acl['ARN'], ResourceType=resource_type)
+            for resource_arn in response.get('ResourceArns', []):
+                associations[resource_arn] = web_acl
+    except ClientError as e:
+        logger.debug(f"Error listing {resource_type} resources for web ACLs in {region}, "
+                     f"looking up web ACLs per resource instead: {e}")
+        errors[region] = {'Error': {'Code': e.response.get('Error', {}).get('Code', ''), 'Message': str(e)}}
+        return errors[region]
+    logger.debug(f"Indexed {len(associations)} {resource_type} web ACL associations in {region}")
+    return {'Associations': associations}
+
+
+def web_acl_for_resource(check: Any, region: str, resource_arn: str,
+                         fallback: Callable[[str], Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Look up the web ACL associated with a resource in the association index.
+
+    CloudFront distributions are looked up in the distribution index.
+    Resources of other types, and indexes that cannot be built (e.g.
+    without wafv2:ListResourcesForWebACL permission), are looked up with the
+    per-resource fallback instead.
+
+    Args:
+        check: Security check whose session and cache are used
+        region: AWS region of the resource
+        resource_arn: ARN of the resource
+        fallback: GetWebACLForResource call of the service client, taking the resource ARN
+
+    Returns:
+        Dictionary with 'WebACL' (None if no web ACL is associated), or the
+        fallback's response
+    """
+    if resource_arn.split(':')[2:3] == ['cloudfront']:
+        web_acl = _distribution_web_acl(check, resource_arn)
+        return fallback(resource_arn) if 'Error' in web_acl else web_acl
+    resource_type = resource_type_of(resource_arn)
+    if resource_type is None:
+        return fallback(resource_arn)
+    associations = get_associations(check, region, resource_type)
+    if 'Error' in associations:
+        return fallback(resource_arn)
+    return {'WebACL': associations['Associations'].get(resource_arn)}
@@ -7,60 +7,51 @@ as a library, while the CLI functions use this class to provide the
 command-line interface.
 """
 import argparse
+import contextlib
 import datetime
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from boto3 import Session
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 
-from sraverify.core.session import get_session
+from sraverify.core.session import get_session, role_arn_for_account, SessionPool
+from sraverify.core.cache import CacheManager, DiskCache, DEFAULT_CACHE_TTL
+from sraverify.core.clients import client_pool
+from sraverify.core.context import ScanContext
+from sraverify.core.finding import Finding
 from sraverify.core.logging import logger, configure_logging
-from sraverify.utils.outputs import write_csv_output
+from sraverify.core.metrics import MetricsCollector, check_scope, metrics
+from sraverify.core.planner import execute_plan, plan_prefetch
+from sraverify.core.registry import registry, SEVERITY_LEVELS
+from sraverify.core.snapshot import RECORD, REPLAY, Snapshot
+from sraverify.utils.checkpoint import Checkpoint
+from sraverify.utils.merge import DEFAULT_INPUT_PATTERN, find_input_files, merge_findings
+from sraverify.utils.outputs import FindingSink, OUTPUT_FORMATS, open_sink
 from sraverify.utils.progress import ScanProgress
 from sraverify.utils.banner import print_banner
-from sraverify.services.guardduty import CHECKS as guardduty_checks
-from sraverify.services.cloudtrail import CHECKS as cloudtrail_checks
-from sraverify.services.accessanalyzer import CHECKS as accessanalyzer_checks
-from sraverify.services.config import CHECKS as config_checks
-from sraverify.services.securityhub import CHECKS as securityhub_checks
-from sraverify.services.s3 import CHECKS as s3_checks
-from sraverify.services.inspector import CHECKS as inspector_checks
-from sraverify.services.ec2 import CHECKS as ec2_checks
-from sraverify.services.macie import CHECKS as macie_checks
-from sraverify.services.shield import CHECKS as shield_checks
-from sraverify.services.waf import CHECKS as waf_checks
-from sraverify.services.account import CHECKS as account_checks
-from sraverify.services.auditmanager import CHECKS as auditmanager_checks
-from sraverify.services.firewallmanager import CHECKS as firewallmanager_checks
-from sraverify.services.securitylake import CHECKS as securitylake_checks
-from sraverify.services.securityincidentresponse import CHECKS as securityincidentresponse_checks
-from sraverify.services.organizations import CHECKS as organizations_checks
-
-# Collect all checks from different services
-ALL_CHECKS = {
-    **guardduty_checks,
-    **cloudtrail_checks,
-    **accessanalyzer_checks,
-    **config_checks,
-    **securityhub_checks,
-    **s3_checks,
-    **inspector_checks,
-    **ec2_checks,
-    **macie_checks,
-    **shield_checks,
-    **waf_checks,
-    **account_checks,
-    **auditmanager_checks,
-    **firewallmanager_checks,
-    **securitylake_checks,
-    **securityincidentresponse_checks,
-    **organizations_checks
-}
+from sraverify.services.organizations.client import OrganizationsClient
+
+# All checks, keyed by check ID in execution order; check modules are imported on first use
+ALL_CHECKS = registry
+
+# Default number of checks executed concurrently by run_checks
+DEFAULT_MAX_WORKERS = 10
+
+# Default number of accounts scanned concurrently by scan_accounts
+DEFAULT_PARALLEL_ACCOUNTS = 5
+
+# Services listed in the end-of-run API call summary
+METRICS_SUMMARY_LIMIT = 10
 
 class SRAVerify:
     """Main class for SRA Verify functionality."""
 
     def __init__(self, profile: Optional[str] = None, role_arn: Optional[str] = None,
                  regions: Optional[List[str]] = None, session: Optional[Session] = None,
-                 debug: bool = False):
+                 debug: bool = False, cache: Optional[CacheManager] = None,
+                 snapshot: Optional[Snapshot] = None):
         """
         Initialize SRA Verify.
 
@@ -70,11 +61,24 @@ class SRAVerify:
             regions: List of AWS regions to check
             session: Existing AWS session to use (if provided)
             debug: Enable debug logging
+            cache: Cache to use for API responses, e.g. one backed by a DiskCache
+                   (default: a new in-memory cache)
+            snapshot: Snapshot to record every API response to, or to replay responses from
+                      instead of calling AWS
         """
         configure_logging(debug)
         self.regions = regions
+        # Attached before the session is created, so assuming a role is recorded or replayed too
+        self.snapshot = snapshot
+        if snapshot is not None:
+            client_pool.use_snapshot(snapshot)
         self.session = session if session else get_session(profile=profile, role_arn=role_arn)
+        # API responses cached for the duration of a scan, keyed by account and region
+        self.cache = cache if cache is not None else CacheManager()
+        # Account facts are resolved once and shared by every check in the scan
+        self.context = ScanContext(self.session, regions, cache=self.cache)
         self.progress = None
+        self._progress_lock = threading.Lock()
 
     def get_available_checks(self, account_type: str = 'all') -> Dict[str, Dict[str, str]]:
         """
@@ -87,16 +91,14 @@ class SRAVerify:
             Dictionary mapping check IDs to check information
         """
         checks = {}
-        for check_id, check_class in sorted(ALL_CHECKS.items()):
-            check = check_class()
-            if account_type == 'all' or check.account_type == account_type:
-                checks[check_id] = {
-                    'name': check.check_name,
-                    'service': check.service,
-                    'account_type': check.account_type,
-                    'description': check.description,
-                    'severity': check.severity
-                }
+        for spec in sorted(ALL_CHECKS.specs(account_type), key=lambda spec: spec.check_id):
+            checks[spec.check_id] = {
+                'name': spec.name,
+                'service': spec.service,
+                'account_type': spec.account_type,
+                'description': spec.description,
+                'severity': spec.severity
+            }
         return checks
 
     def get_available_services(self) -> List[str]:
@@ -106,39 +108,281 @@ class SRAVerify:
         Returns:
             List of service names
         """
-        services = set()
-        for check_class in ALL_CHECKS.values():
-            check = check_class()
-            services.add(check.service)
-        return sorted(list(services))
+        return ALL_CHECKS.services()
 
-    def run_checks(self, account_type: str = 'all', service: Optional[str] = None,
+    def run_checks(self, account_type: str = 'all', service: Optional[Union[str, List[str]]] = None,
                   check_id: Optional[str] = None, audit_accounts: Optional[List[str]] = None,
                   log_archive_accounts: Optional[List[str]] = None,
-                  show_progress: bool = False) -> List[Dict[str, Any]]:
+                  show_progress: bool = False,
+                  max_workers: int = DEFAULT_MAX_WORKERS,
+                  sink: Optional[FindingSink] = None,
+                  min_severity: Optional[str] = None,
+                  exclude: Optional[List[str]] = None,
+                  checkpoint: Optional[Checkpoint] = None) -> List[Dict[str, Any]]:
         """
         Run security checks.
 
+        Checks are executed concurrently on a bounded worker pool. Findings are
+        returned in the same order as a sequential run, grouped by service.
+        With a sink, findings are written to it as checks complete, in the same
+        order, instead of being collected in memory.
+
         Args:
             account_type: Type of accounts to check ('application', 'audit', 'log-archive', 'management', or 'all')
-            service: Run checks for a specific service
+            service: Run checks for a specific service, or a list of services
             check_id: Run a specific check
             audit_accounts: List of AWS accounts used for Audit/Security Tooling
             log_archive_accounts: List of AWS accounts used for Logging
             show_progress: Whether to show progress bar
+            max_workers: Maximum number of checks to run concurrently (1 runs checks sequentially)
+            sink: Output to stream findings to (see sraverify.utils.outputs)
+            min_severity: Only run checks at or above this severity ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
+            exclude: Check IDs or service names to skip
+            checkpoint: Checkpoint to record completed checks to; checks it already holds are not
+                        run again and their recorded findings are returned instead
 
         Returns:
-            List of findings
+            List of finding dictionaries, or an empty list if a sink was given
         """
-        # Start with all checks or filtered by account type
+        ordered_checks = self._select_checks(account_type, service, check_id, min_severity, exclude)
+        if not ordered_checks:
+            return []
+
+        # Set up progress tracking if requested
+        if show_progress:
+            self.progress = ScanProgress(len(ordered_checks))
+
+        # Fetched data is cleared, so nothing counts as prefetched any more
+        self.cache.clear()
+        self.context.reset()
+        all_findings = self._execute_checks(
+            ordered_checks, self.session, self.context,
+            audit_accounts, log_archive_accounts, max_workers, sink, checkpoint
+        )
+        self._log_cache_stats()
+
+        if self.progress:
+            self.progress.finish()
+
+        return all_findings
+
+    def scan_accounts(self, account_ids: List[str], role: str, account_type: str = 'all',
+                      service: Optional[Union[str, List[str]]] = None, check_id: Optional[str] = None,
+                      audit_accounts: Optional[List[str]] = None,
+                      log_archive_accounts: Optional[List[str]] = None,
+                      show_progress: bool = False,
+                      max_workers: int = DEFAULT_MAX_WORKERS,
+                      parallel_accounts: int = DEFAULT_PARALLEL_ACCOUNTS,
+                      sink: Optional[FindingSink] = None,
+                      min_severity: Optional[str] = None,
+                      exclude: Optional[List[str]] = None,
+                      checkpoint: Optional[Checkpoint] = None) -> List[Dict[str, Any]]:
+        """
+        Run security checks against several accounts and merge the findings.
+
+        The role is assumed in each account from this instance's session. With
+        account_type 'all', each account gets the checks for the roles it plays:
+        application checks everywhere, plus management, audit and log-archive
+        checks in the management, audit and log archive accounts.
+
+        Args:
+            account_ids: AWS account IDs to scan
+            role: Role name or role ARN to assume in each account
+            account_type: Type of checks to run in every account, or 'all' to pick per account
+            service: Run checks for a specific service, or a list of services
+            check_id: Run a specific check
+            audit_accounts: List of AWS accounts used for Audit/Security Tooling
+            log_archive_accounts: List of AWS accounts used for Logging
+            show_progress: Whether to show progress bar
+            max_workers: Maximum number of checks to run concurrently per account
+            parallel_accounts: Maximum number of accounts to scan concurrently
+            sink: Output to stream findings to as checks complete; each account's findings
+                  keep their order, but accounts scanned concurrently are interleaved
+            min_severity: Only run checks at or above this severity ('LOW', 'MEDIUM', 'HIGH', 'CRITICAL')
+            exclude: Check IDs or service names to skip
+            checkpoint: Checkpoint to record completed checks to; checks it already holds are not
+                        run again, and accounts whose checks have all completed are not accessed
+
+        Returns:
+            List of finding dictionaries for all accounts in account order, or an empty list if a sink was given
+        """
+        selected_checks = self._select_checks(account_type, service, check_id, min_severity, exclude)
+        if not selected_checks:
+            return []
+        check_account_types = {
+            check_id: ALL_CHECKS.spec(check_id).account_type
+            for _, check_id, _ in selected_checks
+        }
+
+        management_account_id = None
         if account_type == 'all':
-            checks_to_run = ALL_CHECKS.copy()
-        else:
-            logger.debug(f"Filtering checks by account type: {account_type}")
-            checks_to_run = {
-                check_id: check_class for check_id, check_class in ALL_CHECKS.items()
-                if check_class().account_type == account_type
+            try:
+                management_account_id = self.context.management_account_id
+            except Exception as e:
+                logger.warning(f"Could not determine management account, skipping management checks: {e}")
+
+        # Work out which checks apply to each account before starting
+        account_plans = []
+        for account_id in account_ids:
+            if account_type == 'all':
+                account_types = {'application'}
+                if account_id == management_account_id:
+                    account_types.add('management')
+                if audit_accounts and account_id in audit_accounts:
+                    account_types.add('audit')
+                if log_archive_accounts and account_id in log_archive_accounts:
+                    account_types.add('log-archive')
+                account_checks = [
+                    entry for entry in selected_checks
+                    if check_account_types[entry[1]] in account_types
+                ]
+            else:
+                account_checks = selected_checks
+            if account_checks:
+                account_plans.append((account_id, account_checks))
+
+        total_checks = sum(len(account_checks) for _, account_checks in account_plans)
+        if show_progress and total_checks:
+            self.progress = ScanProgress(total_checks)
+
+        try:
+            partition = self.session.get_partition_for_region(self.session.region_name or 'us-east-1')
+        except Exception:
+            partition = 'aws'
+        session_pool = SessionPool(self.session)
+        self.cache.clear()
+
+        # Scan accounts concurrently, keeping results in account order
+        results = [[] for _ in account_plans]
+        workers = max(1, min(parallel_accounts or 1, len(account_plans)))
+        logger.debug(f"Scanning {len(account_plans)} accounts with {workers} workers")
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sraverify-account") as executor:
+            futures = {
+                executor.submit(
+                    self._scan_account, account_id, account_checks, check_account_types,
+                    session_pool.get_session, role_arn_for_account(role, account_id, partition),
+                    audit_accounts, log_archive_accounts, max_workers, sink, checkpoint
+                ): index
+                for index, (account_id, account_checks) in enumerate(account_plans)
             }
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                session_pool.release(role_arn_for_account(role, account_plans[index][0], partition))
+
+        all_findings = []
+        for findings in results:
+            all_findings.extend(findings)
+        self._log_cache_stats()
+
+        if self.progress:
+            self.progress.finish()
+
+        return all_findings
+
+    def _scan_account(self, account_id: str, account_checks: List[Tuple[str, str, Any]],
+                      check_account_types: Dict[str, str], get_session, role_arn: str,
+                      audit_accounts: Optional[List[str]] = None,
+                      log_archive_accounts: Optional[List[str]] = None,
+                      max_workers: int = DEFAULT_MAX_WORKERS,
+                      sink: Optional[FindingSink] = None,
+                      checkpoint: Optional[Checkpoint] = None) -> List[Dict[str, Any]]:
+        """
+        Assume the scan role in one account and run its checks.
+
+        Args:
+            account_id: AWS account ID to scan
+            account_checks: List of (service name, check ID, check class) tuples for the account
+            check_account_types: Mapping of check ID to the check's account type
+            get_session: Callable returning a session for a role ARN
+            role_arn: ARN of the role to assume in the account
+            audit_accounts: List of AWS accounts used for Audit/Security Tooling
+            log_archive_accounts: List of AWS accounts used for Logging
+            max_workers: Maximum number of checks to run concurrently
+            sink: Output to stream findings to
+            checkpoint: Checkpoint to record completed checks to and reuse findings from
+
+        Returns:
+            List of findings for the account, or an ERROR finding per check if the role could not be
+            assumed; empty if a sink was given
+        """
+        if checkpoint is not None and checkpoint.is_complete(account_id, [c for _, c, _ in account_checks]):
+            # Nothing left to run, so do not assume the role at all
+            logger.debug(f"Account {account_id} already completed in checkpoint")
+            findings = []
+            for service_name, check_id, _ in account_checks:
+                findings.extend(checkpoint.completed(account_id, check_id))
+                self._advance_progress(service_name)
+            if sink is not None:
+                sink.write(findings)
+                return []
+            return findings
+
+        logger.debug(f"Scanning account {account_id} with {len(account_checks)} checks")
+        try:
+            session = get_session(role_arn)
+        except Exception as e:
+            logger.error(f"Skipping account {account_id}: {e}")
+            findings = []
+            for service_name, check_id, check_class in account_checks:
+                findings.append(self._error_finding(
+                    check_id, service_name, check_account_types[check_id], e, account_id
+                ))
+                self._advance_progress(service_name)
+            if sink is not None:
+                sink.write(findings)
+                return []
+            return findings
+
+        if self.snapshot is not None:
+            self.snapshot.label(session, account_id)
+        context = ScanContext(session, self.regions, cache=self.cache)
+        try:
+            return self._execute_checks(
+                account_checks, session, context,
+                audit_accounts, log_archive_accounts, max_workers, sink, checkpoint
+            )
+        finally:
+            # The account's clients are not used again, so free them for the accounts still to scan
+            client_pool.release(session)
+
+    def list_organization_accounts(self) -> List[str]:
+        """
+        List the active accounts in the organization.
+
+        Returns:
+            List of AWS account IDs
+
+        Raises:
+            Exception: If the organization accounts cannot be listed
+        """
+        response = OrganizationsClient(session=self.session).list_accounts()
+        if "Error" in response:
+            raise Exception(f"Failed to list organization accounts: {response['Error'].get('Message')}")
+        return [
+            account['Id'] for account in response.get('Accounts', [])
+            if account.get('Status') == 'ACTIVE'
+        ]
+
+    def _select_checks(self, account_type: str = 'all', service: Optional[Union[str, List[str]]] = None,
+                       check_id: Optional[str] = None, min_severity: Optional[str] = None,
+                       exclude: Optional[List[str]] = None) -> List[Tuple[str, str, Any]]:
+        """
+        Select the checks to run, grouped by service.
+
+        Args:
+            account_type: Type of accounts to check ('application', 'audit', 'log-archive', 'management', or 'all')
+            service: Run checks for a specific service, or a list of services
+            check_id: Run a specific check
+            min_severity: Only run checks at or above this severity
+            exclude: Check IDs or service names to skip
+
+        Returns:
+            List of (service name, check ID, check class) tuples in execution order
+        """
+        # Filtering uses the registry's metadata indexes, so only the chosen check modules are imported
+        if account_type != 'all':
+            logger.debug(f"Filtering checks by account type: {account_type}")
 
         # Filter by specific check if provided
         if check_id:
@@ -147,109 +391,369 @@ class SRAVerify:
                 logger.error(f"Check {check_id} not found")
                 return []
 
-            check = ALL_CHECKS[check_id]()
-            if account_type != 'all' and check.account_type != account_type:
-                logger.error(f"Check {check_id} is for {check.account_type} accounts, but account_type is set to {account_type}")
+            spec = ALL_CHECKS.spec(check_id)
+            if account_type != 'all' and spec.account_type != account_type:
+                logger.error(f"Check {check_id} is for {spec.account_type} accounts, but account_type is set to {account_type}")
                 return []
 
-            checks_to_run = {check_id: ALL_CHECKS[check_id]}
-
         # Filter by service if provided
-        if service:
-            logger.debug(f"Filtering checks by service: {service}")
-            service_checks = {}
-            for check_id, check_class in checks_to_run.items():
-                check = check_class()
-                if check.service.lower() == service.lower():
-                    service_checks[check_id] = check_class
-
-            if not service_checks:
-                logger.error(f"No {account_type} checks found for service {service}")
-                return []
+        services = [service] if isinstance(service, str) else service
+        if services:
+            logger.debug(f"Filtering checks by service: {', '.join(services)}")
+            known_services = {name.lower() for name in ALL_CHECKS.services()}
+            for name in services:
+                if name.lower() not in known_services:
+                    logger.warning(f"Unknown service {name}")
+        if min_severity:
+            logger.debug(f"Filtering checks by minimum severity: {min_severity}")
+        if exclude:
+            logger.debug(f"Excluding checks: {', '.join(exclude)}")
 
-            checks_to_run = service_checks
+        specs = ALL_CHECKS.select(
+            account_type,
+            services=services or None,
+            min_severity=min_severity,
+            exclude=exclude,
+            check_ids=[check_id] if check_id else None
+        )
 
         # Check if there are any checks after filtering
-        if not checks_to_run:
-            logger.error("No checks found with selected filters")
+        if not specs:
+            if services:
+                logger.error(f"No {account_type} checks found for service {', '.join(services)}")
+            else:
+                logger.error("No checks found with selected filters")
             return []
 
-        all_findings = []
-
         # Group checks by service for better organization
         service_checks = {}
-        for check_id, check_class in checks_to_run.items():
-            check = check_class()
-            if check.service not in service_checks:
-                service_checks[check.service] = []
-            service_checks[check.service].append((check_id, check_class))
+        for spec in specs:
+            service_checks.setdefault(spec.service, []).append(spec.check_id)
 
-        # Set up progress tracking if requested
-        if show_progress:
-            self.progress = ScanProgress(len(checks_to_run))
+        # Flatten the service grouping into a stable execution order
+        ordered_checks = []
+        for service_name, check_ids in service_checks.items():
+            logger.debug(f"Selected {len(check_ids)} checks for service {service_name}")
+            for selected_id in check_ids:
+                ordered_checks.append((service_name, selected_id, ALL_CHECKS[selected_id]))
+        return ordered_checks
+
+    def _execute_checks(self, ordered_checks: List[Tuple[str, str, Any]], session: Session,
+                        context: ScanContext, audit_accounts: Optional[List[str]] = None,
+                        log_archive_accounts: Optional[List[str]] = None,
+                        max_workers: int = DEFAULT_MAX_WORKERS,
+                        sink: Optional[FindingSink] = None,
+                        checkpoint: Optional[Checkpoint] = None) -> List[Dict[str, Any]]:
+        """
+        Execute checks against one account on a bounded worker pool.
+
+        Args:
+            ordered_checks: List of (service name, check ID, check class) tuples
+            session: AWS session for the account
+            context: Scan context for the account
+            audit_accounts: List of AWS accounts used for Audit/Security Tooling
+            log_archive_accounts: List of AWS accounts used for Logging
+            max_workers: Maximum number of checks to run concurrently (1 runs checks sequentially)
+            sink: Output to write findings to as soon as every earlier check has been written
+            checkpoint: Checkpoint to record completed checks to and reuse findings from
+
+        Returns:
+            List of finding dictionaries in the order of ordered_checks, or an empty list if a sink was given
+        """
+        results = [None] * len(ordered_checks)
+
+        # Reuse the findings of checks that completed in an earlier, interrupted run
+        account_id = None
+        if checkpoint is not None:
+            try:
+                account_id = context.account_id
+            except Exception as e:
+                logger.warning(f"Could not determine account ID, not using checkpoint: {e}")
+                checkpoint = None
+        if checkpoint is not None:
+            for index, (service_name, check_id, _) in enumerate(ordered_checks):
+                results[index] = checkpoint.completed(account_id, check_id)
+                if results[index] is not None:
+                    self._advance_progress(service_name)
+        pending = [index for index, findings in enumerate(results) if findings is None]
+        if checkpoint is not None and len(pending) < len(ordered_checks):
+            logger.debug(f"Skipping {len(ordered_checks) - len(pending)} checks completed in checkpoint")
 
-        # Run checks by service
-        for service_name, checks in service_checks.items():
+        next_to_write = 0
+
+        def write_completed():
+            # Write completed checks in order, releasing them once written
+            nonlocal next_to_write
+            while next_to_write < len(results) and results[next_to_write] is not None:
+                sink.write(results[next_to_write])
+                results[next_to_write] = []
+                next_to_write += 1
+
+        if sink is not None:
+            write_completed()
+
+        if pending:
+            pending_checks = [ordered_checks[index] for index in pending]
+
+            # Fetch the data the checks declare once, concurrently, before any check runs
+            self._prefetch(pending_checks, session, context, audit_accounts, log_archive_accounts, max_workers)
+
+            # Run checks on a bounded worker pool, keeping results in submission order
+            workers = max(1, min(max_workers or 1, len(pending)))
+            logger.debug(f"Running {len(pending)} checks with {workers} workers")
             if self.progress:
-                self.progress.update(service_name)
-            logger.debug(f"Running {len(checks)} checks for service {service_name}")
+                with self._progress_lock:
+                    self.progress.update(pending_checks[0][0])
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sraverify-check") as executor:
+                futures = {
+                    executor.submit(
+                        self._run_check, check_id, check_class, service_name,
+                        audit_accounts, log_archive_accounts, session, context
+                    ): index
+                    for index, (service_name, check_id, check_class) in zip(pending, pending_checks)
+                }
+                for future in as_completed(futures):
+                    index = futures[future]
+                    results[index] = future.result()
+                    self._advance_progress(ordered_checks[index][0])
+                    if checkpoint is not None:
+                        checkpoint.record(account_id, ordered_checks[index][1], results[index])
+
+                    if sink is not None:
+                        write_completed()
+
+        # Findings leave the scan as plain dictionaries, so callers can use json.dumps and isinstance(f, dict)
+        all_findings = []
+        for findings in results:
+            all_findings.extend(finding.to_dict() if isinstance(finding, Finding) else finding
+                                for finding in findings)
+        return all_findings
+
+    def _create_check(self, check_class, audit_accounts: Optional[List[str]] = None,
+                      log_archive_accounts: Optional[List[str]] = None,
+                      session: Optional[Session] = None,
+                      context: Optional[ScanContext] = None):
+        """
+        Instantiate and initialize a check.
+
+        Args:
+            check_class: Check class to instantiate
+            audit_accounts: List of AWS accounts used for Audit/Security Tooling
+            log_archive_accounts: List of AWS accounts used for Logging
+            session: AWS session to run the check with (defaults to this instance's session)
+            context: Scan context to share with the check (defaults to this instance's context)
+
+        Returns:
+            Initialized check
+        """
+        check = check_class()
+        check.initialize(session or self.session, regions=self.regions,
+                         context=context or self.context)
+
+        # Pass audit and log archive accounts to the check if it needs them
+        if audit_accounts:
+            check._audit_accounts = audit_accounts
+        if log_archive_accounts:
+            check._log_archive_accounts = log_archive_accounts
+        return check
+
+    def _prefetch(self, ordered_checks: List[Tuple[str, str, Any]], session: Session,
+                  context: ScanContext, audit_accounts: Optional[List[str]] = None,
+                  log_archive_accounts: Optional[List[str]] = None,
+                  max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Fetch the data required by a set of checks with the fewest unique calls.
 
-            for check_id, check_class in checks:
-                logger.debug(f"Initializing check {check_id}")
-                check = check_class()
-                check.initialize(self.session, regions=self.regions)
+        Failures are only logged; each check fetches whatever is missing itself.
 
-                # Pass audit and log archive accounts to the check if it needs them
-                if audit_accounts:
-                    check._audit_accounts = audit_accounts
-                if log_archive_accounts:
-                    check._log_archive_accounts = log_archive_accounts
+        Args:
+            ordered_checks: List of (service name, check ID, check class) tuples
+            session: AWS session for the account
+            context: Scan context for the account
+            audit_accounts: List of AWS accounts used for Audit/Security Tooling
+            log_archive_accounts: List of AWS accounts used for Logging
+            max_workers: Maximum number of concurrent calls
+        """
+        plan = plan_prefetch((service_name, check_class) for service_name, _, check_class in ordered_checks)
+        if not len(plan):
+            return
+        try:
+            owners = {
+                owner: self._create_check(owner, audit_accounts, log_archive_accounts, session, context)
+                for owner in plan.owners()
+            }
+            execute_plan(plan, owners, context.regions, context, max_workers)
+        except Exception as e:
+            logger.debug(f"Prefetch failed, checks will fetch their own data: {e}")
+
+    def _run_check(self, check_id: str, check_class, service_name: str,
+                   audit_accounts: Optional[List[str]] = None,
+                   log_archive_accounts: Optional[List[str]] = None,
+                   session: Optional[Session] = None,
+                   context: Optional[ScanContext] = None) -> List[Dict[str, Any]]:
+        """
+        Initialize and execute a single check.
+
+        Args:
+            check_id: ID of the check to run
+            check_class: Check class to instantiate
+            service_name: Service the check belongs to
+            audit_accounts: List of AWS accounts used for Audit/Security Tooling
+            log_archive_accounts: List of AWS accounts used for Logging
+            session: AWS session to run the check with (defaults to this instance's session)
+            context: Scan context to share with the check (defaults to this instance's context)
 
+        Returns:
+            List of findings produced by the check, or a single ERROR finding if it failed
+        """
+        check = None
+        try:
+            # Initializing resolves the account and regions, which can fail too
+            logger.debug(f"Initializing check {check_id}")
+            check = self._create_check(check_class, audit_accounts, log_archive_accounts, session, context)
+            with check_scope(check_id, check.account_id):
+                check.prefetch_data()
+                logger.debug(f"Executing check {check_id}: {check.check_name}")
+                findings = check.execute()
+            logger.debug(f"Check {check_id} completed with {len(findings)} findings")
+            return findings
+        except Exception as e:
+            logger.error(f"Error running check {check_id}: {e}", exc_info=True)
+            account_info = check.account_info if check is not None else None
+            if not account_info:
                 try:
-                    logger.debug(f"Executing check {check_id}: {check.check_name}")
-                    findings = check.execute()
-                    all_findings.extend(findings)
-                    logger.debug(f"Check {check_id} completed with {len(findings)} findings")
-                except Exception as e:
-                    logger.error(f"Error running check {check_id}: {e}", exc_info=True)
-                    # Add a failure finding
-                    all_findings.append({
-                        "CheckId": check_id,
-                        "Status": "ERROR",
-                        "Region": "global",
-                        "Severity": "UNKNOWN",
-                        "Title": f"Error running {check_id}",
-                        "Description": f"An error occurred while running check {check_id}",
-                        "ResourceId": None,
-                        "ResourceType": None,
-                        "AccountId": None,
-                        "CheckedValue": None,
-                        "ActualValue": str(e),
-                        "Remediation": "Check the error message and try again",
-                        "Service": service_name,
-                        "CheckLogic": None,
-                        "AccountType": check.account_type
-                    })
-
-                if self.progress:
-                    self.progress.increment()
+                    account_info = (context or self.context).account_info
+                except Exception:
+                    account_info = {}
+            account_type = check.account_type if check is not None else check_class.account_type
+            # Add a failure finding
+            return [self._error_finding(check_id, service_name, account_type, e,
+                                        account_info.get('account_id'), account_info.get('account_name'))]
 
-        if self.progress:
-            self.progress.finish()
+    def _advance_progress(self, service_name: str):
+        """
+        Record one completed check on the progress bar, if shown.
+
+        Args:
+            service_name: Service of the completed check
+        """
+        if not self.progress:
+            return
+        # Accounts scanned concurrently report progress from several threads
+        with self._progress_lock:
+            self.progress.update(service_name)
+            self.progress.increment()
+
+    def _log_cache_stats(self):
+        """Log scan cache hit and miss counts per namespace."""
+        for namespace, counts in self.cache.stats().items():
+            logger.debug(f"Cache {namespace}: {counts['hits']} hits "
+                         f"({counts['disk_hits']} from disk), {counts['misses']} misses")
+
+    @staticmethod
+    def _error_finding(check_id: str, service_name: str, account_type: str,
+                       error: Exception, account_id: Optional[str] = None,
+                       account_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the finding reported when a check could not run.
+
+        Args:
+            check_id: ID of the check
+            service_name: Service the check belongs to
+            account_type: Account type of the check
+            error: Error that stopped the check
+            account_id: AWS account the check was meant to run in, if known
+            account_name: Name of that account, if known
+
+        Returns:
+            ERROR finding dictionary
+        """
+        return {
+            "CheckId": check_id,
+            "Status": "ERROR",
+            "Region": "global",
+            "Severity": "UNKNOWN",
+            "Title": f"Error running {check_id}",
+            "Description": f"An error occurred while running check {check_id}",
+            "ResourceId": None,
+            "ResourceType": None,
+            "AccountId": account_id,
+            "AccountName": account_name,
+            "CheckedValue": None,
+            "ActualValue": str(error),
+            "Remediation": "Check the error message and try again",
+            "Service": service_name,
+            "CheckLogic": None,
+            "AccountType": account_type
+        }
+
+
+def _print_metrics_summary(collector: MetricsCollector, limit: int = METRICS_SUMMARY_LIMIT):
+    """
+    Print API call counts and latency per service, slowest first.
+
+    Args:
+        collector: Metrics collector to summarize
+        limit: Maximum number of services to list
+    """
+    rows = collector.summary('service')
+    if not rows:
+        return
+    print("\n-> API calls by service:")
+    print(f"  {'Service':<22}{'Calls':>7}{'Errors':>8}{'Throttles':>11}{'Total s':>10}{'p90 ms':>9}")
+    for row in rows[:limit]:
+        print(f"  {row['service']:<22}{row['calls']:>7}{row['errors']:>8}{row['throttles']:>11}"
+              f"{row['total_ms'] / 1000:>10.1f}{row['p90_ms']:>9.0f}")
+    if len(rows) > limit:
+        print(f"  ... {len(rows) - limit} more services")
 
-        return all_findings
 
+def _parse_ttl_overrides(value: str) -> Dict[str, int]:
+    """
+    Parse --cache-ttl-override values of the form NAMESPACE=SECONDS,NAMESPACE=SECONDS.
 
-def parse_args():
-    """Parse command line arguments."""
-    parser = argparse.ArgumentParser(description='SRA Verify - Security Rule Assessment Verification Tool')
+    Args:
+        value: Comma-separated overrides; namespaces may use shell-style wildcards
+
+    Returns:
+        Mapping of namespace pattern to TTL in seconds
+
+    Raises:
+        argparse.ArgumentTypeError: If an override is malformed
+    """
+    overrides = {}
+    for item in value.split(','):
+        namespace, sep, seconds = item.strip().partition('=')
+        if not sep or not namespace.strip() or not seconds.strip().isdigit():
+            raise argparse.ArgumentTypeError(f"invalid TTL override '{item.strip()}', expected NAMESPACE=SECONDS")
+        overrides[namespace.strip()] = int(seconds)
+    return overrides
+
+
+def parse_args(argv: Optional[List[str]] = None):
+    """
+    Parse command line arguments.
+
+    Args:
+        argv: Arguments to parse (defaults to the process arguments)
+    """
+    parser = argparse.ArgumentParser(description='SRA Verify - Security Rule Assessment Verification Tool',
+                                     epilog='Run "sraverify merge --help" to consolidate findings files of several scans.')
     parser.add_argument('--profile', type=str, help='AWS profile to use')
-    parser.add_argument('--role', type=str, help='ARN of IAM role to assume')
+    parser.add_argument('--role', type=str,
+                        help='ARN of IAM role to assume (with --accounts or --org, a role name or ARN assumed in each account)')
     parser.add_argument('--regions', type=str, help='Comma-separated list of AWS regions to check')
     parser.add_argument('--output', type=str, default='sraverify_findings.csv',
                         help='Output file name (default: sraverify_findings.csv)')
+    parser.add_argument('--format', type=str, choices=OUTPUT_FORMATS,
+                        help='Output format (default: inferred from the output file extension, otherwise csv)')
     parser.add_argument('--check', type=str, help='Run a specific check (e.g., SRA-GD-1)')
-    parser.add_argument('--service', type=str, help='Run checks for a specific service (e.g., GuardDuty)')
+    parser.add_argument('--service', type=str, metavar='SERVICE1,SERVICE2',
+                        help='Run checks for specific services, use comma separated values (e.g., GuardDuty,CloudTrail)')
+    parser.add_argument('--min-severity', type=str.upper, choices=SEVERITY_LEVELS,
+                        help='Only run checks at or above this severity')
+    parser.add_argument('--exclude', type=str, metavar='CHECK_OR_SERVICE,...',
+                        help='Skip these check IDs or services, use comma separated values')
     parser.add_argument('--account-type', type=str,
                         choices=['application', 'audit', 'log-archive', 'management', 'all'],
                         default='all',
@@ -258,20 +762,151 @@ def parse_args():
                         help='AWS accounts used for Audit/Security Tooling, use comma separated values')
     parser.add_argument('--log-archive-account', type=str, metavar='ACCOUNTID1,ACCOUNTID2',
                         help='AWS accounts used for Logging, use comma separated values')
+    parser.add_argument('--accounts', type=str, metavar='ACCOUNTID1,ACCOUNTID2',
+                        help='Scan these AWS accounts in one run by assuming --role in each, use comma separated values')
+    parser.add_argument('--org', action='store_true',
+                        help='Scan all active accounts in the AWS Organization by assuming --role in each')
+    parser.add_argument('--parallel-accounts', type=int, default=DEFAULT_PARALLEL_ACCOUNTS,
+                        help=f'Maximum number of accounts to scan concurrently with --accounts or --org (default: {DEFAULT_PARALLEL_ACCOUNTS})')
     parser.add_argument('--list-checks', action='store_true', help='List available checks')
     parser.add_argument('--list-services', action='store_true', help='List available services')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f'Maximum number of checks to run concurrently (default: {DEFAULT_MAX_WORKERS})')
+    parser.add_argument('--cache-dir', type=str,
+                        help='Persist API responses in this directory and reuse them in later scans')
+    parser.add_argument('--cache-ttl', type=int, default=DEFAULT_CACHE_TTL, metavar='SECONDS',
+                        help=f'Lifetime of persisted API responses (default: {DEFAULT_CACHE_TTL})')
+    parser.add_argument('--cache-ttl-override', type=_parse_ttl_overrides, metavar='NAMESPACE=SECONDS,...',
+                        help='Per-operation cache lifetimes, e.g. organizations.*=86400,guardduty.detector_details=0')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Ignore persisted API responses and refresh them from AWS')
+    parser.add_argument('--checkpoint', type=str, metavar='FILE',
+                        help='Record completed checks and their findings to FILE as the scan runs')
+    parser.add_argument('--resume', action='store_true',
+                        help='Skip checks completed in the --checkpoint file and include their findings in the output')
+    snapshot_group = parser.add_mutually_exclusive_group()
+    snapshot_group.add_argument('--record', type=str, metavar='FILE',
+                                help='Record every AWS API response to a snapshot file')
+    snapshot_group.add_argument('--replay', type=str, metavar='FILE',
+                                help='Run checks against the responses in a snapshot file instead of calling AWS')
+    parser.add_argument('--metrics-out', type=str, metavar='FILE',
+                        help='Write per-check API call metrics (counts, latency, retries, throttles) to a JSON file')
     parser.add_argument('--debug', action='store_true', help='Enable debug logging')
 
-    return parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def parse_merge_args(argv: Optional[List[str]] = None):
+    """
+    Parse command line arguments of the merge command.
+
+    Args:
+        argv: Arguments to parse, without the command name
+    """
+    parser = argparse.ArgumentParser(prog='sraverify merge',
+                                     description='Merge the findings files of several scans into one, '
+                                                 'sorted and without duplicate findings')
+    parser.add_argument('inputs', nargs='+', metavar='INPUT',
+                        help='Findings files (CSV or JSON Lines, optionally .gz) or directories to search for them')
+    parser.add_argument('--output', type=str,
+                        help='Output file name, compressed if it ends with .gz '
+                             '(default: sraverify_consolidated_<timestamp>.csv)')
+    parser.add_argument('--format', type=str, choices=OUTPUT_FORMATS,
+                        help='Output format (default: inferred from the output file extension, otherwise csv)')
+    parser.add_argument('--pattern', type=str, default=DEFAULT_INPUT_PATTERN,
+                        help=f'File name pattern of the findings files in input directories (default: {DEFAULT_INPUT_PATTERN})')
+    parser.add_argument('--debug', action='store_true', help='Enable debug logging')
+    return parser.parse_args(argv)
+
+
+def merge_main(argv: Optional[List[str]] = None):
+    """
+    Entry point of the merge command.
+
+    Exits with status 1 if no findings files are found or none can be read.
+
+    Args:
+        argv: Arguments, without the command name
+    """
+    args = parse_merge_args(argv)
+    configure_logging(args.debug)
+
+    output_file = args.output
+    if not output_file:
+        timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
+        output_file = f"sraverify_consolidated_{timestamp}.{args.format or 'csv'}"
+    # An earlier output in an input directory is not merged into the new one
+    inputs = [path for path in find_input_files(args.inputs, args.pattern)
+              if os.path.abspath(path) != os.path.abspath(output_file)]
+    if not inputs:
+        logger.error("No findings files found")
+        sys.exit(1)
+
+    logger.debug(f"Merging {len(inputs)} findings files into {output_file}")
+    with open_sink(output_file, args.format) as sink:
+        summary = merge_findings(inputs, sink)
+
+    print("\n-> Merge complete!")
+    print(f"  · Files: {summary['files']}" + (f" ({summary['skipped_files']} skipped)" if summary['skipped_files'] else ""))
+    print(f"  · Findings read: {summary['read']}")
+    print(f"  · Duplicates removed: {summary['duplicates']}")
+    print(f"  · Total findings: {sink.total}")
+    print(f"  · Accounts: {summary['accounts']}")
+    print(f"  · Pass: {sink.counts['PASS']}")
+    print(f"  · Fail: {sink.counts['FAIL']}")
+    print(f"  · Error: {sink.counts['ERROR']}")
+    print(f"  · Output: {output_file}")
+    if not summary['files']:
+        logger.error("None of the findings files could be read")
+        sys.exit(1)
 
 
 def main():
     """Main entry point."""
+    if sys.argv[1:2] == ['merge']:
+        merge_main(sys.argv[2:])
+        return
     args = parse_args()
+    multi_account = bool(args.accounts or args.org)
 
-    # Create SRAVerify instance
+    # Create SRAVerify instance; in multi-account mode the role is assumed per account
     regions = [r.strip() for r in args.regions.split(',')] if args.regions else None
-    sra = SRAVerify(profile=args.profile, role_arn=args.role, regions=regions, debug=args.debug)
+    cache = None
+    if args.cache_dir:
+        cache = CacheManager(
+            store=DiskCache(args.cache_dir, ttl=args.cache_ttl, ttl_overrides=args.cache_ttl_override),
+            refresh=args.refresh
+        )
+    snapshot = None
+    if args.record:
+        snapshot = Snapshot(args.record, RECORD)
+    elif args.replay:
+        try:
+            snapshot = Snapshot(args.replay, REPLAY)
+        except FileNotFoundError as e:
+            logger.error(str(e))
+            return
+    try:
+        _run(args, multi_account, regions, cache, snapshot)
+    finally:
+        if snapshot is not None:
+            snapshot.close()
+
+
+def _run(args: argparse.Namespace, multi_account: bool, regions: Optional[List[str]],
+         cache: Optional[CacheManager], snapshot: Optional[Snapshot]):
+    """
+    Run the CLI command.
+
+    Args:
+        args: Parsed command-line arguments
+        multi_account: Whether several accounts are scanned
+        regions: Regions to check, or None to detect enabled regions
+        cache: API response cache, or None for a new in-memory cache
+        snapshot: Snapshot to record to or replay from
+    """
+    sra = SRAVerify(profile=args.profile, role_arn=None if multi_account else args.role,
+                    regions=regions, debug=args.debug, cache=cache, snapshot=snapshot)
 
     if args.list_checks:
         checks = sra.get_available_checks(args.account_type)
@@ -287,6 +922,10 @@ def main():
             print(f"  {service}")
         return
 
+    # Parse check selectors
+    services = [s.strip() for s in args.service.split(',')] if args.service else None
+    exclude = [e.strip() for e in args.exclude.split(',')] if args.exclude else None
+
     # Parse audit accounts if provided
     audit_accounts = None
     if args.audit_account:
@@ -299,11 +938,27 @@ def main():
         log_archive_accounts = [a.strip() for a in args.log_archive_account.split(',')]
         logger.debug(f"Using log archive accounts: {', '.join(log_archive_accounts)}")
 
+    if args.resume and not args.checkpoint:
+        logger.error("--resume requires --checkpoint")
+        return
+
+    # Resolve the accounts to scan in multi-account mode
+    account_ids = None
+    if multi_account:
+        if not args.role:
+            logger.error("--role is required with --accounts or --org")
+            return
+        if args.accounts:
+            account_ids = [a.strip() for a in args.accounts.split(',')]
+        else:
+            account_ids = sra.list_organization_accounts()
+        logger.debug(f"Scanning {len(account_ids)} accounts")
+
     # Generate output filename with timestamp if not specified
     output_file = args.output
     if output_file == 'sraverify_findings.csv':
         timestamp = datetime.datetime.now().strftime('%Y%m%d_%H%M%S')
-        output_file = f"sraverify_findings_{timestamp}.csv"
+        output_file = f"sraverify_findings_{timestamp}.{args.format or 'csv'}"
 
     # Display banner with session information
     print_banner(
@@ -312,38 +967,86 @@ def main():
         session=sra.session,
         regions=regions,
         account_type=args.account_type,
-        checks_count=len(sra.get_available_checks(args.account_type)),
+        checks_count=len(ALL_CHECKS.select(
+            args.account_type, services=services, min_severity=args.min_severity, exclude=exclude,
+            check_ids=[args.check] if args.check else None
+        )),
         output_file=output_file,
-        role=args.role
+        role=args.role,
+        accounts=account_ids
     )
 
-    # Run checks
-    findings = sra.run_checks(
-        account_type=args.account_type,
-        service=args.service,
-        check_id=args.check,
-        audit_accounts=audit_accounts,
-        log_archive_accounts=log_archive_accounts,
-        show_progress=True
-    )
-
-    # Write output
+    # Run checks, writing findings to the output file as each check completes
     logger.debug(f"Writing findings to {output_file}")
-    write_csv_output(findings, output_file)
+    checkpoint = None
+    if args.checkpoint:
+        # Findings are only reused by a scan asking for the same checks in the same regions
+        scan = {
+            'regions': sorted(regions) if regions else None,
+            'account_type': args.account_type,
+            'services': sorted(services) if services else None,
+            'check': args.check,
+            'exclude': sorted(exclude) if exclude else None,
+            'min_severity': args.min_severity,
+            'role': args.role,
+            'audit_accounts': sorted(audit_accounts) if audit_accounts else None,
+            'log_archive_accounts': sorted(log_archive_accounts) if log_archive_accounts else None,
+        }
+        try:
+            checkpoint = Checkpoint(args.checkpoint, resume=args.resume, scan=scan)
+        except ValueError as e:
+            logger.error(f"Cannot resume: {e}")
+            return
+    with open_sink(output_file, args.format) as sink, \
+            checkpoint if checkpoint is not None else contextlib.nullcontext():
+        if multi_account:
+            sra.scan_accounts(
+                account_ids,
+                args.role,
+                account_type=args.account_type,
+                service=services,
+                check_id=args.check,
+                audit_accounts=audit_accounts,
+                log_archive_accounts=log_archive_accounts,
+                show_progress=True,
+                max_workers=args.max_workers,
+                parallel_accounts=args.parallel_accounts,
+                sink=sink,
+                min_severity=args.min_severity,
+                exclude=exclude,
+                checkpoint=checkpoint
+            )
+        else:
+            sra.run_checks(
+                account_type=args.account_type,
+                service=services,
+                check_id=args.check,
+                audit_accounts=audit_accounts,
+                log_archive_accounts=log_archive_accounts,
+                show_progress=True,
+                max_workers=args.max_workers,
+                sink=sink,
+                min_severity=args.min_severity,
+                exclude=exclude,
+                checkpoint=checkpoint
+            )
 
     # Print summary
-    pass_count = sum(1 for f in findings if f.get('Status') == 'PASS')
-    fail_count = sum(1 for f in findings if f.get('Status') == 'FAIL')
-    error_count = sum(1 for f in findings if f.get('Status') == 'ERROR')
-
     logger.debug("Scan complete")
     print("\n-> Scan complete!")
-    print(f"  · Total findings: {len(findings)}")
-    print(f"  · Pass: {pass_count}")
-    print(f"  · Fail: {fail_count}")
-    print(f"  · Error: {error_count}")
+    print(f"  · Total findings: {sink.total}")
+    print(f"  · Pass: {sink.counts['PASS']}")
+    print(f"  · Fail: {sink.counts['FAIL']}")
+    print(f"  · Error: {sink.counts['ERROR']}")
     print(f"  · Output: {output_file}")
+    if args.metrics_out:
+        logger.debug(f"Writing API call metrics to {args.metrics_out}")
+        metrics.write_json(args.metrics_out)
+        print(f"  · Metrics: {args.metrics_out}")
+    if snapshot is not None:
+        print(f"  · Snapshot ({snapshot.mode}): {snapshot.path}")
 
+    _print_metrics_summary(metrics)
 
 if __name__ == "__main__":
     main()
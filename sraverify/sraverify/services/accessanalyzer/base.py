@@ -10,19 +10,11 @@ from sraverify.core.logging import logger
 
 class AccessAnalyzerCheck(SecurityCheck):
     """Base class for all IAM Access Analyzer security checks."""
-    
-    # Class-level caches shared across all instances
-    _delegated_admin_cache = {}
-    _analyzer_cache = {}
-    
-    def __init__(self):
-        """Initialize IAM Access Analyzer base check."""
-        super().__init__(
-            account_type="application",
-            service="IAM Access Analyzer",
-            resource_type="AWS::AccessAnalyzer::Analyzer"
-        )
-    
+
+    account_type = "application"
+    service = "IAM Access Analyzer"
+    resource_type = "AWS::AccessAnalyzer::Analyzer"
+
     def _setup_clients(self):
         """Set up AccessAnalyzer clients for enabled regions."""
         # Clear existing clients
@@ -33,18 +25,30 @@ class AccessAnalyzerCheck(SecurityCheck):
             return
             
         # For organization checks, we need to check all specified regions
+        candidates = {}
         for region in self.regions:
             try:
-                client = AccessAnalyzerClient(region, self.session)
-                if client.is_access_analyzer_available():
-                    self._clients[region] = client
-                    logger.debug(f"Access Analyzer client set up for region {region}")
-                else:
-                    logger.debug(f"Access Analyzer not available in region {region}")
+                candidates[region] = AccessAnalyzerClient(region, self.session)
             except Exception as e:
                 # Skip regions where client creation fails
                 logger.warning(f"Failed to create Access Analyzer client for region {region}: {e}")
                 continue
+        
+        # Probe service availability once per region and account, concurrently
+        cache = self.cache('accessanalyzer.available')
+
+        def is_available(region: str) -> bool:
+            if region not in cache:
+                cache[region] = candidates[region].is_access_analyzer_available()
+            return cache[region]
+
+        availability = self.map_regions(is_available, regions=list(candidates))
+        for region, available in availability.items():
+            if available:
+                self._clients[region] = candidates[region]
+                logger.debug(f"Access Analyzer client set up for region {region}")
+            else:
+                logger.debug(f"Access Analyzer not available in region {region}")
     
     def get_client(self, region: str) -> Optional[AccessAnalyzerClient]:
         """
@@ -68,11 +72,11 @@ class AccessAnalyzerCheck(SecurityCheck):
         Returns:
             List of analyzers in the region
         """
-        # Check class-level cache
-        cache_key = f"{self.session.region_name}:{region}"
-        if cache_key in AccessAnalyzerCheck._analyzer_cache:
+        # Check scan cache
+        cache = self.cache('accessanalyzer.analyzer')
+        if region in cache:
             logger.debug(f"Using cached analyzers for {region}")
-            return AccessAnalyzerCheck._analyzer_cache[cache_key]
+            return cache[region]
         
         # Get client
         client = self.get_client(region)
@@ -85,7 +89,7 @@ class AccessAnalyzerCheck(SecurityCheck):
         analyzers = client.list_analyzers()
         
         # Cache the analyzers
-        AccessAnalyzerCheck._analyzer_cache[cache_key] = analyzers
+        cache[region] = analyzers
         logger.debug(f"Cached {len(analyzers)} analyzers for {region}")
         
         return analyzers
@@ -99,10 +103,11 @@ class AccessAnalyzerCheck(SecurityCheck):
         """
         account_id = self.account_id
         
-        # Check class-level cache
-        if account_id in AccessAnalyzerCheck._delegated_admin_cache:
+        # Check scan cache
+        cache = self.cache('accessanalyzer.delegated_admin')
+        if account_id in cache:
             logger.debug(f"Using cached delegated admin for account {account_id}")
-            return AccessAnalyzerCheck._delegated_admin_cache[account_id]
+            return cache[account_id]
         
         # If not in cache, get it from the client
         # Use the first available region to make the API call
@@ -118,6 +123,6 @@ class AccessAnalyzerCheck(SecurityCheck):
         delegated_admin = client.get_delegated_admin()
         
         # Cache the result
-        AccessAnalyzerCheck._delegated_admin_cache[account_id] = delegated_admin
+        cache[account_id] = delegated_admin
         
         return delegated_admin
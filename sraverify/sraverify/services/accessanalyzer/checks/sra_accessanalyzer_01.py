@@ -9,20 +9,19 @@ from sraverify.core.logging import logger
 class SRA_ACCESSANALYZER_01(AccessAnalyzerCheck):
     """Check if IAM Access Analyzer external access analyzer is configured with account zone of trust."""
 
-    def __init__(self):
-        """Initialize IAM Access Analyzer check."""
-        super().__init__()
-        self.check_id = "SRA-ACCESSANALYZER-01"
-        self.check_name = "IAM Access Analyzer Account Zone of trust"
-        self.description = ("This check verifies whether IAA external access analyzer is configured with a zone of "
-                          "trust of AWS account. IAM Access Analyzer generates a finding for each instance of a "
-                          "resource-based policy that grants access to a resource within your zone of trust to a "
-                          "principal that is not within your zone of trust. When you configure an AWS account as "
-                          "the zone of trust for an analyzer- IAA generates findings or each instance of a "
-                          "resource-based policy that grants access to a resource within your AWS account whether "
-                          "the analyzer exists to a principal that is not within your AWS account.")
-        self.severity = "HIGH"
-        self.check_logic = "List analyzers in each Region. Check if analyzer exists and is configured with account zone of trust."
+    check_id = "SRA-ACCESSANALYZER-01"
+    check_name = "IAM Access Analyzer Account Zone of trust"
+    description = ("This check verifies whether IAA external access analyzer is configured with a zone of "
+                 "trust of AWS account. IAM Access Analyzer generates a finding for each instance of a "
+                 "resource-based policy that grants access to a resource within your zone of trust to a "
+                 "principal that is not within your zone of trust. When you configure an AWS account as "
+                 "the zone of trust for an analyzer- IAA generates findings or each instance of a "
+                 "resource-based policy that grants access to a resource within your AWS account whether "
+                 "the analyzer exists to a principal that is not within your AWS account.")
+    severity = "HIGH"
+    check_logic = "List analyzers in each Region. Check if analyzer exists and is configured with account zone of trust."
+
+    data_requirements = ("get_analyzers",)
 
     def execute(self) -> List[Dict[str, Any]]:
         """Execute the check for each region."""
@@ -3,24 +3,22 @@ Check if IAM Access Analyzer has a delegated administrator for the organization.
 """
 from typing import Dict, List, Any
 from sraverify.services.accessanalyzer.base import AccessAnalyzerCheck
+from sraverify.core.clients import get_client
 from sraverify.core.logging import logger
 
 
 class SRA_ACCESSANALYZER_02(AccessAnalyzerCheck):
     """Check if IAM Access Analyzer has a delegated administrator for the organization."""
-    
-    def __init__(self):
-        """Initialize IAM Access Analyzer check."""
-        super().__init__()
-        self.check_id = "SRA-ACCESSANALYZER-02"
-        self.check_name = "IAM Access Analyzer Organization Delegated Administrator"
-        self.description = ("This check verifies whether IAA service administration for your AWS "
-                          "Organization is delegated out of your AWS Organization management account. "
-                          "The delegated administrator has permissions to create and manage analyzers "
-                          "with the AWS organization as the zone of trust.")
-        self.severity = "HIGH"
-        self.account_type = "management"  
-        self.check_logic = ("Check if a delegated administrator is configured for IAM Access Analyzer in the organization")
+
+    check_id = "SRA-ACCESSANALYZER-02"
+    check_name = "IAM Access Analyzer Organization Delegated Administrator"
+    description = ("This check verifies whether IAA service administration for your AWS "
+                 "Organization is delegated out of your AWS Organization management account. "
+                 "The delegated administrator has permissions to create and manage analyzers "
+                 "with the AWS organization as the zone of trust.")
+    severity = "HIGH"
+    account_type = "management"  
+    check_logic = ("Check if a delegated administrator is configured for IAM Access Analyzer in the organization")
 
     def execute(self) -> List[Dict[str, Any]]:
         """Execute the check."""
@@ -30,15 +28,15 @@ class SRA_ACCESSANALYZER_02(AccessAnalyzerCheck):
         # Check for delegated administrator
         try:
             logger.debug("Checking for IAM Access Analyzer delegated administrator")
-            org_client = self.session.client('organizations')
+            org_client = get_client(self.session, 'organizations')
             response = org_client.list_delegated_administrators(
                 ServicePrincipal='access-analyzer.amazonaws.com'
             )
             
-            # Store in class-level cache
+            # Store in scan cache
             if response['DelegatedAdministrators']:
                 delegated_admin = response['DelegatedAdministrators'][0]
-                self.__class__._delegated_admin_cache[self.account_id] = delegated_admin
+                self.cache('accessanalyzer.delegated_admin')[self.account_id] = delegated_admin
                 logger.debug(f"Found delegated administrator: {delegated_admin['Id']}")
                 
                 findings.append(
@@ -53,7 +51,7 @@ class SRA_ACCESSANALYZER_02(AccessAnalyzerCheck):
                 )
             else:
                 logger.debug("No delegated administrator found for IAM Access Analyzer")
-                self.__class__._delegated_admin_cache[self.account_id] = {}
+                self.cache('accessanalyzer.delegated_admin')[self.account_id] = {}
                 findings.append(
                     self.create_finding(
                         status="FAIL",
@@ -67,7 +65,7 @@ class SRA_ACCESSANALYZER_02(AccessAnalyzerCheck):
                 
         except Exception as e:
             logger.error(f"Error checking delegated administrator: {e}")
-            self.__class__._delegated_admin_cache[self.account_id] = {}
+            self.cache('accessanalyzer.delegated_admin')[self.account_id] = {}
             findings.append(
                 self.create_finding(
                     status="FAIL",
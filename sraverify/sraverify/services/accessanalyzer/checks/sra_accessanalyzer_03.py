@@ -2,26 +2,26 @@
 Check if IAM Access Analyzer delegated admin is the Audit account.
 """
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.accessanalyzer.base import AccessAnalyzerCheck
 from sraverify.core.logging import logger
 
 
 class SRA_ACCESSANALYZER_03(AccessAnalyzerCheck):
     """Check if IAM Access Analyzer delegated admin is the Audit account."""
-    
-    def __init__(self):
-        """Initialize IAM Access Analyzer check."""
-        super().__init__()
-        self.check_id = "SRA-ACCESSANALYZER-03"
-        self.check_name = "IAM Access Analyzer Delegated Admin is the Audit Account"
-        self.description = ("This check verifies whether IAA delegated admin account is the "
-                          "audit account of your AWS organization. Audit account is "
-                          "dedicated to operating security services, monitoring AWS accounts, and "
-                          "automating security alerting and response. IAA helps monitor resources "
-                          "shared outside zone of trust.")
-        self.severity = "HIGH"
-        self.account_type = "management"
-        self.check_logic = ("Check if the delegated administrator account matches any of the specified Audit account IDs")
+
+    check_id = "SRA-ACCESSANALYZER-03"
+    check_name = "IAM Access Analyzer Delegated Admin is the Audit Account"
+    description = ("This check verifies whether IAA delegated admin account is the "
+                 "audit account of your AWS organization. Audit account is "
+                 "dedicated to operating security services, monitoring AWS accounts, and "
+                 "automating security alerting and response. IAA helps monitor resources "
+                 "shared outside zone of trust.")
+    severity = "HIGH"
+    account_type = "management"
+    check_logic = ("Check if the delegated administrator account matches any of the specified Audit account IDs")
+
+    data_requirements = (DataRequirement("get_delegated_admin", ACCOUNT),)
 
     def execute(self) -> List[Dict[str, Any]]:
         """Execute the check."""
@@ -8,22 +8,25 @@ from sraverify.core.logging import logger
 
 class SRA_ACCESSANALYZER_04(AccessAnalyzerCheck):
     """Check if IAM Access Analyzer has an analyzer with Organization zone of trust in every region."""
-    
+
+    check_id = "SRA-ACCESSANALYZER-04"
+    check_name = "IAM Access Analyzer external access analyzer is configured with Organization zone of trust in every region"
+    description = ("This check verifies whether IAA external access analyzer is configured with a zone of trust "
+                 "of your AWS organization in every available region. IAM Access Analyzer generates a finding for each instance of a "
+                 "resource-based policy that grants access to a resource within your zone of trust to a "
+                 "principal that is not within your zone of trust. When you configure an organization as the "
+                 "zone of trust for an analyzer- IAA generates findings or each instance of a resource-based "
+                 "policy that grants access to a resource within your AWS organization to a principal that is "
+                 "not within your AWS organization.")
+    severity = "HIGH"
+    account_type = "audit"
+    check_logic = ("Check if an IAM Access Analyzer with Organization zone of trust exists in each region, created by the audit account")
+
+    data_requirements = ("get_analyzers",)
+
     def __init__(self):
         """Initialize IAM Access Analyzer check."""
         super().__init__()
-        self.check_id = "SRA-ACCESSANALYZER-04"
-        self.check_name = "IAM Access Analyzer external access analyzer is configured with Organization zone of trust in every region"
-        self.description = ("This check verifies whether IAA external access analyzer is configured with a zone of trust "
-                          "of your AWS organization in every available region. IAM Access Analyzer generates a finding for each instance of a "
-                          "resource-based policy that grants access to a resource within your zone of trust to a "
-                          "principal that is not within your zone of trust. When you configure an organization as the "
-                          "zone of trust for an analyzer- IAA generates findings or each instance of a resource-based "
-                          "policy that grants access to a resource within your AWS organization to a principal that is "
-                          "not within your AWS organization.")
-        self.severity = "HIGH"
-        self.account_type = "audit"
-        self.check_logic = ("Check if an IAM Access Analyzer with Organization zone of trust exists in each region, created by the audit account")
         self._analyzer_details_cache = {}
         self._audit_accounts = []
 
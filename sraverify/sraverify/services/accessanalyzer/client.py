@@ -4,11 +4,14 @@ IAM Access Analyzer client for interacting with AWS IAM Access Analyzer service.
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError, EndpointConnectionError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 
 class AccessAnalyzerClient:
     """Client for interacting with AWS IAM Access Analyzer service."""
+    client = lazy_client('accessanalyzer')
+    org_client = lazy_client('organizations')
     
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,8 +23,6 @@ class AccessAnalyzerClient:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('accessanalyzer', region_name=region)
-        self.org_client = self.session.client('organizations', region_name=region)
         logger.debug(f"Initialized AccessAnalyzerClient for region {region}")
     
     def is_access_analyzer_available(self) -> bool:
@@ -1,9 +1,4 @@
-from sraverify.services.account.checks.sra_account_01 import SRA_ACCOUNT_01
-from sraverify.services.account.checks.sra_account_02 import SRA_ACCOUNT_02
-from sraverify.services.account.checks.sra_account_03 import SRA_ACCOUNT_03
+from sraverify.core.registry import service_module_getattr
 
-CHECKS = {
-    "SRA-ACCOUNT-01": SRA_ACCOUNT_01,
-    "SRA-ACCOUNT-02": SRA_ACCOUNT_02,
-    "SRA-ACCOUNT-03": SRA_ACCOUNT_03,
-}
+# CHECKS and check classes are loaded on first access; see sraverify/services/manifest.py
+__getattr__ = service_module_getattr(__name__)
@@ -9,18 +9,11 @@ from sraverify.core.logging import logger
 
 class AccountCheck(SecurityCheck):
     """Base class for all Account security checks."""
-    
-    # Class-level cache shared across all instances
-    _contact_cache = {}
-    
-    def __init__(self):
-        """Initialize Account base check."""
-        super().__init__(
-            account_type="application",
-            service="Account",
-            resource_type="AWS::Account::AlternateContact"
-        )
-    
+
+    account_type = "application"
+    service = "Account"
+    resource_type = "AWS::Account::AlternateContact"
+
     def _setup_clients(self):
         """Set up Account clients for each region."""
         self._clients.clear()
@@ -40,10 +33,11 @@ class AccountCheck(SecurityCheck):
         Returns:
             Dictionary containing contact details or empty dict if not available
         """
-        cache_key = f"{self.account_id}:{region}:{contact_type}"
-        if cache_key in AccountCheck._contact_cache:
+        cache = self.cache('account.contact')
+        cache_key = (region, contact_type, account_id)
+        if cache_key in cache:
             logger.debug(f"Account: Using cached {contact_type} contact for {region}")
-            return AccountCheck._contact_cache[cache_key]
+            return cache[cache_key]
         
         client = self.get_client(region)
         if not client:
@@ -51,6 +45,6 @@ class AccountCheck(SecurityCheck):
             return {}
         
         contact_info = client.get_alternate_contact(contact_type, account_id)
-        AccountCheck._contact_cache[cache_key] = contact_info
+        cache[cache_key] = contact_info
         
         return contact_info
@@ -7,15 +7,13 @@ from sraverify.services.account.base import AccountCheck
 
 class SRA_ACCOUNT_01(AccountCheck):
     """Check if security alternate contact is configured for the AWS account."""
-    
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-ACCOUNT-01"
-        self.check_name = "Security alternate contact configured"
-        self.description = "Verifies that a security alternate contact is configured for the AWS account"
-        self.severity = "MEDIUM"
-        self.check_logic = "Uses GetAlternateContact API to verify security contact exists and has required fields"
-    
+
+    check_id = "SRA-ACCOUNT-01"
+    check_name = "Security alternate contact configured"
+    description = "Verifies that a security alternate contact is configured for the AWS account"
+    severity = "MEDIUM"
+    check_logic = "Uses GetAlternateContact API to verify security contact exists and has required fields"
+
     def execute(self) -> List[Dict[str, Any]]:
         """Execute the security alternate contact check."""
         account_id = self.account_id
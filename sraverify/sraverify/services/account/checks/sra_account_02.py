@@ -7,15 +7,13 @@ from sraverify.services.account.base import AccountCheck
 
 class SRA_ACCOUNT_02(AccountCheck):
     """Check if billing alternate contact is configured for the AWS account."""
-    
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-ACCOUNT-02"
-        self.check_name = "Billing alternate contact configured"
-        self.description = "Verifies that a billing alternate contact is configured for the AWS account"
-        self.severity = "MEDIUM"
-        self.check_logic = "Uses GetAlternateContact API to verify billing contact exists and has required fields"
-    
+
+    check_id = "SRA-ACCOUNT-02"
+    check_name = "Billing alternate contact configured"
+    description = "Verifies that a billing alternate contact is configured for the AWS account"
+    severity = "MEDIUM"
+    check_logic = "Uses GetAlternateContact API to verify billing contact exists and has required fields"
+
     def execute(self) -> List[Dict[str, Any]]:
         """Execute the billing alternate contact check."""
         account_id = self.account_id
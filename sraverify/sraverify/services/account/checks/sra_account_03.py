@@ -7,15 +7,13 @@ from sraverify.services.account.base import AccountCheck
 
 class SRA_ACCOUNT_03(AccountCheck):
     """Check if operations alternate contact is configured for the AWS account."""
-    
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-ACCOUNT-03"
-        self.check_name = "Operations alternate contact configured"
-        self.description = "Verifies that an operations alternate contact is configured for the AWS account"
-        self.severity = "MEDIUM"
-        self.check_logic = "Uses GetAlternateContact API to verify operations contact exists and has required fields"
-    
+
+    check_id = "SRA-ACCOUNT-03"
+    check_name = "Operations alternate contact configured"
+    description = "Verifies that an operations alternate contact is configured for the AWS account"
+    severity = "MEDIUM"
+    check_logic = "Uses GetAlternateContact API to verify operations contact exists and has required fields"
+
     def execute(self) -> List[Dict[str, Any]]:
         """Execute the operations alternate contact check."""
         account_id = self.account_id
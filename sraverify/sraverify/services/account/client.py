@@ -4,11 +4,13 @@ Account client for interacting with AWS Account Management service.
 from typing import Dict, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 
 class AccountClient:
     """Client for interacting with AWS Account Management service."""
+    client = lazy_client('account')
     
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,7 +22,6 @@ class AccountClient:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('account', region_name=region)
     
     def get_alternate_contact(self, contact_type: str, account_id: Optional[str] = None) -> Dict[str, Any]:
         """
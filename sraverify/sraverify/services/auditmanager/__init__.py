@@ -1,10 +1,7 @@
 """
 Audit Manager security checks.
 """
-from sraverify.services.auditmanager.checks.sra_auditmanager_01 import SRA_AUDITMANAGER_01
-from sraverify.services.auditmanager.checks.sra_auditmanager_02 import SRA_AUDITMANAGER_02
+from sraverify.core.registry import service_module_getattr
 
-CHECKS = {
-    "SRA-AUDITMANAGER-01": SRA_AUDITMANAGER_01,
-    "SRA-AUDITMANAGER-02": SRA_AUDITMANAGER_02,
-}
+# CHECKS and check classes are loaded on first access; see sraverify/services/manifest.py
+__getattr__ = service_module_getattr(__name__)
@@ -8,18 +8,11 @@ from sraverify.services.auditmanager.client import AuditManagerClient
 
 class AuditManagerCheck(SecurityCheck):
     """Base class for all Audit Manager security checks."""
-    
-    # Class-level cache shared across all instances
-    _account_status_cache = {}
-    
-    def __init__(self):
-        """Initialize Audit Manager base check."""
-        super().__init__(
-            account_type="application",
-            service="AuditManager",
-            resource_type="AWS::AuditManager::Account"
-        )
-    
+
+    account_type = "application"
+    service = "AuditManager"
+    resource_type = "AWS::AuditManager::Account"
+
     def _setup_clients(self):
         """Set up Audit Manager clients for each region."""
         self._clients.clear()
@@ -37,16 +30,16 @@ class AuditManagerCheck(SecurityCheck):
         Returns:
             Account status response or error information
         """
-        cache_key = f"{self.account_id}:{region}"
-        if cache_key in AuditManagerCheck._account_status_cache:
-            return AuditManagerCheck._account_status_cache[cache_key]
+        cache = self.cache('auditmanager.account_status')
+        if region in cache:
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
             return {"Error": {"Code": "NoClient", "Message": f"No client available for region {region}"}}
         
         status = client.get_account_status()
-        AuditManagerCheck._account_status_cache[cache_key] = status
+        cache[region] = status
         return status
     
     def get_organization_admin_account(self, region: str) -> Dict[str, Any]:
@@ -59,14 +52,15 @@ class AuditManagerCheck(SecurityCheck):
         Returns:
             Organization admin account response or error information
         """
-        cache_key = f"org_admin:{region}"
-        if cache_key in AuditManagerCheck._account_status_cache:
-            return AuditManagerCheck._account_status_cache[cache_key]
+        cache = self.cache('auditmanager.account_status')
+        cache_key = ("org_admin", region)
+        if cache_key in cache:
+            return cache[cache_key]
         
         client = self.get_client(region)
         if not client:
             return {"Error": {"Code": "NoClient", "Message": f"No client available for region {region}"}}
         
         admin_info = client.get_organization_admin_account()
-        AuditManagerCheck._account_status_cache[cache_key] = admin_info
+        cache[cache_key] = admin_info
         return admin_info
@@ -8,15 +8,14 @@ from sraverify.services.auditmanager.base import AuditManagerCheck
 class SRA_AUDITMANAGER_01(AuditManagerCheck):
     """Check if AWS Audit Manager is enabled."""
 
-    def __init__(self):
-        """Initialize Audit Manager enabled check."""
-        super().__init__()
-        self.check_id = "SRA-AUDITMANAGER-01"
-        self.check_name = "AWS Audit Manager is enabled"
-        self.description = "This check verifies that AWS Audit Manager is enabled in the AWS account. Audit Manager helps you continuously audit your AWS usage to simplify how you assess risk and compliance with regulations and industry standards."
-        self.severity = "MEDIUM"
-        self.check_logic = "Check account registration status using GetAccountStatus API. Check passes if status is ACTIVE."
-    
+    check_id = "SRA-AUDITMANAGER-01"
+    check_name = "AWS Audit Manager is enabled"
+    description = "This check verifies that AWS Audit Manager is enabled in the AWS account. Audit Manager helps you continuously audit your AWS usage to simplify how you assess risk and compliance with regulations and industry standards."
+    severity = "MEDIUM"
+    check_logic = "Check account registration status using GetAccountStatus API. Check passes if status is ACTIVE."
+
+    data_requirements = ("get_account_status",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,16 +8,15 @@ from sraverify.services.auditmanager.base import AuditManagerCheck
 class SRA_AUDITMANAGER_02(AuditManagerCheck):
     """Check if Audit Manager delegated admin is the audit account."""
 
-    def __init__(self):
-        """Initialize Audit Manager delegated admin check."""
-        super().__init__()
-        self.account_type = "management"
-        self.check_id = "SRA-AUDITMANAGER-02"
-        self.check_name = "Audit Manager delegated admin is the audit account"
-        self.description = "This check verifies that the AWS Audit Manager delegated administrator is configured as the audit account. The delegated administrator should be the security tooling account to centralize audit management."
-        self.severity = "HIGH"
-        self.check_logic = "Get organization admin account using GetOrganizationAdminAccount API and verify it matches the audit account ID."
-    
+    account_type = "management"
+    check_id = "SRA-AUDITMANAGER-02"
+    check_name = "Audit Manager delegated admin is the audit account"
+    description = "This check verifies that the AWS Audit Manager delegated administrator is configured as the audit account. The delegated administrator should be the security tooling account to centralize audit management."
+    severity = "HIGH"
+    check_logic = "Get organization admin account using GetOrganizationAdminAccount API and verify it matches the audit account ID."
+
+    data_requirements = ("get_organization_admin_account",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
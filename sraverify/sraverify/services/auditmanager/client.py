@@ -4,11 +4,13 @@ Audit Manager client for interacting with AWS Audit Manager service.
 from typing import Dict, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 
 class AuditManagerClient:
     """Client for interacting with AWS Audit Manager service."""
+    client = lazy_client('auditmanager')
 
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,7 +22,6 @@ class AuditManagerClient:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('auditmanager', region_name=region)
 
     def get_account_status(self) -> Dict[str, Any]:
         """
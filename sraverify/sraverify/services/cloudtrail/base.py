@@ -9,20 +9,11 @@ from sraverify.core.logging import logger
 
 class CloudTrailCheck(SecurityCheck):
     """Base class for all CloudTrail security checks."""
-    
-    # Class-level caches shared across all instances - only keeping the ones specified
-    _describe_trails_cache = {}
-    _trail_status_cache = {}
-    _delegated_admin_account_id_cache = {}
-    
-    def __init__(self):
-        """Initialize CloudTrail base check."""
-        super().__init__(
-            account_type="management",
-            service="CloudTrail",
-            resource_type="AWS::CloudTrail::Trail"
-        )
-    
+
+    account_type = "management"
+    service = "CloudTrail"
+    resource_type = "AWS::CloudTrail::Trail"
+
     def _setup_clients(self):
         """Set up CloudTrail clients for each region."""
         # Clear existing clients
@@ -58,14 +49,15 @@ class CloudTrailCheck(SecurityCheck):
             logger.warning("No regions specified")
             return []
         
-        # Use session region name as part of cache key
-        cache_key = f"describe_trails:{self.session.region_name}:{include_shadow_trails}"
-        if cache_key in self.__class__._describe_trails_cache:
-            logger.debug(f"Using cached trails for {cache_key}")
-            return self.__class__._describe_trails_cache[cache_key]
-        
         # Use any region to get all trails
-        client = self.get_client(self.regions[0])
+        region = self.regions[0]
+        cache = self.cache('cloudtrail.describe_trails')
+        cache_key = (region, include_shadow_trails)
+        if cache_key in cache:
+            logger.debug(f"Using cached trails for {region}")
+            return cache[cache_key]
+        
+        client = self.get_client(region)
         if not client:
             logger.warning("No CloudTrail client available")
             return []
@@ -74,8 +66,8 @@ class CloudTrailCheck(SecurityCheck):
         trails = client.describe_trails(include_shadow_trails=include_shadow_trails)
         
         # Cache the results
-        self.__class__._describe_trails_cache[cache_key] = trails
-        logger.debug(f"Cached {len(trails)} trails for {cache_key}")
+        cache[cache_key] = trails
+        logger.debug(f"Cached {len(trails)} trails for {region}")
         
         return trails
     
@@ -110,10 +102,11 @@ class CloudTrailCheck(SecurityCheck):
             Dictionary containing trail status
         """
         # Check cache first
-        cache_key = f"{trail_arn}:{region}"
-        if cache_key in self.__class__._trail_status_cache:
+        cache = self.cache('cloudtrail.trail_status')
+        cache_key = (region, trail_arn)
+        if cache_key in cache:
             logger.debug(f"Using cached trail status for {trail_arn} in {region}")
-            return self.__class__._trail_status_cache[cache_key]
+            return cache[cache_key]
         
         client = self.get_client(region)
         if not client:
@@ -124,7 +117,7 @@ class CloudTrailCheck(SecurityCheck):
         status = client.get_trail_status(trail_arn)
         
         # Cache the result
-        self.__class__._trail_status_cache[cache_key] = status
+        cache[cache_key] = status
         logger.debug(f"Cached trail status for {trail_arn} in {region}")
         
         return status
@@ -145,14 +138,16 @@ class CloudTrailCheck(SecurityCheck):
             logger.warning("Could not determine account ID")
             return []
         
+        # Use any region to get delegated administrators
+        region = self.regions[0]
+        
         # Check cache first
-        cache_key = f"{account_id}:{self.session.region_name}"
-        if cache_key in self.__class__._delegated_admin_account_id_cache:
-            logger.debug(f"Using cached delegated administrators for {cache_key}")
-            return self.__class__._delegated_admin_account_id_cache[cache_key]
+        cache = self.cache('cloudtrail.delegated_admin_account_id')
+        if region in cache:
+            logger.debug(f"Using cached delegated administrators for {account_id}")
+            return cache[region]
         
-        # Use any region to get delegated administrators
-        client = self.get_client(self.regions[0])
+        client = self.get_client(region)
         if not client:
             logger.warning("No CloudTrail client available")
             return []
@@ -161,7 +156,7 @@ class CloudTrailCheck(SecurityCheck):
         delegated_admins = client.list_delegated_administrators()
         
         # Cache the results
-        self.__class__._delegated_admin_account_id_cache[cache_key] = delegated_admins
-        logger.debug(f"Cached {len(delegated_admins)} delegated administrators for {cache_key}")
+        cache[region] = delegated_admins
+        logger.debug(f"Cached {len(delegated_admins)} delegated administrators for {account_id}")
         
         return delegated_admins
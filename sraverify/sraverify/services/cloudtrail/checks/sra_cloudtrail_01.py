@@ -2,32 +2,32 @@
 SRA-CLOUDTRAIL-01: Organization CloudTrail Configuration.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_01(CloudTrailCheck):
     """Check if an Organization trail is configured for the AWS Organization."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-01"
-        self.check_name = "An Organization trail is configured for the AWS Organization"
-        self.account_type = "management"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies that an organization trail is configured for your AWS Organization. "
-            "It is important to have uniform logging strategy for your AWS environment. Organization trail "
-            "logs all events for all AWS accounts in that organization and delivers logs to a single S3 bucket, "
-            "CloudWatch Logs and Event Bridge. Organization trails are automatically applied to all member accounts "
-            "in the organization. Member accounts can see the organization trail, but can't modify or delete it. "
-            "Organization trail should be configured for all AWS regions even if you are not operating out of any region."
-        )
-        self.check_logic = (
-            "Check if at least one trail has IsOrganizationTrail set to true."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-01"
+    check_name = "An Organization trail is configured for the AWS Organization"
+    account_type = "management"
+    severity = "HIGH"
+    description = (
+        "This check verifies that an organization trail is configured for your AWS Organization. "
+        "It is important to have uniform logging strategy for your AWS environment. Organization trail "
+        "logs all events for all AWS accounts in that organization and delivers logs to a single S3 bucket, "
+        "CloudWatch Logs and Event Bridge. Organization trails are automatically applied to all member accounts "
+        "in the organization. Member accounts can see the organization trail, but can't modify or delete it. "
+        "Organization trail should be configured for all AWS regions even if you are not operating out of any region."
+    )
+    check_logic = (
+        "Check if at least one trail has IsOrganizationTrail set to true."
+    )
+
+    data_requirements = (DataRequirement("describe_trails", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
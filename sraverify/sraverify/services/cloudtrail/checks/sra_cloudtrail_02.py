@@ -2,33 +2,33 @@
 SRA-CLOUDTRAIL-02: Organization CloudTrail KMS Encryption.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_02(CloudTrailCheck):
     """Check if organization trails are encrypted with KMS."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-02"
-        self.check_name = "Organization trail is encrypted with KMS"
-        self.account_type = "management"
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies that your organization trail is encrypted with a KMS key. "
-            "Log files delivered by CloudTrail to your bucket should be encrypted by using SSE-KMS. "
-            "This is selected by default in the console but can be altered by users. With SSE-KMS "
-            "you create and manage the KMS key yourself with the ability to manage permissions on "
-            "who can use the key. For a user to read log files they must have read permissions to "
-            "the bucket and have permissions that allows decrypt permission on the key applied by "
-            "the KMS key policy."
-        )
-        self.check_logic = (
-            "Check if organization trails have KmsKeyId configured."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-02"
+    check_name = "Organization trail is encrypted with KMS"
+    account_type = "management"
+    severity = "MEDIUM"
+    description = (
+        "This check verifies that your organization trail is encrypted with a KMS key. "
+        "Log files delivered by CloudTrail to your bucket should be encrypted by using SSE-KMS. "
+        "This is selected by default in the console but can be altered by users. With SSE-KMS "
+        "you create and manage the KMS key yourself with the ability to manage permissions on "
+        "who can use the key. For a user to read log files they must have read permissions to "
+        "the bucket and have permissions that allows decrypt permission on the key applied by "
+        "the KMS key policy."
+    )
+    check_logic = (
+        "Check if organization trails have KmsKeyId configured."
+    )
+
+    data_requirements = (DataRequirement("describe_trails", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -2,31 +2,31 @@
 SRA-CLOUDTRAIL-03: Organization CloudTrail Log File Validation.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_03(CloudTrailCheck):
     """Check if organization trails have log file validation enabled."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-03"
-        self.check_name = "Organization trail has Log File validation enabled"
-        self.account_type = "management"
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies that your organization trail has log file validation enabled. "
-            "Validated log files are especially valuable in security and forensic investigations. "
-            "CloudTrail log file integrity validation uses industry standard algorithms: SHA-256 for "
-            "hashing and SHA-256 with RSA for digital signing. This makes it computationally unfeasible "
-            "to modify, delete or forge CloudTrail log files without detection."
-        )
-        self.check_logic = (
-            "Check if organization trails have LogFileValidationEnabled set to true."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-03"
+    check_name = "Organization trail has Log File validation enabled"
+    account_type = "management"
+    severity = "MEDIUM"
+    description = (
+        "This check verifies that your organization trail has log file validation enabled. "
+        "Validated log files are especially valuable in security and forensic investigations. "
+        "CloudTrail log file integrity validation uses industry standard algorithms: SHA-256 for "
+        "hashing and SHA-256 with RSA for digital signing. This makes it computationally unfeasible "
+        "to modify, delete or forge CloudTrail log files without detection."
+    )
+    check_logic = (
+        "Check if organization trails have LogFileValidationEnabled set to true."
+    )
+
+    data_requirements = (DataRequirement("describe_trails", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
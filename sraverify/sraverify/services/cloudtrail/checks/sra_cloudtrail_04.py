@@ -2,29 +2,29 @@
 SRA-CLOUDTRAIL-04: Organization CloudTrail Multi-Region Configuration.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_04(CloudTrailCheck):
     """Check if organization trails are configured as multi-region trails."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-04"
-        self.check_name = "Organization Trail is a multi-region trail"
-        self.account_type = "management"
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies whether the Organization trail is configured as a multi-region trail. "
-            "This helps with visibility across your entire AWS environment, even for AWS Regions where "
-            "you are not operating to ensure you detect any malicious and/or unauthorized activities."
-        )
-        self.check_logic = (
-            "Check if organization trails have IsMultiRegionTrail set to true."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-04"
+    check_name = "Organization Trail is a multi-region trail"
+    account_type = "management"
+    severity = "MEDIUM"
+    description = (
+        "This check verifies whether the Organization trail is configured as a multi-region trail. "
+        "This helps with visibility across your entire AWS environment, even for AWS Regions where "
+        "you are not operating to ensure you detect any malicious and/or unauthorized activities."
+    )
+    check_logic = (
+        "Check if organization trails have IsMultiRegionTrail set to true."
+    )
+
+    data_requirements = (DataRequirement("describe_trails", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -2,31 +2,31 @@
 SRA-CLOUDTRAIL-05: CloudTrail CloudWatch Logs Configuration.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_05(CloudTrailCheck):
     """Check if trails have CloudWatch Logs configuration."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-05"
-        self.check_name = "CloudTrail has CloudWatch Logs configuration"
-        self.account_type = "management"
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies that CloudTrail has CloudWatch Logs configuration. "
-            "CloudWatch Logs enables you to centralize the CloudTrail logs from all your AWS accounts and "
-            "regions in the AWS Organization, to a single, highly scalable service. You can then easily "
-            "view them, search them for specific error codes or patterns, filter them based on specific "
-            "fields, or archive them securely for future analysis."
-        )
-        self.check_logic = (
-            "Check if trails have CloudWatchLogsLogGroupArn and CloudWatchLogsRoleArn configured."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-05"
+    check_name = "CloudTrail has CloudWatch Logs configuration"
+    account_type = "management"
+    severity = "MEDIUM"
+    description = (
+        "This check verifies that CloudTrail has CloudWatch Logs configuration. "
+        "CloudWatch Logs enables you to centralize the CloudTrail logs from all your AWS accounts and "
+        "regions in the AWS Organization, to a single, highly scalable service. You can then easily "
+        "view them, search them for specific error codes or patterns, filter them based on specific "
+        "fields, or archive them securely for future analysis."
+    )
+    check_logic = (
+        "Check if trails have CloudWatchLogsLogGroupArn and CloudWatchLogsRoleArn configured."
+    )
+
+    data_requirements = (DataRequirement("describe_trails", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -2,30 +2,30 @@
 SRA-CLOUDTRAIL-06: Organization CloudTrail Global Service Events.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_06(CloudTrailCheck):
     """Check if organization trails are configured to publish events from global services."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-06"
-        self.check_name = "Organization trail is configured to publish events from global services"
-        self.account_type = "management"
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies that your organization trail is configured to publish event from AWS global services. "
-            "The organization trail should capture events from global services such as AWS IAM, AWS STS and Amazon CloudFront. "
-            "Trails created using CloudTrail console by default have global service event configured but if you are creating "
-            "trail with AWS CLI, AWS SDKs, or CloudTrail API you have to specify to included global services events."
-        )
-        self.check_logic = (
-            "Check if organization trails have IncludeGlobalServiceEvents set to true."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-06"
+    check_name = "Organization trail is configured to publish events from global services"
+    account_type = "management"
+    severity = "MEDIUM"
+    description = (
+        "This check verifies that your organization trail is configured to publish event from AWS global services. "
+        "The organization trail should capture events from global services such as AWS IAM, AWS STS and Amazon CloudFront. "
+        "Trails created using CloudTrail console by default have global service event configured but if you are creating "
+        "trail with AWS CLI, AWS SDKs, or CloudTrail API you have to specify to included global services events."
+    )
+    check_logic = (
+        "Check if organization trails have IncludeGlobalServiceEvents set to true."
+    )
+
+    data_requirements = (DataRequirement("describe_trails", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
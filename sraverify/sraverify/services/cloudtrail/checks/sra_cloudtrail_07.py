@@ -2,29 +2,29 @@
 SRA-CLOUDTRAIL-07: Organization CloudTrail Active Logging.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_07(CloudTrailCheck):
     """Check if organization trails are actively publishing events."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-07"
-        self.check_name = "Organization trail is actively publishing events"
-        self.account_type = "management"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies that your organization trail is running and actively logging events. "
-            "If a trail is modified to stop logging, accidently or by malicious user, you will not have "
-            "visibility into any API activity across your AWS environment."
-        )
-        self.check_logic = (
-            "Check if organization trails have IsLogging set to true in their status."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-07"
+    check_name = "Organization trail is actively publishing events"
+    account_type = "management"
+    severity = "HIGH"
+    description = (
+        "This check verifies that your organization trail is running and actively logging events. "
+        "If a trail is modified to stop logging, accidently or by malicious user, you will not have "
+        "visibility into any API activity across your AWS environment."
+    )
+    check_logic = (
+        "Check if organization trails have IsLogging set to true in their status."
+    )
+
+    data_requirements = (DataRequirement("describe_trails", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -3,31 +3,31 @@ SRA-CLOUDTRAIL-08: Organization CloudTrail S3 Delivery.
 """
 from typing import List, Dict, Any
 from datetime import datetime, timedelta, timezone
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_08(CloudTrailCheck):
     """Check if organization trails are publishing logs to destination S3 bucket."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-08"
-        self.check_name = "Organization trail is publishing logs to destination S3 bucket"
-        self.account_type = "management"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies that last attempt to send CloudTrail logs to S3 bucket was successful. "
-            "CloudTrail log files are an audit log of actions taken by an IAM identity or an AWS service. "
-            "The integrity, completeness and availability of these logs is crucial for forensic and auditing purposes. "
-            "By logging to a dedicated and centralized Amazon S3 bucket, you can enforce strict security controls, "
-            "access, and segregation of duties."
-        )
-        self.check_logic = (
-            "Check if organization trails have LatestDeliveryTime within the last 24 hours."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-08"
+    check_name = "Organization trail is publishing logs to destination S3 bucket"
+    account_type = "management"
+    severity = "HIGH"
+    description = (
+        "This check verifies that last attempt to send CloudTrail logs to S3 bucket was successful. "
+        "CloudTrail log files are an audit log of actions taken by an IAM identity or an AWS service. "
+        "The integrity, completeness and availability of these logs is crucial for forensic and auditing purposes. "
+        "By logging to a dedicated and centralized Amazon S3 bucket, you can enforce strict security controls, "
+        "access, and segregation of duties."
+    )
+    check_logic = (
+        "Check if organization trails have LatestDeliveryTime within the last 24 hours."
+    )
+
+    data_requirements = (DataRequirement("describe_trails", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
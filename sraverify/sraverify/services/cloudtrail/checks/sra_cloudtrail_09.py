@@ -3,29 +3,29 @@ SRA-CLOUDTRAIL-09: Organization CloudTrail CloudWatch Logs Delivery.
 """
 from typing import List, Dict, Any
 from datetime import datetime, timedelta, timezone
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_09(CloudTrailCheck):
     """Check if organization trails are publishing logs to CloudWatch Logs."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-09"
-        self.check_name = "Organization trail is publishing logs to CloudWatch Logs"
-        self.account_type = "management"
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies that last attempt to send CloudTrail logs to CloudWatch Logs was successful. "
-            "Successful delivery of CloudTrails logs to CloudWatch ensures later availability for monitoring. "
-            "CloudTrail requires right permission to send log events to CloudWatch Logs."
-        )
-        self.check_logic = (
-            "Check if organization trails have LatestCloudWatchLogsDeliveryTime within the last 24 hours."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-09"
+    check_name = "Organization trail is publishing logs to CloudWatch Logs"
+    account_type = "management"
+    severity = "MEDIUM"
+    description = (
+        "This check verifies that last attempt to send CloudTrail logs to CloudWatch Logs was successful. "
+        "Successful delivery of CloudTrails logs to CloudWatch ensures later availability for monitoring. "
+        "CloudTrail requires right permission to send log events to CloudWatch Logs."
+    )
+    check_logic = (
+        "Check if organization trails have LatestCloudWatchLogsDeliveryTime within the last 24 hours."
+    )
+
+    data_requirements = (DataRequirement("describe_trails", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -3,27 +3,27 @@ SRA-CLOUDTRAIL-10: Organization CloudTrail Log File Validation Digest Delivery.
 """
 from typing import List, Dict, Any
 from datetime import datetime, timedelta, timezone
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_10(CloudTrailCheck):
     """Check if organization trails are delivering log file validation digest files."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-10"
-        self.check_name = "Organization trail is configured to deliver Log file validation digest files to destination bucket"
-        self.account_type = "management"
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies that log file validation digest files are being successfully delivered to a S3 bucket."
-        )
-        self.check_logic = (
-            "Check if organization trails have LatestDigestDeliveryTime within the last 24 hours."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-10"
+    check_name = "Organization trail is configured to deliver Log file validation digest files to destination bucket"
+    account_type = "management"
+    severity = "MEDIUM"
+    description = (
+        "This check verifies that log file validation digest files are being successfully delivered to a S3 bucket."
+    )
+    check_logic = (
+        "Check if organization trails have LatestDigestDeliveryTime within the last 24 hours."
+    )
+
+    data_requirements = (DataRequirement("describe_trails", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -2,31 +2,31 @@
 SRA-CLOUDTRAIL-11: Organization CloudTrail Logs Centralized in Log Archive Account.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_11(CloudTrailCheck):
     """Check if organization trails logs are delivered to a centralized S3 bucket in the Log Archive account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-11"
-        self.check_name = "Organization trail Logs are delivered to a centralized S3 bucket in the Log Archive Account"
-        self.account_type = "management"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether the corresponding S3 buckets that stores organization trail logs "
-            "in created in Log Archive account. This separates the management and usage of CloudTrail log "
-            "privileges. The Log Archive account is dedicated to ingesting and archiving all security-related "
-            "logs and backups."
-        )
-        self.check_logic = (
-            "Check if organization trails are configured to deliver logs to S3 buckets owned by "
-            "the Log Archive account by comparing the S3 bucket ARN with the provided Log Archive account IDs."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-11"
+    check_name = "Organization trail Logs are delivered to a centralized S3 bucket in the Log Archive Account"
+    account_type = "management"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether the corresponding S3 buckets that stores organization trail logs "
+        "in created in Log Archive account. This separates the management and usage of CloudTrail log "
+        "privileges. The Log Archive account is dedicated to ingesting and archiving all security-related "
+        "logs and backups."
+    )
+    check_logic = (
+        "Check if organization trails are configured to deliver logs to S3 buckets owned by "
+        "the Log Archive account by comparing the S3 bucket ARN with the provided Log Archive account IDs."
+    )
+
+    data_requirements = (DataRequirement("describe_trails", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
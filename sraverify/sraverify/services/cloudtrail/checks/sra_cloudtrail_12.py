@@ -2,29 +2,29 @@
 SRA-CLOUDTRAIL-12: CloudTrail Delegated Administrator Configuration.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_12(CloudTrailCheck):
     """Check if CloudTrail service administration is delegated out of AWS Organization management account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-12"
-        self.check_name = "Delegated Administrator set for CloudTrail"
-        self.account_type = "management"
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies whether CloudTrail service administration is delegated out of AWS Organization "
-            "management account. The delegated administrator has permissions to create and manage analyzers "
-            "with the AWS organization as the zone of trust."
-        )
-        self.check_logic = (
-            "Check if there is at least one delegated administrator for CloudTrail service."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-12"
+    check_name = "Delegated Administrator set for CloudTrail"
+    account_type = "management"
+    severity = "MEDIUM"
+    description = (
+        "This check verifies whether CloudTrail service administration is delegated out of AWS Organization "
+        "management account. The delegated administrator has permissions to create and manage analyzers "
+        "with the AWS organization as the zone of trust."
+    )
+    check_logic = (
+        "Check if there is at least one delegated administrator for CloudTrail service."
+    )
+
+    data_requirements = (DataRequirement("get_delegated_administrators", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -2,30 +2,30 @@
 SRA-CLOUDTRAIL-13: CloudTrail Delegated Administrator is the Audit Account.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.cloudtrail.base import CloudTrailCheck
 from sraverify.core.logging import logger
 
 
 class SRA_CLOUDTRAIL_13(CloudTrailCheck):
     """Check if CloudTrail delegated administrator is the Audit account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CLOUDTRAIL-13"
-        self.check_name = "The audit account is the Delegated Administrator set for CloudTrail"
-        self.account_type = "management"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether CloudTrail delegated admin account is the audit account of your AWS organization. "
-            "Audit account is dedicated to operating security services, monitoring AWS accounts, and "
-            "automating security alerting and response. CloudTrail helps monitor API activities across "
-            "all your AWS accounts and regions."
-        )
-        self.check_logic = (
-            "Check if the delegated administrator account matches any of the specified Audit account IDs."
-        )
-    
+
+    check_id = "SRA-CLOUDTRAIL-13"
+    check_name = "The audit account is the Delegated Administrator set for CloudTrail"
+    account_type = "management"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether CloudTrail delegated admin account is the audit account of your AWS organization. "
+        "Audit account is dedicated to operating security services, monitoring AWS accounts, and "
+        "automating security alerting and response. CloudTrail helps monitor API activities across "
+        "all your AWS accounts and regions."
+    )
+    check_logic = (
+        "Check if the delegated administrator account matches any of the specified Audit account IDs."
+    )
+
+    data_requirements = (DataRequirement("get_delegated_administrators", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
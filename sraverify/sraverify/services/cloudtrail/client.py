@@ -4,11 +4,14 @@ CloudTrail client for interacting with AWS CloudTrail service.
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import get_client, lazy_client
 from sraverify.core.logging import logger
 
 
 class CloudTrailClient:
     """Client for interacting with AWS CloudTrail service."""
+    client = lazy_client('cloudtrail')
+    org_client = lazy_client('organizations')
     
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,8 +23,6 @@ class CloudTrailClient:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('cloudtrail', region_name=region)
-        self.org_client = self.session.client('organizations', region_name=region)
 
     def describe_trails(self, trail_name_list: Optional[List[str]] = None, include_shadow_trails: bool = True) -> List[Dict[str, Any]]:
         """
@@ -105,7 +106,7 @@ class CloudTrailClient:
         """
         try:
             logger.debug(f"Getting current account ID in {self.region}")
-            sts_client = self.session.client("sts")
+            sts_client = get_client(self.session, 'sts')
             response = sts_client.get_caller_identity()
             account_id = response["Account"]
             logger.debug(f"Current account ID: {account_id}")
@@ -9,28 +9,17 @@ from sraverify.core.logging import logger
 
 class ConfigCheck(SecurityCheck):
     """Base class for all AWS Config security checks."""
-    
-    # Class-level caches shared across all instances
-    _config_recorder_status_cache = {}
-    _config_delivery_channel_status_cache = {}
-    _config_organization_aggregator = {}
-    _config_delivery_channel_cache = {}
-    _config_delegated_admin_cache = {}
-    
+
+    account_type = "account"  # Default to account, can be overridden in child classes
+    service = "Config"
+    resource_type = "AWS::Config::ConfigurationRecorder"
+
     # Config service principals
     CONFIG_SERVICE_PRINCIPALS = [
         "config.amazonaws.com",
         "config-multiaccountsetup.amazonaws.com"
     ]
     
-    def __init__(self):
-        """Initialize Config base check."""
-        super().__init__(
-            account_type="account",  # Default to account, can be overridden in child classes
-            service="Config",
-            resource_type="AWS::Config::ConfigurationRecorder"
-        )
-    
     def _setup_clients(self):
         """Set up Config clients for each region."""
         # Clear existing clients
@@ -54,7 +43,7 @@ class ConfigCheck(SecurityCheck):
     
     def get_configuration_recorders(self, region: str) -> List[Dict[str, Any]]:
         """
-        Get configuration recorders for a specific region.
+        Get configuration recorders for a specific region with caching.
         
         Args:
             region: AWS region name
@@ -62,6 +51,12 @@ class ConfigCheck(SecurityCheck):
         Returns:
             List of configuration recorders
         """
+        # Check cache first
+        cache = self.cache('config.recorders')
+        if region in cache:
+            logger.debug(f"Using cached configuration recorders for {region}")
+            return cache[region]
+        
         # Get client for the region
         client = self.get_client(region)
         if not client:
@@ -70,7 +65,10 @@ class ConfigCheck(SecurityCheck):
         
         # Get configuration recorders from client
         recorders = client.describe_configuration_recorders()
-        logger.debug(f"Found {len(recorders)} configuration recorders for {region}")
+        
+        # Cache the results - store the complete response
+        cache[region] = recorders
+        logger.debug(f"Cached {len(recorders)} configuration recorders for {region}")
         
         return recorders
     
@@ -85,10 +83,10 @@ class ConfigCheck(SecurityCheck):
             List of configuration recorder statuses
         """
         # Check cache first
-        cache_key = f"{region}:{self.session.region_name}"
-        if cache_key in self.__class__._config_recorder_status_cache:
+        cache = self.cache('config.recorder_status')
+        if region in cache:
             logger.debug(f"Using cached configuration recorder status for {region}")
-            return self.__class__._config_recorder_status_cache[cache_key]
+            return cache[region]
         
         # Get client for the region
         client = self.get_client(region)
@@ -100,7 +98,7 @@ class ConfigCheck(SecurityCheck):
         statuses = client.describe_configuration_recorder_status()
         
         # Cache the results - store the complete response
-        self.__class__._config_recorder_status_cache[cache_key] = statuses
+        cache[region] = statuses
         logger.debug(f"Cached {len(statuses)} configuration recorder statuses for {region}")
         
         return statuses
@@ -116,10 +114,10 @@ class ConfigCheck(SecurityCheck):
             List of delivery channels
         """
         # Check cache first
-        cache_key = f"{region}:{self.session.region_name}"
-        if cache_key in self.__class__._config_delivery_channel_cache:
+        cache = self.cache('config.delivery_channel')
+        if region in cache:
             logger.debug(f"Using cached delivery channels for {region}")
-            return self.__class__._config_delivery_channel_cache[cache_key]
+            return cache[region]
             
         # Get client for the region
         client = self.get_client(region)
@@ -131,7 +129,7 @@ class ConfigCheck(SecurityCheck):
         channels = client.describe_delivery_channels()
         
         # Cache the results
-        self.__class__._config_delivery_channel_cache[cache_key] = channels
+        cache[region] = channels
         logger.debug(f"Cached {len(channels)} delivery channels for {region}")
         
         return channels
@@ -147,10 +145,10 @@ class ConfigCheck(SecurityCheck):
             List of delivery channel statuses
         """
         # Check cache first
-        cache_key = f"{region}:{self.session.region_name}"
-        if cache_key in self.__class__._config_delivery_channel_status_cache:
+        cache = self.cache('config.delivery_channel_status')
+        if region in cache:
             logger.debug(f"Using cached delivery channel status for {region}")
-            return self.__class__._config_delivery_channel_status_cache[cache_key]
+            return cache[region]
         
         # Get client for the region
         client = self.get_client(region)
@@ -162,7 +160,7 @@ class ConfigCheck(SecurityCheck):
         statuses = client.describe_delivery_channel_status()
         
         # Cache the results - store the complete response
-        self.__class__._config_delivery_channel_status_cache[cache_key] = statuses
+        cache[region] = statuses
         logger.debug(f"Cached {len(statuses)} delivery channel statuses for {region}")
         
         return statuses
@@ -178,10 +176,10 @@ class ConfigCheck(SecurityCheck):
             List of configuration aggregators
         """
         # Check cache first
-        cache_key = f"{region}:{self.session.region_name}"
-        if cache_key in self.__class__._config_organization_aggregator:
+        cache = self.cache('config.organization_aggregator')
+        if region in cache:
             logger.debug(f"Using cached configuration aggregators for {region}")
-            return self.__class__._config_organization_aggregator[cache_key]
+            return cache[region]
         
         # Get client for the region
         client = self.get_client(region)
@@ -193,7 +191,7 @@ class ConfigCheck(SecurityCheck):
         aggregators = client.describe_configuration_aggregators()
         
         # Cache the results
-        self.__class__._config_organization_aggregator[cache_key] = aggregators
+        cache[region] = aggregators
         logger.debug(f"Cached {len(aggregators)} configuration aggregators for {region}")
         
         return aggregators
@@ -222,12 +220,13 @@ class ConfigCheck(SecurityCheck):
         
         all_delegated_admins = []
         
+        cache = self.cache('config.delegated_admin')
         for sp in service_principals:
             # Check cache first
-            cache_key = f"{account_id}:{self.session.region_name}:{sp}"
-            if cache_key in self.__class__._config_delegated_admin_cache:
-                logger.debug(f"Using cached delegated administrators for {cache_key}")
-                admins = self.__class__._config_delegated_admin_cache[cache_key]
+            cache_key = (self.regions[0], sp)
+            if cache_key in cache:
+                logger.debug(f"Using cached delegated administrators for {sp}")
+                admins = cache[cache_key]
                 all_delegated_admins.extend(admins)
                 continue
             
@@ -241,8 +240,8 @@ class ConfigCheck(SecurityCheck):
             delegated_admins = client.list_delegated_administrators(sp)
             
             # Cache the results
-            self.__class__._config_delegated_admin_cache[cache_key] = delegated_admins
-            logger.debug(f"Cached {len(delegated_admins)} delegated administrators for {cache_key}")
+            cache[cache_key] = delegated_admins
+            logger.debug(f"Cached {len(delegated_admins)} delegated administrators for {sp}")
             
             all_delegated_admins.extend(delegated_admins)
         
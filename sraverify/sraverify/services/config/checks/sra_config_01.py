@@ -8,23 +8,22 @@ from sraverify.core.logging import logger
 
 class SRA_CONFIG_01(ConfigCheck):
     """Check if AWS Config recorder is configured in each region."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CONFIG-01"
-        self.check_name = "AWS Config recorder is configured in this region"
-        self.account_type = "application"  
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies that a configuration recorder exists in the AWS Region. "
-            "AWS Config uses the configuration recorder to detect changes in your resource configurations "
-            "and capture these changes as configuration items. You must create a configuration recorder "
-            "in every AWS Region for AWS Config can track your resource configurations in the region."
-        )
-        self.check_logic = (
-            "Checks if AWS Config recorder exists in each region using describe-configuration-recorder-status API."
-        )
+
+    check_id = "SRA-CONFIG-01"
+    check_name = "AWS Config recorder is configured in this region"
+    account_type = "application"  
+    severity = "HIGH"
+    description = (
+        "This check verifies that a configuration recorder exists in the AWS Region. "
+        "AWS Config uses the configuration recorder to detect changes in your resource configurations "
+        "and capture these changes as configuration items. You must create a configuration recorder "
+        "in every AWS Region for AWS Config can track your resource configurations in the region."
+    )
+    check_logic = (
+        "Checks if AWS Config recorder exists in each region using describe-configuration-recorder-status API."
+    )
+
+    data_requirements = ("get_configuration_recorders", "get_configuration_recorder_status")
     
     def execute(self) -> List[Dict[str, Any]]:
         """
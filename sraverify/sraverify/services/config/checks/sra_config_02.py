@@ -8,24 +8,23 @@ from sraverify.core.logging import logger
 
 class SRA_CONFIG_02(ConfigCheck):
     """Check if AWS Config recorder is running."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CONFIG-02"
-        self.check_name = "AWS Config recorder is running"
-        self.account_type = "application"  
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies that configuration recorder is running. AWS Config configuration "
-            "recorder must be started and running to record resource configurations. If you set up "
-            "AWS Config by using the console or the AWS CLI, AWS Config automatically creates and "
-            "then starts the configuration recorder for you. Users with right permission have the "
-            "ability to stop configuration recorder."
-        )
-        self.check_logic = (
-            "Checks if AWS Config recorder is running by verifying the lastStatus is SUCCESS."
-        )
+
+    check_id = "SRA-CONFIG-02"
+    check_name = "AWS Config recorder is running"
+    account_type = "application"  
+    severity = "HIGH"
+    description = (
+        "This check verifies that configuration recorder is running. AWS Config configuration "
+        "recorder must be started and running to record resource configurations. If you set up "
+        "AWS Config by using the console or the AWS CLI, AWS Config automatically creates and "
+        "then starts the configuration recorder for you. Users with right permission have the "
+        "ability to stop configuration recorder."
+    )
+    check_logic = (
+        "Checks if AWS Config recorder is running by verifying the lastStatus is SUCCESS."
+    )
+
+    data_requirements = ("get_configuration_recorders", "get_configuration_recorder_status")
     
     def execute(self) -> List[Dict[str, Any]]:
         """
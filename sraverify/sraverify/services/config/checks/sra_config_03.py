@@ -8,23 +8,22 @@ from sraverify.core.logging import logger
 
 class SRA_CONFIG_03(ConfigCheck):
     """Check if AWS Config latest recording event is processed successfully."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CONFIG-03"
-        self.check_name = "AWS Config latest recording event is processed successfully"
-        self.account_type = "application"  # This check applies to all account types
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether the last delivery attempt to the delivery channel was successful "
-            "to ensure you receive configuration change notifications. As AWS Config continually records "
-            "the changes that occur to your AWS resources, it sends notifications and updated configuration "
-            "states through the delivery channel."
-        )
-        self.check_logic = (
-            "Checks if the lastStatus of the delivery channel is SUCCESS."
-        )
+
+    check_id = "SRA-CONFIG-03"
+    check_name = "AWS Config latest recording event is processed successfully"
+    account_type = "application"  # This check applies to all account types
+    severity = "HIGH"
+    description = (
+        "This check verifies whether the last delivery attempt to the delivery channel was successful "
+        "to ensure you receive configuration change notifications. As AWS Config continually records "
+        "the changes that occur to your AWS resources, it sends notifications and updated configuration "
+        "states through the delivery channel."
+    )
+    check_logic = (
+        "Checks if the lastStatus of the delivery channel is SUCCESS."
+    )
+
+    data_requirements = ("get_delivery_channels", "get_delivery_channel_status")
     
     def execute(self) -> List[Dict[str, Any]]:
         """
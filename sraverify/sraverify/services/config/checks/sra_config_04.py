@@ -8,24 +8,23 @@ from sraverify.core.logging import logger
 
 class SRA_CONFIG_04(ConfigCheck):
     """Check if AWS Config has an organization aggregator."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CONFIG-04"
-        self.check_name = "AWS Config has organization aggregator"
-        self.account_type = "audit"  # This check applies to audit account
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies that a AWS Config aggregator exists in the AWS Region that collects "
-            "configuration and compliance data from all member accounts of the AWS Organization. "
-            "It periodically retrieves configuration snapshots from the source accounts and stores "
-            "them in the designated S3 bucket."
-        )
-        self.check_logic = (
-            "Checks if AWS Config aggregator exists using describe-configuration-aggregators API."
-        )
-        self.resource_type = "AWS::Config::ConfigurationAggregator"
+
+    check_id = "SRA-CONFIG-04"
+    check_name = "AWS Config has organization aggregator"
+    account_type = "audit"  # This check applies to audit account
+    severity = "HIGH"
+    description = (
+        "This check verifies that a AWS Config aggregator exists in the AWS Region that collects "
+        "configuration and compliance data from all member accounts of the AWS Organization. "
+        "It periodically retrieves configuration snapshots from the source accounts and stores "
+        "them in the designated S3 bucket."
+    )
+    check_logic = (
+        "Checks if AWS Config aggregator exists using describe-configuration-aggregators API."
+    )
+    resource_type = "AWS::Config::ConfigurationAggregator"
+
+    data_requirements = ("get_configuration_aggregators",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,23 +8,22 @@ from sraverify.core.logging import logger
 
 class SRA_CONFIG_05(ConfigCheck):
     """Check if AWS Config organization aggregator includes all regions."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CONFIG-05"
-        self.check_name = "AWS Config organization aggregator includes all regions"
-        self.account_type = "audit"  # This check applies to audit account
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies that the AWS Config organization aggregator is configured to aggregate "
-            "config data from all existing and future AWS Regions. This provides you visibility into "
-            "activities across all regions even if your business does not operate in the region."
-        )
-        self.check_logic = (
-            "Checks if AWS Config organization aggregator has AllAwsRegions set to true."
-        )
-        self.resource_type = "AWS::Config::ConfigurationAggregator"
+
+    check_id = "SRA-CONFIG-05"
+    check_name = "AWS Config organization aggregator includes all regions"
+    account_type = "audit"  # This check applies to audit account
+    severity = "MEDIUM"
+    description = (
+        "This check verifies that the AWS Config organization aggregator is configured to aggregate "
+        "config data from all existing and future AWS Regions. This provides you visibility into "
+        "activities across all regions even if your business does not operate in the region."
+    )
+    check_logic = (
+        "Checks if AWS Config organization aggregator has AllAwsRegions set to true."
+    )
+    resource_type = "AWS::Config::ConfigurationAggregator"
+
+    data_requirements = ("get_configuration_aggregators",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
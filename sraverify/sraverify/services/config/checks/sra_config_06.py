@@ -9,26 +9,29 @@ from sraverify.core.logging import logger
 
 class SRA_CONFIG_06(ConfigCheck):
     """Check if AWS Config delivery channel S3 bucket is centralized in Log Archive account."""
+
+    check_id = "SRA-CONFIG-06"
+    check_name = "AWS Config delivery channel S3 bucket is centralized in Log Archive account"
+    account_type = "application"  # This check applies to management account
+    severity = "MEDIUM"
+    description = (
+        "This check verifies that the AWS Config delivery channel S3 bucket is centralized in "
+        "Log Archive account. Security Tooling provides central visibility and monitoring of AWS "
+        "Organization wide resource configuration."
+    )
+    check_logic = (
+        "Checks if AWS Config delivery channel S3 bucket is owned by the Log Archive account."
+    )
+    resource_type = "AWS::Config::DeliveryChannel"
+
+    data_requirements = ("get_delivery_channels",)
     
     def __init__(self):
         """Initialize the check."""
         super().__init__()
-        self.check_id = "SRA-CONFIG-06"
-        self.check_name = "AWS Config delivery channel S3 bucket is centralized in Log Archive account"
-        self.account_type = "application"  # This check applies to management account
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies that the AWS Config delivery channel S3 bucket is centralized in "
-            "Log Archive account. Security Tooling provides central visibility and monitoring of AWS "
-            "Organization wide resource configuration."
-        )
-        self.check_logic = (
-            "Checks if AWS Config delivery channel S3 bucket is owned by the Log Archive account."
-        )
-        self.resource_type = "AWS::Config::DeliveryChannel"
         # Initialize log archive account attribute
         self._log_archive_accounts = None
-    
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,37 +8,39 @@ from sraverify.core.logging import logger
 
 class SRA_CONFIG_07(ConfigCheck):
     """Check if Config administration for the AWS Organization has a delegated administrator."""
-    
+
+    check_id = "SRA-CONFIG-07"
+    check_name = "Config administration for the AWS Organization has a delegated administrator"
+    account_type = "management"  # This check applies to management account
+    severity = "MEDIUM"
+    description = (
+        "This check verifies whether Config service administration for your AWS Organization "
+        "is delegated out of the AWS Organization management account."
+    )
+    check_logic = (
+        "Checks if a delegated administrator exists for the Config service using the "
+        "list-delegated-administrators API with service principals config.amazonaws.com "
+        "and config-multiaccountsetup.amazonaws.com."
+    )
+    resource_type = "AWS::Organizations::Account"
+
     def __init__(self):
         """Initialize the check."""
         super().__init__()
-        self.check_id = "SRA-CONFIG-07"
-        self.check_name = "Config administration for the AWS Organization has a delegated administrator"
-        self.account_type = "management"  # This check applies to management account
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies whether Config service administration for your AWS Organization "
-            "is delegated out of the AWS Organization management account."
-        )
-        self.check_logic = (
-            "Checks if a delegated administrator exists for the Config service using the "
-            "list-delegated-administrators API with service principals config.amazonaws.com "
-            "and config-multiaccountsetup.amazonaws.com."
-        )
-        self.resource_type = "AWS::Organizations::Account"
         # Initialize parameters as an empty dict
         self.params = {}
-    
-    def initialize(self, session, regions=None, **kwargs):
+
+    def initialize(self, session, regions=None, context=None, **kwargs):
         """
         Initialize check with AWS session, regions, and parameters.
         
         Args:
             session: AWS session to use for the check
             regions: List of AWS regions to check
+            context: Scan-wide context shared by all checks
             **kwargs: Additional parameters for the check
         """
-        super().initialize(session, regions)
+        super().initialize(session, regions, context=context)
         # Store parameters
         self.params = kwargs
         logger.debug(f"Initialized {self.check_id} with parameters: {self.params}")
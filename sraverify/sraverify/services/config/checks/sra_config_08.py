@@ -8,36 +8,38 @@ from sraverify.core.logging import logger
 
 class SRA_CONFIG_08(ConfigCheck):
     """Check if Config delegated admin account is the Security Tooling (Audit) account."""
-    
+
+    check_id = "SRA-CONFIG-08"
+    check_name = "Config delegated admin account is the Security Tooling (Audit) account"
+    account_type = "management"  # This check applies to management account
+    severity = "MEDIUM"
+    description = (
+        "This check verifies whether Config delegated admin account is the audit account of your "
+        "AWS organization. The audit account is dedicated to operating security services, monitoring "
+        "AWS accounts, and automating security alerting and response."
+    )
+    check_logic = (
+        "Compares the delegated admin account ID with the provided audit account ID."
+    )
+    resource_type = "AWS::Organizations::Account"
+
     def __init__(self):
         """Initialize the check."""
         super().__init__()
-        self.check_id = "SRA-CONFIG-08"
-        self.check_name = "Config delegated admin account is the Security Tooling (Audit) account"
-        self.account_type = "management"  # This check applies to management account
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies whether Config delegated admin account is the audit account of your "
-            "AWS organization. The audit account is dedicated to operating security services, monitoring "
-            "AWS accounts, and automating security alerting and response."
-        )
-        self.check_logic = (
-            "Compares the delegated admin account ID with the provided audit account ID."
-        )
-        self.resource_type = "AWS::Organizations::Account"
         # Initialize audit account attribute
         self._audit_accounts = []
-    
-    def initialize(self, session, regions=None, **kwargs):
+
+    def initialize(self, session, regions=None, context=None, **kwargs):
         """
         Initialize check with AWS session, regions, and parameters.
         
         Args:
             session: AWS session to use for the check
             regions: List of AWS regions to check
+            context: Scan-wide context shared by all checks
             **kwargs: Additional parameters for the check
         """
-        super().initialize(session, regions)
+        super().initialize(session, regions, context=context)
         
         # Extract audit-account from kwargs
         if 'audit-account' in kwargs:
@@ -8,24 +8,23 @@ from sraverify.core.logging import logger
 
 class SRA_CONFIG_09(ConfigCheck):
     """Check if Config Organization aggregator is in a valid status."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-CONFIG-09"
-        self.check_name = "Config Organization aggregator is in a valid status"
-        self.account_type = "audit"  # This check applies to audit account
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies whether Config Organization aggregator has a valid status. "
-            "A value of FAILED indicates errors while moving data and value OUTDATED indicates "
-            "the data is not the most recent."
-        )
-        self.check_logic = (
-            "Checks if all aggregator sources have a status of SUCCEEDED using "
-            "describe-configuration-aggregator-sources-status API."
-        )
-        self.resource_type = "AWS::Config::ConfigurationAggregator"
+
+    check_id = "SRA-CONFIG-09"
+    check_name = "Config Organization aggregator is in a valid status"
+    account_type = "audit"  # This check applies to audit account
+    severity = "MEDIUM"
+    description = (
+        "This check verifies whether Config Organization aggregator has a valid status. "
+        "A value of FAILED indicates errors while moving data and value OUTDATED indicates "
+        "the data is not the most recent."
+    )
+    check_logic = (
+        "Checks if all aggregator sources have a status of SUCCEEDED using "
+        "describe-configuration-aggregator-sources-status API."
+    )
+    resource_type = "AWS::Config::ConfigurationAggregator"
+
+    data_requirements = ("get_configuration_aggregators",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -4,11 +4,15 @@ AWS Config client for interacting with AWS Config service.
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import get_client, lazy_client
 from sraverify.core.logging import logger
 
 
 class ConfigClient:
     """Client for interacting with AWS Config service."""
+    client = lazy_client('config')
+    org_client = lazy_client('organizations')
+    s3_client = lazy_client('s3')
     
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,9 +24,6 @@ class ConfigClient:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('config', region_name=region)
-        self.org_client = self.session.client('organizations', region_name=region)
-        self.s3_client = self.session.client('s3', region_name=region)
 
     def get_account_id(self) -> Optional[str]:
         """
@@ -33,7 +34,7 @@ class ConfigClient:
         """
         try:
             logger.debug(f"Getting current account ID in {self.region}")
-            sts_client = self.session.client("sts")
+            sts_client = get_client(self.session, 'sts')
             response = sts_client.get_caller_identity()
             account_id = response["Account"]
             logger.debug(f"Current account ID: {account_id}")
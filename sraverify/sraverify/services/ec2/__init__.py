@@ -1,8 +1,7 @@
 """
 EC2 security checks.
 """
-from sraverify.services.ec2.checks.sra_ec2_01 import SRA_EC2_01
+from sraverify.core.registry import service_module_getattr
 
-CHECKS = {
-    "SRA-EC2-01": SRA_EC2_01,
-}
+# CHECKS and check classes are loaded on first access; see sraverify/services/manifest.py
+__getattr__ = service_module_getattr(__name__)
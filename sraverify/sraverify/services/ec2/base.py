@@ -9,18 +9,11 @@ from sraverify.core.logging import logger
 
 class EC2Check(SecurityCheck):
     """Base class for all EC2 security checks."""
-    
-    # Class-level caches shared across all instances
-    _ebs_encryption_default_cache = {}
-    
-    def __init__(self):
-        """Initialize EC2 base check."""
-        super().__init__(
-            account_type="application",
-            service="EC2",
-            resource_type="AWS::EC2::Instance"
-        )
-    
+
+    account_type = "application"
+    service = "EC2"
+    resource_type = "AWS::EC2::Instance"
+
     def _setup_clients(self):
         """Set up EC2 clients for each region."""
         # Clear existing clients
@@ -53,12 +46,11 @@ class EC2Check(SecurityCheck):
             Dictionary containing EBS encryption by default status
         """
         # Check cache first
-        account_id = self.account_id
-        cache_key = f"{account_id}:{region}"
+        cache = self.cache('ec2.ebs_encryption_default')
         
-        if cache_key in self.__class__._ebs_encryption_default_cache:
+        if region in cache:
             logger.debug(f"Using cached EBS encryption by default status for {region}")
-            return self.__class__._ebs_encryption_default_cache[cache_key]
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -69,7 +61,7 @@ class EC2Check(SecurityCheck):
         encryption_status = client.get_ebs_encryption_by_default()
         
         # Cache the result
-        self.__class__._ebs_encryption_default_cache[cache_key] = encryption_status
+        cache[region] = encryption_status
         logger.debug(f"Cached EBS encryption by default status for {region}")
         
         return encryption_status
@@ -8,21 +8,20 @@ from sraverify.core.logging import logger
 
 class SRA_EC2_01(EC2Check):
     """Check if AWS account level EBS encryption by default is enabled."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-EC2-01"
-        self.check_name = "AWS account level EBS encryption by default is enabled"
-        self.description = (
-            "This check verifies that the AWS account level configuration to encrypt EBS volumes by default "
-            "is enabled in the AWS Region. This enforces, at AWS account level, the encryption of the new EBS "
-            "volumes and snapshot copies that you create. You can use AWS managed keys or a customer managed KMS key."
-        )
-        self.severity = "HIGH"
-        self.account_type = "application"
-        self.check_logic = "Check Pass if 'EbsEncryptionByDefault' = true."
-        self.resource_type = "AWS::EC2::Volume"
+
+    check_id = "SRA-EC2-01"
+    check_name = "AWS account level EBS encryption by default is enabled"
+    description = (
+        "This check verifies that the AWS account level configuration to encrypt EBS volumes by default "
+        "is enabled in the AWS Region. This enforces, at AWS account level, the encryption of the new EBS "
+        "volumes and snapshot copies that you create. You can use AWS managed keys or a customer managed KMS key."
+    )
+    severity = "HIGH"
+    account_type = "application"
+    check_logic = "Check Pass if 'EbsEncryptionByDefault' = true."
+    resource_type = "AWS::EC2::Volume"
+
+    data_requirements = ("get_ebs_encryption_by_default",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -4,11 +4,13 @@ EC2 client for interacting with AWS EC2 service.
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import get_client, lazy_client
 from sraverify.core.logging import logger
 
 
 class EC2Client:
     """Client for interacting with AWS EC2 service."""
+    client = lazy_client('ec2')
     
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,7 +22,6 @@ class EC2Client:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('ec2', region_name=region)
 
     def get_ebs_encryption_by_default(self) -> Dict[str, Any]:
         """
@@ -50,7 +51,7 @@ class EC2Client:
         """
         try:
             logger.debug(f"Getting current account ID in {self.region}")
-            sts_client = self.session.client("sts")
+            sts_client = get_client(self.session, 'sts')
             response = sts_client.get_caller_identity()
             account_id = response["Account"]
             logger.debug(f"Current account ID: {account_id}")
@@ -4,16 +4,9 @@ from sraverify.services.firewallmanager.client import FirewallManagerClient
 from sraverify.core.logging import logger
 
 class FirewallManagerCheck(SecurityCheck):
-    # Class-level caches shared across all instances
-    _admin_account_cache = None
-    _policies_cache = {}
-
-    def __init__(self):
-        super().__init__(
-            account_type="audit",
-            service="FirewallManager",
-            resource_type="AWS::FMS::Policy"
-        )
+    account_type = "audit"
+    service = "FirewallManager"
+    resource_type = "AWS::FMS::Policy"
 
     def _setup_clients(self):
         self._clients.clear()
@@ -26,23 +19,25 @@ class FirewallManagerCheck(SecurityCheck):
                     self._clients[region] = FirewallManagerClient(region, session=self.session)
 
     def get_admin_account(self) -> Dict[str, Any]:
-        if FirewallManagerCheck._admin_account_cache is None:
+        cache = self.cache('firewallmanager.admin_account')
+        if 'us-east-1' not in cache:
             logger.debug("FirewallManager: Fetching admin account")
             client = self.get_client('us-east-1')
             if client:
-                FirewallManagerCheck._admin_account_cache = client.get_admin_account()
+                cache['us-east-1'] = client.get_admin_account()
                 logger.debug("FirewallManager: Cached admin account")
         else:
             logger.debug("FirewallManager: Using cached admin account")
-        return FirewallManagerCheck._admin_account_cache or {}
+        return cache.get('us-east-1') or {}
 
     def list_policies(self, region: str) -> Dict[str, Any]:
-        if region not in FirewallManagerCheck._policies_cache:
+        cache = self.cache('firewallmanager.policies')
+        if region not in cache:
             logger.debug(f"FirewallManager: Fetching policies for {region}")
             client = self.get_client(region)
             if client:
-                FirewallManagerCheck._policies_cache[region] = client.list_policies()
+                cache[region] = client.list_policies()
                 logger.debug(f"FirewallManager: Cached policies for {region}")
         else:
             logger.debug(f"FirewallManager: Using cached policies for {region}")
-        return FirewallManagerCheck._policies_cache.get(region, {})
+        return cache.get(region, {})
@@ -2,16 +2,14 @@ from typing import Dict, List, Any
 from sraverify.services.firewallmanager.base import FirewallManagerCheck
 
 class SRA_FIREWALLMANAGER_01(FirewallManagerCheck):
-    def __init__(self):
-        super().__init__()
-        # Override account type for this specific check
-        self.account_type = "management"
-        self.resource_type = "AWS::FMS::AdminAccount"
-        self.check_id = "SRA-FIREWALLMANAGER-01"
-        self.check_name = "Firewall Manager delegated administrator is the audit account"
-        self.description = "Verifies that AWS Firewall Manager delegated administrator is configured and set to the audit account"
-        self.severity = "HIGH"
-        self.check_logic = "Calls get_admin_account() to retrieve the Firewall Manager administrator account and verifies it matches the audit account ID"
+    # Override account type for this specific check
+    account_type = "management"
+    resource_type = "AWS::FMS::AdminAccount"
+    check_id = "SRA-FIREWALLMANAGER-01"
+    check_name = "Firewall Manager delegated administrator is the audit account"
+    description = "Verifies that AWS Firewall Manager delegated administrator is configured and set to the audit account"
+    severity = "HIGH"
+    check_logic = "Calls get_admin_account() to retrieve the Firewall Manager administrator account and verifies it matches the audit account ID"
 
     def execute(self) -> List[Dict[str, Any]]:
         region = "us-east-1"
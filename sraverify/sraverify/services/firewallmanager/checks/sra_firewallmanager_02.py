@@ -2,13 +2,13 @@ from typing import Dict, List, Any
 from sraverify.services.firewallmanager.base import FirewallManagerCheck
 
 class SRA_FIREWALLMANAGER_02(FirewallManagerCheck):
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-FIREWALLMANAGER-02"
-        self.check_name = "Firewall Manager manages security groups"
-        self.description = "Verifies that AWS Firewall Manager has security group policies configured in each region"
-        self.severity = "MEDIUM"
-        self.check_logic = "Calls list_policies() per region and checks for policies with SecurityServiceType of SECURITY_GROUPS_COMMON, SECURITY_GROUPS_CONTENT_AUDIT, or SECURITY_GROUPS_USAGE_AUDIT"
+    check_id = "SRA-FIREWALLMANAGER-02"
+    check_name = "Firewall Manager manages security groups"
+    description = "Verifies that AWS Firewall Manager has security group policies configured in each region"
+    severity = "MEDIUM"
+    check_logic = "Calls list_policies() per region and checks for policies with SecurityServiceType of SECURITY_GROUPS_COMMON, SECURITY_GROUPS_CONTENT_AUDIT, or SECURITY_GROUPS_USAGE_AUDIT"
+
+    data_requirements = ("list_policies",)
 
     def execute(self) -> List[Dict[str, Any]]:
         account_id = self.account_id
@@ -2,13 +2,13 @@ from typing import Dict, List, Any
 from sraverify.services.firewallmanager.base import FirewallManagerCheck
 
 class SRA_FIREWALLMANAGER_03(FirewallManagerCheck):
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-FIREWALLMANAGER-03"
-        self.check_name = "Firewall Manager manages WAF policies"
-        self.description = "Verifies that AWS Firewall Manager has WAF policies configured in each region"
-        self.severity = "MEDIUM"
-        self.check_logic = "Calls list_policies() per region and checks for policies with SecurityServiceType of WAF or WAFV2"
+    check_id = "SRA-FIREWALLMANAGER-03"
+    check_name = "Firewall Manager manages WAF policies"
+    description = "Verifies that AWS Firewall Manager has WAF policies configured in each region"
+    severity = "MEDIUM"
+    check_logic = "Calls list_policies() per region and checks for policies with SecurityServiceType of WAF or WAFV2"
+
+    data_requirements = ("list_policies",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
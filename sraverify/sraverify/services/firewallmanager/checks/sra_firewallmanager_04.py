@@ -2,13 +2,13 @@ from typing import Dict, List, Any
 from sraverify.services.firewallmanager.base import FirewallManagerCheck
 
 class SRA_FIREWALLMANAGER_04(FirewallManagerCheck):
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-FIREWALLMANAGER-04"
-        self.check_name = "Firewall Manager manages Shield Advanced policies"
-        self.description = "Verifies that AWS Firewall Manager has Shield Advanced policies configured in each region"
-        self.severity = "MEDIUM"
-        self.check_logic = "Calls list_policies() per region and checks for policies with SecurityServiceType of SHIELD_ADVANCED"
+    check_id = "SRA-FIREWALLMANAGER-04"
+    check_name = "Firewall Manager manages Shield Advanced policies"
+    description = "Verifies that AWS Firewall Manager has Shield Advanced policies configured in each region"
+    severity = "MEDIUM"
+    check_logic = "Calls list_policies() per region and checks for policies with SecurityServiceType of SHIELD_ADVANCED"
+
+    data_requirements = ("list_policies",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
@@ -2,13 +2,13 @@ from typing import Dict, List, Any
 from sraverify.services.firewallmanager.base import FirewallManagerCheck
 
 class SRA_FIREWALLMANAGER_05(FirewallManagerCheck):
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-FIREWALLMANAGER-05"
-        self.check_name = "Firewall Manager manages Network ACL policies"
-        self.description = "Verifies that AWS Firewall Manager has Network ACL policies configured in each region"
-        self.severity = "MEDIUM"
-        self.check_logic = "Calls list_policies() per region and checks for policies with SecurityServiceType of NETWORK_ACL_COMMON"
+    check_id = "SRA-FIREWALLMANAGER-05"
+    check_name = "Firewall Manager manages Network ACL policies"
+    description = "Verifies that AWS Firewall Manager has Network ACL policies configured in each region"
+    severity = "MEDIUM"
+    check_logic = "Calls list_policies() per region and checks for policies with SecurityServiceType of NETWORK_ACL_COMMON"
+
+    data_requirements = ("list_policies",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
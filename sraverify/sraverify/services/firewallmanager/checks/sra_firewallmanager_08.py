@@ -2,13 +2,13 @@ from typing import Dict, List, Any
 from sraverify.services.firewallmanager.base import FirewallManagerCheck
 
 class SRA_FIREWALLMANAGER_08(FirewallManagerCheck):
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-FIREWALLMANAGER-08"
-        self.check_name = "Firewall Manager policy remediation is enabled"
-        self.description = "Verifies that AWS Firewall Manager policies have remediation enabled to automatically apply to new resources"
-        self.severity = "MEDIUM"
-        self.check_logic = "Calls list_policies() per region and checks that all policies have RemediationEnabled set to true"
+    check_id = "SRA-FIREWALLMANAGER-08"
+    check_name = "Firewall Manager policy remediation is enabled"
+    description = "Verifies that AWS Firewall Manager policies have remediation enabled to automatically apply to new resources"
+    severity = "MEDIUM"
+    check_logic = "Calls list_policies() per region and checks that all policies have RemediationEnabled set to true"
+
+    data_requirements = ("list_policies",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
@@ -2,13 +2,13 @@ from typing import Dict, List, Any
 from sraverify.services.firewallmanager.base import FirewallManagerCheck
 
 class SRA_FIREWALLMANAGER_09(FirewallManagerCheck):
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-FIREWALLMANAGER-09"
-        self.check_name = "Firewall Manager policies are in active status"
-        self.description = "Verifies that AWS Firewall Manager policies are in ACTIVE status and not out of admin scope"
-        self.severity = "HIGH"
-        self.check_logic = "Calls list_policies() per region and checks that all policies have PolicyStatus set to ACTIVE"
+    check_id = "SRA-FIREWALLMANAGER-09"
+    check_name = "Firewall Manager policies are in active status"
+    description = "Verifies that AWS Firewall Manager policies are in ACTIVE status and not out of admin scope"
+    severity = "HIGH"
+    check_logic = "Calls list_policies() per region and checks that all policies have PolicyStatus set to ACTIVE"
+
+    data_requirements = ("list_policies",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
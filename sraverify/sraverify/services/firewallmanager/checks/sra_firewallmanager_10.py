@@ -2,13 +2,13 @@ from typing import Dict, List, Any
 from sraverify.services.firewallmanager.base import FirewallManagerCheck
 
 class SRA_FIREWALLMANAGER_10(FirewallManagerCheck):
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-FIREWALLMANAGER-10"
-        self.check_name = "Firewall Manager policy cleanup is enabled"
-        self.description = "Verifies that AWS Firewall Manager policies have cleanup enabled to remove protections from resources that leave policy scope"
-        self.severity = "MEDIUM"
-        self.check_logic = "Calls list_policies() per region and checks that policies have DeleteUnusedFMManagedResources set to true"
+    check_id = "SRA-FIREWALLMANAGER-10"
+    check_name = "Firewall Manager policy cleanup is enabled"
+    description = "Verifies that AWS Firewall Manager policies have cleanup enabled to remove protections from resources that leave policy scope"
+    severity = "MEDIUM"
+    check_logic = "Calls list_policies() per region and checks that policies have DeleteUnusedFMManagedResources set to true"
+
+    data_requirements = ("list_policies",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
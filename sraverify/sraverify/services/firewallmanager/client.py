@@ -1,13 +1,15 @@
 from typing import Dict, Any, Optional
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 class FirewallManagerClient:
+    client = lazy_client('fms')
+
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('fms', region_name=region)
 
     def get_admin_account(self) -> Dict[str, Any]:
         try:
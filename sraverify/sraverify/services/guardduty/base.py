@@ -9,21 +9,11 @@ from sraverify.core.logging import logger
 
 class GuardDutyCheck(SecurityCheck):
     """Base class for all GuardDuty security checks."""
-    
-    # Class-level caches shared across all instances
-    _detector_details_cache = {}
-    _detector_ids_cache = {}
-    _org_config_cache = {}
-    _admin_accounts_cache = {}
-    
-    def __init__(self):
-        """Initialize GuardDuty base check."""
-        super().__init__(
-            account_type="application",
-            service="GuardDuty",
-            resource_type="AWS::GuardDuty::Detector"
-        )
-    
+
+    account_type = "application"
+    service = "GuardDuty"
+    resource_type = "AWS::GuardDuty::Detector"
+
     def _setup_clients(self):
         """Set up GuardDuty clients for each region."""
         # Clear existing clients
@@ -43,11 +33,11 @@ class GuardDutyCheck(SecurityCheck):
         Returns:
             Detector ID if available, None otherwise
         """
-        # Check class-level cache
-        cache_key = f"{self.session.region_name}:{region}"
-        if cache_key in GuardDutyCheck._detector_ids_cache:
+        # Check scan cache
+        cache = self.cache('guardduty.detector_ids')
+        if region in cache:
             logger.debug(f"GuardDuty: Using cached detector ID for {region}")
-            return GuardDutyCheck._detector_ids_cache[cache_key]
+            return cache[region]
         
         # Get client
         client = self.get_client(region)
@@ -63,13 +53,13 @@ class GuardDutyCheck(SecurityCheck):
         if detector_id and isinstance(detector_id, str) and detector_id.startswith("ERROR:"):
             _, error_code, error_message = detector_id.split(":", 2)
             logger.warning(f"GuardDuty: Error accessing GuardDuty in {region}: {error_code}")
-            GuardDutyCheck._detector_ids_cache[cache_key] = None
+            cache[region] = None
             return None
         
         # Cache the detector ID
         if detector_id:
             logger.debug(f"GuardDuty: Found detector ID {detector_id} for {region}")
-            GuardDutyCheck._detector_ids_cache[cache_key] = detector_id
+            cache[region] = detector_id
         else:
             logger.debug(f"GuardDuty: No detector ID found for {region}")
         
@@ -85,11 +75,11 @@ class GuardDutyCheck(SecurityCheck):
         Returns:
             Dictionary containing detector details or empty dict if not available
         """
-        # Check if we already have cached details in the class-level cache
-        cache_key = f"{self.session.region_name}:{region}"  # Include session region to avoid conflicts
-        if cache_key in GuardDutyCheck._detector_details_cache:
+        # Check scan cache
+        cache = self.cache('guardduty.detector_details')
+        if region in cache:
             logger.debug(f"GuardDuty: Using cached detector details for {region}")
-            return GuardDutyCheck._detector_details_cache[cache_key]
+            return cache[region]
         
         # Get detector ID
         detector_id = self.get_detector_id(region)
@@ -107,8 +97,8 @@ class GuardDutyCheck(SecurityCheck):
         logger.debug(f"GuardDuty: Getting detector details for {detector_id} in {region}")
         details = client.get_detector_details(detector_id)
         
-        # Cache the details in the class-level cache
-        GuardDutyCheck._detector_details_cache[cache_key] = details
+        # Cache the details in the scan cache
+        cache[region] = details
         logger.debug(f"GuardDuty: Cached detector details for {region}")
         
         return details
@@ -123,11 +113,11 @@ class GuardDutyCheck(SecurityCheck):
         Returns:
             Dictionary containing organization configuration details or empty dict if not available
         """
-        # Check if we already have cached org config in the class-level cache
-        cache_key = f"{self.session.region_name}:{region}"
-        if cache_key in GuardDutyCheck._org_config_cache:
+        # Check scan cache
+        cache = self.cache('guardduty.org_config')
+        if region in cache:
             logger.debug(f"GuardDuty: Using cached organization configuration for {region}")
-            return GuardDutyCheck._org_config_cache[cache_key]
+            return cache[region]
         
         # Get detector ID
         detector_id = self.get_detector_id(region)
@@ -145,8 +135,8 @@ class GuardDutyCheck(SecurityCheck):
         logger.debug(f"GuardDuty: Getting organization configuration for {detector_id} in {region}")
         org_config = client.describe_organization_configuration(detector_id)
         
-        # Cache the org config in the class-level cache
-        GuardDutyCheck._org_config_cache[cache_key] = org_config
+        # Cache the org config in the scan cache
+        cache[region] = org_config
         logger.debug(f"GuardDuty: Cached organization configuration for {region}")
         
         return org_config
@@ -161,11 +151,11 @@ class GuardDutyCheck(SecurityCheck):
         Returns:
             Dictionary containing organization admin accounts details or empty dict if not available
         """
-        # Check if we already have cached admin accounts in the class-level cache
-        cache_key = f"{self.session.region_name}:{region}"
-        if cache_key in GuardDutyCheck._admin_accounts_cache:
+        # Check scan cache
+        cache = self.cache('guardduty.admin_accounts')
+        if region in cache:
             logger.debug(f"GuardDuty: Using cached organization admin accounts for {region}")
-            return GuardDutyCheck._admin_accounts_cache[cache_key]
+            return cache[region]
         
         # Get client
         client = self.get_client(region)
@@ -177,8 +167,8 @@ class GuardDutyCheck(SecurityCheck):
         logger.debug(f"GuardDuty: Listing organization admin accounts in {region}")
         admin_accounts = client.list_organization_admin_accounts()
         
-        # Cache the admin accounts in the class-level cache
-        GuardDutyCheck._admin_accounts_cache[cache_key] = admin_accounts
+        # Cache the admin accounts in the scan cache
+        cache[region] = admin_accounts
         logger.debug(f"GuardDuty: Cached organization admin accounts for {region}")
         
         return admin_accounts
@@ -191,17 +181,16 @@ class GuardDutyCheck(SecurityCheck):
             List of region names where GuardDuty is enabled
         """
         # If no detector IDs have been discovered yet, try to discover them
-        if not any(k.endswith(f":{region}") for k in GuardDutyCheck._detector_ids_cache.keys() 
-                  for region in self.regions):
+        detector_ids = self.cache('guardduty.detector_ids')
+        cached_regions = detector_ids.keys()
+        if not any(region in cached_regions for region in self.regions):
             logger.debug("GuardDuty: No detector IDs cached, discovering them now")
-            for region in self.regions:
-                self.get_detector_id(region)
+            self.map_regions(self.get_detector_id)
         
-        # Get regions from the class-level cache that match the current session
-        prefix = f"{self.session.region_name}:"
+        # Get regions with a detector from the scan cache
         enabled_regions = [
-            key.split(":")[-1] for key in GuardDutyCheck._detector_ids_cache.keys()
-            if key.startswith(prefix) and GuardDutyCheck._detector_ids_cache[key] is not None
+            region for region, detector_id in detector_ids.items()
+            if detector_id is not None
         ]
         
         return enabled_regions
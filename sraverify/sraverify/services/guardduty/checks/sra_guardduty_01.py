@@ -8,19 +8,18 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_01(GuardDutyCheck):
     """Check if GuardDuty detector exists."""
 
-    def __init__(self):
-        """Initialize GuardDuty enabled check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-01"
-        self.check_name = "GuardDuty detector exists"
-        self.description = "This check verifies that an GuardDuty detector exists in the AWS Region.\
+    check_id = "SRA-GUARDDUTY-01"
+    check_name = "GuardDuty detector exists"
+    description = "This check verifies that an GuardDuty detector exists in the AWS Region.\
               A detector is a resource that represents the GuardDuty service and should be present \
                 in all AWS member account and AWS Region so that GuardDuty can generate findings \
                     about unauthorized or unusual activity even in those Regions that you may not \
                         be using actively."
-        self.severity = "HIGH"
-        self.check_logic = "Get detector_id in each Region. Check fails if there is no detector_id"
-    
+    severity = "HIGH"
+    check_logic = "Get detector_id in each Region. Check fails if there is no detector_id"
+
+    data_requirements = ("get_detector_id",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
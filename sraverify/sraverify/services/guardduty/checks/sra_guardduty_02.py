@@ -8,19 +8,18 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_02(GuardDutyCheck):
     """Check if GuardDuty finding frequency is set."""
 
-    def __init__(self):
-        """Initialize GuardDuty enabled check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-02"
-        self.check_name = "GuardDuty finding frequency is set"
-        self.description = ("This check verifies that the GuardDuty finding frequency is set "
-                           "as per your organization requirement. This determines how often updates to active "
-                           "findings are exported to EventBridge, S3 (optional) and Detective (optional). "
-                           "By default, updated findings are exported every 6 hours but you can set to "
-                           "every 15 minutes or 1 hour.")
-        self.severity = "LOW"
-        self.check_logic = "Get detector details in each Region. Check value of FindingPublishingFrequency."
-    
+    check_id = "SRA-GUARDDUTY-02"
+    check_name = "GuardDuty finding frequency is set"
+    description = ("This check verifies that the GuardDuty finding frequency is set "
+                  "as per your organization requirement. This determines how often updates to active "
+                  "findings are exported to EventBridge, S3 (optional) and Detective (optional). "
+                  "By default, updated findings are exported every 6 hours but you can set to "
+                  "every 15 minutes or 1 hour.")
+    severity = "LOW"
+    check_logic = "Get detector details in each Region. Check value of FindingPublishingFrequency."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
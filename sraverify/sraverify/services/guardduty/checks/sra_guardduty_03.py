@@ -8,18 +8,17 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_03(GuardDutyCheck):
     """Check if GuardDuty detector is enabled."""
 
-    def __init__(self):
-        """Initialize GuardDuty enabled check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-03"
-        self.check_name = "GuardDuty detector is enabled"
-        self.description = ("This check verifies that the GuardDuty detector in the "
-                            "AWS account and AWS region is enabled. Detector represents " 
-                            "GuardDuty service in the AWS account and specific region, "
-                            "if disabled will not provided threat intelligence service.")
-        self.severity = "HIGH"
-        self.check_logic = "Get detector details in each Region. Check value of FindingPublishingFrequency."
-    
+    check_id = "SRA-GUARDDUTY-03"
+    check_name = "GuardDuty detector is enabled"
+    description = ("This check verifies that the GuardDuty detector in the "
+                   "AWS account and AWS region is enabled. Detector represents " 
+                   "GuardDuty service in the AWS account and specific region, "
+                   "if disabled will not provided threat intelligence service.")
+    severity = "HIGH"
+    check_logic = "Get detector details in each Region. Check value of FindingPublishingFrequency."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
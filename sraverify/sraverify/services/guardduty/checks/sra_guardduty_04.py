@@ -8,18 +8,17 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_04(GuardDutyCheck):
     """Check if GuardDuty has DNS logs enabled as a log source."""
 
-    def __init__(self):
-        """Initialize GuardDuty DNS logs check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-04"
-        self.check_name = "GuardDuty DNS logs enabled"
-        self.description = ("This check verifies that GuardDuty has DNS logs as one of the log sources, enabled. "
-                            "If you use AWS DNS resolvers for your Amazon EC2 instances (the default setting), " 
-                            "then GuardDuty can access and process your request and response DNS logs through the " 
-                            "internal AWS DNS resolvers.")
-        self.severity = "MEDIUM"
-        self.check_logic = "Get detector details in each Region. Check if DNS logs are enabled in the Features array."
-    
+    check_id = "SRA-GUARDDUTY-04"
+    check_name = "GuardDuty DNS logs enabled"
+    description = ("This check verifies that GuardDuty has DNS logs as one of the log sources, enabled. "
+                   "If you use AWS DNS resolvers for your Amazon EC2 instances (the default setting), " 
+                   "then GuardDuty can access and process your request and response DNS logs through the " 
+                   "internal AWS DNS resolvers.")
+    severity = "MEDIUM"
+    check_logic = "Get detector details in each Region. Check if DNS logs are enabled in the Features array."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,18 +8,17 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_05(GuardDutyCheck):
     """Check if GuardDuty has VPC flow logs enabled as a log source."""
 
-    def __init__(self):
-        """Initialize GuardDuty VPC flow logs check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-05"
-        self.check_name = "GuardDuty VPC flow logs enabled"
-        self.description = ("This check verifies that GuardDuty has VPC flow logs as one of the log sources, "
-                            "enabled.GuardDuty analyzes your VPC flow logs from Amazon EC2 instances within your account. "
-                            "It consumes VPC flow log events directly from the VPC Flow Logs feature through an independent "
-                            "and duplicated stream of flow logs.")
-        self.severity = "MEDIUM"
-        self.check_logic = "Get detector details in each Region. Check if VPC Flow logs are enabled in the Features array."
-    
+    check_id = "SRA-GUARDDUTY-05"
+    check_name = "GuardDuty VPC flow logs enabled"
+    description = ("This check verifies that GuardDuty has VPC flow logs as one of the log sources, "
+                   "enabled.GuardDuty analyzes your VPC flow logs from Amazon EC2 instances within your account. "
+                   "It consumes VPC flow log events directly from the VPC Flow Logs feature through an independent "
+                   "and duplicated stream of flow logs.")
+    severity = "MEDIUM"
+    check_logic = "Get detector details in each Region. Check if VPC Flow logs are enabled in the Features array."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
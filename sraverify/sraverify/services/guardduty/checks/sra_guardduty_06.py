@@ -8,18 +8,17 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_06(GuardDutyCheck):
     """Check if GuardDuty has S3 protection enabled."""
 
-    def __init__(self):
-        """Initialize GuardDuty S3 protection check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-06"
-        self.check_name = "GuardDuty S3 protection enabled"
-        self.description = ("This check verifies that GuardDuty has S3 protection enabled. "
-                           "GuardDuty provides enhanced visibility through S3 protection. "
-                           "GuardDuty monitors both AWS CloudTrail management events and AWS CloudTrail "
-                           "S3 data events to identify potential threats in your Amazon S3 resources.")
-        self.severity = "HIGH"
-        self.check_logic = "Get detector details in each Region. Check if S3 protection is enabled in the Features array."
-    
+    check_id = "SRA-GUARDDUTY-06"
+    check_name = "GuardDuty S3 protection enabled"
+    description = ("This check verifies that GuardDuty has S3 protection enabled. "
+                  "GuardDuty provides enhanced visibility through S3 protection. "
+                  "GuardDuty monitors both AWS CloudTrail management events and AWS CloudTrail "
+                  "S3 data events to identify potential threats in your Amazon S3 resources.")
+    severity = "HIGH"
+    check_logic = "Get detector details in each Region. Check if S3 protection is enabled in the Features array."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,19 +8,18 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_07(GuardDutyCheck):
     """Check if GuardDuty has EKS protection enabled."""
 
-    def __init__(self):
-        """Initialize GuardDuty EKS protection check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-07"
-        self.check_name = "GuardDuty EKS protection enabled"
-        self.description = ("This check verifies that GuardDuty has EKS protection enabled. "
-                           "EKS Audit Log Monitoring helps you detect potentially suspicious activities "
-                           "in your EKS clusters within Amazon Elastic Kubernetes Service. It consumes "
-                           "Kubernetes audit log events directly from the Amazon EKS control plane logging "
-                           "feature through an independent and duplicated stream of audit logs.")
-        self.severity = "HIGH"
-        self.check_logic = "Get detector details in each Region. Check if EKS protection is enabled in the Features array."
-    
+    check_id = "SRA-GUARDDUTY-07"
+    check_name = "GuardDuty EKS protection enabled"
+    description = ("This check verifies that GuardDuty has EKS protection enabled. "
+                  "EKS Audit Log Monitoring helps you detect potentially suspicious activities "
+                  "in your EKS clusters within Amazon Elastic Kubernetes Service. It consumes "
+                  "Kubernetes audit log events directly from the Amazon EKS control plane logging "
+                  "feature through an independent and duplicated stream of audit logs.")
+    severity = "HIGH"
+    check_logic = "Get detector details in each Region. Check if EKS protection is enabled in the Features array."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,17 +8,16 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_08(GuardDutyCheck):
     """Check if GuardDuty has CloudTrail event and management logs enabled."""
 
-    def __init__(self):
-        """Initialize GuardDuty CloudTrail logs check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-08"
-        self.check_name = "GuardDuty CloudTrail logs enabled"
-        self.description = ("This check verifies that GuardDuty has CloudTrail event and management logs as one of the feature, enabled. "
-                           "GuardDuty consumes CloudTrail management events directly from CloudTrail through an independent and "
-                           "duplicated stream of events and analyzes the CloudTrail event logs.")
-        self.severity = "HIGH"
-        self.check_logic = "Get detector details in each Region. Check if CloudTrail logs are enabled in the Features array."
-    
+    check_id = "SRA-GUARDDUTY-08"
+    check_name = "GuardDuty CloudTrail logs enabled"
+    description = ("This check verifies that GuardDuty has CloudTrail event and management logs as one of the feature, enabled. "
+                  "GuardDuty consumes CloudTrail management events directly from CloudTrail through an independent and "
+                  "duplicated stream of events and analyzes the CloudTrail event logs.")
+    severity = "HIGH"
+    check_logic = "Get detector details in each Region. Check if CloudTrail logs are enabled in the Features array."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,18 +8,17 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_09(GuardDutyCheck):
     """Check if GuardDuty has malware protection for EBS enabled."""
 
-    def __init__(self):
-        """Initialize GuardDuty malware protection for EBS check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-09"
-        self.check_name = "GuardDuty malware protection for EBS enabled"
-        self.description = ("This check verifies that GuardDuty malware protection for EBS is enabled. "
-                           "Malware Protection for EC2 helps you detect the potential presence of malware "
-                           "by scanning the Amazon EBS volumes that are attached to the Amazon EC2 instances "
-                           "and container workloads.")
-        self.severity = "HIGH"
-        self.check_logic = "Get detector details in each Region. Check if malware protection for EBS is enabled in the Features array."
-    
+    check_id = "SRA-GUARDDUTY-09"
+    check_name = "GuardDuty malware protection for EBS enabled"
+    description = ("This check verifies that GuardDuty malware protection for EBS is enabled. "
+                  "Malware Protection for EC2 helps you detect the potential presence of malware "
+                  "by scanning the Amazon EBS volumes that are attached to the Amazon EC2 instances "
+                  "and container workloads.")
+    severity = "HIGH"
+    check_logic = "Get detector details in each Region. Check if malware protection for EBS is enabled in the Features array."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,17 +8,16 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_10(GuardDutyCheck):
     """Check if GuardDuty has RDS protection enabled."""
 
-    def __init__(self):
-        """Initialize GuardDuty RDS protection check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-10"
-        self.check_name = "GuardDuty RDS protection enabled"
-        self.description = ("This check verifies that GuardDuty RDS protection is enabled. "
-                           "RDS Protection in Amazon GuardDuty analyzes and profiles RDS login activity "
-                           "for potential access threats to Amazon Aurora databases and Amazon RDS for PostgreSQL.")
-        self.severity = "HIGH"
-        self.check_logic = "Get detector details in each Region. Check if RDS protection is enabled in the Features array."
-    
+    check_id = "SRA-GUARDDUTY-10"
+    check_name = "GuardDuty RDS protection enabled"
+    description = ("This check verifies that GuardDuty RDS protection is enabled. "
+                  "RDS Protection in Amazon GuardDuty analyzes and profiles RDS login activity "
+                  "for potential access threats to Amazon Aurora databases and Amazon RDS for PostgreSQL.")
+    severity = "HIGH"
+    check_logic = "Get detector details in each Region. Check if RDS protection is enabled in the Features array."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,17 +8,16 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_11(GuardDutyCheck):
     """Check if GuardDuty has EKS runtime protection enabled."""
 
-    def __init__(self):
-        """Initialize GuardDuty EKS runtime protection check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-11"
-        self.check_name = "GuardDuty EKS runtime protection enabled"
-        self.description = ("This check verifies that GuardDuty EKS runtime (original) or runtime protection is enabled. "
-                           "Runtime Monitoring observes and analyzes operating system-level, networking, "
-                           "and file events to help you detect potential threats in specific AWS workloads")
-        self.severity = "HIGH"
-        self.check_logic = "Get detector details in each Region. Check if EKS runtime monitoring or runtime monitoring is enabled in the Features array."
-    
+    check_id = "SRA-GUARDDUTY-11"
+    check_name = "GuardDuty EKS runtime protection enabled"
+    description = ("This check verifies that GuardDuty EKS runtime (original) or runtime protection is enabled. "
+                  "Runtime Monitoring observes and analyzes operating system-level, networking, "
+                  "and file events to help you detect potential threats in specific AWS workloads")
+    severity = "HIGH"
+    check_logic = "Get detector details in each Region. Check if EKS runtime monitoring or runtime monitoring is enabled in the Features array."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,17 +8,16 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_12(GuardDutyCheck):
     """Check if GuardDuty has Lambda protection enabled."""
 
-    def __init__(self):
-        """Initialize GuardDuty Lambda protection check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-12"
-        self.check_name = "GuardDuty Lambda protection enabled"
-        self.description = ("This check verifies that GuardDuty Lambda protection is enabled. "
-                           "Lambda Protection helps identify potential security threats when an AWS Lambda "
-                           "function gets invoked in the AWS environment.")
-        self.severity = "HIGH"
-        self.check_logic = "Get detector details in each Region. Check if Lambda protection is enabled in the Features array."
-    
+    check_id = "SRA-GUARDDUTY-12"
+    check_name = "GuardDuty Lambda protection enabled"
+    description = ("This check verifies that GuardDuty Lambda protection is enabled. "
+                  "Lambda Protection helps identify potential security threats when an AWS Lambda "
+                  "function gets invoked in the AWS environment.")
+    severity = "HIGH"
+    check_logic = "Get detector details in each Region. Check if Lambda protection is enabled in the Features array."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,18 +8,17 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_13(GuardDutyCheck):
     """Check if GuardDuty service administration is delegated to a different account."""
 
-    def __init__(self):
-        """Initialize GuardDuty service administration delegation check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-13"
-        self.check_name = "GuardDuty service administration delegated"
-        self.description = ("This check verifies whether GuardDuty service administration for the AWS Organization "
-                           "is delegated. Centralized management of GuardDuty across the organization improves "
-                           "security visibility and control.")
-        self.severity = "HIGH"
-        self.check_logic = "Check if GuardDuty is configured with a delegated administrator using GuardDuty list-organization-admin-accounts API."
-        self.account_type = "management"
-    
+    check_id = "SRA-GUARDDUTY-13"
+    check_name = "GuardDuty service administration delegated"
+    description = ("This check verifies whether GuardDuty service administration for the AWS Organization "
+                  "is delegated. Centralized management of GuardDuty across the organization improves "
+                  "security visibility and control.")
+    severity = "HIGH"
+    check_logic = "Check if GuardDuty is configured with a delegated administrator using GuardDuty list-organization-admin-accounts API."
+    account_type = "management"
+
+    data_requirements = ("get_detector_id", "list_organization_admin_accounts")
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -9,20 +9,23 @@ from sraverify.core.logging import logger
 class SRA_GUARDDUTY_14(GuardDutyCheck):
     """Check if GuardDuty delegated admin account is the audit account."""
 
+    check_id = "SRA-GUARDDUTY-14"
+    check_name = "GuardDuty delegated admin is audit account"
+    description = ("This check verifies whether GuardDuty delegated admin account is the audit account "
+                  "of your AWS organization. The audit account is dedicated to operating security services, "
+                  "monitoring AWS accounts, and automating security alerting and response. GuardDuty helps "
+                  "monitor resources for unusual and suspicious activities.")
+    severity = "HIGH"
+    check_logic = "Check if GuardDuty delegated administrator is the audit account using GuardDuty list-organization-admin-accounts API."
+    account_type = "management"
+
+    data_requirements = ("get_detector_id", "list_organization_admin_accounts")
+
     def __init__(self):
         """Initialize GuardDuty delegated admin check."""
         super().__init__()
-        self.check_id = "SRA-GUARDDUTY-14"
-        self.check_name = "GuardDuty delegated admin is audit account"
-        self.description = ("This check verifies whether GuardDuty delegated admin account is the audit account "
-                           "of your AWS organization. The audit account is dedicated to operating security services, "
-                           "monitoring AWS accounts, and automating security alerting and response. GuardDuty helps "
-                           "monitor resources for unusual and suspicious activities.")
-        self.severity = "HIGH"
-        self.check_logic = "Check if GuardDuty delegated administrator is the audit account using GuardDuty list-organization-admin-accounts API."
-        self.account_type = "management"
         self._audit_accounts = []
-    
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
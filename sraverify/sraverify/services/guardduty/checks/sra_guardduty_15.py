@@ -9,18 +9,17 @@ from sraverify.core.logging import logger
 class SRA_GUARDDUTY_15(GuardDutyCheck):
     """Check if GuardDuty auto-enablement is configured for member accounts."""
 
-    def __init__(self):
-        """Initialize GuardDuty auto-enablement check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-15"
-        self.check_name = "GuardDuty auto-enablement configured"
-        self.description = ("This check verifies whether auto-enablement configuration for GuardDuty is "
-                           " enabled for member accounts of the AWS Organization. This ensures that all  "
-                           "existing and new member accounts will have GuardDuty monitoring.")
-        self.severity = "HIGH"
-        self.check_logic = "Check if GuardDuty AutoEnableOrganizationMembers is set to ALL using describe-organization-configuration API."
-        self.account_type = "audit"
-    
+    check_id = "SRA-GUARDDUTY-15"
+    check_name = "GuardDuty auto-enablement configured"
+    description = ("This check verifies whether auto-enablement configuration for GuardDuty is "
+                  " enabled for member accounts of the AWS Organization. This ensures that all  "
+                  "existing and new member accounts will have GuardDuty monitoring.")
+    severity = "HIGH"
+    check_logic = "Check if GuardDuty AutoEnableOrganizationMembers is set to ALL using describe-organization-configuration API."
+    account_type = "audit"
+
+    data_requirements = ("get_organization_configuration",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -9,18 +9,17 @@ from sraverify.core.logging import logger
 class SRA_GUARDDUTY_16(GuardDutyCheck):
     """Check if GuardDuty member account limit is reached."""
 
-    def __init__(self):
-        """Initialize GuardDuty member account limit check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-16"
-        self.check_name = "GuardDuty member account limit not reached"
-        self.description = ("This check verifies whether the maximum number of allowed member accounts are already "
-                           "associated with the delegated administrator account for the AWS Organization. "
-                           "Reaching the limit prevents adding new accounts to GuardDuty monitoring.")
-        self.severity = "HIGH"
-        self.check_logic = "Check if MemberAccountLimitReached is false using describe-organization-configuration API."
-        self.account_type = "audit"
-    
+    check_id = "SRA-GUARDDUTY-16"
+    check_name = "GuardDuty member account limit not reached"
+    description = ("This check verifies whether the maximum number of allowed member accounts are already "
+                  "associated with the delegated administrator account for the AWS Organization. "
+                  "Reaching the limit prevents adding new accounts to GuardDuty monitoring.")
+    severity = "HIGH"
+    check_logic = "Check if MemberAccountLimitReached is false using describe-organization-configuration API."
+    account_type = "audit"
+
+    data_requirements = ("get_organization_configuration",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,18 +8,17 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_17(GuardDutyCheck):
     """Check if GuardDuty has EKS addon management enabled."""
 
-    def __init__(self):
-        """Initialize GuardDuty EKS addon management check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-17"
-        self.check_name = "GuardDuty EKS addon management enabled"
-        self.description = ("This check verifies that GuardDuty has EKS addon management enabled. "
-                           "EKS addon management allows GuardDuty to automatically deploy and manage "
-                           "the security agent on your EKS clusters, simplifying the setup and maintenance "
-                           "of runtime monitoring for Kubernetes workloads.")
-        self.severity = "HIGH"
-        self.check_logic = "Get detector details in each Region. Check if EKS_ADDON_MANAGEMENT is enabled in the RUNTIME_MONITORING feature's AdditionalConfiguration."
-    
+    check_id = "SRA-GUARDDUTY-17"
+    check_name = "GuardDuty EKS addon management enabled"
+    description = ("This check verifies that GuardDuty has EKS addon management enabled. "
+                  "EKS addon management allows GuardDuty to automatically deploy and manage "
+                  "the security agent on your EKS clusters, simplifying the setup and maintenance "
+                  "of runtime monitoring for Kubernetes workloads.")
+    severity = "HIGH"
+    check_logic = "Get detector details in each Region. Check if EKS_ADDON_MANAGEMENT is enabled in the RUNTIME_MONITORING feature's AdditionalConfiguration."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
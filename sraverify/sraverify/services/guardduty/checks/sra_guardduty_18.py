@@ -8,18 +8,17 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_18(GuardDutyCheck):
     """Check if GuardDuty has ECS Fargate agent management enabled."""
 
-    def __init__(self):
-        """Initialize GuardDuty ECS Fargate agent management check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-18"
-        self.check_name = "GuardDuty ECS Fargate agent management enabled"
-        self.description = ("This check verifies that GuardDuty has ECS Fargate agent management enabled. "
-                           "ECS Fargate agent management allows GuardDuty to automatically deploy and manage "
-                           "the security agent on your ECS Fargate tasks, simplifying the setup and maintenance "
-                           "of runtime monitoring for containerized workloads.")
-        self.severity = "HIGH"
-        self.check_logic = "Get detector details in each Region. Check if ECS_FARGATE_AGENT_MANAGEMENT is enabled in the RUNTIME_MONITORING feature's AdditionalConfiguration."
-    
+    check_id = "SRA-GUARDDUTY-18"
+    check_name = "GuardDuty ECS Fargate agent management enabled"
+    description = ("This check verifies that GuardDuty has ECS Fargate agent management enabled. "
+                  "ECS Fargate agent management allows GuardDuty to automatically deploy and manage "
+                  "the security agent on your ECS Fargate tasks, simplifying the setup and maintenance "
+                  "of runtime monitoring for containerized workloads.")
+    severity = "HIGH"
+    check_logic = "Get detector details in each Region. Check if ECS_FARGATE_AGENT_MANAGEMENT is enabled in the RUNTIME_MONITORING feature's AdditionalConfiguration."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,18 +8,17 @@ from sraverify.services.guardduty.base import GuardDutyCheck
 class SRA_GUARDDUTY_19(GuardDutyCheck):
     """Check if GuardDuty has EC2 agent management enabled."""
 
-    def __init__(self):
-        """Initialize GuardDuty EC2 agent management check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-19"
-        self.check_name = "GuardDuty EC2 agent management enabled"
-        self.description = ("This check verifies that GuardDuty has EC2 agent management enabled. "
-                           "EC2 agent management allows GuardDuty to automatically deploy and manage "
-                           "the security agent on your EC2 instances, simplifying the setup and maintenance "
-                           "of runtime monitoring for EC2 workloads.")
-        self.severity = "HIGH"
-        self.check_logic = "Get detector details in each Region. Check if EC2_AGENT_MANAGEMENT is enabled in the RUNTIME_MONITORING feature's AdditionalConfiguration."
-    
+    check_id = "SRA-GUARDDUTY-19"
+    check_name = "GuardDuty EC2 agent management enabled"
+    description = ("This check verifies that GuardDuty has EC2 agent management enabled. "
+                  "EC2 agent management allows GuardDuty to automatically deploy and manage "
+                  "the security agent on your EC2 instances, simplifying the setup and maintenance "
+                  "of runtime monitoring for EC2 workloads.")
+    severity = "HIGH"
+    check_logic = "Get detector details in each Region. Check if EC2_AGENT_MANAGEMENT is enabled in the RUNTIME_MONITORING feature's AdditionalConfiguration."
+
+    data_requirements = ("get_detector_details",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -9,18 +9,17 @@ from sraverify.core.logging import logger
 class SRA_GUARDDUTY_20(GuardDutyCheck):
     """Check if GuardDuty S3 data events are configured for auto-enablement."""
 
-    def __init__(self):
-        """Initialize GuardDuty S3 data events auto-enablement check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-20"
-        self.check_name = "GuardDuty S3 data events auto-enablement configured"
-        self.description = ("This check verifies whether S3 data events are configured for auto-enablement "
-                           "in GuardDuty for all member accounts. S3 data events provide visibility into "
-                           "object-level API operations, enhancing threat detection for S3 buckets.")
-        self.severity = "HIGH"
-        self.check_logic = "Check if S3_DATA_EVENTS feature is configured with AutoEnable set to ALL."
-        self.account_type = "audit"
-    
+    check_id = "SRA-GUARDDUTY-20"
+    check_name = "GuardDuty S3 data events auto-enablement configured"
+    description = ("This check verifies whether S3 data events are configured for auto-enablement "
+                  "in GuardDuty for all member accounts. S3 data events provide visibility into "
+                  "object-level API operations, enhancing threat detection for S3 buckets.")
+    severity = "HIGH"
+    check_logic = "Check if S3_DATA_EVENTS feature is configured with AutoEnable set to ALL."
+    account_type = "audit"
+
+    data_requirements = ("get_organization_configuration",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -9,19 +9,18 @@ from sraverify.core.logging import logger
 class SRA_GUARDDUTY_21(GuardDutyCheck):
     """Check if GuardDuty EBS Malware Protection is configured for auto-enablement."""
 
-    def __init__(self):
-        """Initialize GuardDuty EBS Malware Protection auto-enablement check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-21"
-        self.check_name = "GuardDuty EBS Malware Protection auto-enablement configured"
-        self.description = ("This check verifies whether EBS Malware Protection is configured for auto-enablement "
-                           "in GuardDuty for all member accounts. EBS Malware Protection scans EBS volumes for "
-                           "malware when GuardDuty detects a potential threat, helping to identify and remediate "
-                           "malware infections in your AWS environment.")
-        self.severity = "HIGH"
-        self.check_logic = "Check if EBS_MALWARE_PROTECTION feature is configured with AutoEnable set to ALL."
-        self.account_type = "audit"
-    
+    check_id = "SRA-GUARDDUTY-21"
+    check_name = "GuardDuty EBS Malware Protection auto-enablement configured"
+    description = ("This check verifies whether EBS Malware Protection is configured for auto-enablement "
+                  "in GuardDuty for all member accounts. EBS Malware Protection scans EBS volumes for "
+                  "malware when GuardDuty detects a potential threat, helping to identify and remediate "
+                  "malware infections in your AWS environment.")
+    severity = "HIGH"
+    check_logic = "Check if EBS_MALWARE_PROTECTION feature is configured with AutoEnable set to ALL."
+    account_type = "audit"
+
+    data_requirements = ("get_organization_configuration",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -9,18 +9,17 @@ from sraverify.core.logging import logger
 class SRA_GUARDDUTY_22(GuardDutyCheck):
     """Check if GuardDuty EKS Audit Logs are configured for auto-enablement."""
 
-    def __init__(self):
-        """Initialize GuardDuty EKS Audit Logs auto-enablement check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-22"
-        self.check_name = "GuardDuty EKS Audit Logs auto-enablement configured"
-        self.description = ("This check verifies whether EKS Audit Logs are configured for auto-enablement "
-                           "in GuardDuty for all member accounts. EKS Audit Logs monitoring analyzes Kubernetes "
-                           "audit logs to detect potentially suspicious activities in Amazon EKS clusters.")
-        self.severity = "HIGH"
-        self.check_logic = "Check if EKS_AUDIT_LOGS feature is configured with AutoEnable set to ALL."
-        self.account_type = "audit"
-    
+    check_id = "SRA-GUARDDUTY-22"
+    check_name = "GuardDuty EKS Audit Logs auto-enablement configured"
+    description = ("This check verifies whether EKS Audit Logs are configured for auto-enablement "
+                  "in GuardDuty for all member accounts. EKS Audit Logs monitoring analyzes Kubernetes "
+                  "audit logs to detect potentially suspicious activities in Amazon EKS clusters.")
+    severity = "HIGH"
+    check_logic = "Check if EKS_AUDIT_LOGS feature is configured with AutoEnable set to ALL."
+    account_type = "audit"
+
+    data_requirements = ("get_organization_configuration",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
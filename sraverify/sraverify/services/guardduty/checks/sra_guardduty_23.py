@@ -9,19 +9,18 @@ from sraverify.core.logging import logger
 class SRA_GUARDDUTY_23(GuardDutyCheck):
     """Check if GuardDuty Runtime Monitoring is configured for auto-enablement."""
 
-    def __init__(self):
-        """Initialize GuardDuty Runtime Monitoring auto-enablement check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-23"
-        self.check_name = "GuardDuty Runtime Monitoring auto-enablement configured"
-        self.description = ("This check verifies whether Runtime Monitoring and its components (ECS Fargate Agent Management, "
-                           "EC2 Agent Management, and EKS Addon Management) are configured for auto-enablement "
-                           "in GuardDuty for all member accounts. Runtime Monitoring provides threat detection for "
-                           "runtime behavior of resources, helping to identify malicious activities.")
-        self.severity = "HIGH"
-        self.check_logic = "Check if RUNTIME_MONITORING feature and its components are configured with AutoEnable set to ALL."
-        self.account_type = "audit"
-    
+    check_id = "SRA-GUARDDUTY-23"
+    check_name = "GuardDuty Runtime Monitoring auto-enablement configured"
+    description = ("This check verifies whether Runtime Monitoring and its components (ECS Fargate Agent Management, "
+                  "EC2 Agent Management, and EKS Addon Management) are configured for auto-enablement "
+                  "in GuardDuty for all member accounts. Runtime Monitoring provides threat detection for "
+                  "runtime behavior of resources, helping to identify malicious activities.")
+    severity = "HIGH"
+    check_logic = "Check if RUNTIME_MONITORING feature and its components are configured with AutoEnable set to ALL."
+    account_type = "audit"
+
+    data_requirements = ("get_organization_configuration",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
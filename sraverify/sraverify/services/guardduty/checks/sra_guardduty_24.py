@@ -9,18 +9,17 @@ from sraverify.core.logging import logger
 class SRA_GUARDDUTY_24(GuardDutyCheck):
     """Check if GuardDuty Lambda Network Logs are configured for auto-enablement."""
 
-    def __init__(self):
-        """Initialize GuardDuty Lambda Network Logs auto-enablement check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-24"
-        self.check_name = "GuardDuty Lambda Network Logs auto-enablement configured"
-        self.description = ("This check verifies whether Lambda Network Logs are configured for auto-enablement "
-                           "in GuardDuty for all member accounts. Lambda Network Logs monitoring analyzes VPC flow logs "
-                           "for Lambda functions to detect potentially suspicious network activity.")
-        self.severity = "HIGH"
-        self.check_logic = "Check if LAMBDA_NETWORK_LOGS feature is configured with AutoEnable set to ALL."
-        self.account_type = "audit"
-    
+    check_id = "SRA-GUARDDUTY-24"
+    check_name = "GuardDuty Lambda Network Logs auto-enablement configured"
+    description = ("This check verifies whether Lambda Network Logs are configured for auto-enablement "
+                  "in GuardDuty for all member accounts. Lambda Network Logs monitoring analyzes VPC flow logs "
+                  "for Lambda functions to detect potentially suspicious network activity.")
+    severity = "HIGH"
+    check_logic = "Check if LAMBDA_NETWORK_LOGS feature is configured with AutoEnable set to ALL."
+    account_type = "audit"
+
+    data_requirements = ("get_organization_configuration",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
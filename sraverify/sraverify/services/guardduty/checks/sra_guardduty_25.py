@@ -9,18 +9,17 @@ from sraverify.core.logging import logger
 class SRA_GUARDDUTY_25(GuardDutyCheck):
     """Check if GuardDuty RDS Login Events are configured for auto-enablement."""
 
-    def __init__(self):
-        """Initialize GuardDuty RDS Login Events auto-enablement check."""
-        super().__init__()
-        self.check_id = "SRA-GUARDDUTY-25"
-        self.check_name = "GuardDuty RDS Login Events auto-enablement configured"
-        self.description = ("This check verifies whether RDS Login Events are configured for auto-enablement "
-                           "in GuardDuty for all member accounts. RDS Login Events monitoring analyzes database "
-                           "login activity to detect potentially suspicious login attempts to RDS databases.")
-        self.severity = "HIGH"
-        self.check_logic = "Check if RDS_LOGIN_EVENTS feature is configured with AutoEnable set to ALL."
-        self.account_type = "audit"
-    
+    check_id = "SRA-GUARDDUTY-25"
+    check_name = "GuardDuty RDS Login Events auto-enablement configured"
+    description = ("This check verifies whether RDS Login Events are configured for auto-enablement "
+                  "in GuardDuty for all member accounts. RDS Login Events monitoring analyzes database "
+                  "login activity to detect potentially suspicious login attempts to RDS databases.")
+    severity = "HIGH"
+    check_logic = "Check if RDS_LOGIN_EVENTS feature is configured with AutoEnable set to ALL."
+    account_type = "audit"
+
+    data_requirements = ("get_organization_configuration",)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -4,11 +4,13 @@ GuardDuty client for interacting with AWS GuardDuty service.
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 
 class GuardDutyClient:
     """Client for interacting with AWS GuardDuty service."""
+    client = lazy_client('guardduty')
     
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,7 +22,6 @@ class GuardDutyClient:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('guardduty', region_name=region)
     
     def get_detector_id(self) -> Optional[str]:
         """
@@ -9,22 +9,11 @@ from sraverify.core.logging import logger
 
 class InspectorCheck(SecurityCheck):
     """Base class for all Inspector security checks."""
-    
-    # Class-level caches shared across all instances
-    _inspector_account_status = {}
-    _inspector_batch_account_status = {}  # SRA-INSPECTOR-7
-    _inspector_delegated_admin = {}
-    _inspector_org_config = {}
-    _organization_members = {}
-    
-    def __init__(self):
-        """Initialize Inspector base check."""
-        super().__init__(
-            account_type="application",  # Default, can be overridden in subclasses
-            service="Inspector",
-            resource_type="AWS::Inspector::Assessment"
-        )
-    
+
+    account_type = "application"  # Default, can be overridden in subclasses
+    service = "Inspector"
+    resource_type = "AWS::Inspector::Assessment"
+
     def _setup_clients(self):
         """Set up Inspector clients for each region."""
         # Clear existing clients
@@ -62,10 +51,10 @@ class InspectorCheck(SecurityCheck):
             return {}
         
         # Check cache first
-        cache_key = f"{account_id}:{region}"
-        if cache_key in self.__class__._inspector_account_status:
-            logger.debug(f"Using cached Inspector account status for {cache_key}")
-            return self.__class__._inspector_account_status[cache_key]
+        cache = self.cache('inspector.account_status')
+        if region in cache:
+            logger.debug(f"Using cached Inspector account status for {region}")
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -92,8 +81,8 @@ class InspectorCheck(SecurityCheck):
                 break
         
         # Cache the result
-        self.__class__._inspector_account_status[cache_key] = account_status
-        logger.debug(f"Cached Inspector account status for {cache_key}")
+        cache[region] = account_status
+        logger.debug(f"Cached Inspector account status for {region}")
         
         return account_status
     
@@ -108,10 +97,10 @@ class InspectorCheck(SecurityCheck):
             Dictionary containing delegated admin information
         """
         # Check cache first
-        cache_key = f"{self.session.region_name}:{region}"
-        if cache_key in self.__class__._inspector_delegated_admin:
-            logger.debug(f"Using cached Inspector delegated admin for {cache_key}")
-            return self.__class__._inspector_delegated_admin[cache_key]
+        cache = self.cache('inspector.delegated_admin')
+        if region in cache:
+            logger.debug(f"Using cached Inspector delegated admin for {region}")
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -122,14 +111,14 @@ class InspectorCheck(SecurityCheck):
         response = client.get_delegated_admin_account()
         
         # Cache the result
-        self.__class__._inspector_delegated_admin[cache_key] = response
-        logger.debug(f"Cached Inspector delegated admin for {cache_key}")
+        cache[region] = response
+        logger.debug(f"Cached Inspector delegated admin for {region}")
         
         return response
     
     def get_organization_members(self, region: str) -> List[Dict[str, Any]]:
         """
-        Get all AWS Organization member accounts with caching.
+        Get all AWS Organization member accounts from the shared organization directory.
         
         Args:
             region: AWS region name (not used for Organizations API call)
@@ -137,30 +126,12 @@ class InspectorCheck(SecurityCheck):
         Returns:
             List of organization member accounts
         """
-        # Use the current session region for Organizations API call
-        current_region = self.session.region_name
-        
-        # Check cache first
-        cache_key = f"{current_region}:organizations"
-        if cache_key in self.__class__._organization_members:
-            logger.debug(f"Using cached organization members for {cache_key}")
-            return self.__class__._organization_members[cache_key]
-        
-        # Use the client for the current region
-        client = self.get_client(current_region)
-        if not client:
-            logger.warning(f"No Inspector client available for region {current_region}")
+        try:
+            return self.org_directory.accounts
+        except Exception as e:
+            logger.debug(f"Error listing organization accounts: {e}")
             return []
         
-        # Get organization members from client
-        accounts = client.list_organization_accounts()
-        
-        # Cache the result
-        self.__class__._organization_members[cache_key] = accounts
-        logger.debug(f"Cached {len(accounts)} organization members for {cache_key} (using current region)")
-        
-        return accounts
-        
     def batch_get_account_status(self, region: str, account_ids: List[str]) -> Dict[str, Dict]:
         """
         Get Inspector account status for multiple accounts with caching.
@@ -173,10 +144,10 @@ class InspectorCheck(SecurityCheck):
             Dictionary mapping account IDs to their status
         """
         # Check cache first
-        cache_key = f"{self.session.region_name}:{region}:batch_status"
-        if cache_key in self.__class__._inspector_batch_account_status:
-            logger.debug(f"Using cached Inspector batch account status for {cache_key}")
-            return self.__class__._inspector_batch_account_status[cache_key]
+        cache = self.cache('inspector.batch_account_status')
+        if region in cache:
+            logger.debug(f"Using cached Inspector batch account status for {region}")
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -197,7 +168,7 @@ class InspectorCheck(SecurityCheck):
                 logger.debug(f"Error getting batch account status in {region}: {e}")
         
         # Cache the result
-        self.__class__._inspector_batch_account_status[cache_key] = result
+        cache[region] = result
         logger.debug(f"Cached Inspector batch account status for {len(result)} accounts in {region}")
         
         return result
@@ -213,10 +184,10 @@ class InspectorCheck(SecurityCheck):
             Dictionary containing organization configuration
         """
         # Check cache first
-        cache_key = f"{self.session.region_name}:{region}"
-        if cache_key in self.__class__._inspector_org_config:
-            logger.debug(f"Using cached Inspector organization configuration for {cache_key}")
-            return self.__class__._inspector_org_config[cache_key]
+        cache = self.cache('inspector.org_config')
+        if region in cache:
+            logger.debug(f"Using cached Inspector organization configuration for {region}")
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -227,7 +198,7 @@ class InspectorCheck(SecurityCheck):
         response = client.describe_organization_configuration()
         
         # Cache the result
-        self.__class__._inspector_org_config[cache_key] = response
-        logger.debug(f"Cached Inspector organization configuration for {cache_key}")
+        cache[region] = response
+        logger.debug(f"Cached Inspector organization configuration for {region}")
         
         return response
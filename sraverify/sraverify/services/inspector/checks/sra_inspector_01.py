@@ -8,22 +8,21 @@ from sraverify.core.logging import logger
 
 class SRA_INSPECTOR_01(InspectorCheck):
     """Check if Inspector service is enabled for the account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-INSPECTOR-01"
-        self.check_name = "Inspector service is enabled"
-        self.account_type = "application"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Inspector service status for the account is enabled. "
-            "Amazon Inspector is a vulnerability management service that continuously scans your AWS "
-            "workloads for software vulnerabilities and unintended network exposure."
-        )
-        self.check_logic = (
-            "Check runs inspector2 batch-get-account-status. Check PASS if response state status = Enabled"
-        )
+
+    check_id = "SRA-INSPECTOR-01"
+    check_name = "Inspector service is enabled"
+    account_type = "application"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Inspector service status for the account is enabled. "
+        "Amazon Inspector is a vulnerability management service that continuously scans your AWS "
+        "workloads for software vulnerabilities and unintended network exposure."
+    )
+    check_logic = (
+        "Check runs inspector2 batch-get-account-status. Check PASS if response state status = Enabled"
+    )
+
+    data_requirements = ("get_account_status",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,21 +8,20 @@ from sraverify.core.logging import logger
 
 class SRA_INSPECTOR_02(InspectorCheck):
     """Check if Inspector EC2 vulnerability scanning is enabled for the account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-INSPECTOR-02"
-        self.check_name = "Inspector EC2 vulnerability scanning is enabled"
-        self.account_type = "application"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Inspector EC2 vulnerability scanning feature is enabled. "
-            "Inspector automatically discovers EC2 instances and scans for software vulnerability."
-        )
-        self.check_logic = (
-            "Check runs inspector2 batch-get-account-status. Check PASS if response ec2 status = ENABLED"
-        )
+
+    check_id = "SRA-INSPECTOR-02"
+    check_name = "Inspector EC2 vulnerability scanning is enabled"
+    account_type = "application"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Inspector EC2 vulnerability scanning feature is enabled. "
+        "Inspector automatically discovers EC2 instances and scans for software vulnerability."
+    )
+    check_logic = (
+        "Check runs inspector2 batch-get-account-status. Check PASS if response ec2 status = ENABLED"
+    )
+
+    data_requirements = ("get_account_status",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
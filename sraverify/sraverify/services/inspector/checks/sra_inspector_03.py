@@ -8,21 +8,20 @@ from sraverify.core.logging import logger
 
 class SRA_INSPECTOR_03(InspectorCheck):
     """Check if Inspector ECR image vulnerability scanning is enabled for the account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-INSPECTOR-03"
-        self.check_name = "Inspector ECR image vulnerability scanning is enabled"
-        self.account_type = "application"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Inspector ECR image vulnerability scanning feature is enabled. "
-            "Amazon Inspector scans container images stored in Amazon ECR for software vulnerabilities to generate findings."
-        )
-        self.check_logic = (
-            "Check runs inspector2 batch-get-account-status. Check PASS if ecr status = ENABLED"
-        )
+
+    check_id = "SRA-INSPECTOR-03"
+    check_name = "Inspector ECR image vulnerability scanning is enabled"
+    account_type = "application"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Inspector ECR image vulnerability scanning feature is enabled. "
+        "Amazon Inspector scans container images stored in Amazon ECR for software vulnerabilities to generate findings."
+    )
+    check_logic = (
+        "Check runs inspector2 batch-get-account-status. Check PASS if ecr status = ENABLED"
+    )
+
+    data_requirements = ("get_account_status",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,21 +8,20 @@ from sraverify.core.logging import logger
 
 class SRA_INSPECTOR_04(InspectorCheck):
     """Check if Inspector Lambda function and layers vulnerability scanning is enabled for the account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-INSPECTOR-04"
-        self.check_name = "Inspector Lambda function and layers vulnerability scanning is enabled"
-        self.account_type = "application"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Inspector Lambda function and layers for package and code vulnerability. "
-            "Amazon Inspector monitors each Lambda function throughout its lifetime until it's either deleted or excluded from scanning."
-        )
-        self.check_logic = (
-            "Check runs inspector2 batch-get-account-status. Check PASS if lambda status = ENABLED AND lambdaCode status = ENABLED"
-        )
+
+    check_id = "SRA-INSPECTOR-04"
+    check_name = "Inspector Lambda function and layers vulnerability scanning is enabled"
+    account_type = "application"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Inspector Lambda function and layers for package and code vulnerability. "
+        "Amazon Inspector monitors each Lambda function throughout its lifetime until it's either deleted or excluded from scanning."
+    )
+    check_logic = (
+        "Check runs inspector2 batch-get-account-status. Check PASS if lambda status = ENABLED AND lambdaCode status = ENABLED"
+    )
+
+    data_requirements = ("get_account_status",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,21 +8,20 @@ from sraverify.core.logging import logger
 
 class SRA_INSPECTOR_05(InspectorCheck):
     """Check if Inspector delegated admin account is configured."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-INSPECTOR-05"
-        self.check_name = "Inspector delegated admin account is configured"
-        self.account_type = "management"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether a delegated administrator account is configured for Amazon Inspector. "
-            "A delegated administrator can manage Inspector findings across all accounts in the organization."
-        )
-        self.check_logic = (
-            "Check runs inspector2 get-delegated-admin-account. Check PASS if response contains delegatedAdmin"
-        )
+
+    check_id = "SRA-INSPECTOR-05"
+    check_name = "Inspector delegated admin account is configured"
+    account_type = "management"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether a delegated administrator account is configured for Amazon Inspector. "
+        "A delegated administrator can manage Inspector findings across all accounts in the organization."
+    )
+    check_logic = (
+        "Check runs inspector2 get-delegated-admin-account. Check PASS if response contains delegatedAdmin"
+    )
+
+    data_requirements = ("get_delegated_admin",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
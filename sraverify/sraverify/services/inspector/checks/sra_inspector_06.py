@@ -8,23 +8,22 @@ from sraverify.core.logging import logger
 
 class SRA_INSPECTOR_06(InspectorCheck):
     """Check if Inspector delegated admin account is the audit account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-INSPECTOR-06"
-        self.check_name = "Inspector delegated admin account is the audit account"
-        self.account_type = "management"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Inspector delegated admin account is the audit account of your AWS organization. "
-            "Audit account is dedicated to operating security services, monitoring AWS accounts, and automating security "
-            "alerting and response. Inspector provides vulnerability management service."
-        )
-        self.check_logic = (
-            "Check runs inspector2 get-delegated-admin-account. PASS if delegated admin is the Audit account "
-            "specified by flag --audit-account"
-        )
+
+    check_id = "SRA-INSPECTOR-06"
+    check_name = "Inspector delegated admin account is the audit account"
+    account_type = "management"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Inspector delegated admin account is the audit account of your AWS organization. "
+        "Audit account is dedicated to operating security services, monitoring AWS accounts, and automating security "
+        "alerting and response. Inspector provides vulnerability management service."
+    )
+    check_logic = (
+        "Check runs inspector2 get-delegated-admin-account. PASS if delegated admin is the Audit account "
+        "specified by flag --audit-account"
+    )
+
+    data_requirements = ("get_delegated_admin",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
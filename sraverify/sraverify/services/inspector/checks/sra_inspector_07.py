@@ -8,25 +8,28 @@ from sraverify.core.logging import logger
 
 class SRA_INSPECTOR_07(InspectorCheck):
     """Check if all active member accounts have Inspector enabled."""
+
+    check_id = "SRA-INSPECTOR-07"
+    check_name = "All active member accounts have Inspector enabled"
+    account_type = "audit"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether all active members accounts of the AWS Organization have Inspector enabled. "
+        "Inspector is an automated vulnerability management service that continually scans Amazon Elastic Compute Cloud (EC2), "
+        "AWS Lambda functions, and container images in Amazon ECR."
+    )
+    check_logic = (
+        "Check runs aws organizations list-accounts AND aws inspector2 batch-get-account-status. "
+        "PASS if all organization accounts (except audit) have Inspector enabled"
+    )
+
+    data_requirements = ("get_organization_members", "get_delegated_admin")
     
     def __init__(self):
         """Initialize the check."""
         super().__init__()
-        self.check_id = "SRA-INSPECTOR-07"
-        self.check_name = "All active member accounts have Inspector enabled"
-        self.account_type = "audit"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether all active members accounts of the AWS Organization have Inspector enabled. "
-            "Inspector is an automated vulnerability management service that continually scans Amazon Elastic Compute Cloud (EC2), "
-            "AWS Lambda functions, and container images in Amazon ECR."
-        )
-        self.check_logic = (
-            "Check runs aws organizations list-accounts AND aws inspector2 batch-get-account-status. "
-            "PASS if all organization accounts (except audit) have Inspector enabled"
-        )
         self._audit_accounts = []  # Will be populated from command line args
-    
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check using BatchGetAccountStatus.
@@ -37,14 +40,8 @@ class SRA_INSPECTOR_07(InspectorCheck):
         
         # Check each region separately
         for region in self.regions:
-            # Get organization members
-            org_accounts = self.get_organization_members(region)
-            
-            # Create a set of all active organization account IDs
-            org_account_ids = set()
-            for account in org_accounts:
-                if account.get('Status') == 'ACTIVE':
-                    org_account_ids.add(account.get('Id'))
+            # Get the IDs of all active organization accounts
+            org_account_ids = self.get_active_account_ids()
             
             # Get delegated admin account
             delegated_admin_response = self.get_delegated_admin(region)
@@ -61,8 +58,8 @@ class SRA_INSPECTOR_07(InspectorCheck):
             # Remove audit accounts from the list of accounts to check
             accounts_to_check = org_account_ids - set(audit_accounts)
             
-            # Convert to list for the API call
-            accounts_list = list(accounts_to_check)
+            # Convert to a sorted list for the API call, so the request is the same in every run
+            accounts_list = sorted(accounts_to_check)
             
             # Use BatchGetAccountStatus to check which accounts have Inspector enabled
             account_statuses = self.batch_get_account_status(region, accounts_list)
@@ -8,21 +8,20 @@ from sraverify.core.logging import logger
 
 class SRA_INSPECTOR_08(InspectorCheck):
     """Check if Inspector EC2 auto-enable is configured."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-INSPECTOR-08"
-        self.check_name = "Inspector EC2 auto-enable is configured"
-        self.account_type = "audit"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Inspector is configured to automatically enable EC2 scanning for new accounts. "
-            "Auto-enable ensures that EC2 instances in new accounts added to the organization are automatically scanned."
-        )
-        self.check_logic = (
-            "Check runs inspector2 describe-organization-configuration. Check PASS if autoEnable.ec2=true"
-        )
+
+    check_id = "SRA-INSPECTOR-08"
+    check_name = "Inspector EC2 auto-enable is configured"
+    account_type = "audit"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Inspector is configured to automatically enable EC2 scanning for new accounts. "
+        "Auto-enable ensures that EC2 instances in new accounts added to the organization are automatically scanned."
+    )
+    check_logic = (
+        "Check runs inspector2 describe-organization-configuration. Check PASS if autoEnable.ec2=true"
+    )
+
+    data_requirements = ("get_organization_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
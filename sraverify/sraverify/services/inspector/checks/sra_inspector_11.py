@@ -8,21 +8,20 @@ from sraverify.core.logging import logger
 
 class SRA_INSPECTOR_11(InspectorCheck):
     """Check if Inspector Lambda Code auto-enable is configured."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-INSPECTOR-11"
-        self.check_name = "Inspector Lambda Code auto-enable is configured"
-        self.account_type = "audit"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Inspector is configured to automatically enable Lambda Code scanning for new accounts. "
-            "Auto-enable ensures that Lambda function code in new accounts added to the organization is automatically scanned."
-        )
-        self.check_logic = (
-            "Check runs inspector2 describe-organization-configuration. Check PASS if autoEnable.lambdaCode=true"
-        )
+
+    check_id = "SRA-INSPECTOR-11"
+    check_name = "Inspector Lambda Code auto-enable is configured"
+    account_type = "audit"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Inspector is configured to automatically enable Lambda Code scanning for new accounts. "
+        "Auto-enable ensures that Lambda function code in new accounts added to the organization is automatically scanned."
+    )
+    check_logic = (
+        "Check runs inspector2 describe-organization-configuration. Check PASS if autoEnable.lambdaCode=true"
+    )
+
+    data_requirements = ("get_organization_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -4,11 +4,13 @@ Inspector client for interacting with AWS Inspector service.
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 
 class InspectorClient:
     """Client for interacting with AWS Inspector service."""
+    client = lazy_client('inspector2')
     
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,8 +22,6 @@ class InspectorClient:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('inspector2', region_name=region)
-        self.org_client = self.session.client('organizations', region_name=region)
 
     def batch_get_account_status(self, account_ids: List[str]) -> Dict[str, Any]:
         """
@@ -79,21 +79,3 @@ class InspectorClient:
         except Exception as e:
             logger.debug(f"Unexpected error describing Inspector organization configuration in {self.region}: {e}")
             return {}
-    
-    def list_organization_accounts(self) -> List[Dict[str, Any]]:
-        """
-        List all accounts in the AWS Organization.
-        
-        Returns:
-            List of organization accounts
-        """
-        try:
-            logger.debug(f"Listing organization accounts in {self.region}")
-            response = self.org_client.list_accounts()
-            return response.get('Accounts', [])
-        except ClientError as e:
-            logger.debug(f"Error listing organization accounts in {self.region}: {e}")
-            return []
-        except Exception as e:
-            logger.debug(f"Unexpected error listing organization accounts in {self.region}: {e}")
-            return []
@@ -9,23 +9,11 @@ from sraverify.core.logging import logger
 
 class MacieCheck(SecurityCheck):
     """Base class for all Macie security checks."""
-    
-    # Class-level caches shared across all instances
-    _findings_publication_cache = {}
-    _export_configuration_cache = {}
-    _macie_delegated_admin_cache = {}
-    _macie_members_cache = {}
-    _org_members_cache = {}
-    _auto_enable_cache = {}
-    
-    def __init__(self):
-        """Initialize Macie base check."""
-        super().__init__(
-            account_type="application",  # Default, can be overridden in subclasses
-            service="Macie",
-            resource_type="AWS::Macie::Session"
-        )
-    
+
+    account_type = "application"  # Default, can be overridden in subclasses
+    service = "Macie"
+    resource_type = "AWS::Macie::Session"
+
     def _setup_clients(self):
         """Set up Macie clients for each region."""
         # Clear existing clients
@@ -58,12 +46,11 @@ class MacieCheck(SecurityCheck):
             Dictionary containing findings publication configuration
         """
         # Check cache first
-        account_id = self.account_id
-        cache_key = f"{account_id}:{region}"
+        cache = self.cache('macie.findings_publication')
         
-        if cache_key in self.__class__._findings_publication_cache:
+        if region in cache:
             logger.debug(f"Using cached Macie findings publication configuration for {region}")
-            return self.__class__._findings_publication_cache[cache_key]
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -74,7 +61,7 @@ class MacieCheck(SecurityCheck):
         config = client.get_findings_publication_configuration()
         
         # Cache the result
-        self.__class__._findings_publication_cache[cache_key] = config
+        cache[region] = config
         logger.debug(f"Cached Macie findings publication configuration for {region}")
         
         return config
@@ -90,12 +77,11 @@ class MacieCheck(SecurityCheck):
             Dictionary containing classification export configuration
         """
         # Check cache first
-        account_id = self.account_id
-        cache_key = f"{account_id}:{region}"
+        cache = self.cache('macie.export_configuration')
         
-        if cache_key in self.__class__._export_configuration_cache:
+        if region in cache:
             logger.debug(f"Using cached Macie classification export configuration for {region}")
-            return self.__class__._export_configuration_cache[cache_key]
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -106,7 +92,7 @@ class MacieCheck(SecurityCheck):
         config = client.get_classification_export_configuration()
         
         # Cache the result
-        self.__class__._export_configuration_cache[cache_key] = config
+        cache[region] = config
         logger.debug(f"Cached Macie classification export configuration for {region}")
         
         return config
@@ -122,12 +108,11 @@ class MacieCheck(SecurityCheck):
             List of delegated administrators
         """
         # Check cache first
-        account_id = self.account_id
-        cache_key = f"{account_id}:{region}"
+        cache = self.cache('macie.delegated_admin')
         
-        if cache_key in self.__class__._macie_delegated_admin_cache:
+        if region in cache:
             logger.debug(f"Using cached Macie delegated administrator for {region}")
-            return self.__class__._macie_delegated_admin_cache[cache_key]
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -138,7 +123,7 @@ class MacieCheck(SecurityCheck):
         delegated_admin = client.list_delegated_administrators()
         
         # Cache the result
-        self.__class__._macie_delegated_admin_cache[cache_key] = delegated_admin
+        cache[region] = delegated_admin
         logger.debug(f"Cached Macie delegated administrator for {region}")
         
         return delegated_admin
@@ -154,12 +139,11 @@ class MacieCheck(SecurityCheck):
             List of Macie members
         """
         # Check cache first
-        account_id = self.account_id
-        cache_key = f"{account_id}:{region}"
+        cache = self.cache('macie.members')
         
-        if cache_key in self.__class__._macie_members_cache:
+        if region in cache:
             logger.debug(f"Using cached Macie members for {region}")
-            return self.__class__._macie_members_cache[cache_key]
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -170,42 +154,26 @@ class MacieCheck(SecurityCheck):
         members = client.list_members()
         
         # Cache the result
-        self.__class__._macie_members_cache[cache_key] = members
+        cache[region] = members
         logger.debug(f"Cached {len(members)} Macie members for {region}")
         
         return members
     
     def get_organization_members(self, region: str) -> List[Dict[str, Any]]:
         """
-        Get AWS Organization members with caching.
+        Get AWS Organization members from the shared organization directory.
         
         Args:
-            region: AWS region name
+            region: AWS region name (accounts are the same in every region)
             
         Returns:
             List of AWS Organization members
         """
-        # Check cache first
-        account_id = self.account_id
-        cache_key = f"{account_id}:{region}"
-        
-        if cache_key in self.__class__._org_members_cache:
-            logger.debug(f"Using cached AWS Organization members for {region}")
-            return self.__class__._org_members_cache[cache_key]
-        
-        client = self.get_client(region)
-        if not client:
-            logger.warning(f"No Macie client available for region {region}")
+        try:
+            return self.org_directory.accounts
+        except Exception as e:
+            logger.error(f"Error listing AWS Organization accounts: {e}")
             return []
-        
-        # Get organization members from client
-        members = client.list_organization_accounts()
-        
-        # Cache the result
-        self.__class__._org_members_cache[cache_key] = members
-        logger.debug(f"Cached {len(members)} AWS Organization members for {region}")
-        
-        return members
     
     def get_organization_configuration(self, region: str) -> Dict[str, Any]:
         """
@@ -218,12 +186,11 @@ class MacieCheck(SecurityCheck):
             Dictionary containing Macie organization configuration
         """
         # Check cache first
-        account_id = self.account_id
-        cache_key = f"{account_id}:{region}"
+        cache = self.cache('macie.auto_enable')
         
-        if cache_key in self.__class__._auto_enable_cache:
+        if region in cache:
             logger.debug(f"Using cached Macie organization configuration for {region}")
-            return self.__class__._auto_enable_cache[cache_key]
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -234,7 +201,7 @@ class MacieCheck(SecurityCheck):
         config = client.describe_organization_configuration()
         
         # Cache the result
-        self.__class__._auto_enable_cache[cache_key] = config
+        cache[region] = config
         logger.debug(f"Cached Macie organization configuration for {region}")
         
         return config
@@ -249,12 +216,11 @@ class MacieCheck(SecurityCheck):
             Dictionary containing Macie administrator account information
         """
         # Check cache first
-        account_id = self.account_id
-        cache_key = f"{account_id}:{region}"
+        cache = self.cache('macie.administrator_account')
         
-        if cache_key in self.__class__._macie_delegated_admin_cache:
+        if region in cache:
             logger.debug(f"Using cached Macie administrator account for {region}")
-            return self.__class__._macie_delegated_admin_cache[cache_key]
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -265,7 +231,7 @@ class MacieCheck(SecurityCheck):
         admin_account = client.get_administrator_account()
         
         # Cache the result
-        self.__class__._macie_delegated_admin_cache[cache_key] = admin_account
+        cache[region] = admin_account
         logger.debug(f"Cached Macie administrator account for {region}")
         
         return admin_account
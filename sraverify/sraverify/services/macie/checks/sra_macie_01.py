@@ -8,20 +8,19 @@ from sraverify.core.logging import logger
 
 class SRA_MACIE_01(MacieCheck):
     """Check if Macie publish policy findings to Security Hub is enabled."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-MACIE-01"
-        self.check_name = "Macie publish policy findings to Security Hub is enabled"
-        self.description = (
-            "This check verifies whether Macie is configured to publish new and updated policy findings to AWS Security Hub. "
-            "Policy findings denotes potential security or privacy issue with a S3 bucket."
-        )
-        self.severity = "HIGH"
-        self.account_type = "application"
-        self.check_logic = "Check validates macie2 get-findings-publication-configuration. Check PASS if 'publishPolicyFindings': true"
-        self.resource_type = "AWS::Macie::Session"
+
+    check_id = "SRA-MACIE-01"
+    check_name = "Macie publish policy findings to Security Hub is enabled"
+    description = (
+        "This check verifies whether Macie is configured to publish new and updated policy findings to AWS Security Hub. "
+        "Policy findings denotes potential security or privacy issue with a S3 bucket."
+    )
+    severity = "HIGH"
+    account_type = "application"
+    check_logic = "Check validates macie2 get-findings-publication-configuration. Check PASS if 'publishPolicyFindings': true"
+    resource_type = "AWS::Macie::Session"
+
+    data_requirements = ("get_findings_publication_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
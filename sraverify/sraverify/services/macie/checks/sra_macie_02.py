@@ -8,22 +8,21 @@ from sraverify.core.logging import logger
 
 class SRA_MACIE_02(MacieCheck):
     """Check if Macie publish classification findings to Security Hub is enabled."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-MACIE-02"
-        self.check_name = "Macie publish classification findings to Security Hub is enabled"
-        self.description = (
-            "This check verifies whether Macie is configured to publish sensitive data findings to AWS Security Hub. "
-            "Sensitive data findings denotes potential sensitive data in as S3 object. Macie continually evaluates your "
-            "S3 bucket inventory and uses sampling techniques to identify and select representative S3 objects from your buckets. "
-            "Macie then retrieves and analyzes the selected objects, inspecting them for sensitive data."
-        )
-        self.severity = "HIGH"
-        self.account_type = "application"
-        self.check_logic = "Check validates macie2 get-findings-publication-configuration. Check PASS if 'publishClassificationFindings': true"
-        self.resource_type = "AWS::Macie::Session"
+
+    check_id = "SRA-MACIE-02"
+    check_name = "Macie publish classification findings to Security Hub is enabled"
+    description = (
+        "This check verifies whether Macie is configured to publish sensitive data findings to AWS Security Hub. "
+        "Sensitive data findings denotes potential sensitive data in as S3 object. Macie continually evaluates your "
+        "S3 bucket inventory and uses sampling techniques to identify and select representative S3 objects from your buckets. "
+        "Macie then retrieves and analyzes the selected objects, inspecting them for sensitive data."
+    )
+    severity = "HIGH"
+    account_type = "application"
+    check_logic = "Check validates macie2 get-findings-publication-configuration. Check PASS if 'publishClassificationFindings': true"
+    resource_type = "AWS::Macie::Session"
+
+    data_requirements = ("get_findings_publication_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,24 +8,23 @@ from sraverify.core.logging import logger
 
 class SRA_MACIE_03(MacieCheck):
     """Check if Macie findings are exported to a S3 bucket in Log Archive account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-MACIE-03"
-        self.check_name = "Macie findings exported to a S3 bucket in Log Archive account are encrypted at rest"
-        self.description = (
-            "This check verifies whether all Macie findings are being exported to a S3 bucket within the Log Archive account. "
-            "Log Archive account is the central repository of all AWS Organization logs."
-        )
-        self.severity = "HIGH"
-        self.account_type = "application"
-        self.check_logic = (
-            "Check validates using get-classification-export-configuration if Macie is set to export findings to S3 AND "
-            "if the S3 bucket is in the log archive account validated by EITHER the bucket name containing OR the KMS key "
-            "arn containing the --log-archive account ID. If bucket account can't be validated to --log-archive FAIL with value of bucket."
-        )
-        self.resource_type = "AWS::Macie::Session"
+
+    check_id = "SRA-MACIE-03"
+    check_name = "Macie findings exported to a S3 bucket in Log Archive account are encrypted at rest"
+    description = (
+        "This check verifies whether all Macie findings are being exported to a S3 bucket within the Log Archive account. "
+        "Log Archive account is the central repository of all AWS Organization logs."
+    )
+    severity = "HIGH"
+    account_type = "application"
+    check_logic = (
+        "Check validates using get-classification-export-configuration if Macie is set to export findings to S3 AND "
+        "if the S3 bucket is in the log archive account validated by EITHER the bucket name containing OR the KMS key "
+        "arn containing the --log-archive account ID. If bucket account can't be validated to --log-archive FAIL with value of bucket."
+    )
+    resource_type = "AWS::Macie::Session"
+
+    data_requirements = ("get_classification_export_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,20 +8,19 @@ from sraverify.core.logging import logger
 
 class SRA_MACIE_04(MacieCheck):
     """Check if Macie findings exported to S3 are encrypted at rest using KMS."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-MACIE-04"
-        self.check_name = "Checks that findings are being exported to S3 in the log archive account are encrypted at rest"
-        self.description = (
-            "This check verifies whether all Macie findings that are being exported to a S3 bucket within the Log Archive account "
-            "are encrypted using KMS key. Macie findings are sensitive in natures and should be encrypted to prevent from unauthorized disclosure."
-        )
-        self.severity = "HIGH"
-        self.account_type = "application"
-        self.check_logic = "Check validates using get-classification-export-configuration that kms key exists. PASS if KMS ARN returned."
-        self.resource_type = "AWS::Macie::Session"
+
+    check_id = "SRA-MACIE-04"
+    check_name = "Checks that findings are being exported to S3 in the log archive account are encrypted at rest"
+    description = (
+        "This check verifies whether all Macie findings that are being exported to a S3 bucket within the Log Archive account "
+        "are encrypted using KMS key. Macie findings are sensitive in natures and should be encrypted to prevent from unauthorized disclosure."
+    )
+    severity = "HIGH"
+    account_type = "application"
+    check_logic = "Check validates using get-classification-export-configuration that kms key exists. PASS if KMS ARN returned."
+    resource_type = "AWS::Macie::Session"
+
+    data_requirements = ("get_classification_export_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,19 +8,18 @@ from sraverify.core.logging import logger
 
 class SRA_MACIE_05(MacieCheck):
     """Check if Macie administration for the AWS Organization has a delegated administrator."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-MACIE-05"
-        self.check_name = "Macie administration for the AWS Organization has a delegated administrator"
-        self.description = (
-            "This check verifies whether Macie service administration for the AWS Organization is delegated out to AWS Organization management account."
-        )
-        self.severity = "HIGH"
-        self.account_type = "management"
-        self.check_logic = "Check validates that a delegated administrator exists for Macie. PASS if macie2 get-administrator-account returns a valid administrator account"
-        self.resource_type = "AWS::Macie::Session"
+
+    check_id = "SRA-MACIE-05"
+    check_name = "Macie administration for the AWS Organization has a delegated administrator"
+    description = (
+        "This check verifies whether Macie service administration for the AWS Organization is delegated out to AWS Organization management account."
+    )
+    severity = "HIGH"
+    account_type = "management"
+    check_logic = "Check validates that a delegated administrator exists for Macie. PASS if macie2 get-administrator-account returns a valid administrator account"
+    resource_type = "AWS::Macie::Session"
+
+    data_requirements = ("get_macie_administrator_account",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
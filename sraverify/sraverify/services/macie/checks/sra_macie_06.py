@@ -8,21 +8,20 @@ from sraverify.core.logging import logger
 
 class SRA_MACIE_06(MacieCheck):
     """Check if Macie delegated admin account is the Security Tooling (Audit) account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-MACIE-06"
-        self.check_name = "Macie delegated admin account is the Security Tooling (Audit) account"
-        self.description = (
-            "This check verifies whether Macie delegated admin account is the audit account of your AWS organization. "
-            "audit account is dedicated to operating security services, monitoring AWS accounts, and automating security "
-            "alerting and response. Macie provides sensitive data discovery service."
-        )
-        self.severity = "HIGH"
-        self.account_type = "management"
-        self.check_logic = "Check validates that the administrator account for Macie is the --audit-account. Check PASS if macie2 get-administrator-account account ID == audit account passed via —audit-account flag"
-        self.resource_type = "AWS::Macie::Session"
+
+    check_id = "SRA-MACIE-06"
+    check_name = "Macie delegated admin account is the Security Tooling (Audit) account"
+    description = (
+        "This check verifies whether Macie delegated admin account is the audit account of your AWS organization. "
+        "audit account is dedicated to operating security services, monitoring AWS accounts, and automating security "
+        "alerting and response. Macie provides sensitive data discovery service."
+    )
+    severity = "HIGH"
+    account_type = "management"
+    check_logic = "Check validates that the administrator account for Macie is the --audit-account. Check PASS if macie2 get-administrator-account account ID == audit account passed via —audit-account flag"
+    resource_type = "AWS::Macie::Session"
+
+    data_requirements = ("get_macie_administrator_account",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
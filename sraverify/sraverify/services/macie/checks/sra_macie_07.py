@@ -8,22 +8,21 @@ from sraverify.core.logging import logger
 
 class SRA_MACIE_07(MacieCheck):
     """Check if all active member accounts have relationship with delegated admin account enabled."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-MACIE-07"
-        self.check_name = "All active member accounts have relationship with delegated admin account enabled"
-        self.description = (
-            "This check verifies whether all active members accounts of the AWS Organization have Macie member relationship "
-            "enabled with Macie delegated admin account. Amazon Macie is a data security service that discovers sensitive data "
-            "by using machine learning and pattern matching, provides visibility into data security risks, and enables automated "
-            "protection against those risks."
-        )
-        self.severity = "HIGH"
-        self.account_type = "audit"
-        self.check_logic = "Check runs organizations list-accounts AND macie2 list-members. Check PASS if macie2 list-members includes all members of the AWS organization minus the audit account."
-        self.resource_type = "AWS::Macie::Session"
+
+    check_id = "SRA-MACIE-07"
+    check_name = "All active member accounts have relationship with delegated admin account enabled"
+    description = (
+        "This check verifies whether all active members accounts of the AWS Organization have Macie member relationship "
+        "enabled with Macie delegated admin account. Amazon Macie is a data security service that discovers sensitive data "
+        "by using machine learning and pattern matching, provides visibility into data security risks, and enables automated "
+        "protection against those risks."
+    )
+    severity = "HIGH"
+    account_type = "audit"
+    check_logic = "Check runs organizations list-accounts AND macie2 list-members. Check PASS if macie2 list-members includes all members of the AWS organization minus the audit account."
+    resource_type = "AWS::Macie::Session"
+
+    data_requirements = ("get_organization_members", "get_macie_members")
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -40,11 +39,11 @@ class SRA_MACIE_07(MacieCheck):
             audit_accounts = self._audit_accounts
         
         for region in self.regions:
-            # Get organization members using the base class method with caching
-            org_members = self.get_organization_members(region)
+            # Get the IDs of the active organization accounts from the shared organization directory
+            active_org_account_ids = self.get_active_account_ids()
             
             # Check if the API call was successful
-            if not org_members:
+            if not active_org_account_ids:
                 findings.append(
                     self.create_finding(
                         status="FAIL",
@@ -74,14 +73,7 @@ class SRA_MACIE_07(MacieCheck):
                 )
                 continue
             
-            # Filter active organization members
-            active_org_members = [
-                member for member in org_members 
-                if member.get('Status') == 'ACTIVE'
-            ]
-            
-            # Create sets of account IDs for comparison
-            active_org_account_ids = {member.get('Id') for member in active_org_members}
+            # Create a set of Macie member account IDs for comparison
             macie_member_account_ids = {member.get('accountId') for member in macie_members}
             
             # Remove the current account (delegated admin) from the set of accounts to check
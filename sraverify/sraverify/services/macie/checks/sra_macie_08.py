@@ -8,20 +8,19 @@ from sraverify.core.logging import logger
 
 class SRA_MACIE_08(MacieCheck):
     """Check if Macie AutoEnable configuration is enabled for new member accounts."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-MACIE-08"
-        self.check_name = "Macie AutoEnable configuration is enabled for new member accounts"
-        self.description = (
-            "This check verifies whether auto-enablement configuration for Macie is enabled for member accounts of the AWS Organization. "
-            "This ensures that all existing and new member accounts will have Macie monitoring."
-        )
-        self.severity = "MEDIUM"
-        self.account_type = "audit"
-        self.check_logic = "Check runs macie2 describe-organization-configuration. PASS if autoenable = True"
-        self.resource_type = "AWS::Macie::Session"
+
+    check_id = "SRA-MACIE-08"
+    check_name = "Macie AutoEnable configuration is enabled for new member accounts"
+    description = (
+        "This check verifies whether auto-enablement configuration for Macie is enabled for member accounts of the AWS Organization. "
+        "This ensures that all existing and new member accounts will have Macie monitoring."
+    )
+    severity = "MEDIUM"
+    account_type = "audit"
+    check_logic = "Check runs macie2 describe-organization-configuration. PASS if autoenable = True"
+    resource_type = "AWS::Macie::Session"
+
+    data_requirements = ("get_organization_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,21 +8,20 @@ from sraverify.core.logging import logger
 
 class SRA_MACIE_09(MacieCheck):
     """Check if all active member accounts have Macie enabled."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-MACIE-09"
-        self.check_name = "All active member accounts have Macie enabled"
-        self.description = (
-            "This check verifies whether all active members accounts of the AWS Organization have Macie enabled. "
-            "Amazon Macie is a data security service that discovers sensitive data by using machine learning and pattern matching, "
-            "provides visibility into data security risks, and enables automated protection against those risks."
-        )
-        self.severity = "HIGH"
-        self.account_type = "audit"
-        self.check_logic = "Check runs macie2 list-members, PASS if 'relationshipStatus': 'Enabled' for all members"
-        self.resource_type = "AWS::Macie::Session"
+
+    check_id = "SRA-MACIE-09"
+    check_name = "All active member accounts have Macie enabled"
+    description = (
+        "This check verifies whether all active members accounts of the AWS Organization have Macie enabled. "
+        "Amazon Macie is a data security service that discovers sensitive data by using machine learning and pattern matching, "
+        "provides visibility into data security risks, and enables automated protection against those risks."
+    )
+    severity = "HIGH"
+    account_type = "audit"
+    check_logic = "Check runs macie2 list-members, PASS if 'relationshipStatus': 'Enabled' for all members"
+    resource_type = "AWS::Macie::Session"
+
+    data_requirements = ("get_macie_members",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
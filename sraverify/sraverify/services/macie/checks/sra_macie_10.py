@@ -8,20 +8,19 @@ from sraverify.core.logging import logger
 
 class SRA_MACIE_10(MacieCheck):
     """Check if Macie member account limit not reached."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-MACIE-10"
-        self.check_name = "Macie member account limit not reached"
-        self.description = (
-            "This check verifies whether the maximum number of allowed member accounts are already associated with the "
-            "delegated administrator account for the AWS Organization."
-        )
-        self.severity = "MEDIUM"
-        self.account_type = "audit"
-        self.check_logic = "Check runs macie2 describe-organization-configuration. PASS if maxaccountlimitreached = False"
-        self.resource_type = "AWS::Macie::Session"
+
+    check_id = "SRA-MACIE-10"
+    check_name = "Macie member account limit not reached"
+    description = (
+        "This check verifies whether the maximum number of allowed member accounts are already associated with the "
+        "delegated administrator account for the AWS Organization."
+    )
+    severity = "MEDIUM"
+    account_type = "audit"
+    check_logic = "Check runs macie2 describe-organization-configuration. PASS if maxaccountlimitreached = False"
+    resource_type = "AWS::Macie::Session"
+
+    data_requirements = ("get_organization_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
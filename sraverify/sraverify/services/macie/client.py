@@ -4,11 +4,14 @@ Macie client for interacting with AWS Macie service.
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import get_client, lazy_client
 from sraverify.core.logging import logger
 
 
 class MacieClient:
     """Client for interacting with AWS Macie service."""
+    client = lazy_client('macie2')
+    org_client = lazy_client('organizations')
     
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,8 +23,6 @@ class MacieClient:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('macie2', region_name=region)
-        self.org_client = self.session.client('organizations', region_name=region)
 
     def get_findings_publication_configuration(self) -> Dict[str, Any]:
         """
@@ -127,30 +128,6 @@ class MacieClient:
             logger.debug(f"Unexpected error listing Macie members in {self.region}: {e}")
             return []
     
-    def list_organization_accounts(self) -> List[Dict[str, Any]]:
-        """
-        List all accounts in the AWS Organization.
-        
-        Returns:
-            List of accounts in the AWS Organization
-        """
-        try:
-            logger.debug(f"Listing AWS Organization accounts in {self.region}")
-            accounts = []
-            paginator = self.org_client.get_paginator('list_accounts')
-            
-            for page in paginator.paginate():
-                accounts.extend(page.get('Accounts', []))
-            
-            logger.debug(f"Found {len(accounts)} AWS Organization accounts")
-            return accounts
-        except ClientError as e:
-            logger.error(f"Error listing AWS Organization accounts: {e}")
-            return []
-        except Exception as e:
-            logger.error(f"Unexpected error listing AWS Organization accounts: {e}")
-            return []
-    
     def describe_organization_configuration(self) -> Dict[str, Any]:
         """
         Describe the Macie organization configuration.
@@ -184,7 +161,7 @@ class MacieClient:
         """
         try:
             logger.debug(f"Getting current account ID in {self.region}")
-            sts_client = self.session.client("sts")
+            sts_client = get_client(self.session, 'sts')
             response = sts_client.get_caller_identity()
             account_id = response["Account"]
             logger.debug(f"Current account ID: {account_id}")
@@ -0,0 +1,1421 @@
+"""
+Check manifest used by sraverify.core.registry.
+
+Generated by `python -m sraverify.core.registry`; do not edit by hand.
+"""
+
+CHECK_MANIFEST = {
+    "SRA-GUARDDUTY-01": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_01",
+        "class_name": "SRA_GUARDDUTY_01",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty detector exists",
+        "description": "This check verifies that an GuardDuty detector exists in the AWS Region.              A detector is a resource that represents the GuardDuty service and should be present                 in all AWS member account and AWS Region so that GuardDuty can generate findings                     about unauthorized or unusual activity even in those Regions that you may not                         be using actively.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-02": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_02",
+        "class_name": "SRA_GUARDDUTY_02",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty finding frequency is set",
+        "description": "This check verifies that the GuardDuty finding frequency is set as per your organization requirement. This determines how often updates to active findings are exported to EventBridge, S3 (optional) and Detective (optional). By default, updated findings are exported every 6 hours but you can set to every 15 minutes or 1 hour.",
+        "severity": "LOW",
+    },
+    "SRA-GUARDDUTY-03": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_03",
+        "class_name": "SRA_GUARDDUTY_03",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty detector is enabled",
+        "description": "This check verifies that the GuardDuty detector in the AWS account and AWS region is enabled. Detector represents GuardDuty service in the AWS account and specific region, if disabled will not provided threat intelligence service.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-04": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_04",
+        "class_name": "SRA_GUARDDUTY_04",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty DNS logs enabled",
+        "description": "This check verifies that GuardDuty has DNS logs as one of the log sources, enabled. If you use AWS DNS resolvers for your Amazon EC2 instances (the default setting), then GuardDuty can access and process your request and response DNS logs through the internal AWS DNS resolvers.",
+        "severity": "MEDIUM",
+    },
+    "SRA-GUARDDUTY-05": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_05",
+        "class_name": "SRA_GUARDDUTY_05",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty VPC flow logs enabled",
+        "description": "This check verifies that GuardDuty has VPC flow logs as one of the log sources, enabled.GuardDuty analyzes your VPC flow logs from Amazon EC2 instances within your account. It consumes VPC flow log events directly from the VPC Flow Logs feature through an independent and duplicated stream of flow logs.",
+        "severity": "MEDIUM",
+    },
+    "SRA-GUARDDUTY-06": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_06",
+        "class_name": "SRA_GUARDDUTY_06",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty S3 protection enabled",
+        "description": "This check verifies that GuardDuty has S3 protection enabled. GuardDuty provides enhanced visibility through S3 protection. GuardDuty monitors both AWS CloudTrail management events and AWS CloudTrail S3 data events to identify potential threats in your Amazon S3 resources.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-07": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_07",
+        "class_name": "SRA_GUARDDUTY_07",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty EKS protection enabled",
+        "description": "This check verifies that GuardDuty has EKS protection enabled. EKS Audit Log Monitoring helps you detect potentially suspicious activities in your EKS clusters within Amazon Elastic Kubernetes Service. It consumes Kubernetes audit log events directly from the Amazon EKS control plane logging feature through an independent and duplicated stream of audit logs.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-08": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_08",
+        "class_name": "SRA_GUARDDUTY_08",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty CloudTrail logs enabled",
+        "description": "This check verifies that GuardDuty has CloudTrail event and management logs as one of the feature, enabled. GuardDuty consumes CloudTrail management events directly from CloudTrail through an independent and duplicated stream of events and analyzes the CloudTrail event logs.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-09": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_09",
+        "class_name": "SRA_GUARDDUTY_09",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty malware protection for EBS enabled",
+        "description": "This check verifies that GuardDuty malware protection for EBS is enabled. Malware Protection for EC2 helps you detect the potential presence of malware by scanning the Amazon EBS volumes that are attached to the Amazon EC2 instances and container workloads.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-10": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_10",
+        "class_name": "SRA_GUARDDUTY_10",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty RDS protection enabled",
+        "description": "This check verifies that GuardDuty RDS protection is enabled. RDS Protection in Amazon GuardDuty analyzes and profiles RDS login activity for potential access threats to Amazon Aurora databases and Amazon RDS for PostgreSQL.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-11": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_11",
+        "class_name": "SRA_GUARDDUTY_11",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty EKS runtime protection enabled",
+        "description": "This check verifies that GuardDuty EKS runtime (original) or runtime protection is enabled. Runtime Monitoring observes and analyzes operating system-level, networking, and file events to help you detect potential threats in specific AWS workloads",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-12": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_12",
+        "class_name": "SRA_GUARDDUTY_12",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty Lambda protection enabled",
+        "description": "This check verifies that GuardDuty Lambda protection is enabled. Lambda Protection helps identify potential security threats when an AWS Lambda function gets invoked in the AWS environment.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-13": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_13",
+        "class_name": "SRA_GUARDDUTY_13",
+        "service": "GuardDuty",
+        "account_type": "management",
+        "name": "GuardDuty service administration delegated",
+        "description": "This check verifies whether GuardDuty service administration for the AWS Organization is delegated. Centralized management of GuardDuty across the organization improves security visibility and control.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-14": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_14",
+        "class_name": "SRA_GUARDDUTY_14",
+        "service": "GuardDuty",
+        "account_type": "management",
+        "name": "GuardDuty delegated admin is audit account",
+        "description": "This check verifies whether GuardDuty delegated admin account is the audit account of your AWS organization. The audit account is dedicated to operating security services, monitoring AWS accounts, and automating security alerting and response. GuardDuty helps monitor resources for unusual and suspicious activities.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-15": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_15",
+        "class_name": "SRA_GUARDDUTY_15",
+        "service": "GuardDuty",
+        "account_type": "audit",
+        "name": "GuardDuty auto-enablement configured",
+        "description": "This check verifies whether auto-enablement configuration for GuardDuty is  enabled for member accounts of the AWS Organization. This ensures that all  existing and new member accounts will have GuardDuty monitoring.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-16": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_16",
+        "class_name": "SRA_GUARDDUTY_16",
+        "service": "GuardDuty",
+        "account_type": "audit",
+        "name": "GuardDuty member account limit not reached",
+        "description": "This check verifies whether the maximum number of allowed member accounts are already associated with the delegated administrator account for the AWS Organization. Reaching the limit prevents adding new accounts to GuardDuty monitoring.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-17": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_17",
+        "class_name": "SRA_GUARDDUTY_17",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty EKS addon management enabled",
+        "description": "This check verifies that GuardDuty has EKS addon management enabled. EKS addon management allows GuardDuty to automatically deploy and manage the security agent on your EKS clusters, simplifying the setup and maintenance of runtime monitoring for Kubernetes workloads.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-18": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_18",
+        "class_name": "SRA_GUARDDUTY_18",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty ECS Fargate agent management enabled",
+        "description": "This check verifies that GuardDuty has ECS Fargate agent management enabled. ECS Fargate agent management allows GuardDuty to automatically deploy and manage the security agent on your ECS Fargate tasks, simplifying the setup and maintenance of runtime monitoring for containerized workloads.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-19": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_19",
+        "class_name": "SRA_GUARDDUTY_19",
+        "service": "GuardDuty",
+        "account_type": "application",
+        "name": "GuardDuty EC2 agent management enabled",
+        "description": "This check verifies that GuardDuty has EC2 agent management enabled. EC2 agent management allows GuardDuty to automatically deploy and manage the security agent on your EC2 instances, simplifying the setup and maintenance of runtime monitoring for EC2 workloads.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-20": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_20",
+        "class_name": "SRA_GUARDDUTY_20",
+        "service": "GuardDuty",
+        "account_type": "audit",
+        "name": "GuardDuty S3 data events auto-enablement configured",
+        "description": "This check verifies whether S3 data events are configured for auto-enablement in GuardDuty for all member accounts. S3 data events provide visibility into object-level API operations, enhancing threat detection for S3 buckets.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-21": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_21",
+        "class_name": "SRA_GUARDDUTY_21",
+        "service": "GuardDuty",
+        "account_type": "audit",
+        "name": "GuardDuty EBS Malware Protection auto-enablement configured",
+        "description": "This check verifies whether EBS Malware Protection is configured for auto-enablement in GuardDuty for all member accounts. EBS Malware Protection scans EBS volumes for malware when GuardDuty detects a potential threat, helping to identify and remediate malware infections in your AWS environment.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-22": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_22",
+        "class_name": "SRA_GUARDDUTY_22",
+        "service": "GuardDuty",
+        "account_type": "audit",
+        "name": "GuardDuty EKS Audit Logs auto-enablement configured",
+        "description": "This check verifies whether EKS Audit Logs are configured for auto-enablement in GuardDuty for all member accounts. EKS Audit Logs monitoring analyzes Kubernetes audit logs to detect potentially suspicious activities in Amazon EKS clusters.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-23": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_23",
+        "class_name": "SRA_GUARDDUTY_23",
+        "service": "GuardDuty",
+        "account_type": "audit",
+        "name": "GuardDuty Runtime Monitoring auto-enablement configured",
+        "description": "This check verifies whether Runtime Monitoring and its components (ECS Fargate Agent Management, EC2 Agent Management, and EKS Addon Management) are configured for auto-enablement in GuardDuty for all member accounts. Runtime Monitoring provides threat detection for runtime behavior of resources, helping to identify malicious activities.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-24": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_24",
+        "class_name": "SRA_GUARDDUTY_24",
+        "service": "GuardDuty",
+        "account_type": "audit",
+        "name": "GuardDuty Lambda Network Logs auto-enablement configured",
+        "description": "This check verifies whether Lambda Network Logs are configured for auto-enablement in GuardDuty for all member accounts. Lambda Network Logs monitoring analyzes VPC flow logs for Lambda functions to detect potentially suspicious network activity.",
+        "severity": "HIGH",
+    },
+    "SRA-GUARDDUTY-25": {
+        "module": "sraverify.services.guardduty.checks.sra_guardduty_25",
+        "class_name": "SRA_GUARDDUTY_25",
+        "service": "GuardDuty",
+        "account_type": "audit",
+        "name": "GuardDuty RDS Login Events auto-enablement configured",
+        "description": "This check verifies whether RDS Login Events are configured for auto-enablement in GuardDuty for all member accounts. RDS Login Events monitoring analyzes database login activity to detect potentially suspicious login attempts to RDS databases.",
+        "severity": "HIGH",
+    },
+    "SRA-CLOUDTRAIL-01": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_01",
+        "class_name": "SRA_CLOUDTRAIL_01",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "An Organization trail is configured for the AWS Organization",
+        "description": "This check verifies that an organization trail is configured for your AWS Organization. It is important to have uniform logging strategy for your AWS environment. Organization trail logs all events for all AWS accounts in that organization and delivers logs to a single S3 bucket, CloudWatch Logs and Event Bridge. Organization trails are automatically applied to all member accounts in the organization. Member accounts can see the organization trail, but can't modify or delete it. Organization trail should be configured for all AWS regions even if you are not operating out of any region.",
+        "severity": "HIGH",
+    },
+    "SRA-CLOUDTRAIL-02": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_02",
+        "class_name": "SRA_CLOUDTRAIL_02",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "Organization trail is encrypted with KMS",
+        "description": "This check verifies that your organization trail is encrypted with a KMS key. Log files delivered by CloudTrail to your bucket should be encrypted by using SSE-KMS. This is selected by default in the console but can be altered by users. With SSE-KMS you create and manage the KMS key yourself with the ability to manage permissions on who can use the key. For a user to read log files they must have read permissions to the bucket and have permissions that allows decrypt permission on the key applied by the KMS key policy.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CLOUDTRAIL-03": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_03",
+        "class_name": "SRA_CLOUDTRAIL_03",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "Organization trail has Log File validation enabled",
+        "description": "This check verifies that your organization trail has log file validation enabled. Validated log files are especially valuable in security and forensic investigations. CloudTrail log file integrity validation uses industry standard algorithms: SHA-256 for hashing and SHA-256 with RSA for digital signing. This makes it computationally unfeasible to modify, delete or forge CloudTrail log files without detection.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CLOUDTRAIL-04": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_04",
+        "class_name": "SRA_CLOUDTRAIL_04",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "Organization Trail is a multi-region trail",
+        "description": "This check verifies whether the Organization trail is configured as a multi-region trail. This helps with visibility across your entire AWS environment, even for AWS Regions where you are not operating to ensure you detect any malicious and/or unauthorized activities.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CLOUDTRAIL-05": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_05",
+        "class_name": "SRA_CLOUDTRAIL_05",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "CloudTrail has CloudWatch Logs configuration",
+        "description": "This check verifies that CloudTrail has CloudWatch Logs configuration. CloudWatch Logs enables you to centralize the CloudTrail logs from all your AWS accounts and regions in the AWS Organization, to a single, highly scalable service. You can then easily view them, search them for specific error codes or patterns, filter them based on specific fields, or archive them securely for future analysis.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CLOUDTRAIL-06": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_06",
+        "class_name": "SRA_CLOUDTRAIL_06",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "Organization trail is configured to publish events from global services",
+        "description": "This check verifies that your organization trail is configured to publish event from AWS global services. The organization trail should capture events from global services such as AWS IAM, AWS STS and Amazon CloudFront. Trails created using CloudTrail console by default have global service event configured but if you are creating trail with AWS CLI, AWS SDKs, or CloudTrail API you have to specify to included global services events.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CLOUDTRAIL-07": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_07",
+        "class_name": "SRA_CLOUDTRAIL_07",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "Organization trail is actively publishing events",
+        "description": "This check verifies that your organization trail is running and actively logging events. If a trail is modified to stop logging, accidently or by malicious user, you will not have visibility into any API activity across your AWS environment.",
+        "severity": "HIGH",
+    },
+    "SRA-CLOUDTRAIL-08": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_08",
+        "class_name": "SRA_CLOUDTRAIL_08",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "Organization trail is publishing logs to destination S3 bucket",
+        "description": "This check verifies that last attempt to send CloudTrail logs to S3 bucket was successful. CloudTrail log files are an audit log of actions taken by an IAM identity or an AWS service. The integrity, completeness and availability of these logs is crucial for forensic and auditing purposes. By logging to a dedicated and centralized Amazon S3 bucket, you can enforce strict security controls, access, and segregation of duties.",
+        "severity": "HIGH",
+    },
+    "SRA-CLOUDTRAIL-09": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_09",
+        "class_name": "SRA_CLOUDTRAIL_09",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "Organization trail is publishing logs to CloudWatch Logs",
+        "description": "This check verifies that last attempt to send CloudTrail logs to CloudWatch Logs was successful. Successful delivery of CloudTrails logs to CloudWatch ensures later availability for monitoring. CloudTrail requires right permission to send log events to CloudWatch Logs.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CLOUDTRAIL-10": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_10",
+        "class_name": "SRA_CLOUDTRAIL_10",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "Organization trail is configured to deliver Log file validation digest files to destination bucket",
+        "description": "This check verifies that log file validation digest files are being successfully delivered to a S3 bucket.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CLOUDTRAIL-11": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_11",
+        "class_name": "SRA_CLOUDTRAIL_11",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "Organization trail Logs are delivered to a centralized S3 bucket in the Log Archive Account",
+        "description": "This check verifies whether the corresponding S3 buckets that stores organization trail logs in created in Log Archive account. This separates the management and usage of CloudTrail log privileges. The Log Archive account is dedicated to ingesting and archiving all security-related logs and backups.",
+        "severity": "HIGH",
+    },
+    "SRA-CLOUDTRAIL-12": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_12",
+        "class_name": "SRA_CLOUDTRAIL_12",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "Delegated Administrator set for CloudTrail",
+        "description": "This check verifies whether CloudTrail service administration is delegated out of AWS Organization management account. The delegated administrator has permissions to create and manage analyzers with the AWS organization as the zone of trust.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CLOUDTRAIL-13": {
+        "module": "sraverify.services.cloudtrail.checks.sra_cloudtrail_13",
+        "class_name": "SRA_CLOUDTRAIL_13",
+        "service": "CloudTrail",
+        "account_type": "management",
+        "name": "The audit account is the Delegated Administrator set for CloudTrail",
+        "description": "This check verifies whether CloudTrail delegated admin account is the audit account of your AWS organization. Audit account is dedicated to operating security services, monitoring AWS accounts, and automating security alerting and response. CloudTrail helps monitor API activities across all your AWS accounts and regions.",
+        "severity": "HIGH",
+    },
+    "SRA-ACCESSANALYZER-01": {
+        "module": "sraverify.services.accessanalyzer.checks.sra_accessanalyzer_01",
+        "class_name": "SRA_ACCESSANALYZER_01",
+        "service": "IAM Access Analyzer",
+        "account_type": "application",
+        "name": "IAM Access Analyzer Account Zone of trust",
+        "description": "This check verifies whether IAA external access analyzer is configured with a zone of trust of AWS account. IAM Access Analyzer generates a finding for each instance of a resource-based policy that grants access to a resource within your zone of trust to a principal that is not within your zone of trust. When you configure an AWS account as the zone of trust for an analyzer- IAA generates findings or each instance of a resource-based policy that grants access to a resource within your AWS account whether the analyzer exists to a principal that is not within your AWS account.",
+        "severity": "HIGH",
+    },
+    "SRA-ACCESSANALYZER-02": {
+        "module": "sraverify.services.accessanalyzer.checks.sra_accessanalyzer_02",
+        "class_name": "SRA_ACCESSANALYZER_02",
+        "service": "IAM Access Analyzer",
+        "account_type": "management",
+        "name": "IAM Access Analyzer Organization Delegated Administrator",
+        "description": "This check verifies whether IAA service administration for your AWS Organization is delegated out of your AWS Organization management account. The delegated administrator has permissions to create and manage analyzers with the AWS organization as the zone of trust.",
+        "severity": "HIGH",
+    },
+    "SRA-ACCESSANALYZER-03": {
+        "module": "sraverify.services.accessanalyzer.checks.sra_accessanalyzer_03",
+        "class_name": "SRA_ACCESSANALYZER_03",
+        "service": "IAM Access Analyzer",
+        "account_type": "management",
+        "name": "IAM Access Analyzer Delegated Admin is the Audit Account",
+        "description": "This check verifies whether IAA delegated admin account is the audit account of your AWS organization. Audit account is dedicated to operating security services, monitoring AWS accounts, and automating security alerting and response. IAA helps monitor resources shared outside zone of trust.",
+        "severity": "HIGH",
+    },
+    "SRA-ACCESSANALYZER-04": {
+        "module": "sraverify.services.accessanalyzer.checks.sra_accessanalyzer_04",
+        "class_name": "SRA_ACCESSANALYZER_04",
+        "service": "IAM Access Analyzer",
+        "account_type": "audit",
+        "name": "IAM Access Analyzer external access analyzer is configured with Organization zone of trust in every region",
+        "description": "This check verifies whether IAA external access analyzer is configured with a zone of trust of your AWS organization in every available region. IAM Access Analyzer generates a finding for each instance of a resource-based policy that grants access to a resource within your zone of trust to a principal that is not within your zone of trust. When you configure an organization as the zone of trust for an analyzer- IAA generates findings or each instance of a resource-based policy that grants access to a resource within your AWS organization to a principal that is not within your AWS organization.",
+        "severity": "HIGH",
+    },
+    "SRA-CONFIG-01": {
+        "module": "sraverify.services.config.checks.sra_config_01",
+        "class_name": "SRA_CONFIG_01",
+        "service": "Config",
+        "account_type": "application",
+        "name": "AWS Config recorder is configured in this region",
+        "description": "This check verifies that a configuration recorder exists in the AWS Region. AWS Config uses the configuration recorder to detect changes in your resource configurations and capture these changes as configuration items. You must create a configuration recorder in every AWS Region for AWS Config can track your resource configurations in the region.",
+        "severity": "HIGH",
+    },
+    "SRA-CONFIG-02": {
+        "module": "sraverify.services.config.checks.sra_config_02",
+        "class_name": "SRA_CONFIG_02",
+        "service": "Config",
+        "account_type": "application",
+        "name": "AWS Config recorder is running",
+        "description": "This check verifies that configuration recorder is running. AWS Config configuration recorder must be started and running to record resource configurations. If you set up AWS Config by using the console or the AWS CLI, AWS Config automatically creates and then starts the configuration recorder for you. Users with right permission have the ability to stop configuration recorder.",
+        "severity": "HIGH",
+    },
+    "SRA-CONFIG-03": {
+        "module": "sraverify.services.config.checks.sra_config_03",
+        "class_name": "SRA_CONFIG_03",
+        "service": "Config",
+        "account_type": "application",
+        "name": "AWS Config latest recording event is processed successfully",
+        "description": "This check verifies whether the last delivery attempt to the delivery channel was successful to ensure you receive configuration change notifications. As AWS Config continually records the changes that occur to your AWS resources, it sends notifications and updated configuration states through the delivery channel.",
+        "severity": "HIGH",
+    },
+    "SRA-CONFIG-04": {
+        "module": "sraverify.services.config.checks.sra_config_04",
+        "class_name": "SRA_CONFIG_04",
+        "service": "Config",
+        "account_type": "audit",
+        "name": "AWS Config has organization aggregator",
+        "description": "This check verifies that a AWS Config aggregator exists in the AWS Region that collects configuration and compliance data from all member accounts of the AWS Organization. It periodically retrieves configuration snapshots from the source accounts and stores them in the designated S3 bucket.",
+        "severity": "HIGH",
+    },
+    "SRA-CONFIG-05": {
+        "module": "sraverify.services.config.checks.sra_config_05",
+        "class_name": "SRA_CONFIG_05",
+        "service": "Config",
+        "account_type": "audit",
+        "name": "AWS Config organization aggregator includes all regions",
+        "description": "This check verifies that the AWS Config organization aggregator is configured to aggregate config data from all existing and future AWS Regions. This provides you visibility into activities across all regions even if your business does not operate in the region.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CONFIG-06": {
+        "module": "sraverify.services.config.checks.sra_config_06",
+        "class_name": "SRA_CONFIG_06",
+        "service": "Config",
+        "account_type": "application",
+        "name": "AWS Config delivery channel S3 bucket is centralized in Log Archive account",
+        "description": "This check verifies that the AWS Config delivery channel S3 bucket is centralized in Log Archive account. Security Tooling provides central visibility and monitoring of AWS Organization wide resource configuration.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CONFIG-07": {
+        "module": "sraverify.services.config.checks.sra_config_07",
+        "class_name": "SRA_CONFIG_07",
+        "service": "Config",
+        "account_type": "management",
+        "name": "Config administration for the AWS Organization has a delegated administrator",
+        "description": "This check verifies whether Config service administration for your AWS Organization is delegated out of the AWS Organization management account.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CONFIG-08": {
+        "module": "sraverify.services.config.checks.sra_config_08",
+        "class_name": "SRA_CONFIG_08",
+        "service": "Config",
+        "account_type": "management",
+        "name": "Config delegated admin account is the Security Tooling (Audit) account",
+        "description": "This check verifies whether Config delegated admin account is the audit account of your AWS organization. The audit account is dedicated to operating security services, monitoring AWS accounts, and automating security alerting and response.",
+        "severity": "MEDIUM",
+    },
+    "SRA-CONFIG-09": {
+        "module": "sraverify.services.config.checks.sra_config_09",
+        "class_name": "SRA_CONFIG_09",
+        "service": "Config",
+        "account_type": "audit",
+        "name": "Config Organization aggregator is in a valid status",
+        "description": "This check verifies whether Config Organization aggregator has a valid status. A value of FAILED indicates errors while moving data and value OUTDATED indicates the data is not the most recent.",
+        "severity": "MEDIUM",
+    },
+    "SRA-SECURITYHUB-01": {
+        "module": "sraverify.services.securityhub.checks.sra_securityhub_01",
+        "class_name": "SRA_SECURITYHUB_01",
+        "service": "SecurityHub",
+        "account_type": "application",
+        "name": "Security Hub enabled account level standards exist",
+        "description": "This check verifies whether a list of enabled Security Hub standards for the current AWS account exists.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYHUB-02": {
+        "module": "sraverify.services.securityhub.checks.sra_securityhub_02",
+        "class_name": "SRA_SECURITYHUB_02",
+        "service": "SecurityHub",
+        "account_type": "audit",
+        "name": "Security Hub auto-enable new standards is enabled",
+        "description": "This check verifies whether Security Hub is configured to auto-enable new security standards as they are added to existing standards. This will ensure that as existing standards are updated with new controls, the AWS account gets evaluated on those new controls.",
+        "severity": "MEDIUM",
+    },
+    "SRA-SECURITYHUB-03": {
+        "module": "sraverify.services.securityhub.checks.sra_securityhub_03",
+        "class_name": "SRA_SECURITYHUB_03",
+        "service": "SecurityHub",
+        "account_type": "management",
+        "name": "Security Hub administration for the account matches delegated administrator",
+        "description": "This check verifies whether Security Hub service administration for the AWS account is set to AWS Organization delegated admin account for Security Hub.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYHUB-04": {
+        "module": "sraverify.services.securityhub.checks.sra_securityhub_04",
+        "class_name": "SRA_SECURITYHUB_04",
+        "service": "SecurityHub",
+        "account_type": "audit",
+        "name": "Security Hub central configuration is enabled",
+        "description": "This check verifies whether Security Hub is configured for central configuration. Central configuration allows the delegated administrator to manage Security Hub, standards, and controls across all organization accounts from a single location.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYHUB-05": {
+        "module": "sraverify.services.securityhub.checks.sra_securityhub_05",
+        "class_name": "SRA_SECURITYHUB_05",
+        "service": "SecurityHub",
+        "account_type": "audit",
+        "name": "Security Hub integration with findings generating products",
+        "description": "This check verifies whether Security Hub has expected integration with AWS services and third party products to ingest security findings.",
+        "severity": "MEDIUM",
+    },
+    "SRA-SECURITYHUB-06": {
+        "module": "sraverify.services.securityhub.checks.sra_securityhub_06",
+        "class_name": "SRA_SECURITYHUB_06",
+        "service": "SecurityHub",
+        "account_type": "management",
+        "name": "Security Hub administration for the AWS Organization has a delegated administrator",
+        "description": "This check verifies whether Security Hub service administration for the AWS Organization is set to AWS Organization delegated admin account for Security Hub.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYHUB-07": {
+        "module": "sraverify.services.securityhub.checks.sra_securityhub_07",
+        "class_name": "SRA_SECURITYHUB_07",
+        "service": "SecurityHub",
+        "account_type": "management",
+        "name": "Security Hub delegated admin account is the audit account",
+        "description": "This check verifies whether Security Hub delegated admin account is the audit account of your AWS organization. Audit account is dedicated to operating security services, monitoring AWS accounts, and automating security alerting and response. AWS Security Hub provides a comprehensive view of the security state in AWS and helps assess AWS environment against security industry standards and best practices.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYHUB-08": {
+        "module": "sraverify.services.securityhub.checks.sra_securityhub_08",
+        "class_name": "SRA_SECURITYHUB_08",
+        "service": "SecurityHub",
+        "account_type": "audit",
+        "name": "All active organization accounts are Security Hub members",
+        "description": "This check verifies whether all active members accounts of the AWS Organization are Security Hub members. Security Hub provides comprehensive security state and should include all AWS accounts.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYHUB-09": {
+        "module": "sraverify.services.securityhub.checks.sra_securityhub_09",
+        "class_name": "SRA_SECURITYHUB_09",
+        "service": "SecurityHub",
+        "account_type": "audit",
+        "name": "All Security Hub member accounts have Enabled status",
+        "description": "This check verifies whether each Security Hub member account has member status Enabled. Enabled status indicates that the member account is currently active. For manually invited member accounts, it indicates that the member account accepted the invitation.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYHUB-10": {
+        "module": "sraverify.services.securityhub.checks.sra_securityhub_10",
+        "class_name": "SRA_SECURITYHUB_10",
+        "service": "SecurityHub",
+        "account_type": "audit",
+        "name": "Security Hub auto-enable is configured",
+        "description": "This check verifies whether Security Hub is configured to be automatically enabled for new member accounts when they join the organization.",
+        "severity": "MEDIUM",
+    },
+    "SRA-SECURITYHUB-11": {
+        "module": "sraverify.services.securityhub.checks.sra_securityhub_11",
+        "class_name": "SRA_SECURITYHUB_11",
+        "service": "SecurityHub",
+        "account_type": "audit",
+        "name": "Security Hub member account limit not reached",
+        "description": "This check verifies whether the maximum number of allowed member accounts are already associated with the delegated administrator account for the AWS Organization.",
+        "severity": "HIGH",
+    },
+    "SRA-S3-01": {
+        "module": "sraverify.services.s3.checks.sra_s3_01",
+        "class_name": "SRA_S3_01",
+        "service": "S3",
+        "account_type": "application",
+        "name": "S3 restrict public bucket is enabled",
+        "description": "This check verifies whether S3 should restrict public policies for S3 buckets. Setting this restricts access to this bucket to only AWS service principals and authorized users within this account if the bucket has a public policy.",
+        "severity": "HIGH",
+    },
+    "SRA-S3-02": {
+        "module": "sraverify.services.s3.checks.sra_s3_02",
+        "class_name": "SRA_S3_02",
+        "service": "S3",
+        "account_type": "application",
+        "name": "S3 block public ACLs is set",
+        "description": "This check verifies whether S3 public block access control lists (ACLs) for buckets and object is enabled. Setting this fails prevents from setting a public ACL on S3 buckets and Objects. It also prevent creating a bucket with public ACL and uploading a object with public ACL.",
+        "severity": "HIGH",
+    },
+    "SRA-S3-03": {
+        "module": "sraverify.services.s3.checks.sra_s3_03",
+        "class_name": "SRA_S3_03",
+        "service": "S3",
+        "account_type": "application",
+        "name": "S3 ignore public ACL is enabled",
+        "description": "This check verifies whether the IgnorePublicACLs is set to True. Setting this causes Amazon S3 to ignore all public ACLs on buckets and objects in the bucket.",
+        "severity": "HIGH",
+    },
+    "SRA-S3-04": {
+        "module": "sraverify.services.s3.checks.sra_s3_04",
+        "class_name": "SRA_S3_04",
+        "service": "S3",
+        "account_type": "application",
+        "name": "S3 block public policy is enabled",
+        "description": "This check verifies whether S3 should block public bucket policies for buckets. Setting this causes Amazon S3 to reject calls that attaches a public access bucket policy to a S3 bucket.",
+        "severity": "HIGH",
+    },
+    "SRA-INSPECTOR-01": {
+        "module": "sraverify.services.inspector.checks.sra_inspector_01",
+        "class_name": "SRA_INSPECTOR_01",
+        "service": "Inspector",
+        "account_type": "application",
+        "name": "Inspector service is enabled",
+        "description": "This check verifies whether Inspector service status for the account is enabled. Amazon Inspector is a vulnerability management service that continuously scans your AWS workloads for software vulnerabilities and unintended network exposure.",
+        "severity": "HIGH",
+    },
+    "SRA-INSPECTOR-02": {
+        "module": "sraverify.services.inspector.checks.sra_inspector_02",
+        "class_name": "SRA_INSPECTOR_02",
+        "service": "Inspector",
+        "account_type": "application",
+        "name": "Inspector EC2 vulnerability scanning is enabled",
+        "description": "This check verifies whether Inspector EC2 vulnerability scanning feature is enabled. Inspector automatically discovers EC2 instances and scans for software vulnerability.",
+        "severity": "HIGH",
+    },
+    "SRA-INSPECTOR-03": {
+        "module": "sraverify.services.inspector.checks.sra_inspector_03",
+        "class_name": "SRA_INSPECTOR_03",
+        "service": "Inspector",
+        "account_type": "application",
+        "name": "Inspector ECR image vulnerability scanning is enabled",
+        "description": "This check verifies whether Inspector ECR image vulnerability scanning feature is enabled. Amazon Inspector scans container images stored in Amazon ECR for software vulnerabilities to generate findings.",
+        "severity": "HIGH",
+    },
+    "SRA-INSPECTOR-04": {
+        "module": "sraverify.services.inspector.checks.sra_inspector_04",
+        "class_name": "SRA_INSPECTOR_04",
+        "service": "Inspector",
+        "account_type": "application",
+        "name": "Inspector Lambda function and layers vulnerability scanning is enabled",
+        "description": "This check verifies whether Inspector Lambda function and layers for package and code vulnerability. Amazon Inspector monitors each Lambda function throughout its lifetime until it's either deleted or excluded from scanning.",
+        "severity": "HIGH",
+    },
+    "SRA-INSPECTOR-05": {
+        "module": "sraverify.services.inspector.checks.sra_inspector_05",
+        "class_name": "SRA_INSPECTOR_05",
+        "service": "Inspector",
+        "account_type": "management",
+        "name": "Inspector delegated admin account is configured",
+        "description": "This check verifies whether a delegated administrator account is configured for Amazon Inspector. A delegated administrator can manage Inspector findings across all accounts in the organization.",
+        "severity": "HIGH",
+    },
+    "SRA-INSPECTOR-06": {
+        "module": "sraverify.services.inspector.checks.sra_inspector_06",
+        "class_name": "SRA_INSPECTOR_06",
+        "service": "Inspector",
+        "account_type": "management",
+        "name": "Inspector delegated admin account is the audit account",
+        "description": "This check verifies whether Inspector delegated admin account is the audit account of your AWS organization. Audit account is dedicated to operating security services, monitoring AWS accounts, and automating security alerting and response. Inspector provides vulnerability management service.",
+        "severity": "HIGH",
+    },
+    "SRA-INSPECTOR-07": {
+        "module": "sraverify.services.inspector.checks.sra_inspector_07",
+        "class_name": "SRA_INSPECTOR_07",
+        "service": "Inspector",
+        "account_type": "audit",
+        "name": "All active member accounts have Inspector enabled",
+        "description": "This check verifies whether all active members accounts of the AWS Organization have Inspector enabled. Inspector is an automated vulnerability management service that continually scans Amazon Elastic Compute Cloud (EC2), AWS Lambda functions, and container images in Amazon ECR.",
+        "severity": "HIGH",
+    },
+    "SRA-INSPECTOR-08": {
+        "module": "sraverify.services.inspector.checks.sra_inspector_08",
+        "class_name": "SRA_INSPECTOR_08",
+        "service": "Inspector",
+        "account_type": "audit",
+        "name": "Inspector EC2 auto-enable is configured",
+        "description": "This check verifies whether Inspector is configured to automatically enable EC2 scanning for new accounts. Auto-enable ensures that EC2 instances in new accounts added to the organization are automatically scanned.",
+        "severity": "HIGH",
+    },
+    "SRA-INSPECTOR-09": {
+        "module": "sraverify.services.inspector.checks.sra_inspector_09",
+        "class_name": "SRA_INSPECTOR_09",
+        "service": "Inspector",
+        "account_type": "audit",
+        "name": "Inspector ECR auto-enable is configured",
+        "description": "This check verifies whether Inspector is configured to automatically enable ECR scanning for new accounts. Auto-enable ensures that container images in ECR repositories in new accounts added to the organization are automatically scanned.",
+        "severity": "HIGH",
+    },
+    "SRA-INSPECTOR-10": {
+        "module": "sraverify.services.inspector.checks.sra_inspector_10",
+        "class_name": "SRA_INSPECTOR_10",
+        "service": "Inspector",
+        "account_type": "audit",
+        "name": "Inspector Lambda auto-enable is configured",
+        "description": "This check verifies whether Inspector is configured to automatically enable Lambda scanning for new accounts. Auto-enable ensures that Lambda functions in new accounts added to the organization are automatically scanned.",
+        "severity": "HIGH",
+    },
+    "SRA-INSPECTOR-11": {
+        "module": "sraverify.services.inspector.checks.sra_inspector_11",
+        "class_name": "SRA_INSPECTOR_11",
+        "service": "Inspector",
+        "account_type": "audit",
+        "name": "Inspector Lambda Code auto-enable is configured",
+        "description": "This check verifies whether Inspector is configured to automatically enable Lambda Code scanning for new accounts. Auto-enable ensures that Lambda function code in new accounts added to the organization is automatically scanned.",
+        "severity": "HIGH",
+    },
+    "SRA-EC2-01": {
+        "module": "sraverify.services.ec2.checks.sra_ec2_01",
+        "class_name": "SRA_EC2_01",
+        "service": "EC2",
+        "account_type": "application",
+        "name": "AWS account level EBS encryption by default is enabled",
+        "description": "This check verifies that the AWS account level configuration to encrypt EBS volumes by default is enabled in the AWS Region. This enforces, at AWS account level, the encryption of the new EBS volumes and snapshot copies that you create. You can use AWS managed keys or a customer managed KMS key.",
+        "severity": "HIGH",
+    },
+    "SRA-MACIE-01": {
+        "module": "sraverify.services.macie.checks.sra_macie_01",
+        "class_name": "SRA_MACIE_01",
+        "service": "Macie",
+        "account_type": "application",
+        "name": "Macie publish policy findings to Security Hub is enabled",
+        "description": "This check verifies whether Macie is configured to publish new and updated policy findings to AWS Security Hub. Policy findings denotes potential security or privacy issue with a S3 bucket.",
+        "severity": "HIGH",
+    },
+    "SRA-MACIE-02": {
+        "module": "sraverify.services.macie.checks.sra_macie_02",
+        "class_name": "SRA_MACIE_02",
+        "service": "Macie",
+        "account_type": "application",
+        "name": "Macie publish classification findings to Security Hub is enabled",
+        "description": "This check verifies whether Macie is configured to publish sensitive data findings to AWS Security Hub. Sensitive data findings denotes potential sensitive data in as S3 object. Macie continually evaluates your S3 bucket inventory and uses sampling techniques to identify and select representative S3 objects from your buckets. Macie then retrieves and analyzes the selected objects, inspecting them for sensitive data.",
+        "severity": "HIGH",
+    },
+    "SRA-MACIE-03": {
+        "module": "sraverify.services.macie.checks.sra_macie_03",
+        "class_name": "SRA_MACIE_03",
+        "service": "Macie",
+        "account_type": "application",
+        "name": "Macie findings exported to a S3 bucket in Log Archive account are encrypted at rest",
+        "description": "This check verifies whether all Macie findings are being exported to a S3 bucket within the Log Archive account. Log Archive account is the central repository of all AWS Organization logs.",
+        "severity": "HIGH",
+    },
+    "SRA-MACIE-04": {
+        "module": "sraverify.services.macie.checks.sra_macie_04",
+        "class_name": "SRA_MACIE_04",
+        "service": "Macie",
+        "account_type": "application",
+        "name": "Checks that findings are being exported to S3 in the log archive account are encrypted at rest",
+        "description": "This check verifies whether all Macie findings that are being exported to a S3 bucket within the Log Archive account are encrypted using KMS key. Macie findings are sensitive in natures and should be encrypted to prevent from unauthorized disclosure.",
+        "severity": "HIGH",
+    },
+    "SRA-MACIE-05": {
+        "module": "sraverify.services.macie.checks.sra_macie_05",
+        "class_name": "SRA_MACIE_05",
+        "service": "Macie",
+        "account_type": "management",
+        "name": "Macie administration for the AWS Organization has a delegated administrator",
+        "description": "This check verifies whether Macie service administration for the AWS Organization is delegated out to AWS Organization management account.",
+        "severity": "HIGH",
+    },
+    "SRA-MACIE-06": {
+        "module": "sraverify.services.macie.checks.sra_macie_06",
+        "class_name": "SRA_MACIE_06",
+        "service": "Macie",
+        "account_type": "management",
+        "name": "Macie delegated admin account is the Security Tooling (Audit) account",
+        "description": "This check verifies whether Macie delegated admin account is the audit account of your AWS organization. audit account is dedicated to operating security services, monitoring AWS accounts, and automating security alerting and response. Macie provides sensitive data discovery service.",
+        "severity": "HIGH",
+    },
+    "SRA-MACIE-07": {
+        "module": "sraverify.services.macie.checks.sra_macie_07",
+        "class_name": "SRA_MACIE_07",
+        "service": "Macie",
+        "account_type": "audit",
+        "name": "All active member accounts have relationship with delegated admin account enabled",
+        "description": "This check verifies whether all active members accounts of the AWS Organization have Macie member relationship enabled with Macie delegated admin account. Amazon Macie is a data security service that discovers sensitive data by using machine learning and pattern matching, provides visibility into data security risks, and enables automated protection against those risks.",
+        "severity": "HIGH",
+    },
+    "SRA-MACIE-08": {
+        "module": "sraverify.services.macie.checks.sra_macie_08",
+        "class_name": "SRA_MACIE_08",
+        "service": "Macie",
+        "account_type": "audit",
+        "name": "Macie AutoEnable configuration is enabled for new member accounts",
+        "description": "This check verifies whether auto-enablement configuration for Macie is enabled for member accounts of the AWS Organization. This ensures that all existing and new member accounts will have Macie monitoring.",
+        "severity": "MEDIUM",
+    },
+    "SRA-MACIE-09": {
+        "module": "sraverify.services.macie.checks.sra_macie_09",
+        "class_name": "SRA_MACIE_09",
+        "service": "Macie",
+        "account_type": "audit",
+        "name": "All active member accounts have Macie enabled",
+        "description": "This check verifies whether all active members accounts of the AWS Organization have Macie enabled. Amazon Macie is a data security service that discovers sensitive data by using machine learning and pattern matching, provides visibility into data security risks, and enables automated protection against those risks.",
+        "severity": "HIGH",
+    },
+    "SRA-MACIE-10": {
+        "module": "sraverify.services.macie.checks.sra_macie_10",
+        "class_name": "SRA_MACIE_10",
+        "service": "Macie",
+        "account_type": "audit",
+        "name": "Macie member account limit not reached",
+        "description": "This check verifies whether the maximum number of allowed member accounts are already associated with the delegated administrator account for the AWS Organization.",
+        "severity": "MEDIUM",
+    },
+    "SRA-SHIELD-01": {
+        "module": "sraverify.services.shield.checks.sra_shield_01",
+        "class_name": "SRA_SHIELD_01",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield Advanced is enabled",
+        "description": "This check verifies that AWS Shield Advanced is enabled. Shield Advanced provides enhanced DDoS protection for your AWS resources and includes 24/7 access to the AWS DDoS Response Team (DRT).",
+        "severity": "HIGH",
+    },
+    "SRA-SHIELD-02": {
+        "module": "sraverify.services.shield.checks.sra_shield_02",
+        "class_name": "SRA_SHIELD_02",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield Advanced auto-renew is enabled",
+        "description": "This check verifies that AWS Shield Advanced subscription has auto-renew enabled to ensure continuous protection.",
+        "severity": "MEDIUM",
+    },
+    "SRA-SHIELD-03": {
+        "module": "sraverify.services.shield.checks.sra_shield_03",
+        "class_name": "SRA_SHIELD_03",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield Advanced is configured for CloudFront distributions",
+        "description": "This check verifies that AWS Shield Advanced is protecting at least one CloudFront distribution.",
+        "severity": "HIGH",
+    },
+    "SRA-SHIELD-04": {
+        "module": "sraverify.services.shield.checks.sra_shield_04",
+        "class_name": "SRA_SHIELD_04",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield Advanced is configured for load balancers",
+        "description": "This check verifies that AWS Shield Advanced is protecting at least one load balancer (Application or Classic Load Balancer).",
+        "severity": "HIGH",
+    },
+    "SRA-SHIELD-05": {
+        "module": "sraverify.services.shield.checks.sra_shield_05",
+        "class_name": "SRA_SHIELD_05",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield Advanced is configured for Elastic IP addresses",
+        "description": "This check verifies that AWS Shield Advanced is protecting at least one Elastic IP address.",
+        "severity": "HIGH",
+    },
+    "SRA-SHIELD-06": {
+        "module": "sraverify.services.shield.checks.sra_shield_06",
+        "class_name": "SRA_SHIELD_06",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield Advanced is configured for Route 53 hosted zones",
+        "description": "This check verifies that AWS Shield Advanced is protecting at least one Route 53 hosted zone.",
+        "severity": "HIGH",
+    },
+    "SRA-SHIELD-07": {
+        "module": "sraverify.services.shield.checks.sra_shield_07",
+        "class_name": "SRA_SHIELD_07",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield Advanced is configured for Global Accelerator",
+        "description": "This check verifies that AWS Shield Advanced is protecting at least one Global Accelerator accelerator.",
+        "severity": "HIGH",
+    },
+    "SRA-SHIELD-08": {
+        "module": "sraverify.services.shield.checks.sra_shield_08",
+        "class_name": "SRA_SHIELD_08",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield Response Team (SRT) access is configured",
+        "description": "This check verifies that AWS Shield Response Team (SRT) access is configured with an appropriate IAM role.",
+        "severity": "MEDIUM",
+    },
+    "SRA-SHIELD-09": {
+        "module": "sraverify.services.shield.checks.sra_shield_09",
+        "class_name": "SRA_SHIELD_09",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield Advanced proactive engagement is enabled",
+        "description": "This check verifies that AWS Shield Advanced proactive engagement is enabled, allowing the Shield Response Team to contact you directly during attacks.",
+        "severity": "MEDIUM",
+    },
+    "SRA-SHIELD-10": {
+        "module": "sraverify.services.shield.checks.sra_shield_10",
+        "class_name": "SRA_SHIELD_10",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Health checks are configured for Shield Advanced protected resources",
+        "description": "This check verifies that Route 53 health checks are associated with Shield Advanced protected resources to enable health-based detection. Route 53 hosted zones are excluded as they don't support health-based detection.",
+        "severity": "MEDIUM",
+    },
+    "SRA-SHIELD-11": {
+        "module": "sraverify.services.shield.checks.sra_shield_11",
+        "class_name": "SRA_SHIELD_11",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield engagement Lambda function is configured",
+        "description": "This check verifies that a Lambda function named 'AWS_Shield_Engagement_Lambda' exists to automate support case creation during DDoS events.",
+        "severity": "MEDIUM",
+    },
+    "SRA-SHIELD-12": {
+        "module": "sraverify.services.shield.checks.sra_shield_12",
+        "class_name": "SRA_SHIELD_12",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield Advanced protected resources have WAF web ACLs associated",
+        "description": "This check verifies that Shield Advanced protected resources that support WAF (CloudFront distributions and Application Load Balancers) have web ACLs associated for enhanced application layer protection.",
+        "severity": "HIGH",
+    },
+    "SRA-SHIELD-13": {
+        "module": "sraverify.services.shield.checks.sra_shield_13",
+        "class_name": "SRA_SHIELD_13",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "CloudWatch alarms exist for Shield Advanced protected CloudFront and Route53 resources",
+        "description": "This check verifies that CloudWatch alarms are configured for Shield Advanced protected CloudFront distributions and Route53 hosted zones to monitor DDoS detection metrics (DDoSDetected).",
+        "severity": "MEDIUM",
+    },
+    "SRA-SHIELD-14": {
+        "module": "sraverify.services.shield.checks.sra_shield_14",
+        "class_name": "SRA_SHIELD_14",
+        "service": "Shield",
+        "account_type": "application",
+        "name": "Shield Advanced protected resources have automatic application layer DDoS mitigation enabled",
+        "description": "This check verifies that Shield Advanced protected application layer resources (CloudFront distributions and Application Load Balancers) have automatic application layer DDoS mitigation enabled with Block action for effective protection.",
+        "severity": "HIGH",
+    },
+    "SRA-WAF-01": {
+        "module": "sraverify.services.waf.checks.sra_waf_01",
+        "class_name": "SRA_WAF_01",
+        "service": "WAF",
+        "account_type": "application",
+        "name": "CloudFront distributions should be associated with AWS WAF",
+        "description": "Ensures that all CloudFront distributions are protected by AWS WAF web ACLs to filter malicious traffic",
+        "severity": "HIGH",
+    },
+    "SRA-WAF-02": {
+        "module": "sraverify.services.waf.checks.sra_waf_02",
+        "class_name": "SRA_WAF_02",
+        "service": "WAF",
+        "account_type": "application",
+        "name": "Application Load Balancers should be associated with AWS WAF",
+        "description": "Ensures that all Application Load Balancers are protected by AWS WAF web ACLs to filter malicious traffic",
+        "severity": "HIGH",
+    },
+    "SRA-WAF-03": {
+        "module": "sraverify.services.waf.checks.sra_waf_03",
+        "class_name": "SRA_WAF_03",
+        "service": "WAF",
+        "account_type": "application",
+        "name": "API Gateway REST APIs should be associated with AWS WAF",
+        "description": "Ensures that all API Gateway REST APIs are protected by AWS WAF web ACLs to filter malicious traffic",
+        "severity": "HIGH",
+    },
+    "SRA-WAF-04": {
+        "module": "sraverify.services.waf.checks.sra_waf_04",
+        "class_name": "SRA_WAF_04",
+        "service": "WAF",
+        "account_type": "application",
+        "name": "AppSync GraphQL APIs should be associated with AWS WAF",
+        "description": "Ensures that all AppSync GraphQL APIs are protected by AWS WAF web ACLs to filter malicious traffic",
+        "severity": "HIGH",
+    },
+    "SRA-WAF-05": {
+        "module": "sraverify.services.waf.checks.sra_waf_05",
+        "class_name": "SRA_WAF_05",
+        "service": "WAF",
+        "account_type": "application",
+        "name": "Cognito user pools should be associated with AWS WAF",
+        "description": "Ensures that all Cognito user pools are protected by AWS WAF web ACLs to filter malicious traffic",
+        "severity": "HIGH",
+    },
+    "SRA-WAF-06": {
+        "module": "sraverify.services.waf.checks.sra_waf_06",
+        "class_name": "SRA_WAF_06",
+        "service": "WAF",
+        "account_type": "application",
+        "name": "App Runner services should be associated with AWS WAF",
+        "description": "Ensures that all App Runner services are protected by AWS WAF web ACLs to filter malicious traffic",
+        "severity": "HIGH",
+    },
+    "SRA-WAF-07": {
+        "module": "sraverify.services.waf.checks.sra_waf_07",
+        "class_name": "SRA_WAF_07",
+        "service": "WAF",
+        "account_type": "application",
+        "name": "Verified Access instances should be associated with AWS WAF",
+        "description": "Ensures that all Verified Access instances are protected by AWS WAF web ACLs to filter malicious traffic",
+        "severity": "HIGH",
+    },
+    "SRA-WAF-08": {
+        "module": "sraverify.services.waf.checks.sra_waf_08",
+        "class_name": "SRA_WAF_08",
+        "service": "WAF",
+        "account_type": "application",
+        "name": "Amplify applications should be associated with AWS WAF",
+        "description": "Ensures that all Amplify applications are protected by AWS WAF web ACLs to filter malicious traffic",
+        "severity": "HIGH",
+    },
+    "SRA-WAF-09": {
+        "module": "sraverify.services.waf.checks.sra_waf_09",
+        "class_name": "SRA_WAF_09",
+        "service": "WAF",
+        "account_type": "application",
+        "name": "WAF Web ACLs should have logging enabled",
+        "description": "Ensures that all WAF Web ACLs have logging enabled to capture traffic analysis data",
+        "severity": "MEDIUM",
+    },
+    "SRA-ACCOUNT-01": {
+        "module": "sraverify.services.account.checks.sra_account_01",
+        "class_name": "SRA_ACCOUNT_01",
+        "service": "Account",
+        "account_type": "application",
+        "name": "Security alternate contact configured",
+        "description": "Verifies that a security alternate contact is configured for the AWS account",
+        "severity": "MEDIUM",
+    },
+    "SRA-ACCOUNT-02": {
+        "module": "sraverify.services.account.checks.sra_account_02",
+        "class_name": "SRA_ACCOUNT_02",
+        "service": "Account",
+        "account_type": "application",
+        "name": "Billing alternate contact configured",
+        "description": "Verifies that a billing alternate contact is configured for the AWS account",
+        "severity": "MEDIUM",
+    },
+    "SRA-ACCOUNT-03": {
+        "module": "sraverify.services.account.checks.sra_account_03",
+        "class_name": "SRA_ACCOUNT_03",
+        "service": "Account",
+        "account_type": "application",
+        "name": "Operations alternate contact configured",
+        "description": "Verifies that an operations alternate contact is configured for the AWS account",
+        "severity": "MEDIUM",
+    },
+    "SRA-AUDITMANAGER-01": {
+        "module": "sraverify.services.auditmanager.checks.sra_auditmanager_01",
+        "class_name": "SRA_AUDITMANAGER_01",
+        "service": "AuditManager",
+        "account_type": "application",
+        "name": "AWS Audit Manager is enabled",
+        "description": "This check verifies that AWS Audit Manager is enabled in the AWS account. Audit Manager helps you continuously audit your AWS usage to simplify how you assess risk and compliance with regulations and industry standards.",
+        "severity": "MEDIUM",
+    },
+    "SRA-AUDITMANAGER-02": {
+        "module": "sraverify.services.auditmanager.checks.sra_auditmanager_02",
+        "class_name": "SRA_AUDITMANAGER_02",
+        "service": "AuditManager",
+        "account_type": "management",
+        "name": "Audit Manager delegated admin is the audit account",
+        "description": "This check verifies that the AWS Audit Manager delegated administrator is configured as the audit account. The delegated administrator should be the security tooling account to centralize audit management.",
+        "severity": "HIGH",
+    },
+    "SRA-FIREWALLMANAGER-01": {
+        "module": "sraverify.services.firewallmanager.checks.sra_firewallmanager_01",
+        "class_name": "SRA_FIREWALLMANAGER_01",
+        "service": "FirewallManager",
+        "account_type": "management",
+        "name": "Firewall Manager delegated administrator is the audit account",
+        "description": "Verifies that AWS Firewall Manager delegated administrator is configured and set to the audit account",
+        "severity": "HIGH",
+    },
+    "SRA-FIREWALLMANAGER-02": {
+        "module": "sraverify.services.firewallmanager.checks.sra_firewallmanager_02",
+        "class_name": "SRA_FIREWALLMANAGER_02",
+        "service": "FirewallManager",
+        "account_type": "audit",
+        "name": "Firewall Manager manages security groups",
+        "description": "Verifies that AWS Firewall Manager has security group policies configured in each region",
+        "severity": "MEDIUM",
+    },
+    "SRA-FIREWALLMANAGER-03": {
+        "module": "sraverify.services.firewallmanager.checks.sra_firewallmanager_03",
+        "class_name": "SRA_FIREWALLMANAGER_03",
+        "service": "FirewallManager",
+        "account_type": "audit",
+        "name": "Firewall Manager manages WAF policies",
+        "description": "Verifies that AWS Firewall Manager has WAF policies configured in each region",
+        "severity": "MEDIUM",
+    },
+    "SRA-FIREWALLMANAGER-04": {
+        "module": "sraverify.services.firewallmanager.checks.sra_firewallmanager_04",
+        "class_name": "SRA_FIREWALLMANAGER_04",
+        "service": "FirewallManager",
+        "account_type": "audit",
+        "name": "Firewall Manager manages Shield Advanced policies",
+        "description": "Verifies that AWS Firewall Manager has Shield Advanced policies configured in each region",
+        "severity": "MEDIUM",
+    },
+    "SRA-FIREWALLMANAGER-05": {
+        "module": "sraverify.services.firewallmanager.checks.sra_firewallmanager_05",
+        "class_name": "SRA_FIREWALLMANAGER_05",
+        "service": "FirewallManager",
+        "account_type": "audit",
+        "name": "Firewall Manager manages Network ACL policies",
+        "description": "Verifies that AWS Firewall Manager has Network ACL policies configured in each region",
+        "severity": "MEDIUM",
+    },
+    "SRA-FIREWALLMANAGER-06": {
+        "module": "sraverify.services.firewallmanager.checks.sra_firewallmanager_06",
+        "class_name": "SRA_FIREWALLMANAGER_06",
+        "service": "FirewallManager",
+        "account_type": "audit",
+        "name": "Firewall Manager manages AWS Network Firewall policies",
+        "description": "Verifies that AWS Firewall Manager has Network Firewall policies configured in each region",
+        "severity": "MEDIUM",
+    },
+    "SRA-FIREWALLMANAGER-07": {
+        "module": "sraverify.services.firewallmanager.checks.sra_firewallmanager_07",
+        "class_name": "SRA_FIREWALLMANAGER_07",
+        "service": "FirewallManager",
+        "account_type": "audit",
+        "name": "Firewall Manager manages Route 53 DNS Firewall policies",
+        "description": "Verifies that AWS Firewall Manager has Route 53 DNS Firewall policies configured in each region",
+        "severity": "MEDIUM",
+    },
+    "SRA-FIREWALLMANAGER-08": {
+        "module": "sraverify.services.firewallmanager.checks.sra_firewallmanager_08",
+        "class_name": "SRA_FIREWALLMANAGER_08",
+        "service": "FirewallManager",
+        "account_type": "audit",
+        "name": "Firewall Manager policy remediation is enabled",
+        "description": "Verifies that AWS Firewall Manager policies have remediation enabled to automatically apply to new resources",
+        "severity": "MEDIUM",
+    },
+    "SRA-FIREWALLMANAGER-09": {
+        "module": "sraverify.services.firewallmanager.checks.sra_firewallmanager_09",
+        "class_name": "SRA_FIREWALLMANAGER_09",
+        "service": "FirewallManager",
+        "account_type": "audit",
+        "name": "Firewall Manager policies are in active status",
+        "description": "Verifies that AWS Firewall Manager policies are in ACTIVE status and not out of admin scope",
+        "severity": "HIGH",
+    },
+    "SRA-FIREWALLMANAGER-10": {
+        "module": "sraverify.services.firewallmanager.checks.sra_firewallmanager_10",
+        "class_name": "SRA_FIREWALLMANAGER_10",
+        "service": "FirewallManager",
+        "account_type": "audit",
+        "name": "Firewall Manager policy cleanup is enabled",
+        "description": "Verifies that AWS Firewall Manager policies have cleanup enabled to remove protections from resources that leave policy scope",
+        "severity": "MEDIUM",
+    },
+    "SRA-SECURITYLAKE-01": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_01",
+        "class_name": "SRA_SECURITYLAKE_01",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake is enabled for all organization accounts",
+        "description": "This check verifies whether Amazon Security Lake is enabled for all active accounts in the organization. Amazon Security Lake is a fully managed security data lake service that you can use to automatically centralize security data from AWS environments, SaaS providers, on premises, cloud sources, and third-party sources into a purpose-built data lake that's stored in your AWS account. The data lake is backed by Amazon S3 buckets, and you retain ownership over your data. You must enable security lake in every AWS account and AWS region to collect security logs and event from your entire AWS environment. This check runs from the delegated administrator account and validates configuration across all organization member accounts.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-02": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_02",
+        "class_name": "SRA_SECURITYLAKE_02",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake SQS queues encrypted with CMK",
+        "description": "This check verifies whether Security Lake manager SQS Queues within delegated admin account is encrypted with a customer managed key from AWS KMS. These SQS queues are used by AWS Lambda function for ETL job and also by subscribers looking for new logs deposited into the data lake. You must use a customer managed KMS key for the encryption as you have greater control on the key usage and permission.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-03": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_03",
+        "class_name": "SRA_SECURITYLAKE_03",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake DLQ encrypted with CMK",
+        "description": "This check verifies whether Security Lake SQS DLQ is encrypted in this region with a customer managed key from AWS KMS. You must use a customer managed KMS key for the encryption as you have greater control on the key usage and permission.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-04": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_04",
+        "class_name": "SRA_SECURITYLAKE_04",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake organization configuration enabled",
+        "description": "This check verifies whether Amazon Security Lake has configuration that will automatically enable new organization accounts as member accounts from an Amazon Security Lake administrator account.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-05": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_05",
+        "class_name": "SRA_SECURITYLAKE_05",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake organization auto-enable matches AWS defaults",
+        "description": "This check verifies whether Amazon Security Lake organization auto-enable configuration matches AWS default/recommended log sources for new accounts (CLOUD_TRAIL_MGMT, LAMBDA_EXECUTION, EKS_AUDIT, ROUTE53, SH_FINDINGS, VPC_FLOW). S3_DATA and WAF are excluded as they are optional due to high volume.",
+        "severity": "MEDIUM",
+    },
+    "SRA-SECURITYLAKE-06": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_06",
+        "class_name": "SRA_SECURITYLAKE_06",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake Route 53 log source enabled with version 2.0 for all organization accounts",
+        "description": "This check verifies whether Amazon Security Lake is configured with Route 53 log and event source version 2.0 for all active accounts in the organization. Route 53 resolver query logs track DNS queries made by resources within Amazon VPC. Security Lake collects resolver query logs directly from Route 53 through an independent and duplicated stream of events. This check runs from the delegated administrator account and validates configuration across all organization member accounts.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-07": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_07",
+        "class_name": "SRA_SECURITYLAKE_07",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake CloudTrail S3 data events enabled with version 2.0 for all organization accounts",
+        "description": "This check verifies whether Amazon Security Lake is configured with CloudTrail data event for S3 log and event source version 2.0 for all active accounts in the organization. CloudTrail data events, also known as data plane operations, show the resource operations performed on or within resources in your AWS account. These operations are often high-volume activities and should be enabled as per your requirement. Security Lake pulls data directly from S3 through an independent and duplicated stream of events. This check runs from the delegated administrator account and validates configuration across all organization member accounts.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-08": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_08",
+        "class_name": "SRA_SECURITYLAKE_08",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake Security Hub findings enabled with version 2.0 for all organization accounts",
+        "description": "This check verifies whether Amazon Security Lake is configured with SecurityHub findings log and event source version 2.0 for all active accounts in the organization. Security Hub findings help you understand your security posture in AWS and let you check your environment against security industry standards and best practices. Security Lake collects findings directly from Security Hub through an independent and duplicated stream of events. This check runs from the delegated administrator account and validates configuration across all organization member accounts.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-09": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_09",
+        "class_name": "SRA_SECURITYLAKE_09",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake EKS audit logs enabled with version 2.0 for all organization accounts",
+        "description": "This check verifies whether Amazon Security Lake is configured with EKS Audit log and event source version 2.0 for all active accounts in the organization. EKS Audit Logs help you detect potentially suspicious activities in your EKS clusters within the Amazon Elastic Kubernetes Service. Security Lake consumes EKS Audit Log events directly from the Amazon EKS control plane logging feature through an independent and duplicative stream of audit logs. This check runs from the delegated administrator account and validates configuration across all organization member accounts.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-10": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_10",
+        "class_name": "SRA_SECURITYLAKE_10",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake Lambda execution logs enabled with version 2.0 for all organization accounts",
+        "description": "This check verifies whether Amazon Security Lake is configured with Lambda execution log and event source version 2.0 for all active accounts in the organization. These operations are often high-volume activities and should be enabled as per your requirement. Security Lake pulls data directly from Lambda through an independent and duplicated stream of events. This check runs from the delegated administrator account and validates configuration across all organization member accounts.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-11": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_11",
+        "class_name": "SRA_SECURITYLAKE_11",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake CloudTrail management logs enabled with version 2.0 for all organization accounts",
+        "description": "This check verifies whether Amazon Security Lake is configured with CloudTrail management log and event source version 2.0 for all active accounts in the organization. CloudTrail management events, also known as control plane events, provide insight into management operations that are performed on CloudTrail in your AWS account. To collect CloudTrail management events in Security Lake, there must be at least one CloudTrail multi-Region organization trail that collects read and write CloudTrail management events. Logging must be enabled for the trail. This check runs from the delegated administrator account and validates configuration across all organization member accounts.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-12": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_12",
+        "class_name": "SRA_SECURITYLAKE_12",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake WAF logs enabled with version 2.0 for all organization accounts",
+        "description": "This check verifies whether Amazon Security Lake is configured with WAF log and event source version 2.0 for all active accounts in the organization. AWS WAF is a web application firewall that helps protect your web applications or APIs against common web exploits and bots that may affect availability, compromise security, or consume excessive resources. Security Lake collects WAF logs directly from AWS WAF through an independent and duplicated stream of events. This check runs from the delegated administrator account and validates configuration across all organization member accounts.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-13": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_13",
+        "class_name": "SRA_SECURITYLAKE_13",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake VPC flow logs enabled with version 2.0 for all organization accounts",
+        "description": "This check verifies whether Amazon Security Lake is configured with VPC Flow log and event source version 2.0 for all active accounts in the organization. VPC Flow Logs is a feature that enables you to capture information about the IP traffic going to and from network interfaces in your VPC. Security Lake collects VPC Flow Logs directly from Amazon VPC through an independent and duplicated stream of events. This check runs from the delegated administrator account and validates configuration across all organization member accounts.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-14": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_14",
+        "class_name": "SRA_SECURITYLAKE_14",
+        "service": "SecurityLake",
+        "account_type": "management",
+        "name": "Security Lake has delegated administrator",
+        "description": "This check verifies whether Security Lake service administration for the AWS Organization is delegated out from AWS Organization management account to a member account.",
+        "severity": "CRITICAL",
+    },
+    "SRA-SECURITYLAKE-15": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_15",
+        "class_name": "SRA_SECURITYLAKE_15",
+        "service": "SecurityLake",
+        "account_type": "management",
+        "name": "Security Lake delegated admin is log archive account",
+        "description": "This check verifies whether Security Lake delegated admin account is the Log Archive account of your AWS organization. The Log Archive account is dedicated to ingesting and archiving all security-related logs and backups.",
+        "severity": "CRITICAL",
+    },
+    "SRA-SECURITYLAKE-16": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_16",
+        "class_name": "SRA_SECURITYLAKE_16",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake audit account has query access",
+        "description": "This check verifies whether the AWS Organization audit account is set up as query access subscriber. These subscribers directly query AWS Lake Formation tables in your S3 bucket with services like Amazon Athena. Separation of log storage (Log Archive account) and log access (audit account) helps is separation of duties and helps in least privilege access.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYLAKE-17": {
+        "module": "sraverify.services.securitylake.checks.sra_securitylake_17",
+        "class_name": "SRA_SECURITYLAKE_17",
+        "service": "SecurityLake",
+        "account_type": "log-archive",
+        "name": "Security Lake audit account has data access",
+        "description": "This check verifies whether the AWS Organization Audit account is set up as data access subscriber. These subscribers can directly access the S3 objects and receive notifications of new objects through a subscription endpoint or by polling an Amazon SQS queue.",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYINCIDENTRESPONSE-01": {
+        "module": "sraverify.services.securityincidentresponse.checks.sra_securityincidentresponse_01",
+        "class_name": "SRA_SECURITYINCIDENTRESPONSE_01",
+        "service": "SecurityIncidentResponse",
+        "account_type": "management",
+        "name": "Security Incident Response delegated admin is audit account",
+        "description": "Verifies that the Security Incident Response delegated administrator is configured and is the audit account",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYINCIDENTRESPONSE-02": {
+        "module": "sraverify.services.securityincidentresponse.checks.sra_securityincidentresponse_02",
+        "class_name": "SRA_SECURITYINCIDENTRESPONSE_02",
+        "service": "SecurityIncidentResponse",
+        "account_type": "audit",
+        "name": "Security Incident Response membership active",
+        "description": "Verifies that Security Incident Response membership is active",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYINCIDENTRESPONSE-03": {
+        "module": "sraverify.services.securityincidentresponse.checks.sra_securityincidentresponse_03",
+        "class_name": "SRA_SECURITYINCIDENTRESPONSE_03",
+        "service": "SecurityIncidentResponse",
+        "account_type": "audit",
+        "name": "Security Incident Response proactive response enabled",
+        "description": "Verifies that Security Incident Response proactive response (Triage) feature is enabled",
+        "severity": "MEDIUM",
+    },
+    "SRA-SECURITYINCIDENTRESPONSE-04": {
+        "module": "sraverify.services.securityincidentresponse.checks.sra_securityincidentresponse_04",
+        "class_name": "SRA_SECURITYINCIDENTRESPONSE_04",
+        "service": "SecurityIncidentResponse",
+        "account_type": "audit",
+        "name": "Security Incident Response enabled for all organization accounts",
+        "description": "Verifies that all active organization accounts are covered by Security Incident Response",
+        "severity": "HIGH",
+    },
+    "SRA-SECURITYINCIDENTRESPONSE-05": {
+        "module": "sraverify.services.securityincidentresponse.checks.sra_securityincidentresponse_05",
+        "class_name": "SRA_SECURITYINCIDENTRESPONSE_05",
+        "service": "SecurityIncidentResponse",
+        "account_type": "application",
+        "name": "Security Incident Response triage service linked role exists",
+        "description": "Verifies that the AWSServiceRoleForSecurityIncidentResponse_Triage service linked role exists",
+        "severity": "MEDIUM",
+    },
+    "SRA-ORGANIZATIONS-01": {
+        "module": "sraverify.services.organizations.checks.sra_organizations_01",
+        "class_name": "SRA_ORGANIZATIONS_01",
+        "service": "Organizations",
+        "account_type": "management",
+        "name": "AWS Organizations is enabled",
+        "description": "This check verifies that AWS Organizations is enabled for the account. AWS Organizations enables central management and governance of multiple AWS accounts, providing consolidated billing, account management, and policy-based controls.",
+        "severity": "HIGH",
+    },
+    "SRA-ORGANIZATIONS-02": {
+        "module": "sraverify.services.organizations.checks.sra_organizations_02",
+        "class_name": "SRA_ORGANIZATIONS_02",
+        "service": "Organizations",
+        "account_type": "management",
+        "name": "Organization has foundational OU - Security",
+        "description": "This check verifies that the organization has a Security organizational unit (OU) directly under the root. The Security OU is a foundational OU recommended by AWS SRA for isolating security-related accounts such as the Security Tooling and Log Archive accounts.",
+        "severity": "MEDIUM",
+    },
+    "SRA-ORGANIZATIONS-03": {
+        "module": "sraverify.services.organizations.checks.sra_organizations_03",
+        "class_name": "SRA_ORGANIZATIONS_03",
+        "service": "Organizations",
+        "account_type": "management",
+        "name": "Organization has foundational OU - Infrastructure",
+        "description": "This check verifies that the organization has an Infrastructure organizational unit (OU) directly under the root. The Infrastructure OU is a foundational OU recommended by AWS SRA for organizing infrastructure-related accounts such as shared services and networking accounts.",
+        "severity": "MEDIUM",
+    },
+    "SRA-ORGANIZATIONS-04": {
+        "module": "sraverify.services.organizations.checks.sra_organizations_04",
+        "class_name": "SRA_ORGANIZATIONS_04",
+        "service": "Organizations",
+        "account_type": "management",
+        "name": "Organization has foundational OU - Workloads",
+        "description": "This check verifies that the organization has a Workloads organizational unit (OU) directly under the root. The Workloads OU is a foundational OU recommended by AWS SRA for organizing application workload accounts including production and non-production environments.",
+        "severity": "MEDIUM",
+    },
+    "SRA-ORGANIZATIONS-05": {
+        "module": "sraverify.services.organizations.checks.sra_organizations_05",
+        "class_name": "SRA_ORGANIZATIONS_05",
+        "service": "Organizations",
+        "account_type": "management",
+        "name": "Organization has all features enabled",
+        "description": "This check verifies that the organization has all features enabled. All features mode enables full governance capabilities including Service Control Policies (SCPs), tag policies, backup policies, and AI services opt-out policies. Organizations with only consolidated billing have limited governance capabilities.",
+        "severity": "HIGH",
+    },
+    "SRA-ORGANIZATIONS-06": {
+        "module": "sraverify.services.organizations.checks.sra_organizations_06",
+        "class_name": "SRA_ORGANIZATIONS_06",
+        "service": "Organizations",
+        "account_type": "management",
+        "name": "Organization has Service Control Policies configured",
+        "description": "This check verifies that the organization has at least one custom Service Control Policy (SCP) configured beyond the default FullAWSAccess policy. SCPs are essential for implementing permission guardrails across the organization to enforce security and compliance requirements.",
+        "severity": "HIGH",
+    },
+    "SRA-ORGANIZATIONS-07": {
+        "module": "sraverify.services.organizations.checks.sra_organizations_07",
+        "class_name": "SRA_ORGANIZATIONS_07",
+        "service": "Organizations",
+        "account_type": "management",
+        "name": "Organization has Resource Control Policies configured",
+        "description": "This check verifies that the organization has at least one custom Resource Control Policy (RCP) configured beyond the default RCPFullAWSAccess policy. RCPs are a type of organization policy that help you centrally establish data perimeter controls across AWS resources in your organization. RCPs complement SCPs by controlling what resources can be accessed rather than what actions principals can perform.",
+        "severity": "MEDIUM",
+    },
+    "SRA-ORGANIZATIONS-08": {
+        "module": "sraverify.services.organizations.checks.sra_organizations_08",
+        "class_name": "SRA_ORGANIZATIONS_08",
+        "service": "Organizations",
+        "account_type": "management",
+        "name": "Audit account is in Security OU",
+        "description": "This check verifies that the audit account (Security Tooling account) is located in the Security organizational unit. According to AWS SRA best practices, the audit account should be placed in the Security OU to ensure proper isolation and governance of security tooling.",
+        "severity": "HIGH",
+    },
+    "SRA-ORGANIZATIONS-09": {
+        "module": "sraverify.services.organizations.checks.sra_organizations_09",
+        "class_name": "SRA_ORGANIZATIONS_09",
+        "service": "Organizations",
+        "account_type": "management",
+        "name": "Log Archive account is in Security OU",
+        "description": "This check verifies that the log archive account is located in the Security organizational unit. According to AWS SRA best practices, the log archive account should be placed in the Security OU to ensure proper isolation and governance of centralized logging infrastructure.",
+        "severity": "HIGH",
+    },
+}
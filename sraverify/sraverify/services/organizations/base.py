@@ -9,28 +9,16 @@ from sraverify.core.logging import logger
 
 class OrganizationsCheck(SecurityCheck):
     """Base class for all AWS Organizations security checks."""
-    
-    # Class-level caches shared across all instances
-    _organization_cache = {}
-    _roots_cache = {}
-    _ous_cache = {}
-    _policies_cache = {}
-    _accounts_cache = {}
-    
-    def __init__(self, resource_type: str = "AWS::Organizations::Organization"):
-        """
-        Initialize Organizations base check.
-        
-        Args:
-            resource_type: AWS resource type for findings (default: Organization)
-        """
-        super().__init__(
-            account_type="management",
-            service="Organizations",
-            resource_type=resource_type
-        )
+
+    account_type = "management"
+    service = "Organizations"
+    resource_type = "AWS::Organizations::Organization"
+
+    def __init__(self):
+        """Initialize Organizations base check."""
+        super().__init__()
         self._org_client = None
-    
+
     def _setup_clients(self):
         """Set up Organizations client (global service, no per-region clients needed)."""
         # Organizations is a global service, we only need one client
@@ -54,18 +42,19 @@ class OrganizationsCheck(SecurityCheck):
         Returns:
             Dictionary containing organization details or Error key if failed.
         """
-        # Check class-level cache
-        cache_key = f"{self.account_id}:organization"
-        if cache_key in OrganizationsCheck._organization_cache:
+        # Check scan cache
+        cache = self.cache('organizations.organization')
+        cache_key = "global"
+        if cache_key in cache:
             logger.debug("Organizations: Using cached organization details")
-            return OrganizationsCheck._organization_cache[cache_key]
+            return cache[cache_key]
         
         # Get organization details
         logger.debug("Organizations: Fetching organization details")
         response = self._org_client.describe_organization()
         
         # Cache the response
-        OrganizationsCheck._organization_cache[cache_key] = response
+        cache[cache_key] = response
         logger.debug("Organizations: Cached organization details")
         
         return response
@@ -78,18 +67,19 @@ class OrganizationsCheck(SecurityCheck):
             Dictionary with Roots key containing list of roots,
             or Error key if failed.
         """
-        # Check class-level cache
-        cache_key = f"{self.account_id}:roots"
-        if cache_key in OrganizationsCheck._roots_cache:
+        # Check scan cache
+        cache = self.cache('organizations.roots')
+        cache_key = "global"
+        if cache_key in cache:
             logger.debug("Organizations: Using cached roots")
-            return OrganizationsCheck._roots_cache[cache_key]
+            return cache[cache_key]
         
         # Get roots
         logger.debug("Organizations: Fetching organization roots")
         response = self._org_client.list_roots()
         
         # Cache the response
-        OrganizationsCheck._roots_cache[cache_key] = response
+        cache[cache_key] = response
         logger.debug("Organizations: Cached roots")
         
         return response
@@ -105,18 +95,19 @@ class OrganizationsCheck(SecurityCheck):
             Dictionary with OrganizationalUnits key containing list of OUs,
             or Error key if failed.
         """
-        # Check class-level cache
-        cache_key = f"{self.account_id}:{parent_id}:ous"
-        if cache_key in OrganizationsCheck._ous_cache:
+        # Check scan cache
+        cache = self.cache('organizations.ous')
+        cache_key = parent_id
+        if cache_key in cache:
             logger.debug(f"Organizations: Using cached OUs for parent {parent_id}")
-            return OrganizationsCheck._ous_cache[cache_key]
+            return cache[cache_key]
         
         # Get OUs
         logger.debug(f"Organizations: Fetching OUs for parent {parent_id}")
         response = self._org_client.list_organizational_units_for_parent(parent_id)
         
         # Cache the response
-        OrganizationsCheck._ous_cache[cache_key] = response
+        cache[cache_key] = response
         logger.debug(f"Organizations: Cached OUs for parent {parent_id}")
         
         return response
@@ -132,18 +123,19 @@ class OrganizationsCheck(SecurityCheck):
             Dictionary with Policies key containing list of policies,
             or Error key if failed.
         """
-        # Check class-level cache
-        cache_key = f"{self.account_id}:{policy_type}:policies"
-        if cache_key in OrganizationsCheck._policies_cache:
+        # Check scan cache
+        cache = self.cache('organizations.policies')
+        cache_key = policy_type
+        if cache_key in cache:
             logger.debug(f"Organizations: Using cached policies of type {policy_type}")
-            return OrganizationsCheck._policies_cache[cache_key]
+            return cache[cache_key]
         
         # Get policies
         logger.debug(f"Organizations: Fetching policies of type {policy_type}")
         response = self._org_client.list_policies(policy_type)
         
         # Cache the response
-        OrganizationsCheck._policies_cache[cache_key] = response
+        cache[cache_key] = response
         logger.debug(f"Organizations: Cached policies of type {policy_type}")
         
         return response
@@ -159,18 +151,19 @@ class OrganizationsCheck(SecurityCheck):
             Dictionary with Accounts key containing list of accounts,
             or Error key if failed.
         """
-        # Check class-level cache
-        cache_key = f"{self.account_id}:{parent_id}:accounts"
-        if cache_key in OrganizationsCheck._accounts_cache:
+        # Check scan cache
+        cache = self.cache('organizations.accounts')
+        cache_key = parent_id
+        if cache_key in cache:
             logger.debug(f"Organizations: Using cached accounts for parent {parent_id}")
-            return OrganizationsCheck._accounts_cache[cache_key]
+            return cache[cache_key]
         
         # Get accounts
         logger.debug(f"Organizations: Fetching accounts for parent {parent_id}")
         response = self._org_client.list_accounts_for_parent(parent_id)
         
         # Cache the response
-        OrganizationsCheck._accounts_cache[cache_key] = response
+        cache[cache_key] = response
         logger.debug(f"Organizations: Cached accounts for parent {parent_id}")
         
         return response
@@ -2,27 +2,28 @@
 Check if AWS Organizations is enabled.
 """
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.organizations.base import OrganizationsCheck
 
 
 class SRA_ORGANIZATIONS_01(OrganizationsCheck):
     """Check if AWS Organizations is enabled."""
 
-    def __init__(self):
-        """Initialize Organizations enabled check."""
-        super().__init__(resource_type="AWS::Organizations::Organization")
-        self.check_id = "SRA-ORGANIZATIONS-01"
-        self.check_name = "AWS Organizations is enabled"
-        self.description = (
-            "This check verifies that AWS Organizations is enabled for the account. "
-            "AWS Organizations enables central management and governance of multiple AWS accounts, "
-            "providing consolidated billing, account management, and policy-based controls."
-        )
-        self.severity = "HIGH"
-        self.check_logic = (
-            "Call DescribeOrganization API to confirm an organization exists. "
-            "Check passes if an organization is found, fails if no organization exists."
-        )
+    resource_type = "AWS::Organizations::Organization"
+    check_id = "SRA-ORGANIZATIONS-01"
+    check_name = "AWS Organizations is enabled"
+    description = (
+        "This check verifies that AWS Organizations is enabled for the account. "
+        "AWS Organizations enables central management and governance of multiple AWS accounts, "
+        "providing consolidated billing, account management, and policy-based controls."
+    )
+    severity = "HIGH"
+    check_logic = (
+        "Call DescribeOrganization API to confirm an organization exists. "
+        "Check passes if an organization is found, fails if no organization exists."
+    )
+
+    data_requirements = (DataRequirement("get_organization", ACCOUNT),)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -2,28 +2,29 @@
 Check if organization has foundational OU - Security.
 """
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.organizations.base import OrganizationsCheck
 
 
 class SRA_ORGANIZATIONS_02(OrganizationsCheck):
     """Check if organization has foundational OU - Security."""
 
-    def __init__(self):
-        """Initialize Security OU check."""
-        super().__init__(resource_type="AWS::Organizations::OrganizationalUnit")
-        self.check_id = "SRA-ORGANIZATIONS-02"
-        self.check_name = "Organization has foundational OU - Security"
-        self.description = (
-            "This check verifies that the organization has a Security organizational unit (OU) "
-            "directly under the root. The Security OU is a foundational OU recommended by AWS SRA "
-            "for isolating security-related accounts such as the Security Tooling and Log Archive accounts."
-        )
-        self.severity = "MEDIUM"
-        self.check_logic = (
-            "Retrieve the organization root using ListRoots API, then list all OUs under the root "
-            "using ListOrganizationalUnitsForParent API. Check passes if an OU named 'Security' "
-            "exists directly under the root."
-        )
+    resource_type = "AWS::Organizations::OrganizationalUnit"
+    check_id = "SRA-ORGANIZATIONS-02"
+    check_name = "Organization has foundational OU - Security"
+    description = (
+        "This check verifies that the organization has a Security organizational unit (OU) "
+        "directly under the root. The Security OU is a foundational OU recommended by AWS SRA "
+        "for isolating security-related accounts such as the Security Tooling and Log Archive accounts."
+    )
+    severity = "MEDIUM"
+    check_logic = (
+        "Retrieve the organization root using ListRoots API, then list all OUs under the root "
+        "using ListOrganizationalUnitsForParent API. Check passes if an OU named 'Security' "
+        "exists directly under the root."
+    )
+
+    data_requirements = (DataRequirement("get_roots", ACCOUNT),)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -2,28 +2,29 @@
 Check if organization has foundational OU - Infrastructure.
 """
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.organizations.base import OrganizationsCheck
 
 
 class SRA_ORGANIZATIONS_03(OrganizationsCheck):
     """Check if organization has foundational OU - Infrastructure."""
 
-    def __init__(self):
-        """Initialize Infrastructure OU check."""
-        super().__init__(resource_type="AWS::Organizations::OrganizationalUnit")
-        self.check_id = "SRA-ORGANIZATIONS-03"
-        self.check_name = "Organization has foundational OU - Infrastructure"
-        self.description = (
-            "This check verifies that the organization has an Infrastructure organizational unit (OU) "
-            "directly under the root. The Infrastructure OU is a foundational OU recommended by AWS SRA "
-            "for organizing infrastructure-related accounts such as shared services and networking accounts."
-        )
-        self.severity = "MEDIUM"
-        self.check_logic = (
-            "Retrieve the organization root using ListRoots API, then list all OUs under the root "
-            "using ListOrganizationalUnitsForParent API. Check passes if an OU named 'Infrastructure' "
-            "exists directly under the root."
-        )
+    resource_type = "AWS::Organizations::OrganizationalUnit"
+    check_id = "SRA-ORGANIZATIONS-03"
+    check_name = "Organization has foundational OU - Infrastructure"
+    description = (
+        "This check verifies that the organization has an Infrastructure organizational unit (OU) "
+        "directly under the root. The Infrastructure OU is a foundational OU recommended by AWS SRA "
+        "for organizing infrastructure-related accounts such as shared services and networking accounts."
+    )
+    severity = "MEDIUM"
+    check_logic = (
+        "Retrieve the organization root using ListRoots API, then list all OUs under the root "
+        "using ListOrganizationalUnitsForParent API. Check passes if an OU named 'Infrastructure' "
+        "exists directly under the root."
+    )
+
+    data_requirements = (DataRequirement("get_roots", ACCOUNT),)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
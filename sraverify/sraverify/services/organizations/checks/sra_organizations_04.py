@@ -2,28 +2,29 @@
 Check if organization has foundational OU - Workloads.
 """
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.organizations.base import OrganizationsCheck
 
 
 class SRA_ORGANIZATIONS_04(OrganizationsCheck):
     """Check if organization has foundational OU - Workloads."""
 
-    def __init__(self):
-        """Initialize Workloads OU check."""
-        super().__init__(resource_type="AWS::Organizations::OrganizationalUnit")
-        self.check_id = "SRA-ORGANIZATIONS-04"
-        self.check_name = "Organization has foundational OU - Workloads"
-        self.description = (
-            "This check verifies that the organization has a Workloads organizational unit (OU) "
-            "directly under the root. The Workloads OU is a foundational OU recommended by AWS SRA "
-            "for organizing application workload accounts including production and non-production environments."
-        )
-        self.severity = "MEDIUM"
-        self.check_logic = (
-            "Retrieve the organization root using ListRoots API, then list all OUs under the root "
-            "using ListOrganizationalUnitsForParent API. Check passes if an OU named 'Workloads' "
-            "exists directly under the root."
-        )
+    resource_type = "AWS::Organizations::OrganizationalUnit"
+    check_id = "SRA-ORGANIZATIONS-04"
+    check_name = "Organization has foundational OU - Workloads"
+    description = (
+        "This check verifies that the organization has a Workloads organizational unit (OU) "
+        "directly under the root. The Workloads OU is a foundational OU recommended by AWS SRA "
+        "for organizing application workload accounts including production and non-production environments."
+    )
+    severity = "MEDIUM"
+    check_logic = (
+        "Retrieve the organization root using ListRoots API, then list all OUs under the root "
+        "using ListOrganizationalUnitsForParent API. Check passes if an OU named 'Workloads' "
+        "exists directly under the root."
+    )
+
+    data_requirements = (DataRequirement("get_roots", ACCOUNT),)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
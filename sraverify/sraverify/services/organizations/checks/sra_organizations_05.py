@@ -2,28 +2,29 @@
 Check if organization has all features enabled.
 """
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.organizations.base import OrganizationsCheck
 
 
 class SRA_ORGANIZATIONS_05(OrganizationsCheck):
     """Check if organization has all features enabled."""
 
-    def __init__(self):
-        """Initialize all features enabled check."""
-        super().__init__(resource_type="AWS::Organizations::Organization")
-        self.check_id = "SRA-ORGANIZATIONS-05"
-        self.check_name = "Organization has all features enabled"
-        self.description = (
-            "This check verifies that the organization has all features enabled. "
-            "All features mode enables full governance capabilities including Service Control Policies (SCPs), "
-            "tag policies, backup policies, and AI services opt-out policies. Organizations with only "
-            "consolidated billing have limited governance capabilities."
-        )
-        self.severity = "HIGH"
-        self.check_logic = (
-            "Call DescribeOrganization API to retrieve organization details. "
-            "Check passes if FeatureSet equals 'ALL', fails if FeatureSet equals 'CONSOLIDATED_BILLING'."
-        )
+    resource_type = "AWS::Organizations::Organization"
+    check_id = "SRA-ORGANIZATIONS-05"
+    check_name = "Organization has all features enabled"
+    description = (
+        "This check verifies that the organization has all features enabled. "
+        "All features mode enables full governance capabilities including Service Control Policies (SCPs), "
+        "tag policies, backup policies, and AI services opt-out policies. Organizations with only "
+        "consolidated billing have limited governance capabilities."
+    )
+    severity = "HIGH"
+    check_logic = (
+        "Call DescribeOrganization API to retrieve organization details. "
+        "Check passes if FeatureSet equals 'ALL', fails if FeatureSet equals 'CONSOLIDATED_BILLING'."
+    )
+
+    data_requirements = (DataRequirement("get_organization", ACCOUNT),)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
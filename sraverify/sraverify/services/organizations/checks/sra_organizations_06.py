@@ -2,28 +2,29 @@
 Check if organization has Service Control Policies configured.
 """
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.organizations.base import OrganizationsCheck
 
 
 class SRA_ORGANIZATIONS_06(OrganizationsCheck):
     """Check if organization has Service Control Policies configured."""
 
-    def __init__(self):
-        """Initialize SCP check."""
-        super().__init__(resource_type="AWS::Organizations::Policy")
-        self.check_id = "SRA-ORGANIZATIONS-06"
-        self.check_name = "Organization has Service Control Policies configured"
-        self.description = (
-            "This check verifies that the organization has at least one custom Service Control Policy (SCP) "
-            "configured beyond the default FullAWSAccess policy. SCPs are essential for implementing "
-            "permission guardrails across the organization to enforce security and compliance requirements."
-        )
-        self.severity = "HIGH"
-        self.check_logic = (
-            "Call ListPolicies API with filter for SERVICE_CONTROL_POLICY type. "
-            "Check passes if at least one custom SCP exists (AwsManaged=False), "
-            "fails if only the default FullAWSAccess policy exists or no SCPs are found."
-        )
+    resource_type = "AWS::Organizations::Policy"
+    check_id = "SRA-ORGANIZATIONS-06"
+    check_name = "Organization has Service Control Policies configured"
+    description = (
+        "This check verifies that the organization has at least one custom Service Control Policy (SCP) "
+        "configured beyond the default FullAWSAccess policy. SCPs are essential for implementing "
+        "permission guardrails across the organization to enforce security and compliance requirements."
+    )
+    severity = "HIGH"
+    check_logic = (
+        "Call ListPolicies API with filter for SERVICE_CONTROL_POLICY type. "
+        "Check passes if at least one custom SCP exists (AwsManaged=False), "
+        "fails if only the default FullAWSAccess policy exists or no SCPs are found."
+    )
+
+    data_requirements = (DataRequirement("get_organization", ACCOUNT),)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
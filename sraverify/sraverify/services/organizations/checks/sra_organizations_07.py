@@ -2,30 +2,31 @@
 Check if organization has Resource Control Policies configured.
 """
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.organizations.base import OrganizationsCheck
 
 
 class SRA_ORGANIZATIONS_07(OrganizationsCheck):
     """Check if organization has Resource Control Policies configured."""
 
-    def __init__(self):
-        """Initialize RCP check."""
-        super().__init__(resource_type="AWS::Organizations::Policy")
-        self.check_id = "SRA-ORGANIZATIONS-07"
-        self.check_name = "Organization has Resource Control Policies configured"
-        self.description = (
-            "This check verifies that the organization has at least one custom Resource Control Policy (RCP) "
-            "configured beyond the default RCPFullAWSAccess policy. RCPs are a type of organization policy "
-            "that help you centrally establish data perimeter controls across AWS resources in your organization. "
-            "RCPs complement SCPs by controlling what resources can be accessed rather than what actions "
-            "principals can perform."
-        )
-        self.severity = "MEDIUM"
-        self.check_logic = (
-            "Call ListPolicies API with filter for RESOURCE_CONTROL_POLICY type. "
-            "Check passes if at least one custom RCP exists (AwsManaged=False), "
-            "fails if only the default RCPFullAWSAccess policy exists or no RCPs are found."
-        )
+    resource_type = "AWS::Organizations::Policy"
+    check_id = "SRA-ORGANIZATIONS-07"
+    check_name = "Organization has Resource Control Policies configured"
+    description = (
+        "This check verifies that the organization has at least one custom Resource Control Policy (RCP) "
+        "configured beyond the default RCPFullAWSAccess policy. RCPs are a type of organization policy "
+        "that help you centrally establish data perimeter controls across AWS resources in your organization. "
+        "RCPs complement SCPs by controlling what resources can be accessed rather than what actions "
+        "principals can perform."
+    )
+    severity = "MEDIUM"
+    check_logic = (
+        "Call ListPolicies API with filter for RESOURCE_CONTROL_POLICY type. "
+        "Check passes if at least one custom RCP exists (AwsManaged=False), "
+        "fails if only the default RCPFullAWSAccess policy exists or no RCPs are found."
+    )
+
+    data_requirements = (DataRequirement("get_organization", ACCOUNT),)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -2,28 +2,33 @@
 Check if audit account is in Security OU.
 """
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.organizations.base import OrganizationsCheck
 
 
 class SRA_ORGANIZATIONS_08(OrganizationsCheck):
     """Check if audit account is in Security OU."""
 
+    resource_type = "AWS::Organizations::Account"
+    check_id = "SRA-ORGANIZATIONS-08"
+    check_name = "Audit account is in Security OU"
+    description = (
+        "This check verifies that the audit account (Security Tooling account) is located in the "
+        "Security organizational unit. According to AWS SRA best practices, the audit account should "
+        "be placed in the Security OU to ensure proper isolation and governance of security tooling."
+    )
+    severity = "HIGH"
+    check_logic = (
+        "Get the Security OU under the organization root, then list all accounts in the Security OU. "
+        "Check passes if the audit account (provided via --audit-account CLI parameter) is found in "
+        "the Security OU."
+    )
+
+    data_requirements = (DataRequirement("get_roots", ACCOUNT),)
+
     def __init__(self):
         """Initialize audit account in Security OU check."""
-        super().__init__(resource_type="AWS::Organizations::Account")
-        self.check_id = "SRA-ORGANIZATIONS-08"
-        self.check_name = "Audit account is in Security OU"
-        self.description = (
-            "This check verifies that the audit account (Security Tooling account) is located in the "
-            "Security organizational unit. According to AWS SRA best practices, the audit account should "
-            "be placed in the Security OU to ensure proper isolation and governance of security tooling."
-        )
-        self.severity = "HIGH"
-        self.check_logic = (
-            "Get the Security OU under the organization root, then list all accounts in the Security OU. "
-            "Check passes if the audit account (provided via --audit-account CLI parameter) is found in "
-            "the Security OU."
-        )
+        super().__init__()
         self._audit_accounts = []  # Will be populated from CLI --audit-account parameter
 
     def execute(self) -> List[Dict[str, Any]]:
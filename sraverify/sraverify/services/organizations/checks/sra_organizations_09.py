@@ -2,28 +2,33 @@
 Check if log archive account is in Security OU.
 """
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.organizations.base import OrganizationsCheck
 
 
 class SRA_ORGANIZATIONS_09(OrganizationsCheck):
     """Check if log archive account is in Security OU."""
 
+    resource_type = "AWS::Organizations::Account"
+    check_id = "SRA-ORGANIZATIONS-09"
+    check_name = "Log Archive account is in Security OU"
+    description = (
+        "This check verifies that the log archive account is located in the Security organizational unit. "
+        "According to AWS SRA best practices, the log archive account should be placed in the Security OU "
+        "to ensure proper isolation and governance of centralized logging infrastructure."
+    )
+    severity = "HIGH"
+    check_logic = (
+        "Get the Security OU under the organization root, then list all accounts in the Security OU. "
+        "Check passes if the log archive account (provided via --log-archive-account CLI parameter) "
+        "is found in the Security OU."
+    )
+
+    data_requirements = (DataRequirement("get_roots", ACCOUNT),)
+
     def __init__(self):
         """Initialize log archive account in Security OU check."""
-        super().__init__(resource_type="AWS::Organizations::Account")
-        self.check_id = "SRA-ORGANIZATIONS-09"
-        self.check_name = "Log Archive account is in Security OU"
-        self.description = (
-            "This check verifies that the log archive account is located in the Security organizational unit. "
-            "According to AWS SRA best practices, the log archive account should be placed in the Security OU "
-            "to ensure proper isolation and governance of centralized logging infrastructure."
-        )
-        self.severity = "HIGH"
-        self.check_logic = (
-            "Get the Security OU under the organization root, then list all accounts in the Security OU. "
-            "Check passes if the log archive account (provided via --log-archive-account CLI parameter) "
-            "is found in the Security OU."
-        )
+        super().__init__()
         self._log_archive_accounts = []  # Will be populated from CLI --log-archive-account parameter
 
     def execute(self) -> List[Dict[str, Any]]:
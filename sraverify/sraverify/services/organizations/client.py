@@ -4,11 +4,14 @@ Organizations client for interacting with AWS Organizations service.
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 
 class OrganizationsClient:
     """Client for interacting with AWS Organizations service."""
+    # Organizations is a global service, always use us-east-1
+    client = lazy_client('organizations', region_name='us-east-1')
     
     def __init__(self, session: Optional[boto3.Session] = None):
         """
@@ -18,8 +21,6 @@ class OrganizationsClient:
             session: AWS session to use (if None, a new session will be created)
         """
         self.session = session or boto3.Session()
-        # Organizations is a global service, always use us-east-1
-        self.client = self.session.client('organizations', region_name='us-east-1')
     
     def describe_organization(self) -> Dict[str, Any]:
         """
@@ -151,3 +152,28 @@ class OrganizationsClient:
                     "Message": error_message
                 }
             }
+
+    def list_accounts(self) -> Dict[str, Any]:
+        """
+        List all accounts in the organization with pagination support.
+        
+        Returns:
+            Dictionary with Accounts key containing list of accounts,
+            or Error key if an error occurred.
+        """
+        try:
+            accounts = []
+            paginator = self.client.get_paginator('list_accounts')
+            for page in paginator.paginate():
+                accounts.extend(page.get('Accounts', []))
+            return {"Accounts": accounts}
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', '')
+            error_message = e.response.get('Error', {}).get('Message', str(e))
+            logger.error(f"Error listing organization accounts: {error_message}")
+            return {
+                "Error": {
+                    "Code": error_code,
+                    "Message": error_message
+                }
+            }
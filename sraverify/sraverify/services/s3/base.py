@@ -9,18 +9,11 @@ from sraverify.core.logging import logger
 
 class S3Check(SecurityCheck):
     """Base class for all S3 security checks."""
-    
-    # Class-level cache shared across all instances
-    _public_access_cache = {}
-    
-    def __init__(self):
-        """Initialize S3 base check."""
-        super().__init__(
-            account_type="application",
-            service="S3",
-            resource_type="AWS::S3::AccountPublicAccessBlock"
-        )
-    
+
+    account_type = "application"
+    service = "S3"
+    resource_type = "AWS::S3::AccountPublicAccessBlock"
+
     def _setup_clients(self):
         """Set up S3 clients for each region."""
         # Clear existing clients
@@ -46,15 +39,15 @@ class S3Check(SecurityCheck):
             logger.warning("Could not determine account ID")
             return {}
         
-        # Use session region name as part of cache key
-        cache_key = f"public_access:{account_id}:{self.session.region_name}"
-        if cache_key in self.__class__._public_access_cache:
-            logger.debug(f"Using cached public access block configuration for {cache_key}")
-            return self.__class__._public_access_cache[cache_key]
-        
         # Use any region to get public access block configuration
         # S3 is a global service, but we need to use a regional endpoint
-        client = self._clients.get(self.regions[0])
+        region = self.regions[0]
+        cache = self.cache('s3.public_access')
+        if region in cache:
+            logger.debug(f"Using cached public access block configuration for {account_id}")
+            return cache[region]
+        
+        client = self._clients.get(region)
         if not client:
             logger.warning("No S3 client available")
             return {}
@@ -63,7 +56,7 @@ class S3Check(SecurityCheck):
         public_access_config = client.get_public_access_block(account_id)
         
         # Cache the results
-        self.__class__._public_access_cache[cache_key] = public_access_config
-        logger.debug(f"Cached public access block configuration for {cache_key}")
+        cache[region] = public_access_config
+        logger.debug(f"Cached public access block configuration for {account_id}")
         
         return public_access_config
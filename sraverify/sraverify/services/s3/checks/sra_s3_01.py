@@ -2,29 +2,29 @@
 SRA-S3-01: S3 restrict public bucket is enabled.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.s3.base import S3Check
 from sraverify.core.logging import logger
 
 
 class SRA_S3_01(S3Check):
     """Check if S3 restrict public bucket is enabled for the account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-S3-01"
-        self.check_name = "S3 restrict public bucket is enabled"
-        self.account_type = "application"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether S3 should restrict public policies for S3 buckets. "
-            "Setting this restricts access to this bucket to only AWS service principals and authorized users "
-            "within this account if the bucket has a public policy."
-        )
-        self.check_logic = (
-            "Check if RestrictPublicBuckets is set to true in the account's public access block configuration."
-        )
-    
+
+    check_id = "SRA-S3-01"
+    check_name = "S3 restrict public bucket is enabled"
+    account_type = "application"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether S3 should restrict public policies for S3 buckets. "
+        "Setting this restricts access to this bucket to only AWS service principals and authorized users "
+        "within this account if the bucket has a public policy."
+    )
+    check_logic = (
+        "Check if RestrictPublicBuckets is set to true in the account's public access block configuration."
+    )
+
+    data_requirements = (DataRequirement("get_public_access", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -2,29 +2,29 @@
 SRA-S3-02: S3 block public ACLs is set.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.s3.base import S3Check
 from sraverify.core.logging import logger
 
 
 class SRA_S3_02(S3Check):
     """Check if S3 block public ACLs is enabled for the account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-S3-02"
-        self.check_name = "S3 block public ACLs is set"
-        self.account_type = "application"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether S3 public block access control lists (ACLs) for buckets and object is enabled. "
-            "Setting this fails prevents from setting a public ACL on S3 buckets and Objects. It also prevent creating "
-            "a bucket with public ACL and uploading a object with public ACL."
-        )
-        self.check_logic = (
-            "Check if BlockPublicAcls is set to true in the account's public access block configuration."
-        )
-    
+
+    check_id = "SRA-S3-02"
+    check_name = "S3 block public ACLs is set"
+    account_type = "application"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether S3 public block access control lists (ACLs) for buckets and object is enabled. "
+        "Setting this fails prevents from setting a public ACL on S3 buckets and Objects. It also prevent creating "
+        "a bucket with public ACL and uploading a object with public ACL."
+    )
+    check_logic = (
+        "Check if BlockPublicAcls is set to true in the account's public access block configuration."
+    )
+
+    data_requirements = (DataRequirement("get_public_access", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
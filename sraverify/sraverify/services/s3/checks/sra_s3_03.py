@@ -2,28 +2,28 @@
 SRA-S3-03: S3 ignore public ACL is enabled.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.s3.base import S3Check
 from sraverify.core.logging import logger
 
 
 class SRA_S3_03(S3Check):
     """Check if S3 ignore public ACLs is enabled for the account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-S3-03"
-        self.check_name = "S3 ignore public ACL is enabled"
-        self.account_type = "application"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether the IgnorePublicACLs is set to True. Setting this causes Amazon S3 "
-            "to ignore all public ACLs on buckets and objects in the bucket."
-        )
-        self.check_logic = (
-            "Check if IgnorePublicAcls is set to true in the account's public access block configuration."
-        )
-    
+
+    check_id = "SRA-S3-03"
+    check_name = "S3 ignore public ACL is enabled"
+    account_type = "application"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether the IgnorePublicACLs is set to True. Setting this causes Amazon S3 "
+        "to ignore all public ACLs on buckets and objects in the bucket."
+    )
+    check_logic = (
+        "Check if IgnorePublicAcls is set to true in the account's public access block configuration."
+    )
+
+    data_requirements = (DataRequirement("get_public_access", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
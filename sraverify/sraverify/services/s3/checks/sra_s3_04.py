@@ -2,28 +2,28 @@
 SRA-S3-04: S3 block public policy is enabled.
 """
 from typing import List, Dict, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.s3.base import S3Check
 from sraverify.core.logging import logger
 
 
 class SRA_S3_04(S3Check):
     """Check if S3 block public policy is enabled for the account."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-S3-04"
-        self.check_name = "S3 block public policy is enabled"
-        self.account_type = "application"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether S3 should block public bucket policies for buckets. "
-            "Setting this causes Amazon S3 to reject calls that attaches a public access bucket policy to a S3 bucket."
-        )
-        self.check_logic = (
-            "Check if BlockPublicPolicy is set to true in the account's public access block configuration."
-        )
-    
+
+    check_id = "SRA-S3-04"
+    check_name = "S3 block public policy is enabled"
+    account_type = "application"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether S3 should block public bucket policies for buckets. "
+        "Setting this causes Amazon S3 to reject calls that attaches a public access bucket policy to a S3 bucket."
+    )
+    check_logic = (
+        "Check if BlockPublicPolicy is set to true in the account's public access block configuration."
+    )
+
+    data_requirements = (DataRequirement("get_public_access", ACCOUNT),)
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -4,11 +4,14 @@ S3 client for interacting with AWS S3 service.
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 
 class S3Client:
     """Client for interacting with AWS S3 service."""
+    client = lazy_client('s3')
+    s3control_client = lazy_client('s3control')
     
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,8 +23,6 @@ class S3Client:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('s3', region_name=region)
-        self.s3control_client = self.session.client('s3control', region_name=region)
         
     def get_public_access_block(self, account_id: str) -> Dict[str, Any]:
         """
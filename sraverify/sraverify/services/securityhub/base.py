@@ -9,24 +9,11 @@ from sraverify.core.logging import logger
 
 class SecurityHubCheck(SecurityCheck):
     """Base class for all SecurityHub security checks."""
-    
-    # Class-level caches shared across all instances
-    _enabled_standards_cache = {}
-    _admin_account_cache = {}
-    _organization_configuration_cache = {}
-    _product_integrations_cache = {}
-    _delegated_admin_cache = {}
-    _organization_accounts_cache = {}
-    _securityhub_members_cache = {}
-    
-    def __init__(self):
-        """Initialize SecurityHub base check."""
-        super().__init__(
-            account_type="audit",  # Default to audit, can be overridden in child classes
-            service="SecurityHub",
-            resource_type="AWS::SecurityHub::Hub"
-        )
-    
+
+    account_type = "audit"  # Default to audit, can be overridden in child classes
+    service = "SecurityHub"
+    resource_type = "AWS::SecurityHub::Hub"
+
     def _setup_clients(self):
         """Set up SecurityHub clients for each region."""
         # Clear existing clients
@@ -64,10 +51,10 @@ class SecurityHubCheck(SecurityCheck):
             return []
         
         # Check cache first
-        cache_key = f"{account_id}:{region}"
-        if cache_key in self.__class__._enabled_standards_cache:
-            logger.debug(f"Using cached enabled standards for {cache_key}")
-            return self.__class__._enabled_standards_cache[cache_key]
+        cache = self.cache('securityhub.enabled_standards')
+        if region in cache:
+            logger.debug(f"Using cached enabled standards for {region}")
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -84,8 +71,8 @@ class SecurityHubCheck(SecurityCheck):
                 return None
             
             # Cache the results
-            self.__class__._enabled_standards_cache[cache_key] = standards
-            logger.debug(f"Cached {len(standards)} enabled standards for {cache_key}")
+            cache[region] = standards
+            logger.debug(f"Cached {len(standards)} enabled standards for {region}")
             
             return standards
         except Exception as e:
@@ -118,10 +105,10 @@ class SecurityHubCheck(SecurityCheck):
             return {}
         
         # Check cache first
-        cache_key = f"{account_id}:{region}"
-        if cache_key in self.__class__._admin_account_cache:
-            logger.debug(f"Using cached administrator account for {cache_key}")
-            return self.__class__._admin_account_cache[cache_key]
+        cache = self.cache('securityhub.admin_account')
+        if region in cache:
+            logger.debug(f"Using cached administrator account for {region}")
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -132,8 +119,8 @@ class SecurityHubCheck(SecurityCheck):
         admin_account = client.get_administrator_account()
         
         # Cache the results
-        self.__class__._admin_account_cache[cache_key] = admin_account
-        logger.debug(f"Cached administrator account for {cache_key}")
+        cache[region] = admin_account
+        logger.debug(f"Cached administrator account for {region}")
         
         return admin_account
     
@@ -153,10 +140,10 @@ class SecurityHubCheck(SecurityCheck):
             return {}
         
         # Check cache first
-        cache_key = f"{account_id}:{region}"
-        if cache_key in self.__class__._organization_configuration_cache:
-            logger.debug(f"Using cached organization configuration for {cache_key}")
-            return self.__class__._organization_configuration_cache[cache_key]
+        cache = self.cache('securityhub.organization_configuration')
+        if region in cache:
+            logger.debug(f"Using cached organization configuration for {region}")
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -167,8 +154,8 @@ class SecurityHubCheck(SecurityCheck):
         org_config = client.describe_organization_configuration()
         
         # Cache the results
-        self.__class__._organization_configuration_cache[cache_key] = org_config
-        logger.debug(f"Cached organization configuration for {cache_key}")
+        cache[region] = org_config
+        logger.debug(f"Cached organization configuration for {region}")
         
         return org_config
     
@@ -188,10 +175,10 @@ class SecurityHubCheck(SecurityCheck):
             return []
         
         # Check cache first
-        cache_key = f"{account_id}:{region}"
-        if cache_key in self.__class__._product_integrations_cache:
-            logger.debug(f"Using cached product integrations for {cache_key}")
-            return self.__class__._product_integrations_cache[cache_key]
+        cache = self.cache('securityhub.product_integrations')
+        if region in cache:
+            logger.debug(f"Using cached product integrations for {region}")
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -203,8 +190,8 @@ class SecurityHubCheck(SecurityCheck):
         
         # Only cache if we got a valid response (not None)
         if products is not None:
-            self.__class__._product_integrations_cache[cache_key] = products
-            logger.debug(f"Cached {len(products)} product integrations for {cache_key}")
+            cache[region] = products
+            logger.debug(f"Cached {len(products)} product integrations for {region}")
         
         return products
     
@@ -224,10 +211,10 @@ class SecurityHubCheck(SecurityCheck):
             return []
         
         # Check cache first
-        cache_key = f"{account_id}:{region}"
-        if cache_key in self.__class__._delegated_admin_cache:
-            logger.debug(f"Using cached delegated administrators for {cache_key}")
-            return self.__class__._delegated_admin_cache[cache_key]
+        cache = self.cache('securityhub.delegated_admin')
+        if region in cache:
+            logger.debug(f"Using cached delegated administrators for {region}")
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -238,8 +225,8 @@ class SecurityHubCheck(SecurityCheck):
         delegated_admins = client.list_delegated_administrators()
         
         # Cache the results
-        self.__class__._delegated_admin_cache[cache_key] = delegated_admins
-        logger.debug(f"Cached {len(delegated_admins)} delegated administrators for {cache_key}")
+        cache[region] = delegated_admins
+        logger.debug(f"Cached {len(delegated_admins)} delegated administrators for {region}")
         
         return delegated_admins
     
@@ -259,10 +246,10 @@ class SecurityHubCheck(SecurityCheck):
             return []
         
         # Check cache first
-        cache_key = f"{account_id}:{region}"
-        if cache_key in self.__class__._admin_account_cache:
-            logger.debug(f"Using cached organization admin accounts for {cache_key}")
-            return self.__class__._admin_account_cache[cache_key]
+        cache = self.cache('securityhub.organization_admin_accounts')
+        if region in cache:
+            logger.debug(f"Using cached organization admin accounts for {region}")
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -273,17 +260,17 @@ class SecurityHubCheck(SecurityCheck):
         admin_accounts = client.list_organization_admin_accounts()
         
         # Cache the results
-        self.__class__._admin_account_cache[cache_key] = admin_accounts
-        logger.debug(f"Cached {len(admin_accounts)} organization admin accounts for {cache_key}")
+        cache[region] = admin_accounts
+        logger.debug(f"Cached {len(admin_accounts)} organization admin accounts for {region}")
         
         return admin_accounts
     
     def get_organization_accounts(self, region: str) -> List[Dict[str, Any]]:
         """
-        Get all organization accounts with caching.
+        Get all organization accounts from the shared organization directory.
         
         Args:
-            region: AWS region name
+            region: AWS region name (accounts are the same in every region)
             
         Returns:
             List of organization accounts
@@ -293,25 +280,11 @@ class SecurityHubCheck(SecurityCheck):
             logger.warning("Could not determine account ID")
             return []
         
-        # Check cache first
-        cache_key = f"{account_id}:{region}"
-        if cache_key in self.__class__._organization_accounts_cache:
-            logger.debug(f"Using cached organization accounts for {cache_key}")
-            return self.__class__._organization_accounts_cache[cache_key]
-        
-        client = self.get_client(region)
-        if not client:
-            logger.warning(f"No SecurityHub client available for region {region}")
+        try:
+            return self.org_directory.accounts
+        except Exception as e:
+            logger.error(f"Error listing organization accounts: {e}")
             return []
-        
-        # Get organization accounts from client
-        accounts = client.list_organization_accounts()
-        
-        # Cache the results
-        self.__class__._organization_accounts_cache[cache_key] = accounts
-        logger.debug(f"Cached {len(accounts)} organization accounts for {cache_key}")
-        
-        return accounts
     
     def get_security_hub_members(self, region: str) -> List[Dict[str, Any]]:
         """
@@ -329,10 +302,10 @@ class SecurityHubCheck(SecurityCheck):
             return []
         
         # Check cache first
-        cache_key = f"{account_id}:{region}"
-        if cache_key in self.__class__._securityhub_members_cache:
-            logger.debug(f"Using cached Security Hub members for {cache_key}")
-            return self.__class__._securityhub_members_cache[cache_key]
+        cache = self.cache('securityhub.members')
+        if region in cache:
+            logger.debug(f"Using cached Security Hub members for {region}")
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -343,7 +316,7 @@ class SecurityHubCheck(SecurityCheck):
         members = client.list_members()
         
         # Cache the results
-        self.__class__._securityhub_members_cache[cache_key] = members
-        logger.debug(f"Cached {len(members)} Security Hub members for {cache_key}")
+        cache[region] = members
+        logger.debug(f"Cached {len(members)} Security Hub members for {region}")
         
         return members
@@ -8,21 +8,20 @@ from sraverify.core.logging import logger
 
 class SRA_SECURITYHUB_01(SecurityHubCheck):
     """Check if Security Hub enabled account level standards exist."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-SECURITYHUB-01"
-        self.check_name = "Security Hub enabled account level standards exist"
-        self.account_type = "application"  # This check is for application accounts
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether a list of enabled Security Hub standards for the current AWS account exists."
-        )
-        self.check_logic = (
-            "Check evaluates if there are any standards enabled in the AWS account and AWS region. "
-            "Check PASS if there are any standards enabled."
-        )
+
+    check_id = "SRA-SECURITYHUB-01"
+    check_name = "Security Hub enabled account level standards exist"
+    account_type = "application"  # This check is for application accounts
+    severity = "HIGH"
+    description = (
+        "This check verifies whether a list of enabled Security Hub standards for the current AWS account exists."
+    )
+    check_logic = (
+        "Check evaluates if there are any standards enabled in the AWS account and AWS region. "
+        "Check PASS if there are any standards enabled."
+    )
+
+    data_requirements = ("get_enabled_standards",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
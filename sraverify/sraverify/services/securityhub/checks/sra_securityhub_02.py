@@ -8,22 +8,21 @@ from sraverify.core.logging import logger
 
 class SRA_SECURITYHUB_02(SecurityHubCheck):
     """Check if Security Hub is configured to auto-enable new security controls."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-SECURITYHUB-02"
-        self.check_name = "Security Hub auto-enable new standards is enabled"
-        self.account_type = "audit"  # This check is for the audit account
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies whether Security Hub is configured to auto-enable new security standards "
-            "as they are added to existing standards. This will ensure that as existing standards are updated "
-            "with new controls, the AWS account gets evaluated on those new controls."
-        )
-        self.check_logic = (
-            "Check evaluates if Security Hub describe organization configuration has AutoEnableStandards set to true."
-        )
+
+    check_id = "SRA-SECURITYHUB-02"
+    check_name = "Security Hub auto-enable new standards is enabled"
+    account_type = "audit"  # This check is for the audit account
+    severity = "MEDIUM"
+    description = (
+        "This check verifies whether Security Hub is configured to auto-enable new security standards "
+        "as they are added to existing standards. This will ensure that as existing standards are updated "
+        "with new controls, the AWS account gets evaluated on those new controls."
+    )
+    check_logic = (
+        "Check evaluates if Security Hub describe organization configuration has AutoEnableStandards set to true."
+    )
+
+    data_requirements = ("get_organization_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
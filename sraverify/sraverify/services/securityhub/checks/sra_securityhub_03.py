@@ -8,24 +8,25 @@ from sraverify.core.logging import logger
 
 class SRA_SECURITYHUB_03(SecurityHubCheck):
     """Check if Security Hub administration for the account matches delegated administrator."""
-    
+
+    check_id = "SRA-SECURITYHUB-03"
+    check_name = "Security Hub administration for the account matches delegated administrator"
+    account_type = "management"  # This check is for the management account
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Security Hub service administration for the AWS account is set to "
+        "AWS Organization delegated admin account for Security Hub."
+    )
+    check_logic = (
+        "Check evaluates securityhub list-organization-admin-accounts and organizations list-delegated-administrators "
+        "--service-principal securityhub.amazonaws.com. Check PASS if AccountID and ID returned are the same."
+    )
+
     def __init__(self):
         """Initialize the check."""
         super().__init__()
-        self.check_id = "SRA-SECURITYHUB-03"
-        self.check_name = "Security Hub administration for the account matches delegated administrator"
-        self.account_type = "management"  # This check is for the management account
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Security Hub service administration for the AWS account is set to "
-            "AWS Organization delegated admin account for Security Hub."
-        )
-        self.check_logic = (
-            "Check evaluates securityhub list-organization-admin-accounts and organizations list-delegated-administrators "
-            "--service-principal securityhub.amazonaws.com. Check PASS if AccountID and ID returned are the same."
-        )
         self._audit_accounts = []  # Will be populated from command line args
-    
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,23 +8,22 @@ from sraverify.core.logging import logger
 
 class SRA_SECURITYHUB_04(SecurityHubCheck):
     """Check if Security Hub central configuration is enabled."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-SECURITYHUB-04"
-        self.check_name = "Security Hub central configuration is enabled"
-        self.account_type = "audit"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Security Hub is configured for central configuration. "
-            "Central configuration allows the delegated administrator to manage Security Hub, "
-            "standards, and controls across all organization accounts from a single location."
-        )
-        self.check_logic = (
-            "Check evaluates if Security Hub organization configuration has ConfigurationType "
-            "set to CENTRAL and Status set to ENABLED in the delegated administrator account in all regions."
-        )
+
+    check_id = "SRA-SECURITYHUB-04"
+    check_name = "Security Hub central configuration is enabled"
+    account_type = "audit"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Security Hub is configured for central configuration. "
+        "Central configuration allows the delegated administrator to manage Security Hub, "
+        "standards, and controls across all organization accounts from a single location."
+    )
+    check_logic = (
+        "Check evaluates if Security Hub organization configuration has ConfigurationType "
+        "set to CENTRAL and Status set to ENABLED in the delegated administrator account in all regions."
+    )
+
+    data_requirements = ("get_organization_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
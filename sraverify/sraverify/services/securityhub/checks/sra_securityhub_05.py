@@ -8,22 +8,21 @@ from sraverify.core.logging import logger
 
 class SRA_SECURITYHUB_05(SecurityHubCheck):
     """Check if Security Hub has integrations with findings generating products."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-SECURITYHUB-05"
-        self.check_name = "Security Hub integration with findings generating products"
-        self.account_type = "audit"  # This check is for the audit account
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies whether Security Hub has expected integration with AWS services "
-            "and third party products to ingest security findings."
-        )
-        self.check_logic = (
-            "Check looks in audit account to evaluate see what types of findings are being ingested. "
-            "PASS if there are any products listed."
-        )
+
+    check_id = "SRA-SECURITYHUB-05"
+    check_name = "Security Hub integration with findings generating products"
+    account_type = "audit"  # This check is for the audit account
+    severity = "MEDIUM"
+    description = (
+        "This check verifies whether Security Hub has expected integration with AWS services "
+        "and third party products to ingest security findings."
+    )
+    check_logic = (
+        "Check looks in audit account to evaluate see what types of findings are being ingested. "
+        "PASS if there are any products listed."
+    )
+
+    data_requirements = ("get_enabled_products_for_import",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,24 +8,21 @@ from sraverify.core.logging import logger
 
 class SRA_SECURITYHUB_06(SecurityHubCheck):
     """Check if Security Hub administration for the AWS Organization has a delegated administrator."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-SECURITYHUB-06"
-        self.check_name = "Security Hub administration for the AWS Organization has a delegated administrator"
-        self.account_type = "management"  # This check is for the management account
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Security Hub service administration for the AWS Organization "
-            "is set to AWS Organization delegated admin account for Security Hub."
-        )
-        self.check_logic = (
-            "Check evaluates securityhub list-organization-admin-accounts and organizations list-delegated-administrators "
-            "--service-principal securityhub.amazonaws.com. Check PASS if AccountID and ID returned are the same."
-        )
-        self.resource_type = "AWS::Organizations::Account"
-    
+
+    check_id = "SRA-SECURITYHUB-06"
+    check_name = "Security Hub administration for the AWS Organization has a delegated administrator"
+    account_type = "management"  # This check is for the management account
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Security Hub service administration for the AWS Organization "
+        "is set to AWS Organization delegated admin account for Security Hub."
+    )
+    check_logic = (
+        "Check evaluates securityhub list-organization-admin-accounts and organizations list-delegated-administrators "
+        "--service-principal securityhub.amazonaws.com. Check PASS if AccountID and ID returned are the same."
+    )
+    resource_type = "AWS::Organizations::Account"
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,26 +8,29 @@ from sraverify.core.logging import logger
 
 class SRA_SECURITYHUB_07(SecurityHubCheck):
     """Check if Security Hub delegated admin account is the audit account."""
+
+    check_id = "SRA-SECURITYHUB-07"
+    check_name = "Security Hub delegated admin account is the audit account"
+    account_type = "management"  # This check is for the management account
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Security Hub delegated admin account is the audit account of your AWS organization. "
+        "Audit account is dedicated to operating security services, monitoring AWS accounts, and automating security alerting and response. "
+        "AWS Security Hub provides a comprehensive view of the security state in AWS and helps assess AWS environment against "
+        "security industry standards and best practices."
+    )
+    check_logic = (
+        "Check evaluates value from organizations list-delegated-administrators --service-principal securityhub.amazonaws.com "
+        "to ensure DelegatedAdministrators ID matches audit account ID passed via flag."
+    )
+
+    data_requirements = ("get_delegated_administrators",)
     
     def __init__(self):
         """Initialize the check."""
         super().__init__()
-        self.check_id = "SRA-SECURITYHUB-07"
-        self.check_name = "Security Hub delegated admin account is the audit account"
-        self.account_type = "management"  # This check is for the management account
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Security Hub delegated admin account is the audit account of your AWS organization. "
-            "Audit account is dedicated to operating security services, monitoring AWS accounts, and automating security alerting and response. "
-            "AWS Security Hub provides a comprehensive view of the security state in AWS and helps assess AWS environment against "
-            "security industry standards and best practices."
-        )
-        self.check_logic = (
-            "Check evaluates value from organizations list-delegated-administrators --service-principal securityhub.amazonaws.com "
-            "to ensure DelegatedAdministrators ID matches audit account ID passed via flag."
-        )
         self._audit_accounts = []  # Will be populated from command line args
-    
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
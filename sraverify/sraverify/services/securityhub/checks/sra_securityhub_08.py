@@ -8,25 +8,28 @@ from sraverify.core.logging import logger
 
 class SRA_SECURITYHUB_08(SecurityHubCheck):
     """Check if all active organization accounts are Security Hub members."""
+
+    check_id = "SRA-SECURITYHUB-08"
+    check_name = "All active organization accounts are Security Hub members"
+    account_type = "audit"  # This check is for the audit account
+    severity = "HIGH"
+    description = (
+        "This check verifies whether all active members accounts of the AWS Organization are Security Hub members. "
+        "Security Hub provides comprehensive security state and should include all AWS accounts."
+    )
+    check_logic = (
+        "Compare the outputs of organizations list-accounts and securityhub list-members. "
+        "Make sure that the list includes all accounts, excluding the Security Hub admin (audit account) "
+        "which is not considered a member."
+    )
+
+    data_requirements = ("get_organization_accounts", "get_security_hub_members")
     
     def __init__(self):
         """Initialize the check."""
         super().__init__()
-        self.check_id = "SRA-SECURITYHUB-08"
-        self.check_name = "All active organization accounts are Security Hub members"
-        self.account_type = "audit"  # This check is for the audit account
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether all active members accounts of the AWS Organization are Security Hub members. "
-            "Security Hub provides comprehensive security state and should include all AWS accounts."
-        )
-        self.check_logic = (
-            "Compare the outputs of organizations list-accounts and securityhub list-members. "
-            "Make sure that the list includes all accounts, excluding the Security Hub admin (audit account) "
-            "which is not considered a member."
-        )
         self._audit_accounts = []  # Will be populated from command line args
-    
+
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -38,19 +41,13 @@ class SRA_SECURITYHUB_08(SecurityHubCheck):
         
         # Check each region separately
         for region in self.regions:
-            # Get all organization accounts
-            org_accounts = self.get_organization_accounts(region)
-            
             # Get Security Hub members
             securityhub_members = self.get_security_hub_members(region)
             
             resource_id = f"securityhub:members/{self.account_id}/{region}"
             
             # Create sets of account IDs for comparison
-            active_org_account_ids = set()
-            for account in org_accounts:
-                if account.get('Status') == 'ACTIVE':
-                    active_org_account_ids.add(account.get('Id'))
+            active_org_account_ids = self.get_active_account_ids()
             
             securityhub_member_ids = set()
             for member in securityhub_members:
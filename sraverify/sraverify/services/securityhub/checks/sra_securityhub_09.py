@@ -8,23 +8,22 @@ from sraverify.core.logging import logger
 
 class SRA_SECURITYHUB_09(SecurityHubCheck):
     """Check if all Security Hub member accounts have Enabled status."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-SECURITYHUB-09"
-        self.check_name = "All Security Hub member accounts have Enabled status"
-        self.account_type = "audit"  # This check is for the audit account
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether each Security Hub member account has member status Enabled. "
-            "Enabled status indicates that the member account is currently active. For manually invited "
-            "member accounts, it indicates that the member account accepted the invitation."
-        )
-        self.check_logic = (
-            "Check runs aws securityhub list-members in each region and verifies that all members have "
-            "MemberStatus: Enabled. PASS if all members have Enabled status."
-        )
+
+    check_id = "SRA-SECURITYHUB-09"
+    check_name = "All Security Hub member accounts have Enabled status"
+    account_type = "audit"  # This check is for the audit account
+    severity = "HIGH"
+    description = (
+        "This check verifies whether each Security Hub member account has member status Enabled. "
+        "Enabled status indicates that the member account is currently active. For manually invited "
+        "member accounts, it indicates that the member account accepted the invitation."
+    )
+    check_logic = (
+        "Check runs aws securityhub list-members in each region and verifies that all members have "
+        "MemberStatus: Enabled. PASS if all members have Enabled status."
+    )
+
+    data_requirements = ("get_security_hub_members",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,23 +8,22 @@ from sraverify.core.logging import logger
 
 class SRA_SECURITYHUB_10(SecurityHubCheck):
     """Check if Security Hub auto-enable is configured for new member accounts."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-SECURITYHUB-10"
-        self.check_name = "Security Hub auto-enable is configured"
-        self.account_type = "audit"  # This check is for the audit account
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies whether Security Hub is configured to be automatically enabled "
-            "for new member accounts when they join the organization."
-        )
-        self.check_logic = (
-            "Check evaluates Security Hub organization configuration. For central configuration, "
-            "PASS if ConfigurationType is CENTRAL (uses configuration policies). For local configuration, "
-            "PASS if AutoEnable is true."
-        )
+
+    check_id = "SRA-SECURITYHUB-10"
+    check_name = "Security Hub auto-enable is configured"
+    account_type = "audit"  # This check is for the audit account
+    severity = "MEDIUM"
+    description = (
+        "This check verifies whether Security Hub is configured to be automatically enabled "
+        "for new member accounts when they join the organization."
+    )
+    check_logic = (
+        "Check evaluates Security Hub organization configuration. For central configuration, "
+        "PASS if ConfigurationType is CENTRAL (uses configuration policies). For local configuration, "
+        "PASS if AutoEnable is true."
+    )
+
+    data_requirements = ("get_organization_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,22 +8,21 @@ from sraverify.core.logging import logger
 
 class SRA_SECURITYHUB_11(SecurityHubCheck):
     """Check if Security Hub member account limit has not been reached."""
-    
-    def __init__(self):
-        """Initialize the check."""
-        super().__init__()
-        self.check_id = "SRA-SECURITYHUB-11"
-        self.check_name = "Security Hub member account limit not reached"
-        self.account_type = "audit"  # This check is for the audit account
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether the maximum number of allowed member accounts are already associated "
-            "with the delegated administrator account for the AWS Organization."
-        )
-        self.check_logic = (
-            "Check evaluates if Security Hub describe-organization-configuration returns \"MemberAccountLimitReached\": false. "
-            "PASS if MemberAccountLimitReached is false."
-        )
+
+    check_id = "SRA-SECURITYHUB-11"
+    check_name = "Security Hub member account limit not reached"
+    account_type = "audit"  # This check is for the audit account
+    severity = "HIGH"
+    description = (
+        "This check verifies whether the maximum number of allowed member accounts are already associated "
+        "with the delegated administrator account for the AWS Organization."
+    )
+    check_logic = (
+        "Check evaluates if Security Hub describe-organization-configuration returns \"MemberAccountLimitReached\": false. "
+        "PASS if MemberAccountLimitReached is false."
+    )
+
+    data_requirements = ("get_organization_configuration",)
     
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -4,11 +4,14 @@ SecurityHub client for interacting with AWS SecurityHub service.
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 
 class SecurityHubClient:
     """Client for interacting with AWS SecurityHub service."""
+    client = lazy_client('securityhub')
+    org_client = lazy_client('organizations')
     
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,8 +23,6 @@ class SecurityHubClient:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('securityhub', region_name=region)
-        self.org_client = self.session.client('organizations', region_name=region)
 
     def get_enabled_standards(self) -> List[Dict[str, Any]]:
         """
@@ -221,29 +222,3 @@ class SecurityHubClient:
         except Exception as e:
             logger.error(f"Unexpected error listing Security Hub members in {self.region}: {e}")
             return []
-    
-    def list_organization_accounts(self) -> List[Dict[str, Any]]:
-        """
-        List all accounts in the organization.
-        
-        Returns:
-            List of organization accounts
-        """
-        try:
-            logger.debug(f"Listing organization accounts in {self.region}")
-            response = self.org_client.list_accounts()
-            accounts = response.get('Accounts', [])
-            
-            # Handle pagination
-            while response.get('NextToken'):
-                response = self.org_client.list_accounts(NextToken=response['NextToken'])
-                accounts.extend(response.get('Accounts', []))
-                
-            logger.debug(f"Found {len(accounts)} organization accounts")
-            return accounts
-        except ClientError as e:
-            logger.error(f"Error listing organization accounts: {e}")
-            return []
-        except Exception as e:
-            logger.error(f"Unexpected error listing organization accounts: {e}")
-            return []
@@ -4,12 +4,9 @@ from sraverify.services.securityincidentresponse.client import SecurityIncidentR
 from sraverify.core.logging import logger
 
 class SecurityIncidentResponseCheck(SecurityCheck):
-    def __init__(self):
-        super().__init__(
-            account_type="management",
-            service="SecurityIncidentResponse",
-            resource_type="AWS::Organizations::DelegatedAdministrator"
-        )
+    account_type = "management"
+    service = "SecurityIncidentResponse"
+    resource_type = "AWS::Organizations::DelegatedAdministrator"
 
     def _setup_clients(self):
         self._clients.clear()
@@ -52,18 +49,13 @@ class SecurityIncidentResponseCheck(SecurityCheck):
         return client.batch_get_member_account_details(membership_id, account_ids)
 
     def get_organization_accounts(self) -> list:
-        """Get all accounts in the organization."""
-        region = self.regions[0] if self.regions else "us-east-1"
-        client = self.get_client(region)
-        if not client:
+        """Get all accounts in the organization from the shared organization directory."""
+        try:
+            return self.org_directory.accounts
+        except Exception as e:
+            logger.error(f"Error listing organization accounts: {e}")
             return []
 
-        response = client.list_accounts()
-        if "Error" in response:
-            return []
-
-        return response.get("Accounts", [])
-
     def get_role(self, role_name: str) -> Dict[str, Any]:
         """Get IAM role details."""
         region = self.regions[0] if self.regions else "us-east-1"
@@ -2,13 +2,11 @@ from typing import Dict, List, Any
 from sraverify.services.securityincidentresponse.base import SecurityIncidentResponseCheck
 
 class SRA_SECURITYINCIDENTRESPONSE_01(SecurityIncidentResponseCheck):
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-SECURITYINCIDENTRESPONSE-01"
-        self.check_name = "Security Incident Response delegated admin is audit account"
-        self.description = "Verifies that the Security Incident Response delegated administrator is configured and is the audit account"
-        self.severity = "HIGH"
-        self.check_logic = "Lists delegated administrators for security-ir.amazonaws.com and verifies the audit account is designated"
+    check_id = "SRA-SECURITYINCIDENTRESPONSE-01"
+    check_name = "Security Incident Response delegated admin is audit account"
+    description = "Verifies that the Security Incident Response delegated administrator is configured and is the audit account"
+    severity = "HIGH"
+    check_logic = "Lists delegated administrators for security-ir.amazonaws.com and verifies the audit account is designated"
 
     def execute(self) -> List[Dict[str, Any]]:
         region = self.regions[0] if self.regions else "us-east-1"
@@ -2,14 +2,12 @@ from typing import Dict, List, Any
 from sraverify.services.securityincidentresponse.base import SecurityIncidentResponseCheck
 
 class SRA_SECURITYINCIDENTRESPONSE_02(SecurityIncidentResponseCheck):
-    def __init__(self):
-        super().__init__()
-        self.account_type = "audit"
-        self.check_id = "SRA-SECURITYINCIDENTRESPONSE-02"
-        self.check_name = "Security Incident Response membership active"
-        self.description = "Verifies that Security Incident Response membership is active"
-        self.severity = "HIGH"
-        self.check_logic = "Lists memberships and verifies status is Active"
+    account_type = "audit"
+    check_id = "SRA-SECURITYINCIDENTRESPONSE-02"
+    check_name = "Security Incident Response membership active"
+    description = "Verifies that Security Incident Response membership is active"
+    severity = "HIGH"
+    check_logic = "Lists memberships and verifies status is Active"
 
     def execute(self) -> List[Dict[str, Any]]:
         region = self.regions[0] if self.regions else "us-east-1"
@@ -2,14 +2,12 @@ from typing import Dict, List, Any
 from sraverify.services.securityincidentresponse.base import SecurityIncidentResponseCheck
 
 class SRA_SECURITYINCIDENTRESPONSE_03(SecurityIncidentResponseCheck):
-    def __init__(self):
-        super().__init__()
-        self.account_type = "audit"
-        self.check_id = "SRA-SECURITYINCIDENTRESPONSE-03"
-        self.check_name = "Security Incident Response proactive response enabled"
-        self.description = "Verifies that Security Incident Response proactive response (Triage) feature is enabled"
-        self.severity = "MEDIUM"
-        self.check_logic = "Lists memberships and checks if Triage opt-in feature is enabled"
+    account_type = "audit"
+    check_id = "SRA-SECURITYINCIDENTRESPONSE-03"
+    check_name = "Security Incident Response proactive response enabled"
+    description = "Verifies that Security Incident Response proactive response (Triage) feature is enabled"
+    severity = "MEDIUM"
+    check_logic = "Lists memberships and checks if Triage opt-in feature is enabled"
 
     def execute(self) -> List[Dict[str, Any]]:
         # Discover the region where Security Incident Response is configured
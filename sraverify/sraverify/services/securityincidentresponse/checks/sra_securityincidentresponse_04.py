@@ -2,22 +2,20 @@ from typing import Dict, List, Any
 from sraverify.services.securityincidentresponse.base import SecurityIncidentResponseCheck
 
 class SRA_SECURITYINCIDENTRESPONSE_04(SecurityIncidentResponseCheck):
-    def __init__(self):
-        super().__init__()
-        self.account_type = "audit"
-        self.check_id = "SRA-SECURITYINCIDENTRESPONSE-04"
-        self.check_name = "Security Incident Response enabled for all organization accounts"
-        self.description = "Verifies that all active organization accounts are covered by Security Incident Response"
-        self.severity = "HIGH"
-        self.check_logic = "Gets all organization accounts and checks if each is associated with Security Incident Response membership"
+    account_type = "audit"
+    check_id = "SRA-SECURITYINCIDENTRESPONSE-04"
+    check_name = "Security Incident Response enabled for all organization accounts"
+    description = "Verifies that all active organization accounts are covered by Security Incident Response"
+    severity = "HIGH"
+    check_logic = "Gets all organization accounts and checks if each is associated with Security Incident Response membership"
 
     def execute(self) -> List[Dict[str, Any]]:
         # Discover the region where Security Incident Response is configured
         region = self.discover_sir_region()
         
-        # Get all organization accounts
-        org_accounts = self.get_organization_accounts()
-        if not org_accounts:
+        # Get the IDs of all active organization accounts
+        active_account_ids = self.get_active_account_ids()
+        if not active_account_ids:
             self.findings.append(self.create_finding(
                 status="ERROR",
                 region=region,
@@ -55,9 +53,8 @@ class SRA_SECURITYINCIDENTRESPONSE_04(SecurityIncidentResponseCheck):
         # Use first active membership
         membership_id = active_memberships[0].get("membershipId")
         
-        # Get active organization accounts
-        active_accounts = [acc for acc in org_accounts if acc.get("Status") == "ACTIVE"]
-        account_ids = [acc.get("Id") for acc in active_accounts]
+        # Sorted, so the batches are the same in every run
+        account_ids = sorted(active_account_ids)
         
         # Process accounts in batches of 100 (API limit)
         batch_size = 100
@@ -2,14 +2,12 @@ from typing import Dict, List, Any
 from sraverify.services.securityincidentresponse.base import SecurityIncidentResponseCheck
 
 class SRA_SECURITYINCIDENTRESPONSE_05(SecurityIncidentResponseCheck):
-    def __init__(self):
-        super().__init__()
-        self.account_type = "application"
-        self.check_id = "SRA-SECURITYINCIDENTRESPONSE-05"
-        self.check_name = "Security Incident Response triage service linked role exists"
-        self.description = "Verifies that the AWSServiceRoleForSecurityIncidentResponse_Triage service linked role exists"
-        self.severity = "MEDIUM"
-        self.check_logic = "Checks if the AWSServiceRoleForSecurityIncidentResponse_Triage IAM role exists in the account"
+    account_type = "application"
+    check_id = "SRA-SECURITYINCIDENTRESPONSE-05"
+    check_name = "Security Incident Response triage service linked role exists"
+    description = "Verifies that the AWSServiceRoleForSecurityIncidentResponse_Triage service linked role exists"
+    severity = "MEDIUM"
+    check_logic = "Checks if the AWSServiceRoleForSecurityIncidentResponse_Triage IAM role exists in the account"
 
     def execute(self) -> List[Dict[str, Any]]:
         region = "global"  # IAM is global
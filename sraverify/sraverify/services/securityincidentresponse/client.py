@@ -1,15 +1,17 @@
 from typing import Dict, Optional, Any, List
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 class SecurityIncidentResponseClient:
+    org_client = lazy_client('organizations')
+    sir_client = lazy_client('security-ir')
+    iam_client = lazy_client('iam')
+
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         self.region = region
         self.session = session or boto3.Session()
-        self.org_client = self.session.client('organizations', region_name=region)
-        self.sir_client = self.session.client('security-ir', region_name=region)
-        self.iam_client = self.session.client('iam', region_name=region)
 
     def list_delegated_administrators(self, service_principal: str = "security-ir.amazonaws.com") -> Dict[str, Any]:
         """List delegated administrators for Security Incident Response service."""
@@ -52,15 +54,6 @@ class SecurityIncidentResponseClient:
             logger.error(f"Error getting member account details for membership {membership_id} in {self.region}: {e}")
             return {"Error": {"Code": e.response['Error']['Code'], "Message": e.response['Error']['Message']}}
 
-    def list_accounts(self) -> Dict[str, Any]:
-        """List all accounts in the organization."""
-        try:
-            response = self.org_client.list_accounts()
-            return response
-        except ClientError as e:
-            logger.error(f"Error listing organization accounts in {self.region}: {e}")
-            return {"Error": {"Code": e.response['Error']['Code'], "Message": e.response['Error']['Message']}}
-
     def get_role(self, role_name: str) -> Dict[str, Any]:
         """Get IAM role details."""
         try:
@@ -9,22 +9,13 @@ from sraverify.core.logging import logger
 class SecurityLakeCheck(SecurityCheck):
     """Security Lake service class with integrated check functionality."""
 
-    # Class-level caches shared across all instances
-    _subscribers_cache = {}
-    _security_lake_status_cache = {}
-    _organization_configuration_cache = {}
-    _delegated_admin_cache = {}
-    _organization_accounts_cache = {}
-    _log_sources_cache = {}
-    _sqs_encryption_cache = {}
+    account_type = "log-archive"
+    service = "SecurityLake"
+    resource_type = "AWS::SecurityLake::SecurityLake"
 
     def __init__(self):
         """Initialize Security Lake service."""
-        super().__init__(
-            account_type="log-archive",
-            service="SecurityLake",
-            resource_type="AWS::SecurityLake::SecurityLake"
-        )
+        super().__init__()
         # Initialize log archive account attribute
         self._log_archive_accounts = None
 
@@ -67,10 +58,10 @@ class SecurityLakeCheck(SecurityCheck):
             return []
 
         # Check cache first
-        cache_key = f"{self.account_id}:{region}"
-        if cache_key in self.__class__._subscribers_cache:
-            logger.debug(f"Using cached subscribers for {cache_key}")
-            return self.__class__._subscribers_cache[cache_key]
+        cache = self.cache('securitylake.subscribers')
+        if region in cache:
+            logger.debug(f"Using cached subscribers for {region}")
+            return cache[region]
 
         client = self.get_client(region)
         if not client:
@@ -81,8 +72,8 @@ class SecurityLakeCheck(SecurityCheck):
             subscribers = client.list_subscribers()
 
             # Cache the results
-            self.__class__._subscribers_cache[cache_key] = subscribers
-            logger.debug(f"Cached {len(subscribers)} subscribers for {cache_key}")
+            cache[region] = subscribers
+            logger.debug(f"Cached {len(subscribers)} subscribers for {region}")
 
             return subscribers
         except Exception as e:
@@ -104,10 +95,10 @@ class SecurityLakeCheck(SecurityCheck):
             return False
 
         # Check cache first
-        cache_key = f"{self.account_id}:{region}"
-        if cache_key in self.__class__._security_lake_status_cache:
-            logger.debug(f"Using cached Security Lake status for {cache_key}")
-            return self.__class__._security_lake_status_cache[cache_key]
+        cache = self.cache('securitylake.status')
+        if region in cache:
+            logger.debug(f"Using cached Security Lake status for {region}")
+            return cache[region]
 
         client = self.get_client(region)
         if not client:
@@ -118,13 +109,13 @@ class SecurityLakeCheck(SecurityCheck):
             is_enabled = client.is_security_lake_enabled()
 
             # Cache the results
-            self.__class__._security_lake_status_cache[cache_key] = is_enabled
-            logger.debug(f"Cached Security Lake status for {cache_key}: {is_enabled}")
+            cache[region] = is_enabled
+            logger.debug(f"Cached Security Lake status for {region}: {is_enabled}")
 
             return is_enabled
         except Exception as e:
             logger.debug(f"Error checking Security Lake status in {region}: {e}")
-            self.__class__._security_lake_status_cache[cache_key] = False
+            cache[region] = False
             return False
 
     def get_organization_configuration(self, region: str) -> Dict[str, Any]:
@@ -142,10 +133,10 @@ class SecurityLakeCheck(SecurityCheck):
             return {}
 
         # Check cache first
-        cache_key = f"{self.account_id}:{region}"
-        if cache_key in self.__class__._organization_configuration_cache:
-            logger.debug(f"Using cached organization configuration for {cache_key}")
-            return self.__class__._organization_configuration_cache[cache_key]
+        cache = self.cache('securitylake.organization_configuration')
+        if region in cache:
+            logger.debug(f"Using cached organization configuration for {region}")
+            return cache[region]
 
         client = self.get_client(region)
         if not client:
@@ -156,13 +147,13 @@ class SecurityLakeCheck(SecurityCheck):
             org_config = client.get_organization_configuration()
 
             # Cache the results
-            self.__class__._organization_configuration_cache[cache_key] = org_config
-            logger.debug(f"Cached organization configuration for {cache_key}")
+            cache[region] = org_config
+            logger.debug(f"Cached organization configuration for {region}")
 
             return org_config
         except Exception as e:
             logger.debug(f"Error getting organization configuration in {region}: {e}")
-            self.__class__._organization_configuration_cache[cache_key] = {}
+            cache[region] = {}
             return {}
 
     def get_log_source_status(self, region: str, source_name: str) -> bool:
@@ -181,19 +172,19 @@ class SecurityLakeCheck(SecurityCheck):
             return False
 
         # Check cache first
-        cache_key = f"{self.account_id}:{region}"
-        if cache_key not in self.__class__._log_sources_cache:
+        cache = self.cache('securitylake.log_sources')
+        if region not in cache:
             client = self.get_client(region)
             if not client:
                 return False
 
             # Get log sources from client and cache them
             log_sources = client.list_log_sources()
-            self.__class__._log_sources_cache[cache_key] = log_sources
-            logger.debug(f"Cached {len(log_sources)} log source entries for {cache_key}")
+            cache[region] = log_sources
+            logger.debug(f"Cached {len(log_sources)} log source entries for {region}")
         else:
-            log_sources = self.__class__._log_sources_cache[cache_key]
-            logger.debug(f"Using cached log sources for {cache_key}")
+            log_sources = cache[region]
+            logger.debug(f"Using cached log sources for {region}")
 
         # Navigate the nested structure to find the source
         # Structure: sources[].sources[].awsLogSource.sourceName
@@ -225,10 +216,10 @@ class SecurityLakeCheck(SecurityCheck):
             return []
 
         # Check cache first
-        cache_key = f"{self.account_id}:{region}"
-        if cache_key in self.__class__._delegated_admin_cache:
-            logger.debug(f"Using cached delegated administrators for {cache_key}")
-            return self.__class__._delegated_admin_cache[cache_key]
+        cache = self.cache('securitylake.delegated_admin')
+        if region in cache:
+            logger.debug(f"Using cached delegated administrators for {region}")
+            return cache[region]
 
         client = self.get_client(region)
         if not client:
@@ -239,8 +230,8 @@ class SecurityLakeCheck(SecurityCheck):
             delegated_admins = client.list_delegated_administrators()
 
             # Cache the results
-            self.__class__._delegated_admin_cache[cache_key] = delegated_admins
-            logger.debug(f"Cached {len(delegated_admins)} delegated administrators for {cache_key}")
+            cache[region] = delegated_admins
+            logger.debug(f"Cached {len(delegated_admins)} delegated administrators for {region}")
 
             return delegated_admins
         except Exception as e:
@@ -249,10 +240,10 @@ class SecurityLakeCheck(SecurityCheck):
 
     def get_organization_accounts(self, region: str) -> List[Dict[str, Any]]:
         """
-        Get all organization accounts with caching.
+        Get all organization accounts from the shared organization directory.
 
         Args:
-            region: AWS region name
+            region: AWS region name (accounts are the same in every region)
 
         Returns:
             List of organization accounts
@@ -261,29 +252,12 @@ class SecurityLakeCheck(SecurityCheck):
             logger.debug("Could not determine account ID")
             return []
 
-        # Check cache first
-        cache_key = f"{self.account_id}:{region}"
-        if cache_key in self.__class__._organization_accounts_cache:
-            logger.debug(f"Using cached organization accounts for {cache_key}")
-            return self.__class__._organization_accounts_cache[cache_key]
-
-        client = self.get_client(region)
-        if not client:
-            return []
-
         try:
-            # Get organization accounts from client
-            accounts = client.list_organization_accounts()
-
-            # Cache the results
-            self.__class__._organization_accounts_cache[cache_key] = accounts
-            logger.debug(f"Cached {len(accounts)} organization accounts for {cache_key}")
-
-            return accounts
+            return self.org_directory.accounts
         except Exception as e:
             logger.debug(f"Error getting organization accounts in {region}: {e}")
             return []
-            
+
     def get_sqs_queue_encryption(self, region: str, queue_url: str) -> Optional[str]:
         """
         Get SQS queue encryption key with caching.
@@ -295,25 +269,26 @@ class SecurityLakeCheck(SecurityCheck):
         Returns:
             KMS key ID or None if not encrypted/error
         """
-        cache_key = f"{self.account_id}:{region}:{queue_url}"
-        if cache_key in self.__class__._sqs_encryption_cache:
+        cache = self.cache('securitylake.sqs_encryption')
+        cache_key = (region, queue_url)
+        if cache_key in cache:
             logger.debug(f"Using cached SQS encryption for {queue_url}")
-            return self.__class__._sqs_encryption_cache[cache_key]
+            return cache[cache_key]
             
         client = self.get_client(region)
         if not client:
             logger.debug(f"No client available for region {region}")
-            self.__class__._sqs_encryption_cache[cache_key] = None
+            cache[cache_key] = None
             return None
             
         try:
             kms_key = client.get_sqs_queue_encryption(queue_url)
-            self.__class__._sqs_encryption_cache[cache_key] = kms_key
+            cache[cache_key] = kms_key
             logger.debug(f"SQS queue {queue_url} encryption: {kms_key}")
             return kms_key
         except Exception as e:
             logger.error(f"Error getting SQS encryption for {queue_url} in {region}: {e}")
-            self.__class__._sqs_encryption_cache[cache_key] = None
+            cache[cache_key] = None
             return None
 
     def get_data_lake_sources(self, region: str, account_id: str = None) -> List[Dict[str, Any]]:
@@ -327,22 +302,23 @@ class SecurityLakeCheck(SecurityCheck):
         Returns:
             List of data lake sources
         """
-        cache_key = f"{self.account_id}:{region}:data_lake_sources:{account_id or 'all'}"
-        if cache_key in self.__class__._log_sources_cache:
-            logger.debug(f"Using cached data lake sources for {cache_key}")
-            return self.__class__._log_sources_cache[cache_key]
+        cache = self.cache('securitylake.data_lake_sources')
+        cache_key = (region, account_id or 'all')
+        if cache_key in cache:
+            logger.debug(f"Using cached data lake sources for {region}")
+            return cache[cache_key]
             
         client = self.get_client(region)
         if not client:
             logger.debug(f"No client available for region {region}")
-            self.__class__._log_sources_cache[cache_key] = []
+            cache[cache_key] = []
             return []
             
         try:
             # Call with or without account_id based on parameter
             data_lake_sources = client.get_data_lake_sources(account_id)
-            self.__class__._log_sources_cache[cache_key] = data_lake_sources
-            logger.debug(f"Cached {len(data_lake_sources)} data lake sources for {cache_key}")
+            cache[cache_key] = data_lake_sources
+            logger.debug(f"Cached {len(data_lake_sources)} data lake sources for {region}")
             return data_lake_sources
         except Exception as e:
             # Use debug level for UnauthorizedException as it's expected when Security Lake isn't enabled
@@ -350,7 +326,7 @@ class SecurityLakeCheck(SecurityCheck):
                 logger.debug(f"Security Lake not enabled in {region}: {e}")
             else:
                 logger.error(f"Error getting data lake sources in {region}: {e}")
-            self.__class__._log_sources_cache[cache_key] = []
+            cache[cache_key] = []
             return []
 
     def get_enabled_regions(self) -> List[str]:
@@ -362,8 +338,9 @@ class SecurityLakeCheck(SecurityCheck):
         """
         enabled_regions = []
 
-        for region in self.regions:
-            if self.is_security_lake_enabled(region):
+        status_by_region = self.map_regions(self.is_security_lake_enabled)
+        for region, is_enabled in status_by_region.items():
+            if is_enabled:
                 logger.debug(f"Security Lake is enabled in {region}")
                 enabled_regions.append(region)
             else:
@@ -388,8 +365,9 @@ class SecurityLakeCheck(SecurityCheck):
             return False
 
         # Check cache first
-        cache_key = f"account_sources:{self.account_id}:{region}"
-        if cache_key not in self.__class__._log_sources_cache:
+        cache = self.cache('securitylake.data_lake_sources')
+        cache_key = (region, self.account_id)
+        if cache_key not in cache:
             client = self.get_client(region)
             if not client:
                 return False
@@ -397,11 +375,11 @@ class SecurityLakeCheck(SecurityCheck):
             # Get account-specific data lake sources and cache them
             # Pass the account ID as a string (not the full account object)
             data_lake_sources = client.get_data_lake_sources(self.account_id)
-            self.__class__._log_sources_cache[cache_key] = data_lake_sources
-            logger.debug(f"Cached {len(data_lake_sources)} account data lake sources for {cache_key}")
+            cache[cache_key] = data_lake_sources
+            logger.debug(f"Cached {len(data_lake_sources)} account data lake sources for {region}")
         else:
-            data_lake_sources = self.__class__._log_sources_cache[cache_key]
-            logger.debug(f"Using cached account data lake sources for {cache_key}")
+            data_lake_sources = cache[cache_key]
+            logger.debug(f"Using cached account data lake sources for {region}")
 
         # Check if the source is enabled for this account
         for source_entry in data_lake_sources:
@@ -431,8 +409,9 @@ class SecurityLakeCheck(SecurityCheck):
             return False
 
         # Check cache first
-        cache_key = f"list_sources:{target_account}:{region}"
-        if cache_key not in self.__class__._log_sources_cache:
+        cache = self.cache('securitylake.configured_log_sources')
+        cache_key = (region, target_account)
+        if cache_key not in cache:
             client = self.get_client(region)
             if not client:
                 return False
@@ -440,14 +419,14 @@ class SecurityLakeCheck(SecurityCheck):
             # Get configured log sources and cache them
             try:
                 log_sources = client.list_log_sources(regions=[region], accounts=[target_account])
-                self.__class__._log_sources_cache[cache_key] = log_sources
-                logger.debug(f"Cached log sources for {cache_key}")
+                cache[cache_key] = log_sources
+                logger.debug(f"Cached log sources for {region}")
             except Exception as e:
                 logger.error(f"Error listing log sources: {e}")
                 return False
         else:
-            log_sources = self.__class__._log_sources_cache[cache_key]
-            logger.debug(f"Using cached log sources for {cache_key}")
+            log_sources = cache[cache_key]
+            logger.debug(f"Using cached log sources for {region}")
 
         # Check if the source is configured with correct version
         for source_entry in log_sources:
@@ -8,30 +8,29 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_01(SecurityLakeCheck):
     """Check if Amazon Security Lake is enabled."""
 
-    def __init__(self):
-        """Initialize check."""
-        super().__init__()
-        self.account_type = "log-archive"  # Check all org accounts from delegated admin
-        self.check_id = "SRA-SECURITYLAKE-01"
-        self.check_name = "Security Lake is enabled for all organization accounts"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Amazon Security Lake is enabled for all active accounts in the organization. "
-            "Amazon Security Lake is a fully managed security data lake service that you "
-            "can use to automatically centralize security data from AWS environments, "
-            "SaaS providers, on premises, cloud sources, and third-party sources into a "
-            "purpose-built data lake that's stored in your AWS account. The data lake is "
-            "backed by Amazon S3 buckets, and you retain ownership over your data. You "
-            "must enable security lake in every AWS account and AWS region to collect "
-            "security logs and event from your entire AWS environment. "
-            "This check runs from the delegated administrator account "
-            "and validates configuration across all organization member accounts."
-        )
-        self.check_logic = (
-            "Checks if Security Lake is enabled for all active organization accounts by calling get_data_lake_sources API. "
-            "The check passes if Security Lake is enabled for all active accounts in the organization. "
-            "The check fails if any active account does not have Security Lake enabled."
-        )
+    account_type = "log-archive"  # Check all org accounts from delegated admin
+    check_id = "SRA-SECURITYLAKE-01"
+    check_name = "Security Lake is enabled for all organization accounts"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Amazon Security Lake is enabled for all active accounts in the organization. "
+        "Amazon Security Lake is a fully managed security data lake service that you "
+        "can use to automatically centralize security data from AWS environments, "
+        "SaaS providers, on premises, cloud sources, and third-party sources into a "
+        "purpose-built data lake that's stored in your AWS account. The data lake is "
+        "backed by Amazon S3 buckets, and you retain ownership over your data. You "
+        "must enable security lake in every AWS account and AWS region to collect "
+        "security logs and event from your entire AWS environment. "
+        "This check runs from the delegated administrator account "
+        "and validates configuration across all organization member accounts."
+    )
+    check_logic = (
+        "Checks if Security Lake is enabled for all active organization accounts by calling get_data_lake_sources API. "
+        "The check passes if Security Lake is enabled for all active accounts in the organization. "
+        "The check fails if any active account does not have Security Lake enabled."
+    )
+
+    data_requirements = ("get_organization_accounts", "get_data_lake_sources")
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -45,16 +44,10 @@ class SRA_SECURITYLAKE_01(SecurityLakeCheck):
             logger.debug(f"Checking if Security Lake is enabled for all organization accounts in {region}")
 
             # Get all organization accounts
-            org_accounts = self.get_organization_accounts(region)
-            if not org_accounts:
+            active_org_account_ids = self.get_active_account_ids()
+            if not active_org_account_ids:
                 logger.debug("No organization accounts found, checking current account only")
-                org_accounts = [{'Id': self.account_id, 'Status': 'ACTIVE'}]
-
-            # Create sets of active account IDs
-            active_org_account_ids = set()
-            for account in org_accounts:
-                if account.get('Status') == 'ACTIVE':
-                    active_org_account_ids.add(account.get('Id'))
+                active_org_account_ids = {self.account_id}
 
             # Get accounts with Security Lake enabled
             enabled_accounts = set()
@@ -8,26 +8,25 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_02(SecurityLakeCheck):
     """Check if Security Lake SQS queues are encrypted with CMK."""
 
-    def __init__(self):
-        """Initialize check."""
-        super().__init__()
-        self.check_id = "SRA-SECURITYLAKE-02"
-        self.check_name = "Security Lake SQS queues encrypted with CMK"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Security Lake manager SQS Queues within "
-            "delegated admin account is encrypted with a customer managed key from "
-            "AWS KMS. These SQS queues are used by AWS Lambda function for ETL job "
-            "and also by subscribers looking for new logs deposited into the data lake. "
-            "You must use a customer managed KMS key for the encryption as you have "
-            "greater control on the key usage and permission."
-        )
-        self.check_logic = (
-            "Gets all subscribers for Security Lake in the region. "
-            "For each subscriber with an SQS endpoint, checks if the queue is encrypted with a customer managed KMS key. "
-            "The check passes if all SQS queues are encrypted with customer managed keys (not AWS managed keys). "
-            "The check fails if any SQS queue is not encrypted or uses an AWS managed key (alias/aws/*)."
-        )
+    check_id = "SRA-SECURITYLAKE-02"
+    check_name = "Security Lake SQS queues encrypted with CMK"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Security Lake manager SQS Queues within "
+        "delegated admin account is encrypted with a customer managed key from "
+        "AWS KMS. These SQS queues are used by AWS Lambda function for ETL job "
+        "and also by subscribers looking for new logs deposited into the data lake. "
+        "You must use a customer managed KMS key for the encryption as you have "
+        "greater control on the key usage and permission."
+    )
+    check_logic = (
+        "Gets all subscribers for Security Lake in the region. "
+        "For each subscriber with an SQS endpoint, checks if the queue is encrypted with a customer managed KMS key. "
+        "The check passes if all SQS queues are encrypted with customer managed keys (not AWS managed keys). "
+        "The check fails if any SQS queue is not encrypted or uses an AWS managed key (alias/aws/*)."
+    )
+
+    data_requirements = ("get_subscribers",)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
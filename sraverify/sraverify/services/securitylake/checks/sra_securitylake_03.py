@@ -8,24 +8,23 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_03(SecurityLakeCheck):
     """Check if Security Lake SQS DLQ is encrypted with CMK."""
 
-    def __init__(self):
-        """Initialize check."""
-        super().__init__()
-        self.check_id = "SRA-SECURITYLAKE-03"
-        self.check_name = "Security Lake DLQ encrypted with CMK"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Security Lake SQS DLQ is encrypted in this "
-            "region with a customer managed key from AWS KMS. You must use a customer "
-            "managed KMS key for the encryption as you have greater control on the key "
-            "usage and permission."
-        )
-        self.check_logic = (
-            "Gets all subscribers for Security Lake in the region. "
-            "For each subscriber with a DLQ endpoint, checks if the queue is encrypted with a customer managed KMS key. "
-            "The check passes if all DLQ queues are encrypted with customer managed keys (not AWS managed keys). "
-            "The check fails if any DLQ queue is not encrypted or uses an AWS managed key (alias/aws/*)."
-        )
+    check_id = "SRA-SECURITYLAKE-03"
+    check_name = "Security Lake DLQ encrypted with CMK"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Security Lake SQS DLQ is encrypted in this "
+        "region with a customer managed key from AWS KMS. You must use a customer "
+        "managed KMS key for the encryption as you have greater control on the key "
+        "usage and permission."
+    )
+    check_logic = (
+        "Gets all subscribers for Security Lake in the region. "
+        "For each subscriber with a DLQ endpoint, checks if the queue is encrypted with a customer managed KMS key. "
+        "The check passes if all DLQ queues are encrypted with customer managed keys (not AWS managed keys). "
+        "The check fails if any DLQ queue is not encrypted or uses an AWS managed key (alias/aws/*)."
+    )
+
+    data_requirements = ("get_subscribers",)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
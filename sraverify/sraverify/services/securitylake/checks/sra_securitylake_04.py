@@ -8,23 +8,22 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_04(SecurityLakeCheck):
     """Check if Security Lake organization configuration is enabled."""
 
-    def __init__(self):
-        """Initialize check."""
-        super().__init__()
-        self.check_id = "SRA-SECURITYLAKE-04"
-        self.check_name = "Security Lake organization configuration enabled"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Amazon Security Lake has configuration that "
-            "will automatically enable new organization accounts as member accounts "
-            "from an Amazon Security Lake administrator account."
-        )
-        self.check_logic = (
-            "Gets the organization configuration for Security Lake in the region. "
-            "The check passes if organization configuration exists, indicating that "
-            "Security Lake is configured to automatically enable new organization accounts. "
-            "The check fails if no organization configuration is found."
-        )
+    check_id = "SRA-SECURITYLAKE-04"
+    check_name = "Security Lake organization configuration enabled"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Amazon Security Lake has configuration that "
+        "will automatically enable new organization accounts as member accounts "
+        "from an Amazon Security Lake administrator account."
+    )
+    check_logic = (
+        "Gets the organization configuration for Security Lake in the region. "
+        "The check passes if organization configuration exists, indicating that "
+        "Security Lake is configured to automatically enable new organization accounts. "
+        "The check fails if no organization configuration is found."
+    )
+
+    data_requirements = ("get_organization_configuration",)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
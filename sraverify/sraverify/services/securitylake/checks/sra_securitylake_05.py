@@ -8,6 +8,24 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_05(SecurityLakeCheck):
     """Check if Security Lake organization auto-enable configuration matches AWS defaults."""
 
+    account_type = "log-archive"  # Organization config managed by delegated admin
+    check_id = "SRA-SECURITYLAKE-05"
+    check_name = "Security Lake organization auto-enable matches AWS defaults"
+    severity = "MEDIUM"
+    description = (
+        "This check verifies whether Amazon Security Lake organization auto-enable "
+        "configuration matches AWS default/recommended log sources for new accounts "
+        "(CLOUD_TRAIL_MGMT, LAMBDA_EXECUTION, EKS_AUDIT, ROUTE53, SH_FINDINGS, VPC_FLOW). "
+        "S3_DATA and WAF are excluded as they are optional due to high volume."
+    )
+    check_logic = (
+        "Gets the organization configuration for Security Lake auto-enable settings. "
+        "The check passes if all AWS default log sources are configured for auto-enable. "
+        "The check fails if any default log sources are missing from auto-enable configuration."
+    )
+
+    data_requirements = ("get_organization_configuration",)
+
     # AWS default/recommended log sources for new accounts
     AWS_DEFAULT_LOG_SOURCES = {
         "CLOUD_TRAIL_MGMT",
@@ -18,25 +36,6 @@ class SRA_SECURITYLAKE_05(SecurityLakeCheck):
         "VPC_FLOW"
     }
 
-    def __init__(self):
-        """Initialize check."""
-        super().__init__()
-        self.account_type = "log-archive"  # Organization config managed by delegated admin
-        self.check_id = "SRA-SECURITYLAKE-05"
-        self.check_name = "Security Lake organization auto-enable matches AWS defaults"
-        self.severity = "MEDIUM"
-        self.description = (
-            "This check verifies whether Amazon Security Lake organization auto-enable "
-            "configuration matches AWS default/recommended log sources for new accounts "
-            "(CLOUD_TRAIL_MGMT, LAMBDA_EXECUTION, EKS_AUDIT, ROUTE53, SH_FINDINGS, VPC_FLOW). "
-            "S3_DATA and WAF are excluded as they are optional due to high volume."
-        )
-        self.check_logic = (
-            "Gets the organization configuration for Security Lake auto-enable settings. "
-            "The check passes if all AWS default log sources are configured for auto-enable. "
-            "The check fails if any default log sources are missing from auto-enable configuration."
-        )
-
     def execute(self) -> List[Dict[str, Any]]:
         """
         Execute the check.
@@ -8,26 +8,25 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_06(SecurityLakeCheck):
     """Check if Route 53 log source is enabled for Security Lake."""
 
-    def __init__(self):
-        """Initialize check."""
-        super().__init__()
-        self.account_type = "log-archive"  # Check from log archive account
-        self.check_id = "SRA-SECURITYLAKE-06"
-        self.check_name = "Security Lake Route 53 log source enabled with version 2.0 for all organization accounts"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Amazon Security Lake is configured with "
-            "Route 53 log and event source version 2.0 for all active accounts in the organization. "
-            "Route 53 resolver query logs track DNS queries made by resources within Amazon VPC. "
-            "Security Lake collects resolver query logs directly from Route 53 through an independent "
-            "and duplicated stream of events. This check runs from the delegated administrator account "
-            "and validates configuration across all organization member accounts."
-        )
-        self.check_logic = (
-            "Checks if the Route 53 log source is enabled in Security Lake with version 2.0. "
-            "The check passes if the ROUTE53 log source is configured. "
-            "The check fails if the ROUTE53 log source is not configured."
-        )
+    account_type = "log-archive"  # Check from log archive account
+    check_id = "SRA-SECURITYLAKE-06"
+    check_name = "Security Lake Route 53 log source enabled with version 2.0 for all organization accounts"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Amazon Security Lake is configured with "
+        "Route 53 log and event source version 2.0 for all active accounts in the organization. "
+        "Route 53 resolver query logs track DNS queries made by resources within Amazon VPC. "
+        "Security Lake collects resolver query logs directly from Route 53 through an independent "
+        "and duplicated stream of events. This check runs from the delegated administrator account "
+        "and validates configuration across all organization member accounts."
+    )
+    check_logic = (
+        "Checks if the Route 53 log source is enabled in Security Lake with version 2.0. "
+        "The check passes if the ROUTE53 log source is configured. "
+        "The check fails if the ROUTE53 log source is not configured."
+    )
+
+    data_requirements = ("get_organization_accounts",)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -40,16 +39,10 @@ class SRA_SECURITYLAKE_06(SecurityLakeCheck):
             logger.debug(f"Checking if Route 53 log source is enabled in {region}")
 
             # Get all organization accounts to check
-            org_accounts = self.get_organization_accounts(region)
-            if not org_accounts:
+            active_org_account_ids = self.get_active_account_ids()
+            if not active_org_account_ids:
                 logger.warning("No organization accounts found")
-                org_accounts = [self.account_id]  # Fall back to current account
-
-            # Create sets of active account IDs
-            active_org_account_ids = set()
-            for account in org_accounts:
-                if account.get('Status') == 'ACTIVE':
-                    active_org_account_ids.add(account.get('Id'))
+                active_org_account_ids = {self.account_id}
 
             # Check each account in the organization
             for account_id in active_org_account_ids:
@@ -8,29 +8,28 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_07(SecurityLakeCheck):
     """Check if CloudTrail S3 data events are enabled for Security Lake."""
 
-    def __init__(self):
-        """Initialize check."""
-        super().__init__()
-        self.account_type = "log-archive"  # Check all org accounts from delegated admin
-        self.check_id = "SRA-SECURITYLAKE-07"
-        self.check_name = "Security Lake CloudTrail S3 data events enabled with version 2.0 for all organization accounts"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Amazon Security Lake is configured with "
-            "CloudTrail data event for S3 log and event source version 2.0 for all active accounts in the organization. "
-            "CloudTrail data events, also known as data plane operations, show "
-            "the resource operations performed on or within resources in your AWS "
-            "account. These operations are often high-volume activities and should "
-            "be enabled as per your requirement. Security Lake pulls data directly "
-            "from S3 through an independent and duplicated stream of events. "
-            "This check runs from the delegated administrator account "
-            "and validates configuration across all organization member accounts."
-        )
-        self.check_logic = (
-            "Checks if the CloudTrail S3 data events log source version 2.0 is enabled in Security Lake "
-            "for all active organization accounts. The check passes if the S3_DATA log source version 2.0 is enabled. "
-            "The check fails if the S3_DATA log source is not enabled or configured with version 1.0."
-        )
+    account_type = "log-archive"  # Check all org accounts from delegated admin
+    check_id = "SRA-SECURITYLAKE-07"
+    check_name = "Security Lake CloudTrail S3 data events enabled with version 2.0 for all organization accounts"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Amazon Security Lake is configured with "
+        "CloudTrail data event for S3 log and event source version 2.0 for all active accounts in the organization. "
+        "CloudTrail data events, also known as data plane operations, show "
+        "the resource operations performed on or within resources in your AWS "
+        "account. These operations are often high-volume activities and should "
+        "be enabled as per your requirement. Security Lake pulls data directly "
+        "from S3 through an independent and duplicated stream of events. "
+        "This check runs from the delegated administrator account "
+        "and validates configuration across all organization member accounts."
+    )
+    check_logic = (
+        "Checks if the CloudTrail S3 data events log source version 2.0 is enabled in Security Lake "
+        "for all active organization accounts. The check passes if the S3_DATA log source version 2.0 is enabled. "
+        "The check fails if the S3_DATA log source is not enabled or configured with version 1.0."
+    )
+
+    data_requirements = ("get_organization_accounts",)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -44,16 +43,10 @@ class SRA_SECURITYLAKE_07(SecurityLakeCheck):
             logger.debug(f"Checking if CloudTrail S3 data events are enabled in {region}")
 
             # Get all organization accounts
-            org_accounts = self.get_organization_accounts(region)
-            if not org_accounts:
+            active_org_account_ids = self.get_active_account_ids()
+            if not active_org_account_ids:
                 logger.debug("No organization accounts found, checking current account only")
-                org_accounts = [{'Id': self.account_id, 'Status': 'ACTIVE'}]
-
-            # Create sets of active account IDs
-            active_org_account_ids = set()
-            for account in org_accounts:
-                if account.get('Status') == 'ACTIVE':
-                    active_org_account_ids.add(account.get('Id'))
+                active_org_account_ids = {self.account_id}
 
             # Check each account in the organization
             for account_id in active_org_account_ids:
@@ -8,28 +8,27 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_09(SecurityLakeCheck):
     """Check if EKS Audit logs are enabled for Security Lake."""
 
-    def __init__(self):
-        """Initialize check."""
-        super().__init__()
-        self.account_type = "log-archive"  # Check all org accounts from delegated admin
-        self.check_id = "SRA-SECURITYLAKE-09"
-        self.check_name = "Security Lake EKS audit logs enabled with version 2.0 for all organization accounts"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Amazon Security Lake is configured with "
-            "EKS Audit log and event source version 2.0 for all active accounts in the organization. "
-            "EKS Audit Logs help you detect potentially suspicious activities in your EKS clusters within the "
-            "Amazon Elastic Kubernetes Service. Security Lake consumes EKS Audit "
-            "Log events directly from the Amazon EKS control plane logging feature "
-            "through an independent and duplicative stream of audit logs. "
-            "This check runs from the delegated administrator account "
-            "and validates configuration across all organization member accounts."
-        )
-        self.check_logic = (
-            "Checks if the EKS Audit logs source version 2.0 is enabled in Security Lake "
-            "for all active organization accounts. The check passes if the EKS_AUDIT log source version 2.0 is enabled. "
-            "The check fails if the EKS_AUDIT log source is not enabled or configured with version 1.0."
-        )
+    account_type = "log-archive"  # Check all org accounts from delegated admin
+    check_id = "SRA-SECURITYLAKE-09"
+    check_name = "Security Lake EKS audit logs enabled with version 2.0 for all organization accounts"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Amazon Security Lake is configured with "
+        "EKS Audit log and event source version 2.0 for all active accounts in the organization. "
+        "EKS Audit Logs help you detect potentially suspicious activities in your EKS clusters within the "
+        "Amazon Elastic Kubernetes Service. Security Lake consumes EKS Audit "
+        "Log events directly from the Amazon EKS control plane logging feature "
+        "through an independent and duplicative stream of audit logs. "
+        "This check runs from the delegated administrator account "
+        "and validates configuration across all organization member accounts."
+    )
+    check_logic = (
+        "Checks if the EKS Audit logs source version 2.0 is enabled in Security Lake "
+        "for all active organization accounts. The check passes if the EKS_AUDIT log source version 2.0 is enabled. "
+        "The check fails if the EKS_AUDIT log source is not enabled or configured with version 1.0."
+    )
+
+    data_requirements = ("get_organization_accounts",)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -43,16 +42,10 @@ class SRA_SECURITYLAKE_09(SecurityLakeCheck):
             logger.debug(f"Checking if EKS Audit logs are enabled in {region}")
 
             # Get all organization accounts
-            org_accounts = self.get_organization_accounts(region)
-            if not org_accounts:
+            active_org_account_ids = self.get_active_account_ids()
+            if not active_org_account_ids:
                 logger.debug("No organization accounts found, checking current account only")
-                org_accounts = [{'Id': self.account_id, 'Status': 'ACTIVE'}]
-
-            # Create sets of active account IDs
-            active_org_account_ids = set()
-            for account in org_accounts:
-                if account.get('Status') == 'ACTIVE':
-                    active_org_account_ids.add(account.get('Id'))
+                active_org_account_ids = {self.account_id}
 
             # Check each account in the organization
             for account_id in active_org_account_ids:
@@ -8,29 +8,28 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_11(SecurityLakeCheck):
     """Check if CloudTrail management logs are enabled for Security Lake."""
 
-    def __init__(self):
-        """Initialize check."""
-        super().__init__()
-        self.account_type = "log-archive"  # Check all org accounts from delegated admin
-        self.check_id = "SRA-SECURITYLAKE-11"
-        self.check_name = "Security Lake CloudTrail management logs enabled with version 2.0 for all organization accounts"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Amazon Security Lake is configured with "
-            "CloudTrail management log and event source version 2.0 for all active accounts in the organization. "
-            "CloudTrail management events, also known as control plane events, provide insight into management "
-            "operations that are performed on CloudTrail in your AWS account. To "
-            "collect CloudTrail management events in Security Lake, there must be at "
-            "least one CloudTrail multi-Region organization trail that collects read "
-            "and write CloudTrail management events. Logging must be enabled for the trail. "
-            "This check runs from the delegated administrator account "
-            "and validates configuration across all organization member accounts."
-        )
-        self.check_logic = (
-            "Checks if the CloudTrail management logs source version 2.0 is enabled in Security Lake "
-            "for all active organization accounts. The check passes if the CLOUD_TRAIL_MGMT log source version 2.0 is enabled. "
-            "The check fails if the CLOUD_TRAIL_MGMT log source is not enabled or configured with version 1.0."
-        )
+    account_type = "log-archive"  # Check all org accounts from delegated admin
+    check_id = "SRA-SECURITYLAKE-11"
+    check_name = "Security Lake CloudTrail management logs enabled with version 2.0 for all organization accounts"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Amazon Security Lake is configured with "
+        "CloudTrail management log and event source version 2.0 for all active accounts in the organization. "
+        "CloudTrail management events, also known as control plane events, provide insight into management "
+        "operations that are performed on CloudTrail in your AWS account. To "
+        "collect CloudTrail management events in Security Lake, there must be at "
+        "least one CloudTrail multi-Region organization trail that collects read "
+        "and write CloudTrail management events. Logging must be enabled for the trail. "
+        "This check runs from the delegated administrator account "
+        "and validates configuration across all organization member accounts."
+    )
+    check_logic = (
+        "Checks if the CloudTrail management logs source version 2.0 is enabled in Security Lake "
+        "for all active organization accounts. The check passes if the CLOUD_TRAIL_MGMT log source version 2.0 is enabled. "
+        "The check fails if the CLOUD_TRAIL_MGMT log source is not enabled or configured with version 1.0."
+    )
+
+    data_requirements = ("get_organization_accounts",)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -44,16 +43,10 @@ class SRA_SECURITYLAKE_11(SecurityLakeCheck):
             logger.debug(f"Checking if CloudTrail management logs are enabled in {region}")
 
             # Get all organization accounts
-            org_accounts = self.get_organization_accounts(region)
-            if not org_accounts:
+            active_org_account_ids = self.get_active_account_ids()
+            if not active_org_account_ids:
                 logger.debug("No organization accounts found, checking current account only")
-                org_accounts = [{'Id': self.account_id, 'Status': 'ACTIVE'}]
-
-            # Create sets of active account IDs
-            active_org_account_ids = set()
-            for account in org_accounts:
-                if account.get('Status') == 'ACTIVE':
-                    active_org_account_ids.add(account.get('Id'))
+                active_org_account_ids = {self.account_id}
 
             # Check each account in the organization
             for account_id in active_org_account_ids:
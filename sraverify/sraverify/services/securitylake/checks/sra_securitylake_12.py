@@ -8,29 +8,28 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_12(SecurityLakeCheck):
     """Check if WAF logs are enabled for Security Lake."""
 
-    def __init__(self):
-        """Initialize check."""
-        super().__init__()
-        self.account_type = "log-archive"  # Check all org accounts from delegated admin
-        self.check_id = "SRA-SECURITYLAKE-12"
-        self.check_name = "Security Lake WAF logs enabled with version 2.0 for all organization accounts"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether Amazon Security Lake is configured with "
-            "WAF log and event source version 2.0 for all active accounts in the organization. "
-            "AWS WAF is a web application firewall that "
-            "helps protect your web applications or APIs against common web exploits "
-            "and bots that may affect availability, compromise security, or consume "
-            "excessive resources. Security Lake collects WAF logs directly from "
-            "AWS WAF through an independent and duplicated stream of events. "
-            "This check runs from the delegated administrator account "
-            "and validates configuration across all organization member accounts."
-        )
-        self.check_logic = (
-            "Checks if the WAF logs source version 2.0 is enabled in Security Lake "
-            "for all active organization accounts. The check passes if the WAF log source version 2.0 is enabled. "
-            "The check fails if the WAF log source is not enabled or configured with version 1.0."
-        )
+    account_type = "log-archive"  # Check all org accounts from delegated admin
+    check_id = "SRA-SECURITYLAKE-12"
+    check_name = "Security Lake WAF logs enabled with version 2.0 for all organization accounts"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether Amazon Security Lake is configured with "
+        "WAF log and event source version 2.0 for all active accounts in the organization. "
+        "AWS WAF is a web application firewall that "
+        "helps protect your web applications or APIs against common web exploits "
+        "and bots that may affect availability, compromise security, or consume "
+        "excessive resources. Security Lake collects WAF logs directly from "
+        "AWS WAF through an independent and duplicated stream of events. "
+        "This check runs from the delegated administrator account "
+        "and validates configuration across all organization member accounts."
+    )
+    check_logic = (
+        "Checks if the WAF logs source version 2.0 is enabled in Security Lake "
+        "for all active organization accounts. The check passes if the WAF log source version 2.0 is enabled. "
+        "The check fails if the WAF log source is not enabled or configured with version 1.0."
+    )
+
+    data_requirements = ("get_organization_accounts",)
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -44,16 +43,10 @@ class SRA_SECURITYLAKE_12(SecurityLakeCheck):
             logger.debug(f"Checking if WAF logs are enabled in {region}")
 
             # Get all organization accounts
-            org_accounts = self.get_organization_accounts(region)
-            if not org_accounts:
+            active_org_account_ids = self.get_active_account_ids()
+            if not active_org_account_ids:
                 logger.debug("No organization accounts found, checking current account only")
-                org_accounts = [{'Id': self.account_id, 'Status': 'ACTIVE'}]
-
-            # Create sets of active account IDs
-            active_org_account_ids = set()
-            for account in org_accounts:
-                if account.get('Status') == 'ACTIVE':
-                    active_org_account_ids.add(account.get('Id'))
+                active_org_account_ids = {self.account_id}
 
             # Check each account in the organization
             for account_id in active_org_account_ids:
@@ -8,23 +8,20 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_14(SecurityLakeCheck):
     """Check if Security Lake has a delegated administrator."""
 
-    def __init__(self):
-        """Initialize check."""
-        super().__init__()
-        self.account_type = "management"  # Delegated admin check runs from management account
-        self.check_id = "SRA-SECURITYLAKE-14"
-        self.check_name = "Security Lake has delegated administrator"
-        self.severity = "CRITICAL"
-        self.description = (
-            "This check verifies whether Security Lake service administration for "
-            "the AWS Organization is delegated out from AWS Organization management "
-            "account to a member account."
-        )
-        self.check_logic = (
-            "Checks if Security Lake has a delegated administrator configured. "
-            "The check passes if at least one delegated administrator is found for the Security Lake service. "
-            "The check fails if no delegated administrator is configured."
-        )
+    account_type = "management"  # Delegated admin check runs from management account
+    check_id = "SRA-SECURITYLAKE-14"
+    check_name = "Security Lake has delegated administrator"
+    severity = "CRITICAL"
+    description = (
+        "This check verifies whether Security Lake service administration for "
+        "the AWS Organization is delegated out from AWS Organization management "
+        "account to a member account."
+    )
+    check_logic = (
+        "Checks if Security Lake has a delegated administrator configured. "
+        "The check passes if at least one delegated administrator is found for the Security Lake service. "
+        "The check fails if no delegated administrator is configured."
+    )
 
     def execute(self) -> List[Dict[str, Any]]:
         """Run check."""
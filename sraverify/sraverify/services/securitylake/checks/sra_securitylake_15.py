@@ -8,25 +8,26 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_15(SecurityLakeCheck):
     """Check if Security Lake delegated admin is Log Archive account."""
 
+    account_type = "management"  # Delegated admin check runs from management account
+    check_id = "SRA-SECURITYLAKE-15"
+    check_name = "Security Lake delegated admin is log archive account"
+    severity = "CRITICAL"
+    description = (
+        "This check verifies whether Security Lake delegated admin account "
+        "is the Log Archive account of your AWS organization. The Log Archive "
+        "account is dedicated to ingesting and archiving all security-related "
+        "logs and backups."
+    )
+    check_logic = (
+        "Checks if the Security Lake delegated administrator is the Log Archive account. "
+        "The check passes if the delegated administrator account ID matches the Log Archive account ID. "
+        "The check fails if there is no delegated administrator or if the delegated administrator "
+        "is not the Log Archive account."
+    )
+
     def __init__(self):
         """Initialize check."""
         super().__init__()
-        self.account_type = "management"  # Delegated admin check runs from management account
-        self.check_id = "SRA-SECURITYLAKE-15"
-        self.check_name = "Security Lake delegated admin is log archive account"
-        self.severity = "CRITICAL"
-        self.description = (
-            "This check verifies whether Security Lake delegated admin account "
-            "is the Log Archive account of your AWS organization. The Log Archive "
-            "account is dedicated to ingesting and archiving all security-related "
-            "logs and backups."
-        )
-        self.check_logic = (
-            "Checks if the Security Lake delegated administrator is the Log Archive account. "
-            "The check passes if the delegated administrator account ID matches the Log Archive account ID. "
-            "The check fails if there is no delegated administrator or if the delegated administrator "
-            "is not the Log Archive account."
-        )
         # Initialize log archive account attribute
         self._log_archive_accounts = None
 
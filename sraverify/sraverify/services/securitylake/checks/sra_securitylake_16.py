@@ -8,26 +8,29 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_16(SecurityLakeCheck):
     """Check if Audit account has query access."""
 
+    check_id = "SRA-SECURITYLAKE-16"
+    check_name = "Security Lake audit account has query access"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether the AWS Organization audit "
+        "account is set up as query access subscriber. These "
+        "subscribers directly query AWS Lake Formation tables in your S3 "
+        "bucket with services like Amazon Athena. Separation of log storage "
+        "(Log Archive account) and log access (audit account) "
+        "helps is separation of duties and helps in least privilege access."
+    )
+    check_logic = (
+        "Checks if the audit account is set up as a query access subscriber. "
+        "The check passes if there is at least one subscriber with type QUERY_ACCESS and "
+        "the account ID matches the audit account ID. "
+        "The check fails if no query access subscriber is found for the audit account."
+    )
+
+    data_requirements = ("get_subscribers",)
+
     def __init__(self):
         """Initialize check."""
         super().__init__()
-        self.check_id = "SRA-SECURITYLAKE-16"
-        self.check_name = "Security Lake audit account has query access"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether the AWS Organization audit "
-            "account is set up as query access subscriber. These "
-            "subscribers directly query AWS Lake Formation tables in your S3 "
-            "bucket with services like Amazon Athena. Separation of log storage "
-            "(Log Archive account) and log access (audit account) "
-            "helps is separation of duties and helps in least privilege access."
-        )
-        self.check_logic = (
-            "Checks if the audit account is set up as a query access subscriber. "
-            "The check passes if there is at least one subscriber with type QUERY_ACCESS and "
-            "the account ID matches the audit account ID. "
-            "The check fails if no query access subscriber is found for the audit account."
-        )
         self._audit_accounts = []
 
     def execute(self) -> List[Dict[str, Any]]:
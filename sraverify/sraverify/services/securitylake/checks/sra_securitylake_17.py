@@ -8,25 +8,28 @@ from sraverify.core.logging import logger
 class SRA_SECURITYLAKE_17(SecurityLakeCheck):
     """Check if Audit account has data access."""
 
+    check_id = "SRA-SECURITYLAKE-17"
+    check_name = "Security Lake audit account has data access"
+    severity = "HIGH"
+    description = (
+        "This check verifies whether the AWS Organization "
+        "Audit account is set up as data access subscriber. These "
+        "subscribers can directly access the S3 objects and receive "
+        "notifications of new objects through a subscription endpoint or "
+        "by polling an Amazon SQS queue."
+    )
+    check_logic = (
+        "Checks if the audit account is set up as a data access subscriber. "
+        "The check passes if there is at least one subscriber with type DATA_ACCESS and "
+        "the account ID matches the audit account ID. "
+        "The check fails if no data access subscriber is found for the audit account."
+    )
+
+    data_requirements = ("get_subscribers",)
+
     def __init__(self):
         """Initialize check."""
         super().__init__()
-        self.check_id = "SRA-SECURITYLAKE-17"
-        self.check_name = "Security Lake audit account has data access"
-        self.severity = "HIGH"
-        self.description = (
-            "This check verifies whether the AWS Organization "
-            "Audit account is set up as data access subscriber. These "
-            "subscribers can directly access the S3 objects and receive "
-            "notifications of new objects through a subscription endpoint or "
-            "by polling an Amazon SQS queue."
-        )
-        self.check_logic = (
-            "Checks if the audit account is set up as a data access subscriber. "
-            "The check passes if there is at least one subscriber with type DATA_ACCESS and "
-            "the account ID matches the audit account ID. "
-            "The check fails if no data access subscriber is found for the audit account."
-        )
         self._audit_accounts = []
 
     def execute(self) -> List[Dict[str, Any]]:
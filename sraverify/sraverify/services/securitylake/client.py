@@ -3,11 +3,14 @@
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import get_client, lazy_client
 from sraverify.core.logging import logger
 
 
 class SecurityLakeClient:
     """Client for interacting with AWS Security Lake service."""
+    client = lazy_client('securitylake')
+    org_client = lazy_client('organizations')
 
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -19,8 +22,6 @@ class SecurityLakeClient:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('securitylake', region_name=region)
-        self.org_client = self.session.client('organizations', region_name=region)
 
     def is_security_lake_enabled(self):
         """
@@ -178,7 +179,7 @@ class SecurityLakeClient:
             KMS key ID or None if error
         """
         try:
-            sqs = self.session.client('sqs', region_name=self.region)
+            sqs = get_client(self.session, 'sqs', self.region)
             response = sqs.get_queue_attributes(
                 QueueUrl=queue_url,
                 AttributeNames=["KmsMasterKeyId"]
@@ -188,28 +189,6 @@ class SecurityLakeClient:
             logger.error(f"Error getting SQS queue encryption for {queue_url}: {e}")
             return None
 
-    def list_organization_accounts(self) -> List[Dict[str, Any]]:
-        """
-        List all accounts in the organization.
-
-        Returns:
-            List of organization accounts or empty list if error
-        """
-        try:
-            response = self.org_client.list_accounts()
-            accounts = response.get('Accounts', [])
-
-            # Handle pagination
-            while response.get('NextToken'):
-                response = self.org_client.list_accounts(NextToken=response['NextToken'])
-                accounts.extend(response.get('Accounts', []))
-
-            logger.debug(f"Found {len(accounts)} organization accounts")
-            return accounts
-        except ClientError as e:
-            logger.error(f"Error listing organization accounts: {e}")
-            return []
-
     def get_data_lake_sources(self, account_id: str = None):
         """
         Get data lake sources for a specific account.
@@ -1,26 +1,20 @@
 """
 Base class for Shield security checks.
 """
-from typing import Dict, Any
+from typing import Any, Dict, List
 from sraverify.core.check import SecurityCheck
+from sraverify.core.webacls import web_acl_for_resource
 from sraverify.services.shield.client import ShieldClient
 from sraverify.core.logging import logger
 
 
 class ShieldCheck(SecurityCheck):
     """Base class for all Shield security checks."""
-    
-    # Class-level cache shared across all instances
-    _subscription_cache = {}
-    
-    def __init__(self):
-        """Initialize Shield base check."""
-        super().__init__(
-            account_type="application",
-            service="Shield",
-            resource_type="AWS::Shield::Subscription"
-        )
-    
+
+    account_type = "application"
+    service = "Shield"
+    resource_type = "AWS::Shield::Subscription"
+
     def _setup_clients(self):
         """Set up Shield clients for each region."""
         self._clients.clear()
@@ -28,6 +22,23 @@ class ShieldCheck(SecurityCheck):
             for region in self.regions:
                 self._clients[region] = ShieldClient(region, session=self.session)
     
+    def get_client(self, region: str) -> ShieldClient:
+        """
+        Get the Shield client for a region, creating it if needed.
+        
+        Shield is queried in us-east-1 and protected resources can be in any
+        region, so clients are not limited to the regions being checked.
+        
+        Args:
+            region: AWS region name
+            
+        Returns:
+            ShieldClient for the region
+        """
+        if region not in self._clients:
+            self._clients[region] = ShieldClient(region, session=self.session)
+        return self._clients[region]
+    
     def get_subscription_state(self, region: str) -> Dict[str, Any]:
         """
         Get Shield Advanced subscription state with caching.
@@ -38,10 +49,10 @@ class ShieldCheck(SecurityCheck):
         Returns:
             Dictionary containing subscription details or empty dict if not available
         """
-        cache_key = f"{self.session.region_name}:{region}"
-        if cache_key in ShieldCheck._subscription_cache:
+        cache = self.cache('shield.subscription')
+        if region in cache:
             logger.debug(f"Shield: Using cached subscription state for {region}")
-            return ShieldCheck._subscription_cache[cache_key]
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -51,7 +62,7 @@ class ShieldCheck(SecurityCheck):
         logger.debug(f"Shield: Fetching subscription state for {region}")
         subscription = client.get_subscription_state()
         
-        ShieldCheck._subscription_cache[cache_key] = subscription
+        cache[region] = subscription
         logger.debug(f"Shield: Cached subscription state for {region}")
         
         return subscription
@@ -66,10 +77,10 @@ class ShieldCheck(SecurityCheck):
         Returns:
             Dictionary containing subscription status or empty dict if not available
         """
-        cache_key = f"status:{self.session.region_name}:{region}"
-        if cache_key in ShieldCheck._subscription_cache:
+        cache = self.cache('shield.subscription_status')
+        if region in cache:
             logger.debug(f"Shield: Using cached subscription status for {region}")
-            return ShieldCheck._subscription_cache[cache_key]
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -79,7 +90,7 @@ class ShieldCheck(SecurityCheck):
         logger.debug(f"Shield: Fetching subscription status for {region}")
         status = client.get_subscription_status()
         
-        ShieldCheck._subscription_cache[cache_key] = status
+        cache[region] = status
         logger.debug(f"Shield: Cached subscription status for {region}")
         
         return status
@@ -95,23 +106,17 @@ class ShieldCheck(SecurityCheck):
         Returns:
             Dictionary containing protections list or empty dict if not available
         """
-        cache_key = f"protections:{self.session.region_name}:{region}:{resource_type or 'all'}"
-        if cache_key in ShieldCheck._subscription_cache:
-            logger.debug(f"Shield: Using cached protections for {region}")
-            return ShieldCheck._subscription_cache[cache_key]
-        
         client = self.get_client(region)
         if not client:
             logger.warning(f"Shield: No Shield client available for region {region}")
             return {}
         
-        logger.debug(f"Shield: Listing protections for {region}")
-        protections = client.list_protections(resource_type)
-        
-        ShieldCheck._subscription_cache[cache_key] = protections
-        logger.debug(f"Shield: Cached protections for {region}")
+        def fetch() -> Dict[str, Any]:
+            logger.debug(f"Shield: Listing protections for {region}")
+            return client.list_protections(resource_type)
         
-        return protections
+        # Most Shield checks read the protections; list them once even when checks run concurrently
+        return self.cached('shield.protections', (region, resource_type or 'all'), fetch)
     
     def describe_drt_access(self, region: str) -> Dict[str, Any]:
         """
@@ -123,10 +128,10 @@ class ShieldCheck(SecurityCheck):
         Returns:
             Dictionary containing DRT access details or empty dict if not available
         """
-        cache_key = f"drt_access:{self.session.region_name}:{region}"
-        if cache_key in ShieldCheck._subscription_cache:
+        cache = self.cache('shield.drt_access')
+        if region in cache:
             logger.debug(f"Shield: Using cached DRT access for {region}")
-            return ShieldCheck._subscription_cache[cache_key]
+            return cache[region]
         
         client = self.get_client(region)
         if not client:
@@ -136,7 +141,7 @@ class ShieldCheck(SecurityCheck):
         logger.debug(f"Shield: Describing DRT access for {region}")
         drt_access = client.describe_drt_access()
         
-        ShieldCheck._subscription_cache[cache_key] = drt_access
+        cache[region] = drt_access
         logger.debug(f"Shield: Cached DRT access for {region}")
         
         return drt_access
@@ -177,12 +182,16 @@ class ShieldCheck(SecurityCheck):
             return {}
         
         logger.debug(f"Shield: Getting web ACL for resource {resource_arn} in {region}")
-        return client.get_web_acl_for_resource(resource_arn)
+        # Looked up in the CloudFront distribution and regional association indexes shared with WAF checks
+        return web_acl_for_resource(self, region, resource_arn, client.get_web_acl_for_resource)
     
     def get_cloudwatch_alarms_for_resource(self, region: str, resource_arn: str) -> Dict[str, Any]:
         """
         Get CloudWatch alarms for Shield Advanced DDoS metrics for a resource.
         
+        Alarms are looked up in the region's alarm index; if the alarms cannot
+        be listed, the resource's alarms are queried directly instead.
+        
         Args:
             region: AWS region name
             resource_arn: ARN of the resource
@@ -195,5 +204,40 @@ class ShieldCheck(SecurityCheck):
             logger.warning(f"Shield: No Shield client available for region {region}")
             return {}
         
-        logger.debug(f"Shield: Getting CloudWatch alarms for resource {resource_arn} in {region}")
-        return client.get_cloudwatch_alarms_for_resource(resource_arn)
+        alarm_index = self.get_ddos_alarm_index(region)
+        if "Error" in alarm_index:
+            logger.debug(f"Shield: Getting CloudWatch alarms for resource {resource_arn} in {region}")
+            return client.get_cloudwatch_alarms_for_resource(resource_arn)
+        return {"DDoSDetectedAlarms": alarm_index["Alarms"].get(resource_arn, [])}
+    
+    def get_ddos_alarm_index(self, region: str) -> Dict[str, Any]:
+        """
+        Get the DDoSDetected CloudWatch alarms of a region, indexed by resource ARN.
+        
+        The alarms are listed once per account and region, so looking up the
+        alarms of each protected resource needs no further API calls. A failed
+        listing (e.g. without cloudwatch:DescribeAlarms permission) is kept too,
+        so lookups go straight to the per-resource call instead of retrying it.
+        
+        Args:
+            region: AWS region name
+            
+        Returns:
+            Dictionary with 'Alarms' mapping the ResourceArn dimension to a list of
+            metric alarms, or error information
+        """
+        client = self.get_client(region)
+        
+        def build() -> Dict[str, Any]:
+            logger.debug(f"Shield: Indexing DDoSDetected alarms in {region}")
+            response = client.list_ddos_detected_alarms()
+            if "Error" in response:
+                return response
+            alarms: Dict[str, List[Dict[str, Any]]] = {}
+            for alarm in response.get("MetricAlarms", []):
+                for dimension in alarm.get("Dimensions", []):
+                    if dimension.get("Name") == "ResourceArn":
+                        alarms.setdefault(dimension.get("Value"), []).append(alarm)
+            return {"Alarms": alarms}
+        
+        return self.cached('shield.ddos_alarms', region, build, cache_errors=True)
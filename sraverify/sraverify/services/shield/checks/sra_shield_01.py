@@ -8,16 +8,13 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_01(ShieldCheck):
     """Check if Shield Advanced is enabled."""
 
-    def __init__(self):
-        """Initialize Shield Advanced enabled check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-01"
-        self.check_name = "Shield Advanced is enabled"
-        self.description = ("This check verifies that AWS Shield Advanced is enabled. "
-                           "Shield Advanced provides enhanced DDoS protection for your AWS resources "
-                           "and includes 24/7 access to the AWS DDoS Response Team (DRT).")
-        self.severity = "HIGH"
-        self.check_logic = "Get Shield subscription state. Check fails if subscription is not active."
+    check_id = "SRA-SHIELD-01"
+    check_name = "Shield Advanced is enabled"
+    description = ("This check verifies that AWS Shield Advanced is enabled. "
+                  "Shield Advanced provides enhanced DDoS protection for your AWS resources "
+                  "and includes 24/7 access to the AWS DDoS Response Team (DRT).")
+    severity = "HIGH"
+    check_logic = "Get Shield subscription state. Check fails if subscription is not active."
 
     def execute(self) -> List[Dict[str, Any]]:
         """
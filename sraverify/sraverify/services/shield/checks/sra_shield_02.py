@@ -8,15 +8,12 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_02(ShieldCheck):
     """Check if Shield Advanced auto-renew is enabled."""
 
-    def __init__(self):
-        """Initialize Shield Advanced auto-renew check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-02"
-        self.check_name = "Shield Advanced auto-renew is enabled"
-        self.description = ("This check verifies that AWS Shield Advanced subscription "
-                           "has auto-renew enabled to ensure continuous protection.")
-        self.severity = "MEDIUM"
-        self.check_logic = "Get Shield subscription details. Check fails if auto-renew is disabled."
+    check_id = "SRA-SHIELD-02"
+    check_name = "Shield Advanced auto-renew is enabled"
+    description = ("This check verifies that AWS Shield Advanced subscription "
+                  "has auto-renew enabled to ensure continuous protection.")
+    severity = "MEDIUM"
+    check_logic = "Get Shield subscription details. Check fails if auto-renew is disabled."
 
     def execute(self) -> List[Dict[str, Any]]:
         """
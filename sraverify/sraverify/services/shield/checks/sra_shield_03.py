@@ -8,16 +8,13 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_03(ShieldCheck):
     """Check if Shield Advanced is configured for CloudFront distributions."""
 
-    def __init__(self):
-        """Initialize Shield Advanced CloudFront protection check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-03"
-        self.check_name = "Shield Advanced is configured for CloudFront distributions"
-        self.description = ("This check verifies that AWS Shield Advanced is protecting "
-                            "at least one CloudFront distribution.")
-        self.severity = "HIGH"
-        self.check_logic = ("List Shield protections filtered by CloudFront resource type. "
-                            "Check fails if no CloudFront distributions are protected.")
+    check_id = "SRA-SHIELD-03"
+    check_name = "Shield Advanced is configured for CloudFront distributions"
+    description = ("This check verifies that AWS Shield Advanced is protecting "
+                   "at least one CloudFront distribution.")
+    severity = "HIGH"
+    check_logic = ("List Shield protections filtered by CloudFront resource type. "
+                   "Check fails if no CloudFront distributions are protected.")
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,16 +8,13 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_04(ShieldCheck):
     """Check if Shield Advanced is configured for load balancers."""
 
-    def __init__(self):
-        """Initialize Shield Advanced load balancer protection check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-04"
-        self.check_name = "Shield Advanced is configured for load balancers"
-        self.description = ("This check verifies that AWS Shield Advanced is protecting "
-                            "at least one load balancer (Application or Classic Load Balancer).")
-        self.severity = "HIGH"
-        self.check_logic = ("List Shield protections and filter by load balancer ARNs. "
-                            "Check fails if no load balancers are protected.")
+    check_id = "SRA-SHIELD-04"
+    check_name = "Shield Advanced is configured for load balancers"
+    description = ("This check verifies that AWS Shield Advanced is protecting "
+                   "at least one load balancer (Application or Classic Load Balancer).")
+    severity = "HIGH"
+    check_logic = ("List Shield protections and filter by load balancer ARNs. "
+                   "Check fails if no load balancers are protected.")
 
     def execute(self) -> List[Dict[str, Any]]:
         """
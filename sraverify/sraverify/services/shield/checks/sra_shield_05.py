@@ -8,16 +8,13 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_05(ShieldCheck):
     """Check if Shield Advanced is configured for Elastic IP addresses."""
 
-    def __init__(self):
-        """Initialize Shield Advanced Elastic IP protection check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-05"
-        self.check_name = "Shield Advanced is configured for Elastic IP addresses"
-        self.description = ("This check verifies that AWS Shield Advanced is protecting "
-                            "at least one Elastic IP address.")
-        self.severity = "HIGH"
-        self.check_logic = ("List Shield protections and filter by Elastic IP ARNs. "
-                            "Check fails if no Elastic IP addresses are protected.")
+    check_id = "SRA-SHIELD-05"
+    check_name = "Shield Advanced is configured for Elastic IP addresses"
+    description = ("This check verifies that AWS Shield Advanced is protecting "
+                   "at least one Elastic IP address.")
+    severity = "HIGH"
+    check_logic = ("List Shield protections and filter by Elastic IP ARNs. "
+                   "Check fails if no Elastic IP addresses are protected.")
 
     def execute(self) -> List[Dict[str, Any]]:
         """
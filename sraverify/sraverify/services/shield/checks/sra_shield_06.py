@@ -8,16 +8,13 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_06(ShieldCheck):
     """Check if Shield Advanced is configured for Route 53 hosted zones."""
 
-    def __init__(self):
-        """Initialize Shield Advanced Route 53 protection check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-06"
-        self.check_name = "Shield Advanced is configured for Route 53 hosted zones"
-        self.description = ("This check verifies that AWS Shield Advanced is protecting "
-                            "at least one Route 53 hosted zone.")
-        self.severity = "HIGH"
-        self.check_logic = ("List Shield protections and filter by Route 53 ARNs. "
-                            "Check fails if no Route 53 hosted zones are protected.")
+    check_id = "SRA-SHIELD-06"
+    check_name = "Shield Advanced is configured for Route 53 hosted zones"
+    description = ("This check verifies that AWS Shield Advanced is protecting "
+                   "at least one Route 53 hosted zone.")
+    severity = "HIGH"
+    check_logic = ("List Shield protections and filter by Route 53 ARNs. "
+                   "Check fails if no Route 53 hosted zones are protected.")
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,16 +8,13 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_07(ShieldCheck):
     """Check if Shield Advanced is configured for Global Accelerator."""
 
-    def __init__(self):
-        """Initialize Shield Advanced Global Accelerator protection check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-07"
-        self.check_name = "Shield Advanced is configured for Global Accelerator"
-        self.description = ("This check verifies that AWS Shield Advanced is protecting "
-                            "at least one Global Accelerator accelerator.")
-        self.severity = "HIGH"
-        self.check_logic = ("List Shield protections and filter by Global Accelerator ARNs. "
-                            "Check fails if no Global Accelerator accelerators are protected.")
+    check_id = "SRA-SHIELD-07"
+    check_name = "Shield Advanced is configured for Global Accelerator"
+    description = ("This check verifies that AWS Shield Advanced is protecting "
+                   "at least one Global Accelerator accelerator.")
+    severity = "HIGH"
+    check_logic = ("List Shield protections and filter by Global Accelerator ARNs. "
+                   "Check fails if no Global Accelerator accelerators are protected.")
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,15 +8,12 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_08(ShieldCheck):
     """Check if Shield Response Team (SRT) access is configured."""
 
-    def __init__(self):
-        """Initialize Shield Response Team access check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-08"
-        self.check_name = "Shield Response Team (SRT) access is configured"
-        self.description = ("This check verifies that AWS Shield Response Team (SRT) "
-                            "access is configured with an appropriate IAM role.")
-        self.severity = "MEDIUM"
-        self.check_logic = "Describe DRT access configuration. Check fails if no role ARN is configured."
+    check_id = "SRA-SHIELD-08"
+    check_name = "Shield Response Team (SRT) access is configured"
+    description = ("This check verifies that AWS Shield Response Team (SRT) "
+                   "access is configured with an appropriate IAM role.")
+    severity = "MEDIUM"
+    check_logic = "Describe DRT access configuration. Check fails if no role ARN is configured."
 
     def execute(self) -> List[Dict[str, Any]]:
         """
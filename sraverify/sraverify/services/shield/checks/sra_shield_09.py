@@ -8,16 +8,13 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_09(ShieldCheck):
     """Check if Shield Advanced proactive engagement is enabled."""
 
-    def __init__(self):
-        """Initialize Shield Advanced proactive engagement check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-09"
-        self.check_name = "Shield Advanced proactive engagement is enabled"
-        self.description = ("This check verifies that AWS Shield Advanced proactive engagement "
-                            "is enabled, allowing the Shield Response Team to contact you directly during attacks.")
-        self.severity = "MEDIUM"
-        self.check_logic = ("Get Shield subscription details and check ProactiveEngagementStatus. "
-                            "Check fails if proactive engagement is disabled.")
+    check_id = "SRA-SHIELD-09"
+    check_name = "Shield Advanced proactive engagement is enabled"
+    description = ("This check verifies that AWS Shield Advanced proactive engagement "
+                   "is enabled, allowing the Shield Response Team to contact you directly during attacks.")
+    severity = "MEDIUM"
+    check_logic = ("Get Shield subscription details and check ProactiveEngagementStatus. "
+                   "Check fails if proactive engagement is disabled.")
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,17 +8,14 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_10(ShieldCheck):
     """Check if health checks are configured for Shield Advanced protected resources."""
 
-    def __init__(self):
-        """Initialize Shield Advanced health checks check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-10"
-        self.check_name = "Health checks are configured for Shield Advanced protected resources"
-        self.description = ("This check verifies that Route 53 health checks are associated "
-                            "with Shield Advanced protected resources to enable health-based detection. "
-                            "Route 53 hosted zones are excluded as they don't support health-based detection.")
-        self.severity = "MEDIUM"
-        self.check_logic = ("List Shield protections and check HealthCheckIds field. "
-                            "Check fails if protected resources (excluding Route 53 hosted zones) lack health checks.")
+    check_id = "SRA-SHIELD-10"
+    check_name = "Health checks are configured for Shield Advanced protected resources"
+    description = ("This check verifies that Route 53 health checks are associated "
+                   "with Shield Advanced protected resources to enable health-based detection. "
+                   "Route 53 hosted zones are excluded as they don't support health-based detection.")
+    severity = "MEDIUM"
+    check_logic = ("List Shield protections and check HealthCheckIds field. "
+                   "Check fails if protected resources (excluding Route 53 hosted zones) lack health checks.")
 
     def execute(self) -> List[Dict[str, Any]]:
         """
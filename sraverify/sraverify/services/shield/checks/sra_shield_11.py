@@ -8,15 +8,12 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_11(ShieldCheck):
     """Check if Shield engagement Lambda function is configured."""
 
-    def __init__(self):
-        """Initialize Shield engagement Lambda function check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-11"
-        self.check_name = "Shield engagement Lambda function is configured"
-        self.description = ("This check verifies that a Lambda function named "
-                            "'AWS_Shield_Engagement_Lambda' exists to automate support case creation during DDoS events.")
-        self.severity = "MEDIUM"
-        self.check_logic = "Check for existence of Lambda function named 'AWS_Shield_Engagement_Lambda' in us-east-1."
+    check_id = "SRA-SHIELD-11"
+    check_name = "Shield engagement Lambda function is configured"
+    description = ("This check verifies that a Lambda function named "
+                   "'AWS_Shield_Engagement_Lambda' exists to automate support case creation during DDoS events.")
+    severity = "MEDIUM"
+    check_logic = "Check for existence of Lambda function named 'AWS_Shield_Engagement_Lambda' in us-east-1."
 
     def execute(self) -> List[Dict[str, Any]]:
         """
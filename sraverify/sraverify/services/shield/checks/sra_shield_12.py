@@ -8,17 +8,14 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_12(ShieldCheck):
     """Check if Shield Advanced protected resources have WAF web ACLs associated."""
 
-    def __init__(self):
-        """Initialize Shield Advanced WAF association check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-12"
-        self.check_name = "Shield Advanced protected resources have WAF web ACLs associated"
-        self.description = ("This check verifies that Shield Advanced protected resources "
-                            "that support WAF (CloudFront distributions and Application Load Balancers) "
-                            "have web ACLs associated for enhanced application layer protection.")
-        self.severity = "HIGH"
-        self.check_logic = ("List Shield protections and check WAF web ACL associations "
-                            "for CloudFront distributions and Application Load Balancers.")
+    check_id = "SRA-SHIELD-12"
+    check_name = "Shield Advanced protected resources have WAF web ACLs associated"
+    description = ("This check verifies that Shield Advanced protected resources "
+                   "that support WAF (CloudFront distributions and Application Load Balancers) "
+                   "have web ACLs associated for enhanced application layer protection.")
+    severity = "HIGH"
+    check_logic = ("List Shield protections and check WAF web ACL associations "
+                   "for CloudFront distributions and Application Load Balancers.")
 
     def execute(self) -> List[Dict[str, Any]]:
         """
@@ -8,17 +8,14 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_13(ShieldCheck):
     """Check if CloudWatch alarms exist for Shield Advanced protected CloudFront and Route53 resources."""
 
-    def __init__(self):
-        """Initialize Shield Advanced CloudWatch alarms check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-13"
-        self.check_name = "CloudWatch alarms exist for Shield Advanced protected CloudFront and Route53 resources"
-        self.description = ("This check verifies that CloudWatch alarms are configured for "
-                           "Shield Advanced protected CloudFront distributions and Route53 hosted zones "
-                           "to monitor DDoS detection metrics (DDoSDetected).")
-        self.severity = "MEDIUM"
-        self.check_logic = ("List Shield protections for CloudFront and Route53 resources, "
-                           "then check if CloudWatch alarms exist for DDoSDetected metric.")
+    check_id = "SRA-SHIELD-13"
+    check_name = "CloudWatch alarms exist for Shield Advanced protected CloudFront and Route53 resources"
+    description = ("This check verifies that CloudWatch alarms are configured for "
+                  "Shield Advanced protected CloudFront distributions and Route53 hosted zones "
+                  "to monitor DDoS detection metrics (DDoSDetected).")
+    severity = "MEDIUM"
+    check_logic = ("List Shield protections for CloudFront and Route53 resources, "
+                  "then check if CloudWatch alarms exist for DDoSDetected metric.")
 
     def execute(self) -> List[Dict[str, Any]]:
         """
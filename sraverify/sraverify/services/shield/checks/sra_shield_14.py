@@ -8,17 +8,14 @@ from sraverify.services.shield.base import ShieldCheck
 class SRA_SHIELD_14(ShieldCheck):
     """Check if Shield Advanced protected resources have automatic application layer DDoS mitigation enabled."""
 
-    def __init__(self):
-        """Initialize Shield Advanced automatic mitigation check."""
-        super().__init__()
-        self.check_id = "SRA-SHIELD-14"
-        self.check_name = "Shield Advanced protected resources have automatic application layer DDoS mitigation enabled"
-        self.description = ("This check verifies that Shield Advanced protected application layer resources "
-                           "(CloudFront distributions and Application Load Balancers) have automatic "
-                           "application layer DDoS mitigation enabled with Block action for effective protection.")
-        self.severity = "HIGH"
-        self.check_logic = ("List Shield protections and check ApplicationLayerAutomaticResponseConfiguration "
-                           "status and action for application layer resources.")
+    check_id = "SRA-SHIELD-14"
+    check_name = "Shield Advanced protected resources have automatic application layer DDoS mitigation enabled"
+    description = ("This check verifies that Shield Advanced protected application layer resources "
+                  "(CloudFront distributions and Application Load Balancers) have automatic "
+                  "application layer DDoS mitigation enabled with Block action for effective protection.")
+    severity = "HIGH"
+    check_logic = ("List Shield protections and check ApplicationLayerAutomaticResponseConfiguration "
+                  "status and action for application layer resources.")
 
     def execute(self) -> List[Dict[str, Any]]:
         """
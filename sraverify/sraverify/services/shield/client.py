@@ -4,11 +4,17 @@ Shield client for interacting with AWS Shield service.
 from typing import Dict, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 
 class ShieldClient:
     """Client for interacting with AWS Shield service."""
+    client = lazy_client('shield')
+    cloudfront_client = lazy_client('cloudfront', region_name='us-east-1')  # CloudFront is global
+    wafv2_client = lazy_client('wafv2')
+    lambda_client = lazy_client('lambda')
+    cloudwatch_client = lazy_client('cloudwatch')
     
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         """
@@ -20,7 +26,6 @@ class ShieldClient:
         """
         self.region = region
         self.session = session or boto3.Session()
-        self.client = self.session.client('shield', region_name=region)
     
     def get_subscription_state(self) -> Dict[str, Any]:
         """
@@ -77,7 +82,10 @@ class ShieldClient:
             if resource_type:
                 params['InclusionFilters'] = {'ResourceTypes': [resource_type]}
             
-            return self.client.list_protections(**params)
+            protections = []
+            for page in self.client.get_paginator('list_protections').paginate(**params):
+                protections.extend(page.get('Protections', []))
+            return {"Protections": protections}
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', '')
             error_message = str(e)
@@ -120,8 +128,7 @@ class ShieldClient:
             Dictionary containing function details or error information
         """
         try:
-            lambda_client = self.session.client('lambda', region_name=self.region)
-            return lambda_client.get_function(FunctionName=function_name)
+            return self.lambda_client.get_function(FunctionName=function_name)
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', '')
             error_message = str(e)
@@ -148,8 +155,7 @@ class ShieldClient:
             if "cloudfront" in resource_arn.lower():
                 # Extract distribution ID from ARN: arn:aws:cloudfront::account:distribution/ID
                 distribution_id = resource_arn.split("/")[-1]
-                cloudfront_client = self.session.client('cloudfront', region_name='us-east-1')
-                response = cloudfront_client.get_distribution_config(Id=distribution_id)
+                response = self.cloudfront_client.get_distribution_config(Id=distribution_id)
                 web_acl_id = response.get('DistributionConfig', {}).get('WebACLId', '')
                 
                 if web_acl_id:
@@ -158,8 +164,7 @@ class ShieldClient:
                     return {"Error": {"Code": "WAFNonexistentItemException", "Message": "No web ACL associated"}}
             else:
                 # For other resources, use WAFv2 API
-                wafv2_client = self.session.client('wafv2', region_name=self.region)
-                return wafv2_client.get_web_acl_for_resource(ResourceArn=resource_arn)
+                return self.wafv2_client.get_web_acl_for_resource(ResourceArn=resource_arn)
         except ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', '')
             error_message = str(e)
@@ -171,6 +176,39 @@ class ShieldClient:
                 }
             }
     
+    def list_ddos_detected_alarms(self) -> Dict[str, Any]:
+        """
+        List the CloudWatch alarms on the Shield Advanced DDoSDetected metric in the region.
+        
+        Returns:
+            Dictionary containing the DDoSDetected metric alarms or error information
+        """
+        try:
+            # DescribeAlarmsForMetric without dimensions only matches alarms without
+            # dimensions, and DescribeAlarms can only narrow by name prefix, which
+            # cannot select these alarms since their names are chosen by whoever
+            # created them. So page through all metric alarms (100 per call) and
+            # filter them here: one listing per region still takes far fewer calls
+            # than one DescribeAlarmsForMetric per protected resource.
+            alarms = []
+            paginator = self.cloudwatch_client.get_paginator('describe_alarms')
+            for page in paginator.paginate(AlarmTypes=['MetricAlarm']):
+                alarms.extend(
+                    alarm for alarm in page.get('MetricAlarms', [])
+                    if alarm.get('Namespace') == 'AWS/DDoSProtection' and alarm.get('MetricName') == 'DDoSDetected'
+                )
+            return {"MetricAlarms": alarms}
+        except ClientError as e:
+            error_code = e.response.get('Error', {}).get('Code', '')
+            error_message = str(e)
+            logger.debug(f"Error listing DDoSDetected alarms in {self.region}: {error_message}")
+            return {
+                "Error": {
+                    "Code": error_code,
+                    "Message": error_message
+                }
+            }
+    
     def get_cloudwatch_alarms_for_resource(self, resource_arn: str) -> Dict[str, Any]:
         """
         Get CloudWatch alarms for Shield Advanced DDoS metrics for a resource.
@@ -182,10 +220,8 @@ class ShieldClient:
             Dictionary containing alarm details or error information
         """
         try:
-            cloudwatch_client = self.session.client('cloudwatch', region_name=self.region)
-            
             # Look for alarms on DDoSDetected metric for this resource
-            response = cloudwatch_client.describe_alarms_for_metric(
+            response = self.cloudwatch_client.describe_alarms_for_metric(
                 MetricName='DDoSDetected',
                 Namespace='AWS/DDoSProtection',
                 Dimensions=[
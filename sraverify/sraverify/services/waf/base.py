@@ -1,23 +1,16 @@
-from typing import Dict, Any
+from typing import Any, Callable, Dict
 from sraverify.core.check import SecurityCheck
+from sraverify.core.webacls import get_distributions, get_web_acls, web_acl_for_resource
 from sraverify.services.waf.client import WAFClient
 
+def stage_arn(region: str, rest_api_id: str, stage_name: str) -> str:
+    # ARN WAF associates API Gateway REST API stages by
+    return f"arn:aws:apigateway:{region}::/restapis/{rest_api_id}/stages/{stage_name}"
+
 class WAFCheck(SecurityCheck):
-    def __init__(self):
-        super().__init__(
-            account_type="application",
-            service="WAF",
-            resource_type="AWS::ElasticLoadBalancingV2::LoadBalancer"
-        )
-        self._distributions_cache = {}
-        self._load_balancers_cache = {}
-        self._rest_apis_cache = {}
-        self._graphql_apis_cache = {}
-        self._user_pools_cache = {}
-        self._apprunner_services_cache = {}
-        self._verified_access_instances_cache = {}
-        self._amplify_apps_cache = {}
-        self._web_acls_cache = {}
+    account_type = "application"
+    service = "WAF"
+    resource_type = "AWS::ElasticLoadBalancingV2::LoadBalancer"
 
     def _setup_clients(self):
         self._clients.clear()
@@ -29,72 +22,80 @@ class WAFCheck(SecurityCheck):
                 if region not in self._clients:
                     self._clients[region] = WAFClient(region, session=self.session)
 
+    def _list(self, namespace: str, region: str, fetch: Callable[[WAFClient], Dict[str, Any]]) -> Dict[str, Any]:
+        # Listed once per account and region, however many checks ask concurrently
+        client = self.get_client(region)
+        if not client:
+            return {}
+        return self.cached(namespace, region, lambda: fetch(client))
+
     def get_distributions(self) -> Dict[str, Any]:
-        if not self._distributions_cache:
-            client = self.get_client('us-east-1')
-            if client:
-                self._distributions_cache = client.list_distributions()
-        return self._distributions_cache
+        # Shared with the CloudFront web ACL index used by Shield checks
+        return get_distributions(self)
 
     def get_load_balancers(self, region: str) -> Dict[str, Any]:
-        if region not in self._load_balancers_cache:
-            client = self.get_client(region)
-            if client:
-                self._load_balancers_cache[region] = client.describe_load_balancers()
-        return self._load_balancers_cache.get(region, {})
+        return self._list('waf.load_balancers', region, WAFClient.describe_load_balancers)
 
     def get_rest_apis(self, region: str) -> Dict[str, Any]:
-        if region not in self._rest_apis_cache:
-            client = self.get_client(region)
-            if client:
-                self._rest_apis_cache[region] = client.get_rest_apis()
-        return self._rest_apis_cache.get(region, {})
+        return self._list('waf.rest_apis', region, WAFClient.get_rest_apis)
+
+    def get_rest_api_stages(self, region: str) -> Dict[str, Any]:
+        # Stages of every REST API in the region, fetched concurrently once per account: {"Stages": {api_id: response}}
+        def fetch(client: WAFClient) -> Dict[str, Any]:
+            rest_apis = self.get_rest_apis(region)
+            if "Error" in rest_apis:
+                return rest_apis
+            api_ids = [api.get("id") for api in rest_apis.get("items", [])]
+            stages = {}
+            for api_id, response in zip(api_ids, self.map_resources(client.get_stages, api_ids)):
+                # Failed APIs are left out, so errors are not persisted and get_stages retries them
+                if "Error" not in response:
+                    for stage in response.get("item", []):
+                        stage["stageArn"] = stage_arn(region, api_id, stage.get("stageName"))
+                    stages[api_id] = response
+            return {"Stages": stages}
+        return self._list('waf.rest_api_stages', region, fetch)
 
     def get_stages(self, region: str, rest_api_id: str) -> Dict[str, Any]:
-        client = self.get_client(region)
-        if client:
+        stages = self.get_rest_api_stages(region)
+        if "Error" in stages:
+            return stages
+        if rest_api_id not in stages.get("Stages", {}):
+            # Stages that could not be listed, or an API created after the region's stages were listed
+            client = self.get_client(region)
+            if not client:
+                return {"Error": {"Message": "No client available"}}
             return client.get_stages(rest_api_id)
-        return {"Error": {"Message": "No client available"}}
+        return stages["Stages"][rest_api_id]
 
     def get_graphql_apis(self, region: str) -> Dict[str, Any]:
-        if region not in self._graphql_apis_cache:
-            client = self.get_client(region)
-            if client:
-                self._graphql_apis_cache[region] = client.list_graphql_apis()
-        return self._graphql_apis_cache.get(region, {})
+        return self._list('waf.graphql_apis', region, WAFClient.list_graphql_apis)
 
     def get_user_pools(self, region: str) -> Dict[str, Any]:
-        if region not in self._user_pools_cache:
-            client = self.get_client(region)
-            if client:
-                self._user_pools_cache[region] = client.list_user_pools()
-        return self._user_pools_cache.get(region, {})
+        return self._list('waf.user_pools', region, WAFClient.list_user_pools)
 
     def get_apprunner_services(self, region: str) -> Dict[str, Any]:
-        if region not in self._apprunner_services_cache:
-            client = self.get_client(region)
-            if client:
-                self._apprunner_services_cache[region] = client.list_services()
-        return self._apprunner_services_cache.get(region, {})
+        return self._list('waf.apprunner_services', region, WAFClient.list_services)
 
     def get_verified_access_instances(self, region: str) -> Dict[str, Any]:
-        if region not in self._verified_access_instances_cache:
-            client = self.get_client(region)
-            if client:
-                self._verified_access_instances_cache[region] = client.describe_verified_access_instances()
-        return self._verified_access_instances_cache.get(region, {})
+        return self._list('waf.verified_access_instances', region, WAFClient.describe_verified_access_instances)
 
     def get_amplify_apps(self, region: str) -> Dict[str, Any]:
-        if region not in self._amplify_apps_cache:
-            client = self.get_client(region)
-            if client:
-                self._amplify_apps_cache[region] = client.list_apps()
-        return self._amplify_apps_cache.get(region, {})
+        return self._list('waf.amplify_apps', region, WAFClient.list_apps)
 
     def get_web_acls(self, region: str, scope: str = "REGIONAL") -> Dict[str, Any]:
-        cache_key = f"{region}_{scope}"
-        if cache_key not in self._web_acls_cache:
-            client = self.get_client(region)
-            if client:
-                self._web_acls_cache[cache_key] = client.list_web_acls(scope)
-        return self._web_acls_cache.get(cache_key, {})
+        # Shared with the web ACL association index
+        return get_web_acls(self, region, scope)
+
+    def get_regional_web_acls(self, region: str) -> Dict[str, Any]:
+        return self.get_web_acls(region, "REGIONAL")
+
+    def get_cloudfront_web_acls(self) -> Dict[str, Any]:
+        return self.get_web_acls("us-east-1", "CLOUDFRONT")
+
+    def get_web_acl_for_resource(self, region: str, resource_arn: str) -> Dict[str, Any]:
+        client = self.get_client(region)
+        if not client:
+            return {"Error": {"Message": "No client available"}}
+        # Looked up in the region's association index, shared with Shield checks
+        return web_acl_for_resource(self, region, resource_arn, client.get_web_acl_for_resource)
@@ -1,15 +1,16 @@
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.waf.base import WAFCheck
 
 class SRA_WAF_01(WAFCheck):
-    def __init__(self):
-        super().__init__()
-        self.resource_type = "AWS::CloudFront::Distribution"
-        self.check_id = "SRA-WAF-01"
-        self.check_name = "CloudFront distributions should be associated with AWS WAF"
-        self.description = "Ensures that all CloudFront distributions are protected by AWS WAF web ACLs to filter malicious traffic"
-        self.severity = "HIGH"
-        self.check_logic = "Lists all CloudFront distributions and verifies each has a WebACLId configured"
+    resource_type = "AWS::CloudFront::Distribution"
+    check_id = "SRA-WAF-01"
+    check_name = "CloudFront distributions should be associated with AWS WAF"
+    description = "Ensures that all CloudFront distributions are protected by AWS WAF web ACLs to filter malicious traffic"
+    severity = "HIGH"
+    check_logic = "Lists all CloudFront distributions and verifies each has a WebACLId configured"
+
+    data_requirements = (DataRequirement("get_distributions", ACCOUNT),)
 
     def execute(self) -> List[Dict[str, Any]]:
         region = "us-east-1"  # CloudFront is global service
@@ -2,13 +2,13 @@ from typing import Dict, List, Any
 from sraverify.services.waf.base import WAFCheck
 
 class SRA_WAF_02(WAFCheck):
-    def __init__(self):
-        super().__init__()
-        self.check_id = "SRA-WAF-02"
-        self.check_name = "Application Load Balancers should be associated with AWS WAF"
-        self.description = "Ensures that all Application Load Balancers are protected by AWS WAF web ACLs to filter malicious traffic"
-        self.severity = "HIGH"
-        self.check_logic = "Lists all Application Load Balancers and verifies each has a WAF web ACL associated"
+    check_id = "SRA-WAF-02"
+    check_name = "Application Load Balancers should be associated with AWS WAF"
+    description = "Ensures that all Application Load Balancers are protected by AWS WAF web ACLs to filter malicious traffic"
+    severity = "HIGH"
+    check_logic = "Lists all Application Load Balancers and verifies each has a WAF web ACL associated"
+
+    data_requirements = ("get_load_balancers",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
@@ -43,11 +43,7 @@ class SRA_WAF_02(WAFCheck):
                 alb_arn = alb.get("LoadBalancerArn")
                 alb_name = alb.get("LoadBalancerName")
                 
-                client = self.get_client(region)
-                if not client:
-                    continue
-
-                web_acl_response = client.get_web_acl_for_resource(alb_arn)
+                web_acl_response = self.get_web_acl_for_resource(region, alb_arn)
 
                 if "Error" in web_acl_response:
                     self.findings.append(self.create_finding(
@@ -1,15 +1,15 @@
 from typing import Dict, List, Any
-from sraverify.services.waf.base import WAFCheck
+from sraverify.services.waf.base import WAFCheck, stage_arn
 
 class SRA_WAF_03(WAFCheck):
-    def __init__(self):
-        super().__init__()
-        self.resource_type = "AWS::ApiGateway::RestApi"
-        self.check_id = "SRA-WAF-03"
-        self.check_name = "API Gateway REST APIs should be associated with AWS WAF"
-        self.description = "Ensures that all API Gateway REST APIs are protected by AWS WAF web ACLs to filter malicious traffic"
-        self.severity = "HIGH"
-        self.check_logic = "Lists all API Gateway REST APIs and verifies each has a WAF web ACL associated"
+    resource_type = "AWS::ApiGateway::RestApi"
+    check_id = "SRA-WAF-03"
+    check_name = "API Gateway REST APIs should be associated with AWS WAF"
+    description = "Ensures that all API Gateway REST APIs are protected by AWS WAF web ACLs to filter malicious traffic"
+    severity = "HIGH"
+    check_logic = "Lists all API Gateway REST APIs and verifies each has a WAF web ACL associated"
+
+    data_requirements = ("get_rest_api_stages",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
@@ -71,14 +71,10 @@ class SRA_WAF_03(WAFCheck):
                     stage_name = stage.get("stageName")
                     resource_id = f"{api_name or api_id}/{stage_name}"
                     
-                    # Construct the API Gateway stage ARN for WAF association check
-                    api_arn = f"arn:aws:apigateway:{region}::/restapis/{api_id}/stages/{stage_name}"
+                    # Stage ARN precomputed by the stage inventory for the WAF association lookup
+                    api_arn = stage.get("stageArn") or stage_arn(region, api_id, stage_name)
                     
-                    client = self.get_client(region)
-                    if not client:
-                        continue
-
-                    web_acl_response = client.get_web_acl_for_resource(api_arn)
+                    web_acl_response = self.get_web_acl_for_resource(region, api_arn)
 
                     if "Error" in web_acl_response:
                         error_code = web_acl_response["Error"].get("Code")
@@ -2,14 +2,14 @@ from typing import Dict, List, Any
 from sraverify.services.waf.base import WAFCheck
 
 class SRA_WAF_04(WAFCheck):
-    def __init__(self):
-        super().__init__()
-        self.resource_type = "AWS::AppSync::GraphQLApi"
-        self.check_id = "SRA-WAF-04"
-        self.check_name = "AppSync GraphQL APIs should be associated with AWS WAF"
-        self.description = "Ensures that all AppSync GraphQL APIs are protected by AWS WAF web ACLs to filter malicious traffic"
-        self.severity = "HIGH"
-        self.check_logic = "Lists all AppSync GraphQL APIs and verifies each has a WAF web ACL associated"
+    resource_type = "AWS::AppSync::GraphQLApi"
+    check_id = "SRA-WAF-04"
+    check_name = "AppSync GraphQL APIs should be associated with AWS WAF"
+    description = "Ensures that all AppSync GraphQL APIs are protected by AWS WAF web ACLs to filter malicious traffic"
+    severity = "HIGH"
+    check_logic = "Lists all AppSync GraphQL APIs and verifies each has a WAF web ACL associated"
+
+    data_requirements = ("get_graphql_apis",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
@@ -55,11 +55,7 @@ class SRA_WAF_04(WAFCheck):
                     ))
                 else:
                     # Double-check using WAF API
-                    client = self.get_client(region)
-                    if not client:
-                        continue
-
-                    web_acl_response = client.get_web_acl_for_resource(api_arn)
+                    web_acl_response = self.get_web_acl_for_resource(region, api_arn)
 
                     if "Error" in web_acl_response:
                         self.findings.append(self.create_finding(
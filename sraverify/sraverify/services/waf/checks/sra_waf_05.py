@@ -2,14 +2,14 @@ from typing import Dict, List, Any
 from sraverify.services.waf.base import WAFCheck
 
 class SRA_WAF_05(WAFCheck):
-    def __init__(self):
-        super().__init__()
-        self.resource_type = "AWS::Cognito::UserPool"
-        self.check_id = "SRA-WAF-05"
-        self.check_name = "Cognito user pools should be associated with AWS WAF"
-        self.description = "Ensures that all Cognito user pools are protected by AWS WAF web ACLs to filter malicious traffic"
-        self.severity = "HIGH"
-        self.check_logic = "Lists all Cognito user pools and verifies each has a WAF web ACL associated"
+    resource_type = "AWS::Cognito::UserPool"
+    check_id = "SRA-WAF-05"
+    check_name = "Cognito user pools should be associated with AWS WAF"
+    description = "Ensures that all Cognito user pools are protected by AWS WAF web ACLs to filter malicious traffic"
+    severity = "HIGH"
+    check_logic = "Lists all Cognito user pools and verifies each has a WAF web ACL associated"
+
+    data_requirements = ("get_user_pools",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
@@ -45,11 +45,7 @@ class SRA_WAF_05(WAFCheck):
                 # Format: arn:partition:cognito-idp:region:account-id:userpool/user-pool-id
                 pool_arn = f"arn:aws:cognito-idp:{region}:{self.account_id}:userpool/{pool_id}"
                 
-                client = self.get_client(region)
-                if not client:
-                    continue
-
-                web_acl_response = client.get_web_acl_for_resource(pool_arn)
+                web_acl_response = self.get_web_acl_for_resource(region, pool_arn)
 
                 if "Error" in web_acl_response:
                     error_code = web_acl_response["Error"].get("Code")
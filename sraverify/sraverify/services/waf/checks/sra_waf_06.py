@@ -2,14 +2,14 @@ from typing import Dict, List, Any
 from sraverify.services.waf.base import WAFCheck
 
 class SRA_WAF_06(WAFCheck):
-    def __init__(self):
-        super().__init__()
-        self.resource_type = "AWS::AppRunner::Service"
-        self.check_id = "SRA-WAF-06"
-        self.check_name = "App Runner services should be associated with AWS WAF"
-        self.description = "Ensures that all App Runner services are protected by AWS WAF web ACLs to filter malicious traffic"
-        self.severity = "HIGH"
-        self.check_logic = "Lists all App Runner services and verifies each has a WAF web ACL associated"
+    resource_type = "AWS::AppRunner::Service"
+    check_id = "SRA-WAF-06"
+    check_name = "App Runner services should be associated with AWS WAF"
+    description = "Ensures that all App Runner services are protected by AWS WAF web ACLs to filter malicious traffic"
+    severity = "HIGH"
+    check_logic = "Lists all App Runner services and verifies each has a WAF web ACL associated"
+
+    data_requirements = ("get_apprunner_services",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
@@ -42,11 +42,7 @@ class SRA_WAF_06(WAFCheck):
                 service_name = service.get("ServiceName")
                 service_id = service.get("ServiceId")
                 
-                client = self.get_client(region)
-                if not client:
-                    continue
-
-                web_acl_response = client.get_web_acl_for_resource(service_arn)
+                web_acl_response = self.get_web_acl_for_resource(region, service_arn)
 
                 if "Error" in web_acl_response:
                     error_code = web_acl_response["Error"].get("Code")
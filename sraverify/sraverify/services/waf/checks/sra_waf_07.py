@@ -2,14 +2,14 @@ from typing import Dict, List, Any
 from sraverify.services.waf.base import WAFCheck
 
 class SRA_WAF_07(WAFCheck):
-    def __init__(self):
-        super().__init__()
-        self.resource_type = "AWS::EC2::VerifiedAccessInstance"
-        self.check_id = "SRA-WAF-07"
-        self.check_name = "Verified Access instances should be associated with AWS WAF"
-        self.description = "Ensures that all Verified Access instances are protected by AWS WAF web ACLs to filter malicious traffic"
-        self.severity = "HIGH"
-        self.check_logic = "Lists all Verified Access instances and verifies each has a WAF web ACL associated"
+    resource_type = "AWS::EC2::VerifiedAccessInstance"
+    check_id = "SRA-WAF-07"
+    check_name = "Verified Access instances should be associated with AWS WAF"
+    description = "Ensures that all Verified Access instances are protected by AWS WAF web ACLs to filter malicious traffic"
+    severity = "HIGH"
+    check_logic = "Lists all Verified Access instances and verifies each has a WAF web ACL associated"
+
+    data_requirements = ("get_verified_access_instances",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
@@ -45,11 +45,7 @@ class SRA_WAF_07(WAFCheck):
                 # Format: arn:partition:ec2:region:account-id:verified-access-instance/instance-id
                 instance_arn = f"arn:aws:ec2:{region}:{self.account_id}:verified-access-instance/{instance_id}"
                 
-                client = self.get_client(region)
-                if not client:
-                    continue
-
-                web_acl_response = client.get_web_acl_for_resource(instance_arn)
+                web_acl_response = self.get_web_acl_for_resource(region, instance_arn)
 
                 if "Error" in web_acl_response:
                     error_code = web_acl_response["Error"].get("Code")
@@ -2,14 +2,14 @@ from typing import Dict, List, Any
 from sraverify.services.waf.base import WAFCheck
 
 class SRA_WAF_08(WAFCheck):
-    def __init__(self):
-        super().__init__()
-        self.resource_type = "AWS::Amplify::App"
-        self.check_id = "SRA-WAF-08"
-        self.check_name = "Amplify applications should be associated with AWS WAF"
-        self.description = "Ensures that all Amplify applications are protected by AWS WAF web ACLs to filter malicious traffic"
-        self.severity = "HIGH"
-        self.check_logic = "Lists all Amplify applications and verifies each has a WAF web ACL associated"
+    resource_type = "AWS::Amplify::App"
+    check_id = "SRA-WAF-08"
+    check_name = "Amplify applications should be associated with AWS WAF"
+    description = "Ensures that all Amplify applications are protected by AWS WAF web ACLs to filter malicious traffic"
+    severity = "HIGH"
+    check_logic = "Lists all Amplify applications and verifies each has a WAF web ACL associated"
+
+    data_requirements = ("get_amplify_apps",)
 
     def execute(self) -> List[Dict[str, Any]]:
         for region in self.regions:
@@ -1,15 +1,16 @@
 from typing import Dict, List, Any
+from sraverify.core.planner import ACCOUNT, DataRequirement
 from sraverify.services.waf.base import WAFCheck
 
 class SRA_WAF_09(WAFCheck):
-    def __init__(self):
-        super().__init__()
-        self.resource_type = "AWS::WAFv2::WebACL"
-        self.check_id = "SRA-WAF-09"
-        self.check_name = "WAF Web ACLs should have logging enabled"
-        self.description = "Ensures that all WAF Web ACLs have logging enabled to capture traffic analysis data"
-        self.severity = "MEDIUM"
-        self.check_logic = "Lists all WAF Web ACLs and verifies each has logging configuration enabled"
+    resource_type = "AWS::WAFv2::WebACL"
+    check_id = "SRA-WAF-09"
+    check_name = "WAF Web ACLs should have logging enabled"
+    description = "Ensures that all WAF Web ACLs have logging enabled to capture traffic analysis data"
+    severity = "MEDIUM"
+    check_logic = "Lists all WAF Web ACLs and verifies each has logging configuration enabled"
+
+    data_requirements = ("get_regional_web_acls", DataRequirement("get_cloudfront_web_acls", ACCOUNT))
 
     def execute(self) -> List[Dict[str, Any]]:
         # Check both regional and global (CloudFront) Web ACLs
@@ -1,39 +1,39 @@
 from typing import Dict, List, Optional, Any
 import boto3
 from botocore.exceptions import ClientError
+from sraverify.core.clients import lazy_client
 from sraverify.core.logging import logger
 
 class WAFClient:
+    elbv2_client = lazy_client('elbv2')
+    wafv2_client = lazy_client('wafv2')
+    apigateway_client = lazy_client('apigateway')
+    appsync_client = lazy_client('appsync')
+    cognito_idp_client = lazy_client('cognito-idp')
+    apprunner_client = lazy_client('apprunner')
+    ec2_client = lazy_client('ec2')
+    amplify_client = lazy_client('amplify')
+
     def __init__(self, region: str, session: Optional[boto3.Session] = None):
         self.region = region
         self.session = session or boto3.Session()
-        self.cloudfront_client = self.session.client('cloudfront', region_name='us-east-1')  # CloudFront is global
-        self.elbv2_client = self.session.client('elbv2', region_name=region)
-        self.wafv2_client = self.session.client('wafv2', region_name=region)
-        self.apigateway_client = self.session.client('apigateway', region_name=region)
-        self.appsync_client = self.session.client('appsync', region_name=region)
-        self.cognito_idp_client = self.session.client('cognito-idp', region_name=region)
-        self.apprunner_client = self.session.client('apprunner', region_name=region)
-        self.ec2_client = self.session.client('ec2', region_name=region)
-        self.amplify_client = self.session.client('amplify', region_name=region)
-
-    def list_distributions(self) -> Dict[str, Any]:
-        try:
-            return self.cloudfront_client.list_distributions()
-        except ClientError as e:
-            logger.error(f"Error listing CloudFront distributions: {e}")
-            return {"Error": {"Message": str(e)}}
 
     def describe_load_balancers(self) -> Dict[str, Any]:
         try:
-            return self.elbv2_client.describe_load_balancers()
+            load_balancers = []
+            for page in self.elbv2_client.get_paginator('describe_load_balancers').paginate():
+                load_balancers.extend(page.get('LoadBalancers', []))
+            return {"LoadBalancers": load_balancers}
         except ClientError as e:
             logger.error(f"Error describing load balancers in {self.region}: {e}")
             return {"Error": {"Message": str(e)}}
 
     def get_rest_apis(self) -> Dict[str, Any]:
         try:
-            return self.apigateway_client.get_rest_apis()
+            rest_apis = []
+            for page in self.apigateway_client.get_paginator('get_rest_apis').paginate():
+                rest_apis.extend(page.get('items', []))
+            return {"items": rest_apis}
         except ClientError as e:
             logger.error(f"Error getting REST APIs in {self.region}: {e}")
             return {"Error": {"Message": str(e)}}
@@ -47,46 +47,60 @@ class WAFClient:
 
     def list_graphql_apis(self) -> Dict[str, Any]:
         try:
-            return self.appsync_client.list_graphql_apis()
+            graphql_apis = []
+            for page in self.appsync_client.get_paginator('list_graphql_apis').paginate():
+                graphql_apis.extend(page.get('graphqlApis', []))
+            return {"graphqlApis": graphql_apis}
         except ClientError as e:
             logger.error(f"Error listing GraphQL APIs in {self.region}: {e}")
             return {"Error": {"Message": str(e)}}
 
     def list_user_pools(self) -> Dict[str, Any]:
         try:
-            return self.cognito_idp_client.list_user_pools(MaxResults=60)
+            user_pools = []
+            paginator = self.cognito_idp_client.get_paginator('list_user_pools')
+            for page in paginator.paginate(PaginationConfig={'PageSize': 60}):
+                user_pools.extend(page.get('UserPools', []))
+            return {"UserPools": user_pools}
         except ClientError as e:
             logger.error(f"Error listing user pools in {self.region}: {e}")
             return {"Error": {"Message": str(e)}}
 
     def list_services(self) -> Dict[str, Any]:
         try:
-            return self.apprunner_client.list_services()
+            # App Runner has no paginator for ListServices
+            services = []
+            params = {}
+            while True:
+                response = self.apprunner_client.list_services(**params)
+                services.extend(response.get('ServiceSummaryList', []))
+                if not response.get('NextToken'):
+                    return {"ServiceSummaryList": services}
+                params['NextToken'] = response['NextToken']
         except ClientError as e:
             logger.error(f"Error listing App Runner services in {self.region}: {e}")
             return {"Error": {"Message": str(e)}}
 
     def describe_verified_access_instances(self) -> Dict[str, Any]:
         try:
-            return self.ec2_client.describe_verified_access_instances()
+            instances = []
+            for page in self.ec2_client.get_paginator('describe_verified_access_instances').paginate():
+                instances.extend(page.get('VerifiedAccessInstances', []))
+            return {"VerifiedAccessInstances": instances}
         except ClientError as e:
             logger.error(f"Error describing Verified Access instances in {self.region}: {e}")
             return {"Error": {"Message": str(e)}}
 
     def list_apps(self) -> Dict[str, Any]:
         try:
-            return self.amplify_client.list_apps()
+            apps = []
+            for page in self.amplify_client.get_paginator('list_apps').paginate():
+                apps.extend(page.get('apps', []))
+            return {"apps": apps}
         except ClientError as e:
             logger.error(f"Error listing Amplify apps in {self.region}: {e}")
             return {"Error": {"Message": str(e)}}
 
-    def list_web_acls(self, scope: str = "REGIONAL") -> Dict[str, Any]:
-        try:
-            return self.wafv2_client.list_web_acls(Scope=scope)
-        except ClientError as e:
-            logger.error(f"Error listing Web ACLs in {self.region}: {e}")
-            return {"Error": {"Message": str(e)}}
-
     def get_logging_configuration(self, resource_arn: str) -> Dict[str, Any]:
         try:
             return self.wafv2_client.get_logging_configuration(ResourceArn=resource_arn)
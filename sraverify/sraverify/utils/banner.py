@@ -5,11 +5,13 @@ from colorama import Fore, Style
 import datetime
 import boto3
 from typing import Optional, List, Dict, Any
+from sraverify.core.clients import get_client
 
 
 def print_banner(profile: str, region: str, session: boto3.Session = None, 
                  regions: Optional[List[str]] = None, account_type: str = 'all',
-                 checks_count: int = 0, output_file: str = None, role: Optional[str] = None):
+                 checks_count: int = 0, output_file: str = None, role: Optional[str] = None,
+                 accounts: Optional[List[str]] = None):
     """
     Print the SRAVerify banner and initial execution information.
     
@@ -22,6 +24,7 @@ def print_banner(profile: str, region: str, session: boto3.Session = None,
         checks_count: Number of checks to run
         output_file: Output file name
         role: ARN of IAM role being assumed
+        accounts: AWS accounts being scanned in multi-account mode
     """
     # ASCII art banner - using raw string to avoid escape sequence issues
     print(fr"""
@@ -45,7 +48,7 @@ def print_banner(profile: str, region: str, session: boto3.Session = None,
     
     if session:
         try:
-            sts = session.client('sts')
+            sts = get_client(session, 'sts')
             caller_identity = sts.get_caller_identity()
             print(f"  · AWS Account: {caller_identity['Account']}")
             print(f"  · User Id: {caller_identity['UserId']}")
@@ -57,6 +60,8 @@ def print_banner(profile: str, region: str, session: boto3.Session = None,
     print("\n-> Starting SRA Verify scan...")
     if role:
         print(f"  · Assuming Role: {role}")
+    if accounts:
+        print(f"  · Accounts: {len(accounts)}")
     print(f"  · Regions: {', '.join(regions) if regions else 'all enabled regions'}")
     print(f"  · Account Type: {account_type}")
     print(f"  · Checks: {checks_count}")
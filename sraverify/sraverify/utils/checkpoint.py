@@ -0,0 +1,151 @@
+"""
+Checkpoints of completed checks, so interrupted scans can be resumed.
+"""
+import json
+import os
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from sraverify.core.logging import logger
+from sraverify.utils.outputs import finding_row
+
+
+class Checkpoint:
+    """
+    Completed (account, check) pairs of a scan and their findings.
+
+    Each completed check is appended to a JSON Lines file as one record and
+    flushed, so the file survives the scan being interrupted. Resuming loads
+    the records and lets the scan reuse their findings instead of running
+    those checks again. Checks that produced an ERROR finding are not
+    recorded, so a resumed scan retries them (e.g. after credentials expired).
+
+    The first record of the file holds the parameters of the scan (regions,
+    account type, check filters), and a scan with other parameters cannot
+    resume from it, since its findings would not match what the scan asked for.
+    """
+
+    def __init__(self, path: str, resume: bool = False, scan: Optional[Mapping[str, Any]] = None):
+        """
+        Open a checkpoint file.
+
+        Args:
+            path: Checkpoint file path
+            resume: Load the completed checks already in the file and append to it,
+                instead of starting a new checkpoint
+            scan: Parameters of the scan, written to a new checkpoint and compared
+                with those of the checkpoint being resumed
+
+        Raises:
+            ValueError: If the checkpoint being resumed was written by a scan with other parameters
+        """
+        self.path = path
+        # Round-tripped through JSON so it compares equal to the parameters read back from the file
+        self.scan = json.loads(json.dumps(dict(scan or {}), default=str))
+        self._completed: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        loaded, truncated = self._load() if resume else (False, False)
+        self._file = open(path, 'a' if loaded else 'w')
+        if truncated:
+            # Start new records on a fresh line after a record cut short
+            self._file.write('\n')
+        if not loaded:
+            self._file.write(json.dumps({'scan': self.scan}) + '\n')
+            self._file.flush()
+        self._lock = threading.Lock()
+
+    def _load(self) -> Tuple[bool, bool]:
+        """
+        Read the completed checks recorded in the file, if it exists.
+
+        Returns:
+            Tuple of whether the file holds a scan's parameters to append to, and
+            whether it does not end with a complete line
+
+        Raises:
+            ValueError: If the file was written by a scan with other parameters
+        """
+        if not os.path.exists(self.path):
+            logger.info(f"No checkpoint at {self.path}, starting a new scan")
+            return False, False
+        scan = None
+        line = ''
+        with open(self.path, 'r') as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                    if line_number == 1 and 'scan' in record:
+                        scan = record['scan']
+                        continue
+                    self._completed[(record['account_id'], record['check_id'])] = record['findings']
+                except (ValueError, KeyError, TypeError) as e:
+                    # The last record is cut short if the scan was killed while writing it
+                    logger.debug(f"Ignoring unreadable checkpoint record {self.path}:{line_number}: {e}")
+        if scan is None:
+            if self._completed:
+                raise ValueError(f"Checkpoint {self.path} does not record the parameters of its scan")
+            # Killed before anything but (part of) the parameters was written
+            logger.info(f"No completed checks in {self.path}, starting a new scan")
+            return False, False
+        if scan != self.scan:
+            changed = sorted(key for key in set(scan) | set(self.scan) if scan.get(key) != self.scan.get(key))
+            raise ValueError(f"Checkpoint {self.path} was written by a scan with different {', '.join(changed)}")
+        logger.info(f"Resuming from {self.path} with {len(self._completed)} completed checks")
+        return True, bool(line) and not line.endswith('\n')
+
+    def completed(self, account_id: str, check_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get the findings of a completed check.
+
+        Args:
+            account_id: AWS account ID
+            check_id: Check ID
+
+        Returns:
+            List of findings, or None if the check has not completed in the account
+        """
+        return self._completed.get((account_id, check_id))
+
+    def is_complete(self, account_id: str, check_ids: Iterable[str]) -> bool:
+        """
+        Check whether all of the given checks have completed in an account.
+
+        Args:
+            account_id: AWS account ID
+            check_ids: Check IDs
+
+        Returns:
+            True if every check has completed
+        """
+        return all((account_id, check_id) in self._completed for check_id in check_ids)
+
+    def record(self, account_id: str, check_id: str, findings: Iterable[Mapping[str, Any]]):
+        """
+        Record a completed check, unless one of its findings is an ERROR.
+
+        Args:
+            account_id: AWS account ID
+            check_id: Check ID
+            findings: Findings the check produced
+        """
+        rows = [finding_row(finding) for finding in findings]
+        if any(row['Status'] == 'ERROR' for row in rows):
+            return
+        line = json.dumps({'account_id': account_id, 'check_id': check_id, 'findings': rows}, default=str)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+
+    def close(self):
+        """Flush and close the checkpoint file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def __enter__(self) -> "Checkpoint":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,163 @@
+"""
+Consolidation of the findings files of many scans into one output.
+
+Each input file is sorted by its findings' key and spilled to a temporary
+run file, then the runs are merged with a k-way heap merge. Memory use is
+bounded by the largest single input file, so thousands of per-account
+result files can be merged in one linear pass. Identical findings are
+written once, and summary counts are gathered while writing.
+"""
+import fnmatch
+import heapq
+import json
+import os
+import tempfile
+from collections import Counter
+from typing import Any, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from sraverify.core.logging import logger
+from sraverify.utils.outputs import COMPRESSED_EXTENSION, REQUIRED_FIELDS, FindingSink, read_findings
+
+# Fields the merged findings are sorted by
+SORT_KEY_FIELDS = ('AccountId', 'CheckId', 'Region', 'ResourceId', 'CheckedValue')
+
+# Fields compared to find duplicates: every field, so only identical findings are
+# dropped, with the sort fields first so the merged output stays in sort order
+DEDUP_KEY_FIELDS = SORT_KEY_FIELDS + tuple(field for field in REQUIRED_FIELDS if field not in SORT_KEY_FIELDS)
+
+# Default pattern of the findings files collected from input directories
+DEFAULT_INPUT_PATTERN = 'sraverify*'
+
+# Maximum number of runs merged at once; more runs are merged in several passes
+MAX_FAN_IN = 64
+
+# Number of findings written to the sink at once
+_WRITE_BATCH_SIZE = 1000
+
+_FINDINGS_EXTENSIONS = ('.csv', '.jsonl', '.ndjson')
+_KEY_INDEXES = [REQUIRED_FIELDS.index(field) for field in DEDUP_KEY_FIELDS]
+_ACCOUNT_INDEX = REQUIRED_FIELDS.index('AccountId')
+
+
+def _finding_key(values: Sequence[Any]) -> Tuple[str, ...]:
+    """Get the deduplication key of a finding from its REQUIRED_FIELDS values."""
+    return tuple('' if values[i] is None else str(values[i]) for i in _KEY_INDEXES)
+
+
+def find_input_files(paths: Iterable[str], pattern: str = DEFAULT_INPUT_PATTERN) -> List[str]:
+    """
+    Expand input paths into findings files.
+
+    Files are used as given. Directories are searched recursively for CSV
+    and JSON Lines files (optionally gzip-compressed) whose name matches
+    the pattern.
+
+    Args:
+        paths: Files and directories
+        pattern: Shell-style pattern of the file names collected from directories
+
+    Returns:
+        List of findings file paths, directory contents in sorted order
+    """
+    files = []
+    for path in paths:
+        if not os.path.isdir(path):
+            files.append(path)
+            continue
+        found = []
+        for root, _, names in os.walk(path):
+            for name in names:
+                base = name[:-len(COMPRESSED_EXTENSION)] if name.lower().endswith(COMPRESSED_EXTENSION) else name
+                if fnmatch.fnmatch(name, pattern) and base.lower().endswith(_FINDINGS_EXTENSIONS):
+                    found.append(os.path.join(root, name))
+        files.extend(sorted(found))
+    return files
+
+
+def _write_run(rows: Iterable[List[Any]], tmp_dir: str) -> str:
+    """Write findings values, already in key order, to a temporary run file."""
+    fd, path = tempfile.mkstemp(suffix='.run', dir=tmp_dir)
+    with os.fdopen(fd, 'w') as f:
+        for values in rows:
+            f.write(json.dumps(values, default=str) + '\n')
+    return path
+
+
+def _read_run(path: str) -> Iterator[List[Any]]:
+    """Read the findings values of a run file, in key order."""
+    with open(path, 'r') as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def _merge_runs(runs: List[str]) -> Iterator[List[Any]]:
+    """Merge run files in key order; findings with equal keys keep the order of the runs."""
+    return heapq.merge(*(_read_run(run) for run in runs), key=_finding_key)
+
+
+def merge_findings(inputs: Sequence[str], sink: FindingSink) -> Dict[str, Any]:
+    """
+    Merge findings files into a sink, sorted by SORT_KEY_FIELDS.
+
+    Findings that are equal in every field are written once. Input files
+    that cannot be read are skipped and reported. Status counts of the
+    merged findings are kept by the sink.
+
+    Args:
+        inputs: Findings files, CSV or JSON Lines, optionally gzip-compressed
+        sink: Output for the merged findings
+
+    Returns:
+        Dictionary of summary counts: files, skipped_files, read, duplicates,
+        written and accounts
+    """
+    summary = Counter(files=0, skipped_files=0, read=0, duplicates=0, written=0, accounts=0)
+    with tempfile.TemporaryDirectory(prefix='sraverify-merge-') as tmp_dir:
+        runs = []
+        for path in inputs:
+            try:
+                # A file is read completely before its run is written, so a bad file adds nothing
+                rows = [list(row.values()) for row in read_findings(path)]
+            except (OSError, ValueError, UnicodeDecodeError) as e:
+                logger.error(f"Skipping findings file {path}: {e}")
+                summary['skipped_files'] += 1
+                continue
+            rows.sort(key=_finding_key)
+            runs.append(_write_run(rows, tmp_dir))
+            summary['files'] += 1
+            summary['read'] += len(rows)
+            logger.debug(f"Read {len(rows)} findings from {path}")
+
+        # Merge groups of runs in order until one pass can merge them all
+        while len(runs) > MAX_FAN_IN:
+            logger.debug(f"Merging {len(runs)} runs in groups of {MAX_FAN_IN}")
+            merged = []
+            for start in range(0, len(runs), MAX_FAN_IN):
+                group = runs[start:start + MAX_FAN_IN]
+                merged.append(_write_run(_merge_runs(group), tmp_dir))
+                for run in group:
+                    os.remove(run)
+            runs = merged
+
+        # The sink may already hold findings, so only this merge's rows are counted
+        total_before = sink.total
+        batch = []
+        previous_key = None
+        previous_account = None
+        for values in _merge_runs(runs):
+            key = _finding_key(values)
+            if key == previous_key:
+                summary['duplicates'] += 1
+                continue
+            previous_key = key
+            if values[_ACCOUNT_INDEX] != previous_account:
+                previous_account = values[_ACCOUNT_INDEX]
+                summary['accounts'] += 1
+            batch.append(dict(zip(REQUIRED_FIELDS, values)))
+            if len(batch) >= _WRITE_BATCH_SIZE:
+                sink.write(batch)
+                batch = []
+        if batch:
+            sink.write(batch)
+        summary['written'] = sink.total - total_before
+    return dict(summary)
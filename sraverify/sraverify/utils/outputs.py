@@ -2,7 +2,12 @@
 Output handling for sraverify scan results.
 """
 import csv
-from typing import List, Dict, Any
+import gzip
+import json
+import os
+import threading
+from collections import Counter
+from typing import List, Dict, Any, Iterable, Iterator, Mapping, Optional
 
 # Required fields as per developer guide
 REQUIRED_FIELDS = [
@@ -24,34 +29,236 @@ REQUIRED_FIELDS = [
     'AccountType'  # Changed from CheckType to AccountType
 ]
 
+# Supported output formats, and the file extensions that select them
+OUTPUT_FORMATS = ('csv', 'jsonl')
+_FORMAT_EXTENSIONS = {'.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+
+# Extension of gzip-compressed output files (e.g. findings.csv.gz)
+COMPRESSED_EXTENSION = '.gz'
+
+
+def infer_format(path: str) -> str:
+    """
+    Infer the format of a findings file from its extension.
+
+    A trailing .gz is ignored, .jsonl and .ndjson select JSON Lines and
+    anything else CSV.
+
+    Args:
+        path: Findings file path
+
+    Returns:
+        'csv' or 'jsonl'
+    """
+    if path.lower().endswith(COMPRESSED_EXTENSION):
+        path = path[:-len(COMPRESSED_EXTENSION)]
+    extension = os.path.splitext(path)[1].lower()
+    return _FORMAT_EXTENSIONS.get(extension, 'csv')
+
+
+def open_text(path: str, mode: str = 'r', newline: Optional[str] = None):
+    """
+    Open a findings file in text mode, gzip-compressed if its name ends with .gz.
+
+    Args:
+        path: File path
+        mode: 'r', 'w' or 'a'
+        newline: Newline handling, as for open ('' for CSV files)
+
+    Returns:
+        Text file object
+    """
+    if path.lower().endswith(COMPRESSED_EXTENSION):
+        return gzip.open(path, mode + 't', newline=newline)
+    return open(path, mode, newline=newline)
+
+
+def finding_row(finding: Mapping[str, Any]) -> Dict[str, Any]:
+    """
+    Build an output row with all required fields, in order, from a finding.
+
+    Missing fields are written as empty strings. A legacy CheckType field is
+    used as AccountType when AccountType is missing. The finding is not modified.
+
+    Args:
+        finding: Finding, either a Finding or a dictionary
+
+    Returns:
+        Dictionary with exactly the REQUIRED_FIELDS keys
+    """
+    return dict(zip(REQUIRED_FIELDS, finding_values(finding)))
+
+
+def finding_values(finding: Mapping[str, Any]) -> List[Any]:
+    """
+    Get the values of the required fields of a finding, in REQUIRED_FIELDS order.
+
+    Args:
+        finding: Finding, either a Finding or a dictionary
+
+    Returns:
+        List of field values, with empty strings for missing fields
+    """
+    values = [finding.get(field, '') for field in REQUIRED_FIELDS]
+    if 'AccountType' not in finding and 'CheckType' in finding:
+        values[-1] = finding['CheckType']
+    return values
+
+
+class FindingSink:
+    """
+    Base class for outputs that receive findings while a scan is running.
+
+    Sinks are thread-safe, so checks completing on different worker threads
+    can write to the same sink. Each write is flushed to the underlying file,
+    so findings already written survive if the scan is interrupted.
+    """
+
+    def __init__(self):
+        """Initialize sink."""
+        self.counts: Counter = Counter()
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def write(self, findings: Iterable[Mapping[str, Any]]):
+        """
+        Write a batch of findings.
+
+        Args:
+            findings: Findings to write, usually those of one check
+        """
+        findings = list(findings)
+        with self._lock:
+            self._write_findings(findings)
+            for finding in findings:
+                self.counts[finding.get('Status', '')] += 1
+            self.total += len(findings)
+
+    def _write_findings(self, findings: List[Mapping[str, Any]]):
+        """Write findings to the output; called with the sink lock held."""
+        raise NotImplementedError
+
+    def close(self):
+        """Flush and close the sink."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class CsvSink(FindingSink):
+    """Sink writing findings to a CSV file with the REQUIRED_FIELDS columns."""
+
+    def __init__(self, output_file: str):
+        """
+        Initialize CSV sink and write the header row.
+
+        Args:
+            output_file: Path to output CSV file, gzip-compressed if it ends with .gz
+        """
+        super().__init__()
+        self.output_file = output_file
+        self._file = open_text(output_file, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(REQUIRED_FIELDS)
+        self._file.flush()
+
+    def _write_findings(self, findings: List[Mapping[str, Any]]):
+        self._writer.writerows(finding_values(finding) for finding in findings)
+        self._file.flush()
+
+    def close(self):
+        """Flush and close the CSV file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class JsonlSink(FindingSink):
+    """Sink writing one JSON object per finding (JSON Lines)."""
+
+    def __init__(self, output_file: str):
+        """
+        Initialize JSON Lines sink.
+
+        Args:
+            output_file: Path to output file, gzip-compressed if it ends with .gz
+        """
+        super().__init__()
+        self.output_file = output_file
+        self._file = open_text(output_file, 'w')
+
+    def _write_findings(self, findings: List[Mapping[str, Any]]):
+        for finding in findings:
+            self._file.write(json.dumps(finding_row(finding), default=str) + '\n')
+        self._file.flush()
+
+    def close(self):
+        """Flush and close the output file."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def open_sink(output_file: str, output_format: Optional[str] = None) -> FindingSink:
+    """
+    Open a sink for an output file.
+
+    Args:
+        output_file: Path to output file, gzip-compressed if it ends with .gz
+        output_format: 'csv' or 'jsonl'; inferred from the file extension if not given
+            (see infer_format)
+
+    Returns:
+        FindingSink writing to the file
+
+    Raises:
+        ValueError: If the output format is not supported
+    """
+    if output_format is None:
+        output_format = infer_format(output_file)
+    if output_format == 'csv':
+        return CsvSink(output_file)
+    if output_format == 'jsonl':
+        return JsonlSink(output_file)
+    raise ValueError(f"Unsupported output format: {output_format}")
+
+
+def read_findings(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read the findings of a CSV or JSON Lines findings file, one row at a time.
+
+    Args:
+        path: Findings file, in a format and compression selected by its extension
+
+    Yields:
+        Dictionary with exactly the REQUIRED_FIELDS keys for each finding
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If a JSON Lines record is not valid JSON
+    """
+    if infer_format(path) == 'jsonl':
+        with open_text(path) as f:
+            for line in f:
+                if line.strip():
+                    yield finding_row(json.loads(line))
+    else:
+        with open_text(path, newline='') as f:
+            for row in csv.DictReader(f):
+                yield finding_row(row)
+
 
 def write_csv_output(findings: List[Dict[str, Any]], output_file: str):
     """
     Write scan findings to a CSV file ensuring all required fields are present.
-    
+
     Args:
         findings: List of finding dictionaries
         output_file: Path to output CSV file
     """
     # Always create the CSV file, even if there are no findings
-    if not findings:
-        findings = []
-    
-    # Ensure each finding has all required fields
-    for finding in findings:
-        for field in REQUIRED_FIELDS:
-            if field not in finding:
-                finding[field] = ''  # Add empty string for missing fields
-        
-        # Handle the case where a finding might have CheckType but not AccountType
-        if 'CheckType' in finding and 'AccountType' not in finding:
-            finding['AccountType'] = finding['CheckType']
-            del finding['CheckType']
-    
-    with open(output_file, 'w', newline='') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=REQUIRED_FIELDS)
-        writer.writeheader()
-        for finding in findings:
-            # Only write the required fields, in the correct order
-            row = {field: finding.get(field, '') for field in REQUIRED_FIELDS}
-            writer.writerow(row)
+    with CsvSink(output_file) as sink:
+        sink.write(findings or [])
@@ -0,0 +1,109 @@
+import unittest
+from collections import Counter
+from unittest.mock import MagicMock
+import boto3
+from botocore.exceptions import ClientError
+from sraverify.core.cache import CacheManager
+from sraverify.core.context import ScanContext
+from sraverify.services.shield.base import ShieldCheck
+from sraverify.services.shield.client import ShieldClient
+
+REGION = 'us-east-1'
+RESOURCE_ARN = 'arn:aws:elasticloadbalancing:us-east-1:111111111111:loadbalancer/app/{}/1'
+
+
+def alarm(name, resource, namespace='AWS/DDoSProtection', metric='DDoSDetected'):
+    return {'AlarmName': name, 'Namespace': namespace, 'MetricName': metric,
+            'Dimensions': [{'Name': 'ResourceArn', 'Value': RESOURCE_ARN.format(resource)}]}
+
+
+class FakeCloudWatch:
+    """CloudWatch client with DDoSDetected and unrelated alarms over two pages."""
+
+    def __init__(self, denied=False):
+        self.denied = denied
+        self.calls = Counter()
+
+    def get_paginator(self, operation_name):
+        paginator = MagicMock()
+
+        def paginate(AlarmTypes):
+            self.calls['DescribeAlarms'] += 1
+            if self.denied:
+                raise ClientError({'Error': {'Code': 'AccessDenied', 'Message': 'denied'}}, 'DescribeAlarms')
+            yield {'MetricAlarms': [alarm('a-ddos', 'a'), alarm('a-cpu', 'a', 'AWS/EC2', 'CPUUtilization')]}
+            yield {'MetricAlarms': [alarm('b-ddos', 'b'), alarm('a-ddos-2', 'a')]}
+
+        paginator.paginate = paginate
+        return paginator
+
+    def describe_alarms_for_metric(self, MetricName, Namespace, Dimensions):
+        self.calls['DescribeAlarmsForMetric'] += 1
+        return {'MetricAlarms': [{'AlarmName': f"{Dimensions[0]['Value']}-alarm"}]}
+
+
+class Check(ShieldCheck):
+    def _setup_clients(self):
+        pass
+
+
+class TestDDoSAlarmIndex(unittest.TestCase):
+    def setUp(self):
+        self.cloudwatch = FakeCloudWatch()
+        self.check = self._check()
+
+    def _check(self, context=None):
+        check = Check()
+        check.session = MagicMock()
+        check.context = context or ScanContext(check.session, [REGION], CacheManager())
+        check.context._account_info = {'account_id': '111111111111', 'account_name': 'test'}
+        check.account_info = check.context.account_info
+        check.get_client(REGION).cloudwatch_client = self.cloudwatch
+        return check
+
+    def _alarm_names(self, resource, check=None):
+        response = (check or self.check).get_cloudwatch_alarms_for_resource(REGION, RESOURCE_ARN.format(resource))
+        return [a['AlarmName'] for a in response['DDoSDetectedAlarms']]
+
+    def test_alarms_are_indexed_by_resource(self):
+        self.assertEqual(self._alarm_names('a'), ['a-ddos', 'a-ddos-2'])
+        self.assertEqual(self._alarm_names('b'), ['b-ddos'])
+        self.assertEqual(self._alarm_names('unmonitored'), [])
+
+        self.assertEqual(self.cloudwatch.calls, Counter({'DescribeAlarms': 1}))
+
+    def test_checks_of_the_account_share_the_index(self):
+        self._alarm_names('a')
+        other = self._check(self.check.context)
+
+        self.assertEqual(self._alarm_names('b', other), ['b-ddos'])
+        self.assertEqual(self.cloudwatch.calls['DescribeAlarms'], 1)
+
+    def test_failed_listing_falls_back_per_resource(self):
+        self.cloudwatch.denied = True
+
+        self.assertEqual(self._alarm_names('a'), [RESOURCE_ARN.format('a') + '-alarm'])
+        self.assertEqual(self._alarm_names('b'), [RESOURCE_ARN.format('b') + '-alarm'])
+
+        # The failed listing is kept, so it is not retried for every resource
+        self.assertIn('Error', self.check.get_ddos_alarm_index(REGION))
+        self.assertEqual(self.cloudwatch.calls, Counter({'DescribeAlarms': 1, 'DescribeAlarmsForMetric': 2}))
+
+
+class TestShieldClients(unittest.TestCase):
+    def test_clients_are_created_per_region_on_demand(self):
+        check = Check()
+        check.session = boto3.Session(aws_access_key_id='AKIATEST', aws_secret_access_key='secret',
+                                      region_name=REGION)
+
+        client = check.get_client('eu-west-1')
+
+        self.assertIsInstance(client, ShieldClient)
+        self.assertIs(check.get_client('eu-west-1'), client)
+        self.assertEqual(client.wafv2_client.meta.region_name, 'eu-west-1')
+        # CloudFront is global, so its client is the us-east-1 one of every region
+        self.assertIs(client.cloudfront_client, check.get_client('ap-south-1').cloudfront_client)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import threading
+import unittest
+from collections import Counter
+from unittest.mock import MagicMock, patch
+from botocore.exceptions import ClientError
+from sraverify.core.cache import CacheManager
+from sraverify.core.context import ScanContext
+from sraverify.services.waf.checks.sra_waf_03 import SRA_WAF_03
+from sraverify.services.waf.client import WAFClient
+
+REGION = 'us-east-1'
+PROTECTED_ARN = 'arn:aws:apigateway:us-east-1::/restapis/api-1/stages/prod'
+
+
+class FakeAPIGateway:
+    """API Gateway client with three REST APIs; api-3's stages fail to list once."""
+
+    def __init__(self):
+        self.calls = Counter()
+        self._lock = threading.Lock()
+
+    def get_paginator(self, operation_name):
+        paginator = MagicMock()
+
+        def paginate():
+            self.calls['GetRestApis'] += 1
+            yield {'items': [{'id': 'api-1', 'name': 'orders'}, {'id': 'api-2', 'name': 'users'}]}
+            yield {'items': [{'id': 'api-3', 'name': 'admin'}]}
+
+        paginator.paginate = paginate
+        return paginator
+
+    def get_stages(self, restApiId):
+        with self._lock:
+            self.calls[('GetStages', restApiId)] += 1
+            first_call = self.calls[('GetStages', restApiId)] == 1
+        if restApiId == 'api-3' and first_call:
+            raise ClientError({'Error': {'Code': 'TooManyRequestsException', 'Message': 'Rate exceeded'}},
+                              'GetStages')
+        if restApiId == 'api-2':
+            return {'item': []}
+        return {'item': [{'stageName': 'prod'}]}
+
+
+class TestRestApiStageInventory(unittest.TestCase):
+    def setUp(self):
+        self.apigateway = FakeAPIGateway()
+        self.context = ScanContext(MagicMock(), [REGION], CacheManager())
+        self.context._account_info = {'account_id': '111111111111', 'account_name': 'test'}
+
+    def _check(self):
+        check = SRA_WAF_03()
+        with patch.object(SRA_WAF_03, '_setup_clients'):
+            check.initialize(self.context.session, regions=[REGION], context=self.context)
+        client = WAFClient(REGION, session=self.context.session)
+        client.apigateway_client = self.apigateway
+        check._clients[REGION] = client
+        return check
+
+    def test_stages_are_listed_once_per_account(self):
+        stages = self._check().get_rest_api_stages(REGION)
+
+        self.assertEqual(sorted(stages['Stages']), ['api-1', 'api-2'])
+        self.assertEqual(stages['Stages']['api-1']['item'][0]['stageArn'], PROTECTED_ARN)
+
+        # Another check reads the inventory from the cache
+        self._check().get_rest_api_stages(REGION)
+        self.assertEqual(self.apigateway.calls['GetRestApis'], 1)
+        self.assertEqual(self.apigateway.calls[('GetStages', 'api-1')], 1)
+
+    def test_failed_api_is_retried_by_get_stages(self):
+        check = self._check()
+        check.get_rest_api_stages(REGION)
+
+        self.assertEqual(check.get_stages(REGION, 'api-3'), {'item': [{'stageName': 'prod'}]})
+        self.assertEqual(check.get_stages(REGION, 'api-1')['item'][0]['stageName'], 'prod')
+        self.assertEqual(self.apigateway.calls[('GetStages', 'api-3')], 2)
+        self.assertEqual(self.apigateway.calls[('GetStages', 'api-1')], 1)
+
+    def test_execute_looks_up_stage_arns(self):
+        check = self._check()
+        looked_up = []
+
+        def web_acl_for_resource(region, resource_arn):
+            looked_up.append(resource_arn)
+            return {'WebACL': {'Name': 'api-acl'} if resource_arn == PROTECTED_ARN else None}
+
+        with patch.object(check, 'get_web_acl_for_resource', side_effect=web_acl_for_resource):
+            findings = check.execute()
+
+        statuses = {finding['ResourceId']: finding['Status'] for finding in findings}
+        self.assertEqual(statuses, {'orders/prod': 'PASS', 'users': 'FAIL', 'admin/prod': 'FAIL'})
+        self.assertEqual(looked_up, [PROTECTED_ARN, 'arn:aws:apigateway:us-east-1::/restapis/api-3/stages/prod'])
+
+
+if __name__ == '__main__':
+    unittest.main()
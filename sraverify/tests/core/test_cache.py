@@ -0,0 +1,112 @@
+import datetime
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from sraverify.core import cache as cache_module
+from sraverify.core.cache import CacheManager, DiskCache, decode_value, encode_value
+
+
+class TestEncoding(unittest.TestCase):
+    def test_round_trip(self):
+        value = {
+            'Detectors': [{'CreatedAt': datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)}],
+            'Key': ('us-east-1', 'detector-1'),
+            'Blob': b'\x00\x01',
+            1: None,
+        }
+        self.assertEqual(decode_value(encode_value(value)), value)
+
+    def test_unknown_type(self):
+        with self.assertRaises(TypeError):
+            encode_value(object())
+
+
+class TestDiskCache(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.directory = tmp_dir.name
+
+    def test_ttl_overrides(self):
+        store = DiskCache(self.directory, ttl=60, ttl_overrides={
+            'organizations.*': 600, 'organizations.directory': 3600, 'guardduty.*': 0, 'guardduty.detector*': 30})
+
+        self.assertEqual(store.ttl_for('securityhub.hub'), 60)
+        self.assertEqual(store.ttl_for('organizations.accounts'), 600)
+        # An exact override wins over a pattern
+        self.assertEqual(store.ttl_for('organizations.directory'), 3600)
+        # The longest matching pattern wins
+        self.assertEqual(store.ttl_for('guardduty.detector_ids'), 30)
+        self.assertEqual(store.ttl_for('guardduty.findings'), 0)
+
+    def test_entries_expire(self):
+        store = DiskCache(self.directory, ttl=60)
+        with patch.object(cache_module.time, 'time', return_value=1000.0):
+            store.store('guardduty.detector_ids', '111111111111', 'us-east-1', ['detector-1'])
+        with patch.object(cache_module.time, 'time', return_value=1059.0):
+            self.assertEqual(store.load('guardduty.detector_ids', '111111111111', 'us-east-1'),
+                             (True, ['detector-1']))
+            self.assertEqual(store.load('guardduty.detector_ids', '222222222222', 'us-east-1'), (False, None))
+        with patch.object(cache_module.time, 'time', return_value=1061.0):
+            self.assertEqual(store.load('guardduty.detector_ids', '111111111111', 'us-east-1'), (False, None))
+
+    def test_disabled_namespace_is_not_written(self):
+        store = DiskCache(self.directory, ttl=60, ttl_overrides={'guardduty.*': 0})
+        store.store('guardduty.detector_ids', '111111111111', 'us-east-1', ['detector-1'])
+        self.assertEqual(os.listdir(self.directory), [])
+
+    def test_failures_are_not_persisted(self):
+        store = DiskCache(self.directory)
+        store.store('guardduty.detector_id', '111111111111', 'us-east-1', None)
+        store.store('guardduty.detectors', '111111111111', 'us-east-1',
+                    {'Error': {'Code': 'AccessDenied', 'Message': 'denied'}})
+        store.store('guardduty.client', '111111111111', 'us-east-1', object())
+        self.assertEqual(os.listdir(self.directory), [])
+
+        # Falsy values that are real answers are kept
+        store.store('guardduty.detector_ids', '111111111111', 'us-east-1', [])
+        self.assertEqual(store.load('guardduty.detector_ids', '111111111111', 'us-east-1'), (True, []))
+
+
+class TestCacheManager(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.directory = tmp_dir.name
+
+    def test_views_are_scoped_by_account(self):
+        cache = CacheManager()
+        first = cache.view('guardduty.detector_ids', '111111111111')
+        first['us-east-1'] = ['detector-1']
+
+        self.assertIn('us-east-1', first)
+        self.assertNotIn('us-east-1', cache.view('guardduty.detector_ids', '222222222222'))
+        self.assertEqual(cache.stats()['guardduty.detector_ids'], {'hits': 1, 'disk_hits': 0, 'misses': 1})
+
+        cache.clear('111111111111')
+        self.assertEqual(len(cache), 0)
+
+    def test_next_scan_reads_persisted_entries(self):
+        CacheManager(DiskCache(self.directory)).view('guardduty.detector_ids', '111111111111')['us-east-1'] = ['d']
+
+        cache = CacheManager(DiskCache(self.directory))
+        view = cache.view('guardduty.detector_ids', '111111111111')
+        self.assertEqual(view.get('us-east-1'), ['d'])
+        self.assertEqual(cache.stats()['guardduty.detector_ids']['disk_hits'], 1)
+
+        # refresh ignores persisted entries
+        refreshed = CacheManager(DiskCache(self.directory), refresh=True)
+        self.assertNotIn('us-east-1', refreshed.view('guardduty.detector_ids', '111111111111'))
+
+    def test_none_is_cached_for_the_scan_only(self):
+        cache = CacheManager(DiskCache(self.directory))
+        cache.view('guardduty.detector_id', '111111111111')['us-east-1'] = None
+
+        self.assertIn('us-east-1', cache.view('guardduty.detector_id', '111111111111'))
+        self.assertNotIn('us-east-1', CacheManager(DiskCache(self.directory)).view(
+            'guardduty.detector_id', '111111111111'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import patch
+import boto3
+from sraverify.core import clients
+from sraverify.core.clients import ClientPool, lazy_client
+from sraverify.core.ratelimit import RateLimiter
+
+
+def session(access_key='AKIATEST', region_name='us-east-1'):
+    return boto3.Session(aws_access_key_id=access_key, aws_secret_access_key='secret', region_name=region_name)
+
+
+class TestClientPool(unittest.TestCase):
+    def setUp(self):
+        self.rate_limiter = RateLimiter()
+        self.pool = ClientPool(rate_limiter=self.rate_limiter, metrics=None)
+
+    def test_clients_are_reused(self):
+        aws_session = session()
+
+        client = self.pool.get_client(aws_session, 'guardduty')
+
+        self.assertIs(self.pool.get_client(aws_session, 'guardduty'), client)
+        self.assertIs(self.pool.get_client(aws_session, 'guardduty', 'us-east-1'), client)
+        self.assertEqual(client.meta.region_name, 'us-east-1')
+        self.assertEqual(len(self.pool), 1)
+
+    def test_clients_are_kept_apart_by_service_region_and_session(self):
+        first, second = session('AKIAFIRST'), session('AKIASECOND')
+
+        clients = {
+            self.pool.get_client(first, 'guardduty'),
+            self.pool.get_client(first, 'guardduty', 'eu-west-1'),
+            self.pool.get_client(first, 'securityhub'),
+            self.pool.get_client(second, 'guardduty'),
+        }
+
+        self.assertEqual(len(clients), 4)
+        self.assertEqual(len(self.pool), 4)
+
+    def test_release_drops_only_the_session_clients_and_buckets(self):
+        first, second = session('AKIAFIRST'), session('AKIASECOND')
+        released = self.pool.get_client(first, 'guardduty')
+        kept = self.pool.get_client(second, 'guardduty')
+        self.rate_limiter.bucket(ClientPool._credentials_key(first), 'us-east-1', 'guardduty', 'ListDetectors')
+        self.rate_limiter.bucket(ClientPool._credentials_key(second), 'us-east-1', 'guardduty', 'ListDetectors')
+
+        self.pool.release(first)
+
+        self.assertEqual(len(self.pool), 1)
+        self.assertIs(self.pool.get_client(second, 'guardduty'), kept)
+        self.assertIsNot(self.pool.get_client(first, 'guardduty'), released)
+        self.assertEqual([key[0] for key in self.rate_limiter._buckets],
+                         [ClientPool._credentials_key(second)])
+
+    def test_clear(self):
+        client = self.pool.get_client(session(), 'guardduty')
+        self.pool.clear()
+        self.assertEqual(len(self.pool), 0)
+        self.assertIsNot(self.pool.get_client(session(), 'guardduty'), client)
+
+
+class ServiceClient:
+    guardduty_client = lazy_client('guardduty')
+    home_client = lazy_client('securityhub', region_name='us-east-1')
+
+    def __init__(self, aws_session, region):
+        self.session = aws_session
+        self.region = region
+
+
+class TestLazyClient(unittest.TestCase):
+    def setUp(self):
+        self.pool = ClientPool(rate_limiter=None, metrics=None)
+        patcher = patch.object(clients, 'client_pool', self.pool)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.session = session()
+
+    def test_client_created_on_first_access(self):
+        wrapper = ServiceClient(self.session, 'eu-west-1')
+        self.assertEqual(len(self.pool), 0)
+
+        client = wrapper.guardduty_client
+
+        self.assertEqual(client.meta.region_name, 'eu-west-1')
+        self.assertIs(wrapper.guardduty_client, client)
+        self.assertEqual(len(self.pool), 1)
+
+    def test_wrappers_share_pooled_clients(self):
+        first = ServiceClient(self.session, 'eu-west-1')
+        second = ServiceClient(self.session, 'eu-west-1')
+
+        self.assertIs(first.guardduty_client, second.guardduty_client)
+        # Fixed-region clients are shared across the wrappers of every region
+        self.assertIs(first.home_client, ServiceClient(self.session, 'ap-south-1').home_client)
+        self.assertEqual(first.home_client.meta.region_name, 'us-east-1')
+
+    def test_released_session_gets_new_clients(self):
+        client = ServiceClient(self.session, 'eu-west-1').guardduty_client
+
+        self.pool.release(self.session)
+
+        self.assertIsNot(ServiceClient(self.session, 'eu-west-1').guardduty_client, client)
+
+    def test_attribute_can_be_replaced(self):
+        wrapper = ServiceClient(self.session, 'eu-west-1')
+        wrapper.guardduty_client = 'stub'
+        self.assertEqual(wrapper.guardduty_client, 'stub')
+        self.assertEqual(len(self.pool), 0)
+        self.assertIsInstance(ServiceClient.guardduty_client, lazy_client)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from sraverify.core.finding import Finding, FindingMetadata
+
+
+class TestFinding(unittest.TestCase):
+    def setUp(self):
+        self.metadata = FindingMetadata(
+            check_id="SRA-TEST-1",
+            title="Test check",
+            severity="High",
+            description="Checks something",
+            resource_type="AWS::Test::Resource",
+            account_id="123456789012",
+            account_name="test",
+            service="Test",
+            check_logic="Looks at something",
+            account_type="application"
+        )
+        self.finding = self._finding("us-east-1")
+
+    def _finding(self, region, status="PASS"):
+        return Finding(self.metadata, status, region, "resource-1", "enabled", "enabled", "None")
+
+    def test_reads_finding_and_metadata_fields(self):
+        self.assertEqual(self.finding['Status'], 'PASS')
+        self.assertEqual(self.finding['Region'], 'us-east-1')
+        self.assertEqual(self.finding['CheckId'], 'SRA-TEST-1')
+        self.assertEqual(self.finding.get('AccountId'), '123456789012')
+        self.assertIsNone(self.finding.get('Missing'))
+        with self.assertRaises(KeyError):
+            self.finding['Missing']
+
+    def test_keys_are_in_output_order(self):
+        keys = list(self.finding)
+        self.assertEqual(keys[:3], ['CheckId', 'Status', 'Region'])
+        self.assertEqual(keys[-1], 'AccountType')
+        self.assertEqual(len(self.finding), len(keys))
+
+    def test_set_finding_field(self):
+        self.finding['Status'] = 'FAIL'
+        self.assertEqual(self.finding['Status'], 'FAIL')
+        self.assertEqual(self.finding.status, 'FAIL')
+
+    def test_metadata_override_does_not_affect_other_findings(self):
+        other = self._finding("eu-west-1")
+        self.finding['Severity'] = 'Low'
+        self.assertEqual(self.finding['Severity'], 'Low')
+        self.assertEqual(other['Severity'], 'High')
+        self.assertEqual(self.metadata.severity, 'High')
+
+    def test_extra_keys(self):
+        self.finding['Extra'] = 1
+        self.assertIn('Extra', self.finding)
+        self.assertEqual(list(self.finding)[-1], 'Extra')
+        del self.finding['Extra']
+        self.assertNotIn('Extra', self.finding)
+        with self.assertRaises(KeyError):
+            del self.finding['Extra']
+
+    def test_delete_standard_field(self):
+        del self.finding['Remediation']
+        self.assertNotIn('Remediation', self.finding)
+        self.assertNotIn('Remediation', list(self.finding))
+        self.assertNotIn('Remediation', self.finding.to_dict())
+        with self.assertRaises(KeyError):
+            self.finding['Remediation']
+        with self.assertRaises(KeyError):
+            del self.finding['Remediation']
+
+    def test_set_deleted_fields_again(self):
+        del self.finding['Remediation']
+        del self.finding['Title']
+        self.finding['Remediation'] = 'Enable it'
+        self.finding['Title'] = 'New title'
+        self.assertEqual(self.finding['Remediation'], 'Enable it')
+        self.assertEqual(self.finding['Title'], 'New title')
+        self.assertEqual(len(self.finding), len(self._finding("us-east-1")))
+
+    def test_equality(self):
+        self.assertEqual(self.finding, self._finding("us-east-1"))
+        self.assertEqual(self.finding, self.finding.to_dict())
+        self.assertEqual(self.finding.to_dict(), self.finding)
+        self.assertNotEqual(self.finding, self._finding("eu-west-1"))
+        self.assertNotEqual(self.finding, self._finding("us-east-1", status="FAIL"))
+
+        other = self._finding("us-east-1")
+        other['Severity'] = 'Low'
+        self.assertNotEqual(self.finding, other)
+        del other['Severity']
+        self.assertNotEqual(self.finding, other)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from botocore.exceptions import ClientError
+from sraverify.core import context as context_module
+from sraverify.core.cache import CacheManager
+from sraverify.core.check import SecurityCheck
+from sraverify.core.context import ScanContext
+from sraverify.core.orgdirectory import OrgDirectory
+
+
+def account(account_id, status='ACTIVE'):
+    return {'Id': account_id, 'Arn': f'arn:aws:organizations::111111111111:account/o-test/{account_id}',
+            'Status': status}
+
+
+ACCOUNTS = [account('111111111111'), account('222222222222'), account('333333333333', 'SUSPENDED')]
+
+
+class Check(SecurityCheck):
+    def _setup_clients(self):
+        pass
+
+
+class TestOrgDirectory(unittest.TestCase):
+    def test_indexes(self):
+        directory = OrgDirectory(ACCOUNTS)
+
+        self.assertIn('222222222222', directory)
+        self.assertNotIn('444444444444', directory)
+        self.assertEqual(directory.get('333333333333')['Status'], 'SUSPENDED')
+        self.assertIsNone(directory.get('444444444444'))
+        self.assertEqual(directory.with_status('ACTIVE'), {'111111111111', '222222222222'})
+        self.assertEqual(directory.with_status('PENDING_CLOSURE'), frozenset())
+        self.assertEqual([a['Id'] for a in directory.active_accounts()], ['111111111111', '222222222222'])
+        self.assertEqual(len(directory), 3)
+
+
+class TestScanContextOrgDirectory(unittest.TestCase):
+    def setUp(self):
+        self.context = ScanContext(MagicMock(), ['us-east-1'], CacheManager())
+        self.context._account_info = {'account_id': '111111111111', 'account_name': 'management'}
+        patcher = patch.object(context_module, 'list_organization_accounts')
+        self.list_accounts = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(context_module, 'get_client')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_accounts_listed_once(self):
+        self.list_accounts.return_value = ACCOUNTS
+
+        first = self.context.org_directory
+        second = self.context.org_directory
+
+        self.assertIs(first, second)
+        self.assertEqual(self.list_accounts.call_count, 1)
+
+    def test_cleared_cache_lists_again(self):
+        self.list_accounts.return_value = ACCOUNTS
+        first = self.context.org_directory
+
+        self.context.cache.clear()
+        self.list_accounts.return_value = ACCOUNTS[:1]
+
+        self.assertIsNot(self.context.org_directory, first)
+        self.assertEqual(len(self.context.org_directory), 1)
+        self.assertEqual(self.list_accounts.call_count, 2)
+
+    def test_failed_listing_is_not_repeated(self):
+        self.list_accounts.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDeniedException', 'Message': 'denied'}}, 'ListAccounts')
+
+        for _ in range(3):
+            with self.assertRaises(ClientError):
+                self.context.org_directory
+        self.assertEqual(self.list_accounts.call_count, 1)
+
+        # A new run lists the accounts again
+        self.list_accounts.side_effect = None
+        self.list_accounts.return_value = ACCOUNTS
+        self.context.reset()
+        self.assertEqual(len(self.context.org_directory), 3)
+        self.assertEqual(self.list_accounts.call_count, 2)
+
+    def test_active_account_ids(self):
+        self.list_accounts.return_value = ACCOUNTS
+        check = Check()
+        check.context = self.context
+
+        active = check.get_active_account_ids()
+        active.discard('111111111111')
+
+        self.assertEqual(check.get_active_account_ids(), {'111111111111', '222222222222'})
+
+    def test_active_account_ids_empty_on_error(self):
+        self.list_accounts.side_effect = ClientError(
+            {'Error': {'Code': 'AccessDeniedException', 'Message': 'denied'}}, 'ListAccounts')
+        check = Check()
+        check.context = self.context
+
+        self.assertEqual(check.get_active_account_ids(), set())
+        self.assertEqual(check.get_active_account_ids(), set())
+        self.assertEqual(self.list_accounts.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
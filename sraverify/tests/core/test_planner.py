@@ -0,0 +1,112 @@
+import threading
+import unittest
+from collections import Counter
+from sraverify.core.planner import (ACCOUNT, DataRequirement, execute_plan, plan_prefetch,
+                                    requirement_key, requirements_of)
+
+
+class Context:
+    account_id = '111111111111'
+
+    def __init__(self):
+        self.prefetched = set()
+
+
+class ServiceBase:
+    """Stands in for a service base class with shared accessors."""
+
+    calls = Counter()
+    lock = threading.Lock()
+
+    def _record(self, name, region=None):
+        with self.lock:
+            ServiceBase.calls[(name, region)] += 1
+
+    def get_detector_id(self, region):
+        self._record('get_detector_id', region)
+
+    def get_detector_details(self, region):
+        self._record('get_detector_details', region)
+
+    def get_delegated_admin(self):
+        self._record('get_delegated_admin')
+
+
+class CheckA(ServiceBase):
+    data_requirements = ('get_detector_id', 'get_detector_details')
+
+
+class CheckB(ServiceBase):
+    data_requirements = ('get_detector_id', DataRequirement('get_delegated_admin', ACCOUNT))
+
+
+class CheckC(ServiceBase):
+    """Overrides an accessor, so its data is not the base class data."""
+
+    data_requirements = ('get_detector_id',)
+
+    def get_detector_id(self, region):
+        self._record('CheckC.get_detector_id', region)
+
+
+class FailingCheck(ServiceBase):
+    data_requirements = ('get_findings',)
+
+    def get_findings(self, region):
+        raise RuntimeError('denied')
+
+
+class TestPlanner(unittest.TestCase):
+    def setUp(self):
+        ServiceBase.calls.clear()
+
+    def test_requirements_of(self):
+        self.assertEqual(requirements_of(CheckB), [DataRequirement('get_detector_id'),
+                                                   DataRequirement('get_delegated_admin', ACCOUNT)])
+
+        class Unknown(ServiceBase):
+            data_requirements = (DataRequirement('get_detector_id', 'organization'),)
+
+        with self.assertRaises(ValueError):
+            requirements_of(Unknown)
+
+    def test_shared_accessors_are_planned_once(self):
+        plan = plan_prefetch([('GuardDuty', CheckA), ('GuardDuty', CheckB), ('GuardDuty', CheckA)])
+
+        self.assertEqual(len(plan), 3)
+        self.assertEqual(plan.call_count(region_count=4), 4 + 4 + 1)
+        # CheckA inherits get_delegated_admin too, so one instance makes every call
+        self.assertEqual(plan.owners(), [CheckA])
+        self.assertEqual(requirement_key(CheckA, DataRequirement('get_detector_id')),
+                         requirement_key(CheckB, DataRequirement('get_detector_id')))
+
+    def test_overridden_accessor_is_planned_separately(self):
+        plan = plan_prefetch([('GuardDuty', CheckA), ('GuardDuty', CheckC)])
+
+        self.assertEqual(len(plan), 3)
+        self.assertEqual(plan.owners(), [CheckA, CheckC])
+
+    def test_execute_plan_calls_each_accessor_once_per_region(self):
+        plan = plan_prefetch([('GuardDuty', CheckA), ('GuardDuty', CheckB), ('Other', FailingCheck)])
+        context = Context()
+        checks = {owner: owner() for owner in plan.owners()}
+
+        execute_plan(plan, checks, ['us-east-1', 'eu-west-1'], context, max_workers=4)
+
+        self.assertEqual(ServiceBase.calls, Counter({
+            ('get_detector_id', 'us-east-1'): 1, ('get_detector_id', 'eu-west-1'): 1,
+            ('get_detector_details', 'us-east-1'): 1, ('get_detector_details', 'eu-west-1'): 1,
+            ('get_delegated_admin', None): 1,
+        }))
+        detector_key = requirement_key(CheckA, DataRequirement('get_detector_id'))
+        admin_key = requirement_key(CheckB, DataRequirement('get_delegated_admin', ACCOUNT))
+        self.assertIn((detector_key, 'eu-west-1'), context.prefetched)
+        self.assertIn((admin_key, None), context.prefetched)
+        # Failed calls are not marked as prefetched, so the check makes them itself
+        findings_key = requirement_key(FailingCheck, DataRequirement('get_findings'))
+        self.assertNotIn((findings_key, 'us-east-1'), context.prefetched)
+        self.assertEqual(len(context.prefetched), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
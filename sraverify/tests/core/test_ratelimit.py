@@ -0,0 +1,108 @@
+import unittest
+from unittest.mock import patch
+from sraverify.core import ratelimit
+from sraverify.core.ratelimit import (
+    BACKOFF_FACTOR, MIN_RATE, RECOVERY_STEP, RateLimiter, TokenBucket
+)
+
+
+class FakeClock:
+    """Stands in for the time module, so waiting for tokens takes no real time."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = patch.object(ratelimit, 'time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate=2.0, burst=3)
+        for _ in range(3):
+            self.assertEqual(bucket.acquire(), 0.0)
+        self.assertAlmostEqual(bucket.acquire(), 0.5)
+        self.assertEqual(self.clock.sleeps, [0.5])
+
+    def test_refill_is_capped_at_burst(self):
+        bucket = TokenBucket(rate=2.0, burst=2)
+        bucket.acquire()
+        bucket.acquire()
+        self.clock.now += 60
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertEqual(bucket.acquire(), 0.0)
+        self.assertGreater(bucket.acquire(), 0.0)
+
+    def test_throttle_halves_rate_and_drains_burst(self):
+        bucket = TokenBucket(rate=10.0, burst=10)
+        bucket.throttled()
+        self.assertEqual(bucket.rate, 10.0 * BACKOFF_FACTOR)
+        # The remaining burst is dropped, so the next call waits for a token
+        self.assertAlmostEqual(bucket.acquire(), 1 / bucket.rate)
+
+    def test_throttle_never_goes_below_min_rate(self):
+        bucket = TokenBucket(rate=10.0, burst=10)
+        for _ in range(20):
+            bucket.throttled()
+        self.assertEqual(bucket.rate, MIN_RATE)
+
+    def test_success_restores_rate_gradually(self):
+        bucket = TokenBucket(rate=10.0, burst=10)
+        bucket.throttled()
+        bucket.succeeded()
+        self.assertAlmostEqual(bucket.rate, 10.0 * BACKOFF_FACTOR + 10.0 * RECOVERY_STEP)
+        for _ in range(100):
+            bucket.succeeded()
+        self.assertEqual(bucket.rate, 10.0)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.limiter = RateLimiter(
+            budgets={('securityhub', None): (10.0, 30), ('securityhub', 'GetFindings'): (3.0, 6)},
+            default_budget=(20.0, 20)
+        )
+
+    def test_operations_share_the_service_bucket(self):
+        bucket = self.limiter.bucket('creds', 'us-east-1', 'securityhub', 'DescribeHub')
+        self.assertIs(bucket, self.limiter.bucket('creds', 'us-east-1', 'securityhub', 'GetEnabledStandards'))
+        self.assertEqual((bucket.rate, bucket.burst), (10.0, 30))
+
+    def test_operation_budget_gets_its_own_bucket(self):
+        bucket = self.limiter.bucket('creds', 'us-east-1', 'securityhub', 'GetFindings')
+        self.assertIsNot(bucket, self.limiter.bucket('creds', 'us-east-1', 'securityhub', 'DescribeHub'))
+        self.assertEqual((bucket.rate, bucket.burst), (3.0, 6))
+
+    def test_buckets_are_per_credentials_and_region(self):
+        bucket = self.limiter.bucket('creds', 'us-east-1', 'guardduty', 'ListDetectors')
+        self.assertEqual((bucket.rate, bucket.burst), (20.0, 20))
+        self.assertIsNot(bucket, self.limiter.bucket('other', 'us-east-1', 'guardduty', 'ListDetectors'))
+        self.assertIsNot(bucket, self.limiter.bucket('creds', 'eu-west-1', 'guardduty', 'ListDetectors'))
+
+    def test_throttle_only_slows_its_own_bucket(self):
+        throttled = self.limiter.bucket('creds', 'us-east-1', 'guardduty', 'ListDetectors')
+        other = self.limiter.bucket('other', 'us-east-1', 'guardduty', 'ListDetectors')
+        throttled.throttled()
+        self.assertLess(throttled.rate, other.rate)
+
+    def test_release_drops_buckets_of_credentials(self):
+        bucket = self.limiter.bucket('creds', 'us-east-1', 'guardduty', 'ListDetectors')
+        other = self.limiter.bucket('other', 'us-east-1', 'guardduty', 'ListDetectors')
+        self.limiter.release('creds')
+        self.assertIsNot(bucket, self.limiter.bucket('creds', 'us-east-1', 'guardduty', 'ListDetectors'))
+        self.assertIs(other, self.limiter.bucket('other', 'us-east-1', 'guardduty', 'ListDetectors'))
+
+
+if __name__ == '__main__':
+    unittest.main()
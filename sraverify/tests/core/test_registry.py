@@ -0,0 +1,103 @@
+import os
+import subprocess
+import sys
+import unittest
+import sraverify.services.manifest as manifest_module
+from sraverify.core.check import SecurityCheck
+from sraverify.core.registry import CheckRegistry, discover_checks, render_manifest
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Prints whether any GuardDuty check module is imported, before and after a check class is requested
+LAZY_IMPORT_SCRIPT = """
+import sys
+from sraverify.main import ALL_CHECKS
+
+def imported():
+    return any(name.startswith('sraverify.services.guardduty.checks.sra_') for name in sys.modules)
+
+before = imported()
+ALL_CHECKS.select(services=['GuardDuty'], min_severity='HIGH')
+after_select = imported()
+check_class = ALL_CHECKS['SRA-GUARDDUTY-01']
+print(before, after_select, imported(), check_class.__name__)
+"""
+
+
+def entry(service, account_type='application', severity='HIGH'):
+    return {'module': 'sraverify.services.test', 'class_name': 'Missing', 'service': service,
+            'account_type': account_type, 'name': 'Test', 'description': 'Test', 'severity': severity}
+
+
+MANIFEST = {
+    'SRA-A-1': entry('ServiceA'),
+    'SRA-A-2': entry('ServiceA', 'audit', 'LOW'),
+    'SRA-B-1': entry('ServiceB', 'management', 'MEDIUM'),
+    'SRA-B-2': entry('ServiceB', severity='CRITICAL'),
+}
+
+
+class RegisteredCheck(SecurityCheck):
+    check_id = 'SRA-C-1'
+    check_name = 'Registered check'
+    service = 'ServiceC'
+    severity = 'LOW'
+
+    def _setup_clients(self):
+        pass
+
+
+class TestCheckRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = CheckRegistry(MANIFEST)
+
+    def _selected(self, **kwargs):
+        return [spec.check_id for spec in self.registry.select(**kwargs)]
+
+    def test_select(self):
+        self.assertEqual(self._selected(), list(MANIFEST))
+        self.assertEqual(self._selected(account_type='application'), ['SRA-A-1', 'SRA-B-2'])
+        self.assertEqual(self._selected(services=['serviceb']), ['SRA-B-1', 'SRA-B-2'])
+        self.assertEqual(self._selected(min_severity='medium'), ['SRA-A-1', 'SRA-B-1', 'SRA-B-2'])
+        self.assertEqual(self._selected(exclude=['ServiceA', 'SRA-B-1']), ['SRA-B-2'])
+        self.assertEqual(self._selected(check_ids=['SRA-B-2', 'SRA-X-1']), ['SRA-B-2'])
+        self.assertEqual(self._selected(account_type='application', services=['ServiceA']), ['SRA-A-1'])
+        with self.assertRaises(ValueError):
+            self._selected(min_severity='urgent')
+
+    def test_metadata_does_not_import_checks(self):
+        # The manifest points at a module that does not exist, so any import would fail
+        self.assertEqual(self.registry.services(), ['ServiceA', 'ServiceB'])
+        self.assertEqual(self.registry.spec('SRA-A-2').account_type, 'audit')
+        self.assertIn('SRA-A-1', self.registry)
+        self.assertEqual(len(self.registry), 4)
+        with self.assertRaises(ModuleNotFoundError):
+            self.registry['SRA-A-1']
+
+    def test_register_and_remove_class(self):
+        self.registry['SRA-C-1'] = RegisteredCheck
+
+        self.assertIs(self.registry['SRA-C-1'], RegisteredCheck)
+        self.assertEqual(self._selected(services=['ServiceC']), ['SRA-C-1'])
+        self.assertEqual(self.registry.spec('SRA-C-1').name, 'Registered check')
+
+        del self.registry['SRA-C-1']
+        self.assertEqual(self._selected(services=['ServiceC']), [])
+
+
+class TestManifest(unittest.TestCase):
+    def test_manifest_is_up_to_date(self):
+        with open(manifest_module.__file__, 'r', encoding='utf-8') as f:
+            current = f.read()
+        self.assertEqual(current, render_manifest(discover_checks()),
+                         "Run python -m sraverify.core.registry to regenerate the manifest")
+
+    def test_check_modules_are_imported_on_first_use(self):
+        env = dict(os.environ, PYTHONPATH=PACKAGE_DIR)
+        result = subprocess.run([sys.executable, '-c', LAZY_IMPORT_SCRIPT], env=env,
+                                capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.split(), ['False', 'False', 'True', 'SRA_GUARDDUTY_01'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import datetime
+import unittest
+from unittest.mock import MagicMock, patch
+import boto3
+from sraverify.core import session as session_module
+from sraverify.core.clients import ClientPool
+from sraverify.core.session import SessionPool, assume_role, role_arn_for_account
+
+ROLE_ARN = 'arn:aws:iam::222222222222:role/SRAMemberRole'
+
+
+class FakeSTS:
+    """Answers AssumeRole with new keys every call, expiring after a given time."""
+
+    def __init__(self, lifetime):
+        self.lifetime = lifetime
+        self.calls = 0
+
+    def assume_role(self, RoleArn, RoleSessionName):
+        self.calls += 1
+        return {'Credentials': {
+            'AccessKeyId': f'ASIA{self.calls}',
+            'SecretAccessKey': 'secret',
+            'SessionToken': 'token',
+            'Expiration': datetime.datetime.now(datetime.timezone.utc) + self.lifetime,
+        }}
+
+
+def base_session():
+    return boto3.Session(aws_access_key_id='AKIATEST', aws_secret_access_key='secret', region_name='us-east-1')
+
+
+class TestAssumeRole(unittest.TestCase):
+    def _assume(self, lifetime):
+        sts = FakeSTS(lifetime)
+        with patch.object(session_module, 'get_client', return_value=sts):
+            return assume_role(base_session(), ROLE_ARN, region='eu-west-1'), sts
+
+    def test_credentials_are_not_refreshed_before_expiry(self):
+        session, sts = self._assume(datetime.timedelta(hours=1))
+
+        self.assertEqual(session.region_name, 'eu-west-1')
+        self.assertEqual(session.get_credentials().get_frozen_credentials().access_key, 'ASIA1')
+        self.assertEqual(sts.calls, 1)
+
+    def test_role_is_assumed_again_near_expiry(self):
+        # Within botocore's refresh window from the start
+        session, sts = self._assume(datetime.timedelta(minutes=5))
+
+        first = session.get_credentials().get_frozen_credentials().access_key
+        second = session.get_credentials().get_frozen_credentials().access_key
+
+        self.assertNotEqual(first, second)
+        self.assertGreater(sts.calls, 1)
+
+    def test_refreshed_session_keeps_its_clients(self):
+        session, sts = self._assume(datetime.timedelta(minutes=5))
+        pool = ClientPool(rate_limiter=None, metrics=None)
+
+        client = pool.get_client(session, 'guardduty')
+        session.get_credentials().get_frozen_credentials()
+
+        self.assertIs(pool.get_client(session, 'guardduty'), client)
+        pool.release(session)
+        self.assertEqual(len(pool), 0)
+
+
+class TestSessionPool(unittest.TestCase):
+    def test_role_assumed_once_until_released(self):
+        pool = SessionPool(base_session())
+        with patch.object(session_module, 'assume_role', side_effect=lambda *a, **k: MagicMock()) as assume:
+            first = pool.get_session(ROLE_ARN)
+            self.assertIs(pool.get_session(ROLE_ARN), first)
+            pool.release(ROLE_ARN)
+            self.assertIsNot(pool.get_session(ROLE_ARN), first)
+        self.assertEqual(assume.call_count, 2)
+
+    def test_failure_names_the_role(self):
+        pool = SessionPool(base_session())
+        with patch.object(session_module, 'assume_role', side_effect=Exception('denied')):
+            with self.assertRaisesRegex(Exception, ROLE_ARN):
+                pool.get_session(ROLE_ARN)
+
+    def test_role_arn_for_account(self):
+        self.assertEqual(role_arn_for_account('SRAMemberRole', '333333333333', 'aws-us-gov'),
+                         'arn:aws-us-gov:iam::333333333333:role/SRAMemberRole')
+        self.assertEqual(role_arn_for_account(ROLE_ARN, '333333333333'),
+                         'arn:aws:iam::333333333333:role/SRAMemberRole')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import boto3
+from botocore.stub import Stubber
+from sraverify.core.clients import ClientPool
+from sraverify.core.snapshot import MISSING_RESPONSE_CODE, RECORD, REPLAY, Snapshot
+
+PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Records or replays a call whose list parameter is built from a set, as checks do
+ROUND_TRIP_SCRIPT = """
+import sys
+import boto3
+from botocore.stub import Stubber
+from sraverify.core.clients import ClientPool
+from sraverify.core.snapshot import RECORD, Snapshot
+
+mode, path = sys.argv[1:3]
+pool = ClientPool(rate_limiter=None, metrics=None)
+snapshot = Snapshot(path, mode)
+pool.use_snapshot(snapshot)
+session = boto3.Session(aws_access_key_id='AKIATEST', aws_secret_access_key='secret', region_name='us-east-1')
+client = pool.get_client(session, 'inspector2')
+account_ids = list({f'{i:012d}' for i in range(20)})
+if mode == RECORD:
+    stubber = Stubber(client)
+    stubber.add_response('batch_get_account_status', {'accounts': [], 'failedAccounts': [
+        {'accountId': '000000000007', 'errorCode': 'ACCESS_DENIED', 'errorMessage': 'denied'}]})
+    stubber.activate()
+response = client.batch_get_account_status(accountIds=account_ids)
+snapshot.close()
+print(','.join(account_ids))
+print(response['failedAccounts'][0]['accountId'], snapshot.replayed, snapshot.missing)
+"""
+
+
+def session():
+    return boto3.Session(aws_access_key_id='AKIATEST', aws_secret_access_key='secret', region_name='us-east-1')
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, 'snapshot.db')
+
+    def _client(self, mode, service_name='guardduty', account_id=None):
+        pool = ClientPool(rate_limiter=None, metrics=None)
+        snapshot = Snapshot(self.path, mode)
+        pool.use_snapshot(snapshot)
+        aws_session = session()
+        if account_id:
+            snapshot.label(aws_session, account_id)
+        return pool.get_client(aws_session, service_name), snapshot
+
+    def test_record_then_replay(self):
+        client, snapshot = self._client(RECORD, account_id='111111111111')
+        with Stubber(client) as stubber:
+            stubber.add_response('list_detectors', {'DetectorIds': ['detector-1']})
+            self.assertEqual(client.list_detectors()['DetectorIds'], ['detector-1'])
+        snapshot.close()
+        self.assertEqual(snapshot.recorded, 1)
+
+        client, snapshot = self._client(REPLAY, account_id='111111111111')
+        self.assertEqual(client.list_detectors()['DetectorIds'], ['detector-1'])
+        snapshot.close()
+        self.assertEqual((snapshot.replayed, snapshot.missing), (1, 0))
+
+    def test_replay_keys_calls_by_account(self):
+        client, snapshot = self._client(RECORD, account_id='111111111111')
+        with Stubber(client) as stubber:
+            stubber.add_response('list_detectors', {'DetectorIds': ['detector-1']})
+            client.list_detectors()
+        snapshot.close()
+
+        client, snapshot = self._client(REPLAY, account_id='222222222222')
+        with self.assertRaises(client.exceptions.ClientError) as raised:
+            client.list_detectors()
+        snapshot.close()
+        self.assertEqual(raised.exception.response['Error']['Code'], MISSING_RESPONSE_CODE)
+        self.assertEqual(snapshot.missing, 1)
+
+    def test_list_parameter_order_does_not_change_key(self):
+        self.assertEqual(Snapshot._params_key({'accountIds': ['b', 'a', 'c']}),
+                         Snapshot._params_key({'accountIds': ['c', 'b', 'a']}))
+        self.assertNotEqual(Snapshot._params_key({'accountIds': ['a', 'b']}),
+                            Snapshot._params_key({'accountIds': ['a', 'c']}))
+        # Lists of structures keep their order
+        self.assertNotEqual(Snapshot._params_key({'Filters': [{'Name': 'a'}, {'Name': 'b'}]}),
+                            Snapshot._params_key({'Filters': [{'Name': 'b'}, {'Name': 'a'}]}))
+
+    def test_replay_of_missing_file_fails(self):
+        with self.assertRaises(FileNotFoundError):
+            Snapshot(self.path, REPLAY)
+        with self.assertRaises(ValueError):
+            Snapshot(self.path, 'rewind')
+
+    def _run(self, mode, hash_seed):
+        env = dict(os.environ, PYTHONHASHSEED=str(hash_seed), PYTHONPATH=PACKAGE_DIR)
+        result = subprocess.run([sys.executable, '-c', ROUND_TRIP_SCRIPT, mode, self.path],
+                                env=env, capture_output=True, text=True, check=True)
+        return result.stdout.splitlines()
+
+    def test_replay_under_other_hash_seed(self):
+        recorded_order, _ = self._run(RECORD, 1)
+        replayed_order, result = self._run(REPLAY, 2)
+        # The request lists the account IDs in another order, and is still found
+        self.assertNotEqual(recorded_order, replayed_order)
+        self.assertEqual(result, '000000000007 1 0')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import unittest
+from collections import Counter
+from unittest.mock import MagicMock, patch
+from botocore.exceptions import ClientError
+from sraverify.core import webacls
+from sraverify.core.cache import CacheManager
+from sraverify.core.check import SecurityCheck
+from sraverify.core.context import ScanContext
+from sraverify.core.webacls import resource_type_of, web_acl_for_resource
+
+REGION = 'us-east-1'
+ALB_ARN = 'arn:aws:elasticloadbalancing:us-east-1:111111111111:loadbalancer/app/{}/1'
+STAGE_ARN = 'arn:aws:apigateway:us-east-1::/restapis/{}/stages/prod'
+DISTRIBUTION_ARN = 'arn:aws:cloudfront::111111111111:distribution/{}'
+
+
+def web_acl(name):
+    return {'Name': name, 'Id': f'{name}-id', 'ARN': f'arn:aws:wafv2:us-east-1:111111111111:regional/webacl/{name}'}
+
+
+class FakeWAFv2:
+    """WAFv2 client with two web ACLs, listed one per page."""
+
+    def __init__(self, associations, denied=False):
+        self.associations = associations
+        self.denied = denied
+        self.calls = Counter()
+
+    def list_web_acls(self, Scope, NextMarker=None):
+        self.calls['ListWebACLs'] += 1
+        if NextMarker is None:
+            return {'WebACLs': [web_acl('first')], 'NextMarker': 'page-2'}
+        return {'WebACLs': [web_acl('second')]}
+
+    def list_resources_for_web_acl(self, WebACLArn, ResourceType):
+        self.calls['ListResourcesForWebACL'] += 1
+        if self.denied:
+            raise ClientError({'Error': {'Code': 'AccessDeniedException', 'Message': 'denied'}},
+                              'ListResourcesForWebACL')
+        return {'ResourceArns': self.associations.get((WebACLArn.split('/')[-1], ResourceType), [])}
+
+
+class FakeCloudFront:
+    def __init__(self):
+        self.calls = Counter()
+
+    def get_paginator(self, operation_name):
+        paginator = MagicMock()
+
+        def paginate():
+            self.calls['ListDistributions'] += 1
+            yield {'DistributionList': {'Items': [{'Id': 'D1', 'WebACLId': 'arn:waf/first'}]}}
+            yield {'DistributionList': {'Items': [{'Id': 'D2', 'WebACLId': ''}]}}
+
+        paginator.paginate = paginate
+        return paginator
+
+
+class Check(SecurityCheck):
+    def _setup_clients(self):
+        pass
+
+
+class TestWebACLIndex(unittest.TestCase):
+    def setUp(self):
+        self.wafv2 = FakeWAFv2({
+            ('first', 'APPLICATION_LOAD_BALANCER'): [ALB_ARN.format('a'), ALB_ARN.format('b')],
+            ('second', 'APPLICATION_LOAD_BALANCER'): [ALB_ARN.format('c')],
+            ('second', 'API_GATEWAY'): [STAGE_ARN.format('api')],
+        })
+        self.cloudfront = FakeCloudFront()
+        clients = {'wafv2': self.wafv2, 'cloudfront': self.cloudfront}
+        patcher = patch.object(webacls, 'get_client', side_effect=lambda session, service, region=None: clients[service])
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.check = Check()
+        self.check.session = MagicMock()
+        self.check.context = ScanContext(self.check.session, [REGION], CacheManager())
+        self.check.context._account_info = {'account_id': '111111111111', 'account_name': 'test'}
+        self.check.account_info = self.check.context.account_info
+        self.fallback = MagicMock(return_value={'WebACL': {'Name': 'fallback'}})
+
+    def _lookup(self, resource_arn, check=None):
+        return web_acl_for_resource(check or self.check, REGION, resource_arn, self.fallback)
+
+    def test_resource_type_of(self):
+        self.assertEqual(resource_type_of(ALB_ARN.format('a')), 'APPLICATION_LOAD_BALANCER')
+        self.assertEqual(resource_type_of(STAGE_ARN.format('api')), 'API_GATEWAY')
+        self.assertIsNone(resource_type_of('arn:aws:s3:::bucket'))
+        self.assertIsNone(resource_type_of('not-an-arn'))
+
+    def test_index_is_built_once_per_resource_type(self):
+        self.assertEqual(self._lookup(ALB_ARN.format('a'))['WebACL']['Name'], 'first')
+        self.assertEqual(self._lookup(ALB_ARN.format('c'))['WebACL']['Name'], 'second')
+        self.assertEqual(self._lookup(ALB_ARN.format('unprotected')), {'WebACL': None})
+        self.assertEqual(self._lookup(STAGE_ARN.format('api'))['WebACL']['Name'], 'second')
+
+        # Web ACLs are listed once; resources once per web ACL and resource type
+        self.assertEqual(self.wafv2.calls, Counter({'ListWebACLs': 2, 'ListResourcesForWebACL': 4}))
+        self.fallback.assert_not_called()
+
+    def test_checks_of_the_account_share_the_index(self):
+        self._lookup(ALB_ARN.format('a'))
+        other = Check()
+        other.session = self.check.session
+        other.context = self.check.context
+        other.account_info = self.check.account_info
+
+        self.assertEqual(self._lookup(ALB_ARN.format('b'), other)['WebACL']['Name'], 'first')
+        self.assertEqual(self.wafv2.calls['ListResourcesForWebACL'], 2)
+
+    def test_failed_index_falls_back_once_per_region(self):
+        self.wafv2.denied = True
+
+        for name in 'abc':
+            self.assertEqual(self._lookup(ALB_ARN.format(name)), {'WebACL': {'Name': 'fallback'}})
+        self.assertEqual(self._lookup(STAGE_ARN.format('api')), {'WebACL': {'Name': 'fallback'}})
+
+        # The failure is met once; every later lookup in the region uses the fallback directly
+        self.assertEqual(self.wafv2.calls['ListResourcesForWebACL'], 1)
+        self.assertEqual(self.fallback.call_count, 4)
+
+    def test_unsupported_resources_use_fallback(self):
+        self.assertEqual(self._lookup('arn:aws:s3:::bucket'), {'WebACL': {'Name': 'fallback'}})
+        self.assertEqual(self.wafv2.calls['ListWebACLs'], 0)
+
+    def test_distributions_are_indexed_by_id(self):
+        self.assertEqual(self._lookup(DISTRIBUTION_ARN.format('D1'))['WebACL']['Id'], 'arn:waf/first')
+        self.assertEqual(self._lookup(DISTRIBUTION_ARN.format('D2')), {'WebACL': None})
+        self.fallback.assert_not_called()
+
+        # Distributions missing from the listing are looked up individually
+        self._lookup(DISTRIBUTION_ARN.format('D3'))
+        self.fallback.assert_called_once_with(DISTRIBUTION_ARN.format('D3'))
+        self.assertEqual(self.cloudfront.calls['ListDistributions'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
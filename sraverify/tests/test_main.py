@@ -0,0 +1,185 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+import boto3
+import sraverify.main as main_module
+from sraverify.core.check import SecurityCheck
+from sraverify.core.context import ScanContext
+from sraverify.main import ALL_CHECKS, SRAVerify
+
+ACCOUNT_ID = '111111111111'
+
+
+class PassingCheck(SecurityCheck):
+    check_id = 'SRA-TEST-1'
+    check_name = 'Test check'
+    service = 'Test'
+
+    def _setup_clients(self):
+        pass
+
+    def execute(self):
+        for region in self.regions:
+            self.findings.append(self.create_finding('PASS', region, f'test/{region}', 'enabled', 'None'))
+        return self.findings
+
+
+class BrokenSetupCheck(PassingCheck):
+    check_id = 'SRA-TEST-2'
+    account_type = 'audit'
+
+    def _setup_clients(self):
+        raise RuntimeError('no clients')
+
+
+class ConcurrentCheck(PassingCheck):
+    """Only completes once every check sharing its barrier is running at the same time."""
+
+    barrier = None
+
+    def execute(self):
+        self.barrier.wait()
+        return super().execute()
+
+
+def concurrent_check(check_id, barrier):
+    return type(check_id.replace('-', '_'), (ConcurrentCheck,), {'check_id': check_id, 'barrier': barrier})
+
+
+def session(access_key='AKIATEST'):
+    return boto3.Session(aws_access_key_id=access_key, aws_secret_access_key='secret', region_name='us-east-1')
+
+
+def scanner(regions=('us-east-1', 'eu-west-1')):
+    sra = SRAVerify(session=session(), regions=list(regions))
+    sra.context._account_info = {'account_id': ACCOUNT_ID, 'account_name': 'test'}
+    return sra
+
+
+class TestRunChecks(unittest.TestCase):
+    def test_findings_are_plain_dictionaries(self):
+        sra = scanner()
+        with patch.object(sra, '_select_checks', return_value=[('Test', 'SRA-TEST-1', PassingCheck)]):
+            findings = sra.run_checks(show_progress=False)
+
+        self.assertEqual([f['Region'] for f in findings], ['us-east-1', 'eu-west-1'])
+        for finding in findings:
+            self.assertIs(type(finding), dict)
+            self.assertEqual(finding['AccountId'], ACCOUNT_ID)
+        self.assertEqual(json.loads(json.dumps(findings)), findings)
+
+    def test_check_failing_to_initialize_reports_error_finding(self):
+        sra = scanner()
+        checks = [('Test', 'SRA-TEST-2', BrokenSetupCheck), ('Test', 'SRA-TEST-1', PassingCheck)]
+        with patch.object(sra, '_select_checks', return_value=checks):
+            findings = sra.run_checks(show_progress=False)
+
+        error = findings[0]
+        self.assertEqual(error['Status'], 'ERROR')
+        self.assertEqual(error['CheckId'], 'SRA-TEST-2')
+        self.assertEqual((error['AccountId'], error['AccountName']), (ACCOUNT_ID, 'test'))
+        self.assertEqual(error['AccountType'], 'audit')
+        self.assertEqual(error['ActualValue'], 'no clients')
+        # The other checks still run
+        self.assertEqual([f['Status'] for f in findings[1:]], ['PASS', 'PASS'])
+
+    def test_unknown_account_reports_error_finding(self):
+        sra = scanner()
+        sra.context._account_info = None
+        with patch.object(sra, '_select_checks', return_value=[('Test', 'SRA-TEST-1', PassingCheck)]), \
+                patch.object(type(sra.context), '_get_account_info', side_effect=Exception('denied')):
+            findings = sra.run_checks(show_progress=False)
+
+        self.assertEqual(len(findings), 1)
+        self.assertEqual(findings[0]['Status'], 'ERROR')
+        self.assertIsNone(findings[0]['AccountId'])
+        self.assertIn('AccountName', findings[0])
+
+    def test_concurrent_checks_keep_their_order(self):
+        barrier = threading.Barrier(3, timeout=5)
+        checks = [('Test', f'SRA-TEST-{n}', concurrent_check(f'SRA-TEST-{n}', barrier)) for n in (5, 3, 4)]
+        sra = scanner(regions=['us-east-1'])
+        with patch.object(sra, '_select_checks', return_value=checks):
+            findings = sra.run_checks(show_progress=False, max_workers=3)
+
+        self.assertEqual([(f['CheckId'], f['Status']) for f in findings],
+                         [('SRA-TEST-5', 'PASS'), ('SRA-TEST-3', 'PASS'), ('SRA-TEST-4', 'PASS')])
+
+    def test_get_findings_returns_dictionaries(self):
+        check = PassingCheck()
+        check.initialize(session(), regions=['us-east-1'], context=scanner().context)
+        check.execute()
+
+        self.assertIsInstance(check.get_findings()[0], dict)
+        self.assertEqual(check.get_findings()[0]['CheckId'], 'SRA-TEST-1')
+
+
+class AccountContext(ScanContext):
+    """Scan context that reads the account ID from the fake assumed-role credentials."""
+
+    def __init__(self, session, regions=None, cache=None):
+        super().__init__(session, regions, cache)
+        self._account_info = {'account_id': session.get_credentials().access_key[4:], 'account_name': ''}
+
+
+class TestScanAccounts(unittest.TestCase):
+    ACCOUNTS = ['222222222222', '333333333333', '444444444444']
+
+    def setUp(self):
+        self.barrier = threading.Barrier(len(self.ACCOUNTS), timeout=5)
+        check_class = concurrent_check('SRA-TEST-9', self.barrier)
+        ALL_CHECKS['SRA-TEST-9'] = check_class
+        self.addCleanup(ALL_CHECKS.__delitem__, 'SRA-TEST-9')
+        self.checks = [('Test', 'SRA-TEST-9', check_class)]
+
+        self.assumed = []
+        self.denied = set()
+        patchers = [
+            patch('sraverify.core.session.assume_role', side_effect=self._assume_role),
+            patch.object(main_module, 'ScanContext', AccountContext),
+            patch.object(main_module.client_pool, 'release', wraps=main_module.client_pool.release),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.sra = scanner(regions=['us-east-1'])
+
+    def _assume_role(self, base_session, role_arn, region=None):
+        account_id = role_arn.split(':')[4]
+        self.assumed.append(role_arn)
+        if account_id in self.denied:
+            raise Exception('AccessDenied')
+        return session(f'AKIA{account_id}')
+
+    def _scan(self, **kwargs):
+        with patch.object(self.sra, '_select_checks', return_value=self.checks):
+            return self.sra.scan_accounts(self.ACCOUNTS, 'SRAMemberRole', account_type='application',
+                                          show_progress=False, **kwargs)
+
+    def test_accounts_are_scanned_concurrently_in_account_order(self):
+        findings = self._scan(parallel_accounts=3)
+
+        self.assertEqual([(f['AccountId'], f['Status']) for f in findings],
+                         [(account_id, 'PASS') for account_id in self.ACCOUNTS])
+        self.assertEqual(sorted(self.assumed),
+                         [f'arn:aws:iam::{account_id}:role/SRAMemberRole' for account_id in self.ACCOUNTS])
+        # Each account's clients are released once its checks have run
+        released = [call.args[0].get_credentials().access_key for call in main_module.client_pool.release.call_args_list]
+        self.assertEqual(sorted(released), [f'AKIA{account_id}' for account_id in self.ACCOUNTS])
+
+    def test_account_whose_role_cannot_be_assumed_reports_error_findings(self):
+        self.denied.add('333333333333')
+        self.barrier = threading.Barrier(2, timeout=5)
+        self.checks = [('Test', 'SRA-TEST-9', concurrent_check('SRA-TEST-9', self.barrier))]
+
+        findings = self._scan(parallel_accounts=3)
+
+        self.assertEqual([(f['AccountId'], f['Status']) for f in findings],
+                         [('222222222222', 'PASS'), ('333333333333', 'ERROR'), ('444444444444', 'PASS')])
+        self.assertIn('AccessDenied', findings[1]['ActualValue'])
+        self.assertEqual(main_module.client_pool.release.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
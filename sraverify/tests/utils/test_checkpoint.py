@@ -0,0 +1,97 @@
+import json
+import os
+import tempfile
+import unittest
+from sraverify.utils.checkpoint import Checkpoint
+
+SCAN = {'regions': ['us-east-1'], 'account_type': 'all', 'check': None}
+
+
+def finding(check_id, status="PASS", resource_id="resource-1"):
+    return {'AccountId': '111111111111', 'CheckId': check_id, 'Status': status,
+            'Region': 'us-east-1', 'ResourceId': resource_id}
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, 'scan.ckpt')
+
+    def _lines(self):
+        with open(self.path) as f:
+            return f.read().splitlines()
+
+    def test_resume_reuses_recorded_findings(self):
+        with Checkpoint(self.path, scan=SCAN) as checkpoint:
+            checkpoint.record('111111111111', 'SRA-A-1', [finding('SRA-A-1')])
+            checkpoint.record('111111111111', 'SRA-A-2', [])
+
+        with Checkpoint(self.path, resume=True, scan=SCAN) as checkpoint:
+            self.assertEqual(len(checkpoint), 2)
+            self.assertTrue(checkpoint.is_complete('111111111111', ['SRA-A-1', 'SRA-A-2']))
+            self.assertFalse(checkpoint.is_complete('111111111111', ['SRA-A-1', 'SRA-A-3']))
+            findings = checkpoint.completed('111111111111', 'SRA-A-1')
+            self.assertEqual(findings[0]['Status'], 'PASS')
+            self.assertEqual(findings[0]['ResourceId'], 'resource-1')
+            self.assertEqual(checkpoint.completed('111111111111', 'SRA-A-2'), [])
+            self.assertIsNone(checkpoint.completed('222222222222', 'SRA-A-1'))
+
+    def test_error_findings_are_not_recorded(self):
+        with Checkpoint(self.path, scan=SCAN) as checkpoint:
+            checkpoint.record('111111111111', 'SRA-A-1', [finding('SRA-A-1'), finding('SRA-A-1', 'ERROR', 'r2')])
+        with Checkpoint(self.path, resume=True, scan=SCAN) as checkpoint:
+            self.assertIsNone(checkpoint.completed('111111111111', 'SRA-A-1'))
+
+    def test_recovers_from_truncated_last_record(self):
+        with Checkpoint(self.path, scan=SCAN) as checkpoint:
+            checkpoint.record('111111111111', 'SRA-A-1', [finding('SRA-A-1')])
+            checkpoint.record('111111111111', 'SRA-A-2', [finding('SRA-A-2')])
+        # Cut the last record short, as if the scan was killed while writing it
+        with open(self.path) as f:
+            content = f.read()
+        with open(self.path, 'w') as f:
+            f.write(content[:-20])
+
+        with Checkpoint(self.path, resume=True, scan=SCAN) as checkpoint:
+            self.assertEqual(len(checkpoint), 1)
+            self.assertIsNone(checkpoint.completed('111111111111', 'SRA-A-2'))
+            checkpoint.record('111111111111', 'SRA-A-2', [finding('SRA-A-2')])
+
+        # The record written after the truncated one starts on its own line
+        lines = self._lines()
+        self.assertEqual(json.loads(lines[-1])['check_id'], 'SRA-A-2')
+        with Checkpoint(self.path, resume=True, scan=SCAN) as checkpoint:
+            self.assertEqual(len(checkpoint), 2)
+            self.assertTrue(checkpoint.is_complete('111111111111', ['SRA-A-1', 'SRA-A-2']))
+
+    def test_new_checkpoint_replaces_file(self):
+        with Checkpoint(self.path, scan=SCAN) as checkpoint:
+            checkpoint.record('111111111111', 'SRA-A-1', [finding('SRA-A-1')])
+        with Checkpoint(self.path, scan=SCAN) as checkpoint:
+            self.assertEqual(len(checkpoint), 0)
+        self.assertEqual(self._lines(), [json.dumps({'scan': SCAN})])
+
+    def test_resume_without_file_starts_new_checkpoint(self):
+        with Checkpoint(self.path, resume=True, scan=SCAN) as checkpoint:
+            self.assertEqual(len(checkpoint), 0)
+        self.assertEqual(json.loads(self._lines()[0]), {'scan': SCAN})
+
+    def test_refuses_to_resume_with_other_scan_parameters(self):
+        with Checkpoint(self.path, scan=SCAN) as checkpoint:
+            checkpoint.record('111111111111', 'SRA-A-1', [finding('SRA-A-1')])
+        with self.assertRaisesRegex(ValueError, 'regions'):
+            Checkpoint(self.path, resume=True, scan=dict(SCAN, regions=['eu-west-1']))
+        # The refused checkpoint is left as it was
+        with Checkpoint(self.path, resume=True, scan=SCAN) as checkpoint:
+            self.assertEqual(len(checkpoint), 1)
+
+    def test_refuses_records_without_scan_parameters(self):
+        with open(self.path, 'w') as f:
+            f.write(json.dumps({'account_id': '111111111111', 'check_id': 'SRA-A-1', 'findings': []}) + '\n')
+        with self.assertRaises(ValueError):
+            Checkpoint(self.path, resume=True, scan=SCAN)
+
+
+if __name__ == '__main__':
+    unittest.main()
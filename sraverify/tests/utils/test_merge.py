@@ -0,0 +1,140 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from sraverify.utils import merge
+from sraverify.utils.merge import find_input_files, merge_findings
+from sraverify.utils.outputs import FindingSink, open_sink, read_findings
+
+
+class ListSink(FindingSink):
+    """Keeps written findings in memory."""
+
+    def __init__(self):
+        super().__init__()
+        self.findings = []
+
+    def _write_findings(self, findings):
+        self.findings.extend(findings)
+
+
+def finding(account_id, check_id, status="PASS", region="us-east-1", resource_id="resource-1",
+            actual_value="enabled"):
+    return {'AccountId': account_id, 'CheckId': check_id, 'Status': status, 'Region': region,
+            'ResourceId': resource_id, 'CheckedValue': 'enabled', 'ActualValue': actual_value}
+
+
+class TestMergeFindings(unittest.TestCase):
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.tmp_dir = tmp_dir.name
+
+    def _write(self, name, findings):
+        path = os.path.join(self.tmp_dir, name)
+        with open_sink(path) as sink:
+            sink.write(findings)
+        return path
+
+    def _merge(self, inputs):
+        sink = ListSink()
+        summary = merge_findings(inputs, sink)
+        return summary, sink.findings
+
+    def test_sorts_and_drops_identical_findings(self):
+        first = self._write('sraverify_1.csv', [finding('222', 'SRA-B-1'), finding('111', 'SRA-A-1')])
+        second = self._write('sraverify_2.jsonl', [finding('111', 'SRA-A-1'), finding('111', 'SRA-A-2')])
+
+        summary, findings = self._merge([first, second])
+
+        self.assertEqual([(f['AccountId'], f['CheckId']) for f in findings],
+                         [('111', 'SRA-A-1'), ('111', 'SRA-A-2'), ('222', 'SRA-B-1')])
+        self.assertEqual(summary['files'], 2)
+        self.assertEqual(summary['read'], 4)
+        self.assertEqual(summary['duplicates'], 1)
+        self.assertEqual(summary['written'], 3)
+        self.assertEqual(summary['accounts'], 2)
+
+    def test_keeps_findings_that_differ_in_status_or_actual_value(self):
+        path = self._write('sraverify_1.csv', [
+            finding('111', 'SRA-A-1'),
+            finding('111', 'SRA-A-1', status='ERROR'),
+            finding('111', 'SRA-A-1', actual_value='disabled'),
+            finding('111', 'SRA-A-1'),
+        ])
+
+        summary, findings = self._merge([path])
+
+        self.assertEqual(len(findings), 3)
+        self.assertEqual(summary['duplicates'], 1)
+        self.assertEqual(sorted(f['Status'] for f in findings), ['ERROR', 'PASS', 'PASS'])
+
+    def test_multi_pass_merge(self):
+        inputs = []
+        expected = set()
+        for index in range(7):
+            account_id = str(100 + index % 3)
+            findings = [finding(account_id, f'SRA-A-{n}', region=f'region-{index}') for n in range(3)]
+            # Every file also repeats a finding of the first one
+            findings.append(finding('100', 'SRA-A-0', region='region-0'))
+            expected.update(json.dumps(f, sort_keys=True) for f in findings)
+            inputs.append(self._write(f'sraverify_{index}.jsonl', findings))
+
+        with patch.object(merge, 'MAX_FAN_IN', 2):
+            summary, findings = self._merge(inputs)
+
+        keys = [(f['AccountId'], f['CheckId'], f['Region']) for f in findings]
+        self.assertEqual(keys, sorted(keys))
+        self.assertEqual(len(findings), len(expected))
+        self.assertEqual(summary['read'], 28)
+        self.assertEqual(summary['duplicates'], 28 - len(expected))
+        self.assertEqual(summary['accounts'], 3)
+
+    def test_written_counts_only_this_merge(self):
+        sink = ListSink()
+        sink.write([finding('999', 'SRA-Z-1'), finding('999', 'SRA-Z-2')])
+        path = self._write('sraverify_1.csv', [finding('111', 'SRA-A-1')])
+
+        summary = merge_findings([path], sink)
+
+        self.assertEqual(summary['written'], 1)
+        self.assertEqual(sink.total, 3)
+
+    def test_skips_unreadable_files(self):
+        good = self._write('sraverify_1.csv', [finding('111', 'SRA-A-1')])
+        bad = os.path.join(self.tmp_dir, 'sraverify_2.jsonl')
+        with open(bad, 'w') as f:
+            f.write('{not json\n')
+
+        summary, findings = self._merge([good, bad])
+
+        self.assertEqual(len(findings), 1)
+        self.assertEqual(summary['files'], 1)
+        self.assertEqual(summary['skipped_files'], 1)
+
+    def test_merged_output_reads_back(self):
+        path = self._write('sraverify_1.csv', [finding('111', 'SRA-A-1'), finding('111', 'SRA-A-2', 'FAIL')])
+        output = os.path.join(self.tmp_dir, 'consolidated.jsonl.gz')
+        with open_sink(output) as sink:
+            merge_findings([path], sink)
+        self.assertEqual(sink.counts['FAIL'], 1)
+        self.assertEqual([row['CheckId'] for row in read_findings(output)], ['SRA-A-1', 'SRA-A-2'])
+
+    def test_find_input_files(self):
+        self._write('sraverify_1.csv', [])
+        self._write('sraverify_2.jsonl.gz', [])
+        self._write('other.csv', [])
+        os.makedirs(os.path.join(self.tmp_dir, 'nested'))
+        self._write(os.path.join('nested', 'sraverify_3.jsonl'), [])
+        with open(os.path.join(self.tmp_dir, 'sraverify.log'), 'w') as f:
+            f.write('log')
+
+        files = find_input_files([self.tmp_dir])
+
+        self.assertEqual([os.path.relpath(f, self.tmp_dir) for f in files],
+                         [os.path.join('nested', 'sraverify_3.jsonl'), 'sraverify_1.csv', 'sraverify_2.jsonl.gz'])
+
+
+if __name__ == '__main__':
+    unittest.main()